@@ -1,9 +1,123 @@
 """
 A package to aid the testing of ExtJS applications from Python using Selenium.
 
+Our helpers, and other public classes, are available from the package, e.g. `pyseext.GridHelper`, but are
+only imported when first used, so that importing the package, e.g. just to read an exception type, is cheap.
+
 See: https://github.com/westy/pyseext
 """
+import importlib
 import logging
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from pyseext.button_helper import ButtonHelper
+    from pyseext.call_batch import CallBatch
+    from pyseext.call_statistics import CallStatistics
+    from pyseext.chrome_tracer import ChromeTracer
+    from pyseext.component_descriptor import ComponentDescriptor
+    from pyseext.component_query import ComponentQuery
+    from pyseext.core import Core
+    from pyseext.field_helper import FieldHelper
+    from pyseext.form_helper import FormHelper
+    from pyseext.grid_helper import GridHelper
+    from pyseext.input_helper import InputHelper
+    from pyseext.instrumentation import Instrumentation
+    from pyseext.local_storage_helper import LocalStorageHelper
+    from pyseext.logging_policy import LoggingPolicy
+    from pyseext.menu_helper import MenuHelper
+    from pyseext.observable_helper import ObservableHelper
+    from pyseext.payload_codec import PayloadCodec
+    from pyseext.polling_strategy import PollingStrategy
+    from pyseext.record_type import RecordType
+    from pyseext.session import Session
+    from pyseext.session_factory import SessionFactory
+    from pyseext.slow_call_detector import SlowCallDetector
+    from pyseext.store_helper import StoreHelper
+    from pyseext.tree_helper import TreeHelper
+    from pyseext.wait_analytics import WaitAnalytics
+
+__version__ = '1.4.1'
+"""The version of this package, which is also stamped on our JavaScript when it is bundled."""
+
+_LAZY_EXPORTS: dict[str, str] = {
+    'ButtonHelper': 'pyseext.button_helper',
+    'CallBatch': 'pyseext.call_batch',
+    'CallStatistics': 'pyseext.call_statistics',
+    'ChromeTracer': 'pyseext.chrome_tracer',
+    'ComponentDescriptor': 'pyseext.component_descriptor',
+    'ComponentQuery': 'pyseext.component_query',
+    'Core': 'pyseext.core',
+    'FieldHelper': 'pyseext.field_helper',
+    'FormHelper': 'pyseext.form_helper',
+    'GridHelper': 'pyseext.grid_helper',
+    'InputHelper': 'pyseext.input_helper',
+    'Instrumentation': 'pyseext.instrumentation',
+    'LocalStorageHelper': 'pyseext.local_storage_helper',
+    'LoggingPolicy': 'pyseext.logging_policy',
+    'MenuHelper': 'pyseext.menu_helper',
+    'ObservableHelper': 'pyseext.observable_helper',
+    'PayloadCodec': 'pyseext.payload_codec',
+    'PollingStrategy': 'pyseext.polling_strategy',
+    'RecordType': 'pyseext.record_type',
+    'Session': 'pyseext.session',
+    'SessionFactory': 'pyseext.session_factory',
+    'SlowCallDetector': 'pyseext.slow_call_detector',
+    'StoreHelper': 'pyseext.store_helper',
+    'TreeHelper': 'pyseext.tree_helper',
+    'WaitAnalytics': 'pyseext.wait_analytics'
+}
+"""The public classes available from the package, keyed on name, with the module each is imported from on first use."""
+
+__all__ = ['__version__', 'batch', *_LAZY_EXPORTS]
 
 logger = logging.getLogger(__name__)
 logger.info("Imported package '%s' from %s",__name__, __path__)
+
+def __getattr__(name: str) -> Any:
+    """Imports one of our public classes on first use, and caches it on the package.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Any: The class.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    """Lists the attributes of the package, including the public classes that have not been imported yet.
+
+    Returns:
+        list[str]: The attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+def batch(driver: 'WebDriver') -> 'CallBatch':
+    """Creates a batch that coalesces calls to our JavaScript for a driver into a single roundtrip.
+
+    e.g.
+        with pyseext.batch(driver):
+            name = field_helper.get_field_value(form_cq, 'name')
+            age = field_helper.get_field_value(form_cq, 'age')
+
+        print(name.result(), age.result())
+
+    See `pyseext.call_batch.CallBatch` for details.
+
+    Args:
+        driver (WebDriver): The webdriver whose calls are to be batched.
+
+    Returns:
+        CallBatch: The batch, to be used as a context manager.
+    """
+    from pyseext.call_batch import CallBatch
+    return CallBatch(driver)
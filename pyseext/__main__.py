@@ -0,0 +1,113 @@
+"""
+The command line interface of this package.
+
+e.g.
+    python -m pyseext bench --browser chrome --output baseline.json
+    python -m pyseext bench --browser chrome --baseline baseline.json --operations 'grid_helper.*'
+"""
+import argparse
+import logging
+import sys
+from typing import Union
+
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyseext.benchmark import BenchmarkReport, BenchmarkRunner
+
+def main(argv: Union[list[str], None] = None) -> int:
+    """Runs a command given on the command line.
+
+    Args:
+        argv (list[str], optional): The command line arguments. Defaults to None, which uses those of the process.
+
+    Returns:
+        int: The exit code, which is 1 if a benchmark regressed against its baseline, and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog='python -m pyseext', description='Python Selenium ExtJS command line tools.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    bench_parser = subparsers.add_parser('bench',
+                                         help='Benchmark the hot paths of our helpers against a local fixture page.',
+                                         description='Benchmark the hot paths of our helpers against a local fixture page, '
+                                                     'reporting latency percentiles and roundtrips per operation.')
+    bench_parser.add_argument('--browser', choices=('chrome', 'edge', 'firefox'), default='chrome', help='The browser to use. Defaults to chrome.')
+    bench_parser.add_argument('--headed', action='store_true', help='Show the browser, rather than running it headless.')
+    bench_parser.add_argument('--iterations', type=int, default=20, help='The number of measured iterations of each operation. Defaults to 20.')
+    bench_parser.add_argument('--warmup', type=int, default=2, help='The number of unmeasured iterations of each operation. Defaults to 2.')
+    bench_parser.add_argument('--operations', nargs='+', metavar='PATTERN', help="Wildcard patterns for the operations to run, e.g. 'grid_helper.*'.")
+    bench_parser.add_argument('--list', action='store_true', help='List the operations, without running them.')
+    bench_parser.add_argument('--output', metavar='FILE', help='Save the results to a JSON file, which can later be used as a baseline.')
+    bench_parser.add_argument('--baseline', metavar='FILE', help='Compare the results against a baseline saved with --output.')
+    bench_parser.add_argument('--threshold', type=float, default=BenchmarkReport.DEFAULT_THRESHOLD * 100,
+                              help='The percentage by which the median latency of an operation can exceed its baseline '
+                                   'before it is a regression. Defaults to %(default)s.')
+    bench_parser.add_argument('--verbose', action='store_true', help='Log the progress of the run.')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    return _bench(args)
+
+def _bench(args: argparse.Namespace) -> int:
+    """Runs the bench command.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    baseline = BenchmarkReport.load(args.baseline) if args.baseline else None
+    threshold = args.threshold / 100
+
+    driver = _create_driver(args.browser, args.headed) if not args.list else None
+
+    try:
+        runner = BenchmarkRunner(driver, args.iterations, args.warmup)
+
+        if args.list:
+            print('\n'.join(runner.get_operation_names()))
+            return 0
+
+        report = runner.run(args.operations)
+    finally:
+        if driver:
+            driver.quit()
+
+    print(report.format_table(baseline, threshold))
+
+    if args.output:
+        report.save(args.output)
+
+    if baseline and any(comparison.is_regression for comparison in report.compare(baseline, threshold)):
+        return 1
+
+    return 0
+
+def _create_driver(browser: str, headed: bool) -> WebDriver:
+    """Creates a local WebDriver.
+
+    Args:
+        browser (str): The browser, one of 'chrome', 'edge' or 'firefox'.
+        headed (bool): Indicates whether to show the browser, rather than running it headless.
+
+    Returns:
+        WebDriver: The webdriver.
+    """
+    if browser == 'firefox':
+        firefox_options = webdriver.FirefoxOptions()
+        if not headed:
+            firefox_options.add_argument('-headless')
+
+        return webdriver.Firefox(options=firefox_options)
+
+    chromium_options = webdriver.EdgeOptions() if browser == 'edge' else webdriver.ChromeOptions()
+    if not headed:
+        chromium_options.add_argument('--headless=new')
+
+    return webdriver.Edge(options=chromium_options) if browser == 'edge' else webdriver.Chrome(options=chromium_options)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+Asyncio counterparts of our helpers, so one event loop can drive many browser sessions concurrently.
+
+e.g.
+    async def approve(driver):
+        grid_helper = pyseext.aio.GridHelper(driver)
+        await grid_helper.wait_to_click_row('gridpanel', {'name': 'Request 1'})
+"""
+from pyseext.aio.driver_executor import DriverExecutor
+from pyseext.aio.async_helper import AsyncHelper
+from pyseext.aio.component_query import ComponentQuery
+from pyseext.aio.grid_helper import GridHelper
+from pyseext.aio.store_helper import StoreHelper
+from pyseext.aio.tree_helper import TreeHelper
+from pyseext.aio.observable_helper import ObservableHelper
@@ -0,0 +1,90 @@
+"""
+Module that contains our AsyncHelper class.
+"""
+from typing import Any, Callable, Coroutine, TYPE_CHECKING, Union
+
+from pyseext.aio.driver_executor import DriverExecutor
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+class AsyncHelper:
+    """Base class for our asyncio counterparts of the synchronous helpers.
+
+    Every public method of the synchronous helper is available as a coroutine function with the same name and
+    arguments, which runs the method on the `DriverExecutor` for the driver. Awaiting a wait, such as
+    `wait_for_store_loaded`, therefore only holds up other calls for the same driver, so one event loop
+    can drive many browser sessions at once.
+
+    The synchronous helper is constructed on first use, on the driver's thread, so constructing one of these
+    does not touch the browser.
+
+    Public class properties, such as `GridHelper.GRID_CQ`, and nested classes, such as exceptions, are
+    available as they are on the synchronous helper.
+    """
+
+    # Class variables
+    _HELPER_CLASS: type = object
+    """The synchronous helper class that subclasses wrap"""
+
+    def __init__(self, driver: 'WebDriver'):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver to use
+        """
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        self._executor = DriverExecutor.get_for_driver(driver)
+        """The `DriverExecutor` that calls for our driver are run on"""
+
+        self._helper: Union[Any, None] = None
+        """The synchronous helper instance, created on first use"""
+
+    def __init_subclass__(cls, **kwargs):
+        """Exposes the public class properties and nested classes of the wrapped helper class on a subclass."""
+        super().__init_subclass__(**kwargs)
+
+        for name, value in vars(cls._HELPER_CLASS).items():
+            if not name.startswith('_') and (not callable(value) or isinstance(value, type)):
+                if name not in vars(cls):
+                    setattr(cls, name, value)
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """Gets a coroutine function that runs the public method of the same name on the synchronous helper.
+
+        Args:
+            name (str): The name of the method.
+
+        Returns:
+            Callable[..., Coroutine[Any, Any, Any]]: The coroutine function.
+        """
+        if name.startswith('_') or not callable(getattr(self._HELPER_CLASS, name, None)):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def call_helper_method(*args, **kwargs) -> Any:
+            """Runs the helper method on the driver's thread."""
+            return await self._executor.run(self._call_helper_method, name, args, kwargs)
+
+        call_helper_method.__name__ = name
+        call_helper_method.__doc__ = getattr(self._HELPER_CLASS, name).__doc__
+
+        return call_helper_method
+
+    def _call_helper_method(self, name: str, args: tuple, kwargs: dict) -> Any:
+        """Calls a method on the synchronous helper, creating the helper first if need be.
+        Runs on the driver's thread.
+
+        Args:
+            name (str): The name of the method.
+            args (tuple): The positional arguments for the method.
+            kwargs (dict): The keyword arguments for the method.
+
+        Returns:
+            Any: The result of the method.
+        """
+        if self._helper is None:
+            self._helper = self._HELPER_CLASS(self._driver)
+
+        return getattr(self._helper, name)(*args, **kwargs)
@@ -0,0 +1,15 @@
+"""
+Module that contains our asyncio ComponentQuery class.
+"""
+from pyseext.aio.async_helper import AsyncHelper
+from pyseext.component_query import ComponentQuery as SyncComponentQuery
+
+class ComponentQuery(AsyncHelper):
+    """An asyncio counterpart of `pyseext.component_query.ComponentQuery`, to help with Ext.ComponentQuery.
+
+    See `AsyncHelper` for how the methods are run.
+    """
+
+    # Class variables
+    _HELPER_CLASS: type = SyncComponentQuery
+    """The synchronous helper class that we wrap"""
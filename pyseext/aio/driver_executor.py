@@ -0,0 +1,75 @@
+"""
+Module that contains our DriverExecutor class.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+class DriverExecutor:
+    """A class that runs the blocking calls for a WebDriver on a single thread dedicated to that driver.
+
+    Calls for the same driver are made one at a time, in the order they were submitted, since a WebDriver
+    session can only do one thing at a time, while calls for different drivers run concurrently.
+    """
+
+    # Class variables
+    _THREAD_NAME_PREFIX: str = 'pyseext-driver'
+    """The prefix for the name of the thread for each driver"""
+
+    _executors: 'WeakKeyDictionary[WebDriver, DriverExecutor]' = WeakKeyDictionary()
+    """The executor for each WebDriver"""
+
+    def __init__(self):
+        """Initialises an instance of this class"""
+        self._thread_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self._THREAD_NAME_PREFIX)
+        """The single threaded pool that the calls are run on"""
+
+    @staticmethod
+    def get_for_driver(driver: 'WebDriver') -> 'DriverExecutor':
+        """Gets the executor for a driver, creating it if need be.
+
+        Args:
+            driver (WebDriver): The webdriver.
+
+        Returns:
+            DriverExecutor: The executor for the driver.
+        """
+        executor = DriverExecutor._executors.get(driver)
+
+        if executor is None:
+            executor = DriverExecutor()
+            DriverExecutor._executors[driver] = executor
+
+        return executor
+
+    @staticmethod
+    def shutdown_for_driver(driver: 'WebDriver', wait: bool = True):
+        """Shuts down the executor for a driver, if it has one, e.g. before quitting the driver.
+
+        Args:
+            driver (WebDriver): The webdriver.
+            wait (bool, optional): Indicates whether to wait for any pending calls to complete. Defaults to True.
+        """
+        executor = DriverExecutor._executors.pop(driver, None)
+
+        if executor:
+            executor._thread_pool.shutdown(wait=wait) # pylint: disable=protected-access
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Runs a blocking function on the driver's thread, without blocking the event loop.
+
+        Args:
+            func (Callable[..., Any]): The function to run.
+            *args: Any positional arguments for the function.
+            **kwargs: Any keyword arguments for the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_pool, functools.partial(func, *args, **kwargs))
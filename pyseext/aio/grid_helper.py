@@ -0,0 +1,15 @@
+"""
+Module that contains our asyncio GridHelper class.
+"""
+from pyseext.aio.async_helper import AsyncHelper
+from pyseext.grid_helper import GridHelper as SyncGridHelper
+
+class GridHelper(AsyncHelper):
+    """An asyncio counterpart of `pyseext.grid_helper.GridHelper`, to help with Ext grid panels.
+
+    See `AsyncHelper` for how the methods are run.
+    """
+
+    # Class variables
+    _HELPER_CLASS: type = SyncGridHelper
+    """The synchronous helper class that we wrap"""
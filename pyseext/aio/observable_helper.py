@@ -0,0 +1,15 @@
+"""
+Module that contains our asyncio ObservableHelper class.
+"""
+from pyseext.aio.async_helper import AsyncHelper
+from pyseext.observable_helper import ObservableHelper as SyncObservableHelper
+
+class ObservableHelper(AsyncHelper):
+    """An asyncio counterpart of `pyseext.observable_helper.ObservableHelper`, to help with observable objects.
+
+    See `AsyncHelper` for how the methods are run.
+    """
+
+    # Class variables
+    _HELPER_CLASS: type = SyncObservableHelper
+    """The synchronous helper class that we wrap"""
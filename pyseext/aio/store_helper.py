@@ -0,0 +1,15 @@
+"""
+Module that contains our asyncio StoreHelper class.
+"""
+from pyseext.aio.async_helper import AsyncHelper
+from pyseext.store_helper import StoreHelper as SyncStoreHelper
+
+class StoreHelper(AsyncHelper):
+    """An asyncio counterpart of `pyseext.store_helper.StoreHelper`, to help with stores.
+
+    See `AsyncHelper` for how the methods are run.
+    """
+
+    # Class variables
+    _HELPER_CLASS: type = SyncStoreHelper
+    """The synchronous helper class that we wrap"""
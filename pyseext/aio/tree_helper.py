@@ -0,0 +1,15 @@
+"""
+Module that contains our asyncio TreeHelper class.
+"""
+from pyseext.aio.async_helper import AsyncHelper
+from pyseext.tree_helper import TreeHelper as SyncTreeHelper
+
+class TreeHelper(AsyncHelper):
+    """An asyncio counterpart of `pyseext.tree_helper.TreeHelper`, to help with trees.
+
+    See `AsyncHelper` for how the methods are run.
+    """
+
+    # Class variables
+    _HELPER_CLASS: type = SyncTreeHelper
+    """The synchronous helper class that we wrap"""
@@ -0,0 +1,13 @@
+"""
+Benchmarks of the hot paths of our helpers, run against a fixture page served from disk, so that the effect of a
+change, such as an upgrade of this package, on the speed of a test suite can be measured.
+
+e.g.
+    report = pyseext.benchmark.BenchmarkRunner(driver).run()
+    report.save('baseline.json')
+
+Or from the command line:
+    python -m pyseext bench --browser chrome --baseline baseline.json
+"""
+from pyseext.benchmark.benchmark_report import BenchmarkReport
+from pyseext.benchmark.benchmark_runner import BenchmarkRunner
@@ -0,0 +1,277 @@
+"""
+Module that contains our BenchmarkReport class.
+"""
+import json
+import math
+from typing import Any, Union
+
+from pyseext import __version__
+
+class BenchmarkReport:
+    """The results of a benchmark run, with the latency percentiles and roundtrips for each operation.
+
+    A report can be saved to a JSON file, and later loaded as a baseline that another run is compared against,
+    to tell whether a change, such as an upgrade of this package, has made the operations slower.
+
+    e.g.
+        report = BenchmarkRunner(driver).run()
+        baseline = BenchmarkReport.load('baseline.json')
+
+        print(report.format_table(baseline))
+        regressions = [comparison for comparison in report.compare(baseline) if comparison.is_regression]
+    """
+
+    # Public class properties
+    FORMAT_VERSION: int = 1
+    """The version of the report file format"""
+
+    PERCENTILES: tuple[int, ...] = (50, 90, 99)
+    """The latency percentiles that are reported for each operation"""
+
+    DEFAULT_THRESHOLD: float = 0.1
+    """The default fraction by which the median latency of an operation can exceed its baseline before it is a regression"""
+
+    def __init__(self, metadata: Union[dict[str, Any], None] = None):
+        """Initialises an instance of this class
+
+        Args:
+            metadata (dict[str, Any], optional): Information about the run, such as the browser used. Defaults to None.
+        """
+        self.metadata: dict[str, Any] = {'pyseext_version': __version__, **(metadata or {})}
+        """Information about the run, such as the version of this package and the browser used"""
+
+        self.results: dict[str, BenchmarkReport.OperationResult] = {}
+        """The results for each operation, keyed on operation name"""
+
+    def add_result(self, result: 'BenchmarkReport.OperationResult'):
+        """Adds the result for an operation, replacing any existing result for it.
+
+        Args:
+            result (BenchmarkReport.OperationResult): The result.
+        """
+        self.results[result.name] = result
+
+    def compare(self, baseline: 'BenchmarkReport', threshold: float = DEFAULT_THRESHOLD) -> list['BenchmarkReport.Comparison']:
+        """Compares the results of this report against those of a baseline report.
+
+        Only operations that are in both reports are compared.
+
+        Args:
+            baseline (BenchmarkReport): The baseline report.
+            threshold (float, optional): The fraction by which the median latency of an operation can exceed its baseline
+                                         before it is a regression. Defaults to `DEFAULT_THRESHOLD`.
+
+        Returns:
+            list[BenchmarkReport.Comparison]: The comparison for each operation.
+        """
+        return [BenchmarkReport.Comparison(result, baseline.results[name], threshold)
+                for name, result in self.results.items()
+                if name in baseline.results]
+
+    def format_table(self, baseline: Union['BenchmarkReport', None] = None, threshold: float = DEFAULT_THRESHOLD) -> str:
+        """Formats the results of this report as a text table, optionally compared against a baseline.
+
+        Args:
+            baseline (BenchmarkReport, optional): The baseline report. Defaults to None.
+            threshold (float, optional): The fraction by which the median latency of an operation can exceed its baseline
+                                         before it is a regression. Defaults to `DEFAULT_THRESHOLD`.
+
+        Returns:
+            str: The table.
+        """
+        comparisons = {comparison.name: comparison for comparison in (self.compare(baseline, threshold) if baseline else [])}
+        name_width = max([len('operation')] + [len(name) for name in self.results])
+
+        headings = ['operation'.ljust(name_width)] + [f'p{percentile} ms'.rjust(9) for percentile in self.PERCENTILES]
+        headings += ['max ms'.rjust(9), 'roundtrips'.rjust(10)]
+        if baseline:
+            headings.append('vs baseline')
+
+        lines = ['  '.join(headings)]
+
+        for name, result in self.results.items():
+            columns = [name.ljust(name_width)]
+            columns += [f'{result.get_percentile(percentile) * 1000:9.1f}' for percentile in self.PERCENTILES]
+            columns += [f'{result.get_max() * 1000:9.1f}', f'{result.get_mean_roundtrips():10.1f}']
+
+            if baseline:
+                comparison = comparisons.get(name)
+                columns.append(comparison.describe() if comparison else 'not in baseline')
+
+            lines.append('  '.join(columns))
+
+        return '\n'.join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Gets this report as a dictionary, as saved by `save`.
+
+        Returns:
+            dict[str, Any]: The report.
+        """
+        return {
+            'format_version': self.FORMAT_VERSION,
+            'metadata': self.metadata,
+            'results': {name: result.to_dict() for name, result in self.results.items()}
+        }
+
+    def save(self, file_path: str):
+        """Saves this report to a JSON file, so that it can be used as a baseline.
+
+        Args:
+            file_path (str): The path of the file to write.
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2, default=str)
+
+    @staticmethod
+    def from_dict(report: dict[str, Any]) -> 'BenchmarkReport':
+        """Creates a report from a dictionary, as returned by `to_dict`.
+
+        Args:
+            report (dict[str, Any]): The report.
+
+        Returns:
+            BenchmarkReport: The report.
+        """
+        benchmark_report = BenchmarkReport()
+        benchmark_report.metadata = report.get('metadata') or {}
+
+        for name, result in report['results'].items():
+            benchmark_report.add_result(BenchmarkReport.OperationResult(name, result['durations'], result['roundtrips'], result.get('errors', 0)))
+
+        return benchmark_report
+
+    @staticmethod
+    def load(file_path: str) -> 'BenchmarkReport':
+        """Loads a report saved by `save`.
+
+        Args:
+            file_path (str): The path of the file to read.
+
+        Returns:
+            BenchmarkReport: The report.
+        """
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return BenchmarkReport.from_dict(json.load(file))
+
+    class OperationResult:
+        """The measurements of the iterations of a single operation."""
+
+        def __init__(self, name: str, durations: list[float], roundtrips: list[int], errors: int = 0):
+            """Initialises an instance of this class
+
+            Args:
+                name (str): The name of the operation.
+                durations (list[float]): The duration of each iteration, in seconds.
+                roundtrips (list[int]): The number of browser roundtrips made by each iteration.
+                errors (int, optional): The number of iterations that raised an exception. Defaults to 0.
+            """
+            self.name = name
+            """The name of the operation"""
+
+            self.durations = durations
+            """The duration of each iteration, in seconds"""
+
+            self.roundtrips = roundtrips
+            """The number of browser roundtrips made by each iteration"""
+
+            self.errors = errors
+            """The number of iterations that raised an exception"""
+
+        def get_percentile(self, percentile: float) -> float:
+            """Gets a percentile of the durations, using the nearest rank method.
+
+            Args:
+                percentile (float): The percentile, between 0 and 100.
+
+            Returns:
+                float: The duration at that percentile, in seconds, or 0 if there are no durations.
+            """
+            if not self.durations:
+                return 0.0
+
+            ordered = sorted(self.durations)
+            rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+            return ordered[rank - 1]
+
+        def get_max(self) -> float:
+            """Gets the longest duration.
+
+            Returns:
+                float: The duration, in seconds, or 0 if there are no durations.
+            """
+            return max(self.durations, default=0.0)
+
+        def get_mean_roundtrips(self) -> float:
+            """Gets the mean number of browser roundtrips per iteration.
+
+            Returns:
+                float: The mean, or 0 if there are no iterations.
+            """
+            return sum(self.roundtrips) / len(self.roundtrips) if self.roundtrips else 0.0
+
+        def to_dict(self) -> dict[str, Any]:
+            """Gets this result as a dictionary, including its percentiles.
+
+            Returns:
+                dict[str, Any]: The result.
+            """
+            result: dict[str, Any] = {f'p{percentile}': self.get_percentile(percentile) for percentile in BenchmarkReport.PERCENTILES}
+            result.update({
+                'max': self.get_max(),
+                'mean_roundtrips': self.get_mean_roundtrips(),
+                'errors': self.errors,
+                'durations': self.durations,
+                'roundtrips': self.roundtrips
+            })
+
+            return result
+
+    class Comparison:
+        """The comparison of the result of an operation against its baseline."""
+
+        def __init__(self, result: 'BenchmarkReport.OperationResult', baseline: 'BenchmarkReport.OperationResult', threshold: float):
+            """Initialises an instance of this class
+
+            Args:
+                result (BenchmarkReport.OperationResult): The result.
+                baseline (BenchmarkReport.OperationResult): The baseline result.
+                threshold (float): The fraction by which the median latency can exceed the baseline before it is a regression.
+            """
+            self.name = result.name
+            """The name of the operation"""
+
+            self.median = result.get_percentile(50)
+            """The median duration, in seconds"""
+
+            self.baseline_median = baseline.get_percentile(50)
+            """The baseline median duration, in seconds"""
+
+            self.mean_roundtrips = result.get_mean_roundtrips()
+            """The mean number of roundtrips per iteration"""
+
+            self.baseline_mean_roundtrips = baseline.get_mean_roundtrips()
+            """The baseline mean number of roundtrips per iteration"""
+
+            self.change = (self.median - self.baseline_median) / self.baseline_median if self.baseline_median else 0.0
+            """The fractional change in the median duration, e.g. 0.25 if it is 25% slower"""
+
+            self.is_regression = self.change > threshold or self.mean_roundtrips > self.baseline_mean_roundtrips
+            """Indicates whether the operation is slower than the threshold allows, or makes more roundtrips than it did"""
+
+        def describe(self) -> str:
+            """Describes this comparison, e.g. '+25.0% p50, +1.0 roundtrips REGRESSION'.
+
+            Returns:
+                str: The description.
+            """
+            description = f'{self.change * 100:+.1f}% p50'
+
+            roundtrip_change = self.mean_roundtrips - self.baseline_mean_roundtrips
+            if roundtrip_change:
+                description += f', {roundtrip_change:+.1f} roundtrips'
+
+            if self.is_regression:
+                description += ' REGRESSION'
+
+            return description
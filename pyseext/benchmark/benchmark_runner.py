@@ -0,0 +1,204 @@
+"""
+Module that contains our BenchmarkRunner class.
+"""
+import fnmatch
+import logging
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyseext.instrumentation import Instrumentation
+from pyseext.session import Session
+from pyseext.benchmark.benchmark_report import BenchmarkReport
+
+class BenchmarkRunner:
+    """Runs benchmarks of the hot paths of our helpers, such as component queries and grid row lookups,
+    against a fixture page that is loaded from disk, and built with a minimal stand-in for Ext JS, so
+    that no network, or Ext JS licence, is needed.
+
+    Each operation is run a number of warm up iterations, which are not measured, followed by a number of measured
+    iterations, for which the latency and number of browser roundtrips are recorded.
+
+    e.g.
+        report = BenchmarkRunner(driver).run(['grid_helper.*'])
+        print(report.format_table())
+    """
+
+    # Public class properties
+    FIXTURE_PATH: Path = Path(__file__).parent / 'fixtures' / 'bench.html'
+    """The path of the fixture page"""
+
+    DEFAULT_CONFIG: dict[str, Any] = {
+        'fieldCount': 3,
+        'gridSizes': [10000, 100000],
+        'treeDepth': 100,
+        'treeBreadth': 10,
+        'loadDelay': 20
+    }
+    """The default configuration of the fixture page, passed to its `BenchApp.setUp` function"""
+
+    # Private class properties
+    _SET_UP_SCRIPT: str = "globalThis.BenchApp.setUp(arguments[0]);"
+    """The script used to build the fixture page"""
+
+    _FORM_CQ: str = '#benchForm'
+    """The component query for the form on the fixture page"""
+
+    _TREE_CQ: str = '#deepTree'
+    """The component query for the tree on the fixture page"""
+
+    def __init__(self, driver: WebDriver, iterations: int = 20, warmup: int = 2, config: Union[dict[str, Any], None] = None):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver to run the benchmarks with.
+            iterations (int, optional): The number of measured iterations of each operation. Defaults to 20.
+            warmup (int, optional): The number of unmeasured iterations of each operation, run before those measured. Defaults to 2.
+            config (dict[str, Any], optional): The configuration of the fixture page, which overrides `DEFAULT_CONFIG`. Defaults to None.
+        """
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        self._iterations = iterations
+        """The number of measured iterations of each operation"""
+
+        self._warmup = warmup
+        """The number of unmeasured iterations of each operation"""
+
+        self._config: dict[str, Any] = {**self.DEFAULT_CONFIG, **(config or {})}
+        """The configuration of the fixture page"""
+
+        self._logger = logging.getLogger(__name__)
+        """The Logger instance for this class instance"""
+
+        self._operations: dict[str, Callable[[], Any]] = self._create_operations()
+        """The operations that can be run, keyed on name"""
+
+    @property
+    def _session(self) -> Session:
+        """The `Session` for our driver, which holds the helpers that are benchmarked"""
+        return Session(self._driver)
+
+    def get_operation_names(self) -> list[str]:
+        """Gets the names of the operations that can be run.
+
+        Returns:
+            list[str]: The operation names, e.g. 'grid_helper.get_row.100k'.
+        """
+        return list(self._operations)
+
+    def load_fixture(self):
+        """Loads the fixture page into the browser, and builds it with our configuration."""
+        self._driver.get(self.FIXTURE_PATH.resolve().as_uri())
+        self._driver.execute_script(self._SET_UP_SCRIPT, self._config)
+
+    def run(self, operation_patterns: Union[list[str], None] = None) -> BenchmarkReport:
+        """Loads the fixture page, then runs the benchmarks.
+
+        Args:
+            operation_patterns (list[str], optional): Shell style wildcard patterns for the names of the operations to run,
+                                                      e.g. 'grid_helper.*'. Defaults to None, which runs all of them.
+
+        Returns:
+            BenchmarkReport: The report of the run.
+        """
+        names = [name for name in self._operations
+                 if not operation_patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in operation_patterns)]
+
+        report = BenchmarkReport({
+            'browser_name': self._driver.capabilities.get('browserName'),
+            'browser_version': self._driver.capabilities.get('browserVersion'),
+            'iterations': self._iterations,
+            'warmup': self._warmup,
+            'config': self._config
+        })
+
+        self.load_fixture()
+
+        # We need a listener for spans to be recorded, but it does not need to do anything with them
+        listener = Instrumentation.Listener()
+        Instrumentation.add_listener(listener)
+
+        try:
+            for name in names:
+                self._logger.info("Running benchmark '%s'", name)
+                report.add_result(self._run_operation(name, self._operations[name]))
+        finally:
+            Instrumentation.remove_listener(listener)
+
+        return report
+
+    def _run_operation(self, name: str, operation: Callable[[], Any]) -> BenchmarkReport.OperationResult:
+        """Runs the warm up and measured iterations of an operation.
+
+        Args:
+            name (str): The name of the operation.
+            operation (Callable[[], Any]): The operation.
+
+        Returns:
+            BenchmarkReport.OperationResult: The result.
+        """
+        for _ in range(self._warmup):
+            operation()
+
+        result = BenchmarkReport.OperationResult(name, [], [])
+
+        for _ in range(self._iterations):
+            with Instrumentation.span(Instrumentation.SPAN_KIND_METHOD, f'benchmark.{name}', self._driver) as span:
+                try:
+                    operation()
+                except Exception: # pylint: disable=broad-exception-caught
+                    self._logger.exception("Benchmark '%s' raised an exception", name)
+                    result.errors += 1
+
+            result.durations.append(span.duration)
+            result.roundtrips.append(span.roundtrip_count)
+
+        return result
+
+    def _create_operations(self) -> dict[str, Callable[[], Any]]:
+        """Creates the operations that can be run, for the configuration of the fixture page.
+
+        Returns:
+            dict[str, Callable[[], Any]]: The operations, keyed on name.
+        """
+        operations: dict[str, Callable[[], Any]] = {}
+
+        grid_sizes: list[int] = self._config['gridSizes']
+        first_grid_cq = f'#grid{grid_sizes[0]}'
+
+        operations['component_query.query'] = lambda: self._session.component_query.query(first_grid_cq)
+        operations['component_query.wait_for_single_query_visible'] = lambda: self._session.component_query.wait_for_single_query_visible(first_grid_cq)
+
+        for size in grid_sizes:
+            label = self._get_size_label(size)
+            last_row = {'id': size - 1}
+
+            operations[f'grid_helper.get_row.{label}'] = lambda grid_cq=f'#grid{size}', row=last_row: self._session.grid_helper.get_row(grid_cq, row)
+            operations[f'grid_helper.get_row_data.{label}'] = lambda grid_cq=f'#grid{size}', row=last_row: self._session.grid_helper.get_row_data(grid_cq, row)
+
+        deepest_node_text = f"Node {self._config['treeDepth']}.{self._config['treeBreadth']}"
+        operations['tree_helper.get_node_icon_element.deep'] = lambda: self._session.tree_helper.get_node_icon_element(self._TREE_CQ, deepest_node_text)
+
+        field_values = {f'field{index}': f'Value {index}' for index in range(self._config['fieldCount'])}
+        operations['form_helper.set_form_values'] = lambda: self._session.form_helper.set_form_values(self._FORM_CQ, field_values)
+
+        operations['store_helper.trigger_reload_and_wait'] = lambda: self._session.store_helper.trigger_reload_and_wait(first_grid_cq)
+
+        return operations
+
+    @staticmethod
+    def _get_size_label(size: int) -> str:
+        """Gets a short label for a number of records, e.g. '10k' for 10000.
+
+        Args:
+            size (int): The number of records.
+
+        Returns:
+            str: The label.
+        """
+        if size >= 1000 and size % 1000 == 0:
+            return f'{size // 1000}k'
+
+        return str(size)
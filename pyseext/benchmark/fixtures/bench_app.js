@@ -0,0 +1,92 @@
+/**
+ * The application our benchmarks are run against, built on our Ext stand-in.
+ *
+ * It is built by calling BenchApp.setUp with a configuration, so that the size of the stores and
+ * depth of the tree can be chosen by the benchmark runner.
+ */
+globalThis.BenchApp = {
+    /**
+     * Builds the application, which must only be done once per page load.
+     *
+     * @param {Object} config            The configuration.
+     * @param {Number} config.fieldCount The number of text fields on the form.
+     * @param {Number[]} config.gridSizes The number of records in each grid, whose ids are 'grid' + size.
+     * @param {Number} config.treeDepth   The depth of the tree.
+     * @param {Number} config.treeBreadth The number of nodes at each level of the tree.
+     * @param {Number} config.loadDelay   The number of milliseconds a store load takes.
+     */
+    setUp: function(config) {
+        var appDom = document.getElementById('bench-app'),
+            form,
+            i;
+
+        form = new Ext.form.Panel({ id: 'benchForm' });
+        for (i = 0; i < config.fieldCount; i += 1) {
+            form.add(new Ext.form.field.Text({ name: 'field' + i }));
+        }
+        form.renderTo(appDom);
+
+        config.gridSizes.forEach(function(size) {
+            new Ext.grid.Panel({
+                id: 'grid' + size,
+                columns: [
+                    { text: 'Id', dataIndex: 'id' },
+                    { text: 'Name', dataIndex: 'name' },
+                    { text: 'Value', dataIndex: 'value' }
+                ],
+                store: new Ext.data.Store({ data: BenchApp.createRecords(size), loadDelay: config.loadDelay })
+            }).renderTo(appDom);
+        });
+
+        new Ext.tree.Panel({
+            id: 'deepTree',
+            store: BenchApp.createTreeStore(config.treeDepth, config.treeBreadth, config.loadDelay)
+        }).renderTo(appDom);
+
+        Ext.isDomReady = true;
+    },
+
+    /**
+     * Creates the data for a store.
+     *
+     * @param  {Number} size The number of records.
+     * @return {Object[]}    The record data.
+     */
+    createRecords: function(size) {
+        var records = new Array(size),
+            i;
+
+        for (i = 0; i < size; i += 1) {
+            records[i] = { id: i, name: 'Record ' + i, value: i * 10 };
+        }
+
+        return records;
+    },
+
+    /**
+     * Creates a tree store, where the last node at each level is the parent of the next level,
+     * so that the last node in the tree, 'Node <depth>.<breadth>', is the last one a depth first search finds.
+     *
+     * @param  {Number} depth     The depth of the tree.
+     * @param  {Number} breadth   The number of nodes at each level.
+     * @param  {Number} loadDelay The number of milliseconds a node load takes.
+     * @return {Ext.data.TreeStore} The tree store.
+     */
+    createTreeStore: function(depth, breadth, loadDelay) {
+        var store = new Ext.data.TreeStore({ root: { text: 'Root' }, loadDelay: loadDelay }),
+            parent = store.getRootNode(),
+            level,
+            i,
+            node;
+
+        for (level = 1; level <= depth; level += 1) {
+            for (i = 1; i <= breadth; i += 1) {
+                node = parent.appendChild({ text: 'Node ' + level + '.' + i });
+            }
+
+            parent = node;
+        }
+
+        return store;
+    }
+};
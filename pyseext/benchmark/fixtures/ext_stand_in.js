@@ -0,0 +1,608 @@
+/**
+ * A minimal stand-in for the parts of Ext JS that our JavaScript uses, so that our helpers can be
+ * benchmarked against a page served from disk, without needing Ext JS itself or a network.
+ *
+ * It is not a general purpose implementation; it only behaves as much like Ext JS as our helpers need.
+ */
+(function() {
+    var registry = [],
+        idCounter = 0,
+        pendingLoads = 0,
+        Ext;
+
+    function extend(Parent, Child, xtypes, members) {
+        Child.prototype = Object.create(Parent.prototype);
+        Child.prototype.constructor = Child;
+        Child.prototype.xtypes = xtypes.concat(Parent.prototype.xtypes || []);
+        Child.prototype.xtype = xtypes[0];
+        Object.keys(members || {}).forEach(function(key) {
+            Child.prototype[key] = members[key];
+        });
+
+        return Child;
+    }
+
+    function createElement(tagName, className, parentDom) {
+        var dom = document.createElement(tagName);
+
+        if (className) {
+            dom.className = className;
+        }
+
+        if (parentDom) {
+            parentDom.appendChild(dom);
+        }
+
+        return dom;
+    }
+
+    function raise(error) {
+        throw new Error((error && error.msg) || error);
+    }
+
+    /**
+     * Element wrapper, as returned by Ext.get and Component.getEl.
+     */
+    function Element(dom) {
+        this.dom = dom;
+    }
+
+    Element.prototype.query = function(cssSelector) {
+        return Array.prototype.slice.call(this.dom.querySelectorAll(cssSelector));
+    };
+
+    Element.prototype.down = function(cssSelector, returnDom) {
+        var dom = this.dom.querySelector(cssSelector);
+
+        return returnDom ? dom : (dom && new Element(dom));
+    };
+
+    /**
+     * Components.
+     */
+    function Component(config) {
+        var me = this;
+
+        Object.keys(config || {}).forEach(function(key) {
+            me[key] = config[key];
+        });
+
+        me.id = me.id || ('component-' + (idCounter += 1));
+        me.hidden = !!me.hidden;
+        me.disabled = !!me.disabled;
+        me.items = [];
+        me.el = new Element(createElement('div', 'x-component x-' + me.xtype));
+        me.el.dom.id = me.id;
+
+        registry.push(me);
+        me.initComponent();
+    }
+
+    Component.prototype.xtypes = ['component', 'box'];
+    Component.prototype.xtype = 'component';
+    Component.prototype.initComponent = function() {};
+    Component.prototype.getEl = function() { return this.el; };
+    Component.prototype.isXType = function(xtype) { return this.xtypes.indexOf(xtype) !== -1; };
+    Component.prototype.isDisabled = function() { return this.disabled; };
+    Component.prototype.isHidden = function() { return this.hidden; };
+    Component.prototype.isVisible = function(deep) {
+        var component = this;
+
+        while (component) {
+            if (component.hidden) {
+                return false;
+            }
+
+            component = deep ? component.ownerCt : null;
+        }
+
+        return true;
+    };
+    Component.prototype.add = function(child) {
+        child.ownerCt = this;
+        this.items.push(child);
+        this.el.dom.appendChild(child.el.dom);
+
+        return child;
+    };
+    Component.prototype.renderTo = function(dom) {
+        dom.appendChild(this.el.dom);
+    };
+
+    var Container = extend(Component, function Container(config) { Component.call(this, config); }, ['container']),
+        Panel = extend(Container, function Panel(config) { Container.call(this, config); }, ['panel']),
+        Button = extend(Component, function Button(config) { Component.call(this, config); }, ['button'], {
+            initComponent: function() {
+                createElement('span', 'x-btn-inner', this.el.dom).textContent = this.text || '';
+            }
+        });
+
+    /**
+     * Form fields.
+     */
+    var Base = extend(Component, function Base(config) { Component.call(this, config); }, ['field'], {
+        initComponent: function() {
+            var me = this;
+
+            me.inputEl = new Element(createElement('input', 'x-form-field', me.el.dom));
+            me.inputEl.dom.name = me.name;
+            me.inputEl.dom.type = me.inputType || 'text';
+        },
+        getValue: function() { return this.inputEl.dom.value; },
+        getRawValue: function() { return this.inputEl.dom.value; },
+        getDisplayValue: function() { return this.inputEl.dom.value; },
+        setValue: function(value) { this.inputEl.dom.value = value === null || value === undefined ? '' : value; },
+        focus: function() { this.inputEl.dom.focus(); }
+    });
+
+    Object.defineProperty(Base.prototype, 'hasFocus', {
+        get: function() { return document.activeElement === this.inputEl.dom; }
+    });
+
+    var Text = extend(Base, function Text(config) { Base.call(this, config); }, ['textfield']),
+        ComboBox = extend(Text, function ComboBox(config) { Text.call(this, config); }, ['combobox', 'combo'], {
+            queryMode: 'local',
+            getStore: function() { return this.store; },
+            select: function(record) { this.setValue(record.get(this.displayField || 'name')); },
+            fireEvent: function() {}
+        }),
+        Checkbox = extend(Base, function Checkbox(config) { config.inputType = 'checkbox'; Base.call(this, config); }, ['checkbox', 'checkboxfield'], {
+            getValue: function() { return this.inputEl.dom.checked; },
+            setValue: function(value) { this.inputEl.dom.checked = !!value; }
+        }),
+        Radio = extend(Checkbox, function Radio(config) { Checkbox.call(this, config); config.inputType = 'radio'; }, ['radio', 'radiofield']),
+        FormPanel = extend(Panel, function FormPanel(config) { Panel.call(this, config); }, ['form'], {
+            getForm: function() {
+                var me = this;
+
+                return {
+                    findField: function(name) {
+                        return me.getFields().items.filter(function(field) { return field.name === name; })[0] || null;
+                    },
+                    getFields: function() {
+                        return me.getFields();
+                    }
+                };
+            },
+            getFields: function() {
+                var fields = registry.filter(function(component) {
+                    return component instanceof Base && component.up(function(owner) { return owner === this; }.bind(this));
+                }, this);
+
+                return {
+                    items: fields,
+                    getAt: function(index) { return fields[index]; }
+                };
+            }
+        });
+
+    Component.prototype.up = function(test) {
+        var owner = this.ownerCt;
+
+        while (owner) {
+            if (test(owner)) {
+                return owner;
+            }
+
+            owner = owner.ownerCt;
+        }
+
+        return null;
+    };
+
+    /**
+     * Data.
+     */
+    function Model(data) {
+        this.data = data;
+        this.id = data.id;
+    }
+
+    Model.prototype.get = function(field) { return this.data[field]; };
+    Model.prototype.getData = function() { return this.data; };
+
+    function Store(config) {
+        var me = this;
+
+        me.autoLoad = !!(config && config.autoLoad);
+        me.loadDelay = (config && config.loadDelay) || 20;
+        me.records = ((config && config.data) || []).map(function(data) { return new Model(data); });
+        me.loadCount = me.records.length ? 1 : 0;
+        me.loading = false;
+    }
+
+    Store.prototype.getAutoLoad = function() { return this.autoLoad; };
+    Store.prototype.isLoaded = function() { return this.loadCount > 0; };
+    Store.prototype.isLoading = function() { return this.loading; };
+    Store.prototype.getCount = function() { return this.records.length; };
+    Store.prototype.getAt = function(index) { return this.records[index]; };
+    Store.prototype.getData = function() {
+        var records = this.records;
+
+        return {
+            findIndexBy: function(fn) {
+                for (var i = 0; i < records.length; i += 1) {
+                    if (fn(records[i], records[i].id)) {
+                        return i;
+                    }
+                }
+
+                return -1;
+            }
+        };
+    };
+    Store.prototype.findBy = function(fn) {
+        return this.getData().findIndexBy(fn);
+    };
+    Store.prototype.load = function() {
+        var me = this;
+
+        me.loading = true;
+        pendingLoads += 1;
+
+        setTimeout(function() {
+            me.loading = false;
+            me.loadCount += 1;
+            pendingLoads -= 1;
+        }, me.loadDelay);
+    };
+    Store.prototype.reload = Store.prototype.load;
+
+    /**
+     * Grids, with rows rendered on demand, as a buffered renderer would.
+     */
+    var GridPanel = extend(Panel, function GridPanel(config) { Panel.call(this, config); }, ['gridpanel', 'grid', 'tablepanel'], {
+        initComponent: function() {
+            var me = this,
+                headerDom = createElement('div', 'x-grid-header-ct', me.el.dom);
+
+            me.bodyDom = createElement('div', 'x-grid-body', me.el.dom);
+            me.renderedRows = {};
+            me.selection = [];
+            me.headerCt = {
+                gridDataColumns: (me.columns || []).map(function(column) {
+                    var columnHeader = new Component({ text: column.text, dataIndex: column.dataIndex, hidden: column.hidden });
+
+                    headerDom.appendChild(columnHeader.el.dom);
+                    columnHeader.el.dom.textContent = column.text;
+                    createElement('div', 'x-column-header-trigger', columnHeader.el.dom);
+
+                    return columnHeader;
+                })
+            };
+        },
+        getStore: function() { return this.store; },
+        getSelectionModel: function() {
+            var me = this;
+
+            return {
+                getSelection: function() { return me.selection; },
+                deselectAll: function() { me.selection = []; }
+            };
+        },
+        getView: function() {
+            var me = this;
+
+            return {
+                getRow: function(index) {
+                    var record = me.store.getAt(index),
+                        rowDom = me.renderedRows[index];
+
+                    if (!record) {
+                        return null;
+                    }
+
+                    if (!rowDom) {
+                        rowDom = createElement('div', 'x-grid-row', me.bodyDom);
+                        rowDom.textContent = (me.columns || []).map(function(column) { return record.get(column.dataIndex); }).join(' | ');
+                        rowDom.addEventListener('click', function() { me.selection = [record]; });
+                        me.renderedRows[index] = rowDom;
+                    }
+
+                    return rowDom;
+                }
+            };
+        }
+    });
+
+    /**
+     * Trees, with node rows rendered on demand.
+     */
+    function NodeInterface(data, parentNode) {
+        this.data = data;
+        this.parentNode = parentNode || null;
+        this.childNodes = [];
+        this.loading = false;
+    }
+
+    NodeInterface.prototype.appendChild = function(data) {
+        var child = new NodeInterface(data, this);
+
+        child.treeStore = this.treeStore;
+        this.childNodes.push(child);
+
+        return child;
+    };
+    NodeInterface.prototype.isLoading = function() { return this.loading; };
+    NodeInterface.prototype.getTreeStore = function() { return this.treeStore; };
+    NodeInterface.prototype.cascadeBy = function(fn) {
+        if (fn(this) !== false) {
+            for (var i = 0; i < this.childNodes.length; i += 1) {
+                this.childNodes[i].cascadeBy(fn);
+            }
+        }
+    };
+    NodeInterface.prototype.findChildBy = function(fn, scope, deep) {
+        var i,
+            child,
+            found;
+
+        for (i = 0; i < this.childNodes.length; i += 1) {
+            child = this.childNodes[i];
+
+            if (fn.call(scope || child, child)) {
+                return child;
+            }
+
+            if (deep) {
+                found = child.findChildBy(fn, scope, deep);
+
+                if (found) {
+                    return found;
+                }
+            }
+        }
+
+        return null;
+    };
+
+    function TreeStore(config) {
+        this.loadDelay = (config && config.loadDelay) || 20;
+        this.root = new NodeInterface((config && config.root) || { text: 'Root' });
+        this.root.treeStore = this;
+    }
+
+    TreeStore.prototype.getRootNode = function() { return this.root; };
+    TreeStore.prototype.load = function(options) {
+        var node = (options && options.node) || this.root;
+
+        node.loading = true;
+        pendingLoads += 1;
+
+        setTimeout(function() {
+            node.loading = false;
+            pendingLoads -= 1;
+        }, this.loadDelay);
+    };
+
+    var TreePanel = extend(Panel, function TreePanel(config) { Panel.call(this, config); }, ['treepanel', 'tablepanel'], {
+        initComponent: function() {
+            this.bodyDom = createElement('div', 'x-tree-body', this.el.dom);
+            this.renderedNodes = new Map();
+        },
+        getStore: function() { return this.store; },
+        getRootNode: function() { return this.store.getRootNode(); },
+        getView: function() {
+            var me = this;
+
+            return {
+                getNode: function(node) {
+                    var rowDom = me.renderedNodes.get(node);
+
+                    if (!rowDom) {
+                        rowDom = createElement('div', 'x-grid-row x-tree-row', me.bodyDom);
+                        createElement('span', 'x-tree-expander', rowDom);
+                        createElement('span', 'x-tree-icon', rowDom);
+                        createElement('span', 'x-tree-node-text', rowDom).textContent = node.data.text;
+                        me.renderedNodes.set(node, rowDom);
+                    }
+
+                    return rowDom;
+                }
+            };
+        }
+    });
+
+    /**
+     * Component queries, supporting descendant selectors made of an xtype (or *), #id,
+     * [attribute=value] and {member(args) === value} parts, e.g. '#form textfield[name="email"]{isVisible(true)}'.
+     */
+    function parseValue(text) {
+        text = text.trim();
+
+        if (text === '') {
+            return undefined;
+        }
+
+        if (/^["'].*["']$/.test(text)) {
+            return text.slice(1, -1);
+        }
+
+        try {
+            return JSON.parse(text);
+        } catch (e) {
+            return text;
+        }
+    }
+
+    function parseSimpleSelector(text) {
+        var part = { xtype: null, id: null, attributes: [], members: [] },
+            pattern = /#([\w-]+)|\[\s*([\w.]+)\s*=\s*("[^"]*"|'[^']*'|[^\]]*)\s*\]|\{\s*(\w+)\(([^)]*)\)\s*(?:(===|!==|==|!=)\s*([^}]*))?\}/g,
+            match,
+            xtypeMatch = /^(\*|[\w.-]+)/.exec(text);
+
+        if (xtypeMatch) {
+            part.xtype = xtypeMatch[1] === '*' ? null : xtypeMatch[1];
+        }
+
+        while ((match = pattern.exec(text))) {
+            if (match[1]) {
+                part.id = match[1];
+            } else if (match[2]) {
+                part.attributes.push({ name: match[2], value: parseValue(match[3]) });
+            } else {
+                part.members.push({
+                    name: match[4],
+                    args: match[5].trim() ? match[5].split(',').map(parseValue) : [],
+                    operator: match[6],
+                    value: match[7] !== undefined ? parseValue(match[7]) : undefined
+                });
+            }
+        }
+
+        return part;
+    }
+
+    function splitSelector(selector) {
+        var parts = [],
+            depth = 0,
+            current = '',
+            i,
+            character;
+
+        for (i = 0; i < selector.length; i += 1) {
+            character = selector[i];
+
+            if (character === '[' || character === '{') {
+                depth += 1;
+            } else if (character === ']' || character === '}') {
+                depth -= 1;
+            }
+
+            if (/\s/.test(character) && depth === 0) {
+                if (current) {
+                    parts.push(current);
+                }
+
+                current = '';
+            } else {
+                current += character;
+            }
+        }
+
+        if (current) {
+            parts.push(current);
+        }
+
+        return parts.map(parseSimpleSelector);
+    }
+
+    function matches(component, part) {
+        var i,
+            member,
+            result;
+
+        if (part.xtype && part.xtype !== 'component' && !component.isXType(part.xtype)) {
+            return false;
+        }
+
+        if (part.id && component.id !== part.id && component.itemId !== part.id) {
+            return false;
+        }
+
+        for (i = 0; i < part.attributes.length; i += 1) {
+            if (String(component[part.attributes[i].name]) !== String(part.attributes[i].value)) {
+                return false;
+            }
+        }
+
+        for (i = 0; i < part.members.length; i += 1) {
+            member = part.members[i];
+            result = typeof component[member.name] === 'function' ? component[member.name].apply(component, member.args) : component[member.name];
+
+            if (member.operator === '===' || member.operator === '==') {
+                if (result !== member.value) {
+                    return false;
+                }
+            } else if (member.operator === '!==' || member.operator === '!=') {
+                if (result === member.value) {
+                    return false;
+                }
+            } else if (!result) {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    function matchesAncestors(component, parts, root) {
+        var partIndex = parts.length - 1,
+            owner = component.ownerCt;
+
+        while (partIndex >= 0 && owner && owner !== root) {
+            if (matches(owner, parts[partIndex])) {
+                partIndex -= 1;
+            }
+
+            owner = owner.ownerCt;
+        }
+
+        return partIndex < 0;
+    }
+
+    function isDescendant(component, root) {
+        return !root || !!component.up(function(owner) { return owner === root; });
+    }
+
+    Ext = {
+        isDomReady: false,
+        Element: Element,
+        Component: Component,
+        container: { Container: Container },
+        panel: { Panel: Panel },
+        button: { Button: Button },
+        form: {
+            Panel: FormPanel,
+            field: { Base: Base, Text: Text, ComboBox: ComboBox, Checkbox: Checkbox, Radio: Radio }
+        },
+        grid: { Panel: GridPanel },
+        tree: { Panel: TreePanel },
+        data: { Model: Model, Store: Store, AbstractStore: Store, TreeStore: TreeStore, NodeInterface: NodeInterface },
+
+        ComponentQuery: {
+            query: function(selector, root) {
+                var parts = splitSelector(selector),
+                    last = parts.pop();
+
+                return registry.filter(function(component) {
+                    return matches(component, last) && isDescendant(component, root) && matchesAncestors(component, parts, root);
+                });
+            }
+        },
+        ClassManager: {
+            get: function(className) {
+                return className.split('.').slice(1).reduce(function(namespace, name) {
+                    return namespace && namespace[name];
+                }, Ext);
+            }
+        },
+        Ajax: {
+            isLoading: function() { return pendingLoads > 0; }
+        },
+        JSON: {
+            encode: function(value) { return JSON.stringify(value); },
+            decode: function(text) { return JSON.parse(text); }
+        },
+        Error: { raise: raise },
+        Function: {
+            defer: function(fn, millis, scope, args) { return setTimeout(function() { fn.apply(scope, args || []); }, millis); }
+        },
+        raise: raise,
+        getCmp: function(id) {
+            return registry.filter(function(component) { return component.id === id; })[0];
+        },
+        get: function(dom) { return dom && new Element(dom); },
+        create: function(className, config) { return new (Ext.ClassManager.get(className))(config); },
+        callback: function(fn, scope, args) { return fn && fn.apply(scope, args || []); },
+        defer: function(fn, millis, scope, args) { return Ext.Function.defer(fn, millis, scope, args); },
+        undefer: function(id) { clearTimeout(id); },
+        isString: function(value) { return typeof value === 'string'; },
+        isNumber: function(value) { return typeof value === 'number' && isFinite(value); },
+        isDate: function(value) { return value instanceof Date; },
+        isFunction: function(value) { return typeof value === 'function'; },
+        isDefined: function(value) { return value !== undefined; }
+    };
+
+    globalThis.Ext = Ext;
+})();
@@ -2,15 +2,17 @@
 Module that contains our ButtonHelper class.
 """
 
-import logging
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.remote.webdriver import WebDriver
+from pyseext.session import Session
+from pyseext.instrumented_helper import InstrumentedHelper
+from pyseext.logging_policy import LoggingPolicy
 
-from pyseext.component_query import ComponentQuery
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from pyseext.component_query import ComponentQuery
 
-class ButtonHelper:
+class ButtonHelper(InstrumentedHelper):
     """A class to help with interacting with Ext buttons"""
 
     # Class variables
@@ -26,22 +28,29 @@ class ButtonHelper:
     """The component query template to use to find a button on a visible message box.
     Requires the inserts: {text}"""
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
+        from selenium.webdriver.common.action_chains import ActionChains
+
         # Instance variables
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
-        self._cq = ComponentQuery(driver)
-        """The `ComponentQuery` instance for this class instance"""
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
 
         self._action_chains = ActionChains(driver)
         """The ActionChains instance for this class instance"""
 
+    @property
+    def _cq(self) -> 'ComponentQuery':
+        """The `ComponentQuery` instance for our driver, from its `Session`"""
+        return Session(self._driver).component_query
+
     def click_button(self, cq: str, root_id: Union[str, None] = None):
         """Finds a button using the supplied component query and clicks it.
 
@@ -0,0 +1,264 @@
+"""
+Module that contains our CallBatch class.
+"""
+from typing import Any, Callable, Hashable, TYPE_CHECKING, Union
+from weakref import WeakKeyDictionary
+
+from selenium.common.exceptions import JavascriptException
+
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from pyseext.has_referenced_javascript import HasReferencedJavaScript
+
+class CallBatch:
+    """A context manager that coalesces calls to our JavaScript into a single roundtrip to the browser.
+
+    While a batch is active for a driver, helper methods that only read from the page (such as
+    `FieldHelper.get_field_value` or `GridHelper.is_column_visible`) do not call the browser, but
+    return a `CallBatch.DeferredResult` instead. When the batch exits, all of the queued calls are made
+    in a single roundtrip, and each deferred result is resolved with its value or exception.
+    The calls are made in the same way as single calls, so use DevTools or compressed payloads when the
+    helper that queued the first call is set to, see `HasReferencedJavaScript.USE_COMPRESSED_PAYLOADS`.
+
+    Any other helper call made within the batch flushes the queued calls first, so calls reach the
+    browser in the order they were made. Checks that deferred reads make first, such as waiting for a grid
+    to be visible, are only made once per batch, see `add_check`. Note that calls made directly on the WebDriver do not flush
+    the batch, so if a deferred read must see the page before such a call then use `flush` first.
+
+    e.g.
+        with pyseext.batch(driver):
+            name = field_helper.get_field_value(form_cq, 'name')
+            age = field_helper.get_field_value(form_cq, 'age')
+
+        print(name.result(), age.result())
+    """
+
+    # Class variables
+    _active_batches: 'WeakKeyDictionary[WebDriver, CallBatch]' = WeakKeyDictionary()
+    """The currently active batch for each WebDriver"""
+
+    def __init__(self, driver: 'WebDriver'):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver whose calls are to be batched.
+        """
+        self._logger = LoggingPolicy.get_logger(__name__)
+        """The Logger instance for this class instance"""
+
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        self._calls: list[CallBatch._DeferredCall] = []
+        """The calls that have been queued, but not yet made"""
+
+        self._previous_batch: Union[CallBatch, None] = None
+        """The batch that was active for our driver when we were entered, which is restored when we exit"""
+
+        self._checks: set[Hashable] = set()
+        """The checks that have been made within this batch"""
+
+    def __enter__(self) -> 'CallBatch':
+        """Makes this batch the active batch for its driver.
+
+        If another batch is already active then its queued calls are made first.
+
+        Returns:
+            CallBatch: This batch.
+        """
+        self._previous_batch = CallBatch._active_batches.get(self._driver)
+
+        if self._previous_batch:
+            self._previous_batch.flush()
+
+        CallBatch._active_batches[self._driver] = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Makes the queued calls, unless an exception is being raised, and restores the previously active batch."""
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                self._calls = []
+        finally:
+            if self._previous_batch:
+                CallBatch._active_batches[self._driver] = self._previous_batch
+            else:
+                CallBatch._active_batches.pop(self._driver, None)
+
+    @staticmethod
+    def get_active(driver: 'WebDriver') -> Union['CallBatch', None]:
+        """Gets the active batch for a driver.
+
+        Args:
+            driver (WebDriver): The webdriver.
+
+        Returns:
+            Union[CallBatch, None]: The active batch, or None if there is not one.
+        """
+        return CallBatch._active_batches.get(driver)
+
+    def add(self,
+            helper: 'HasReferencedJavaScript',
+            function_name: str,
+            args: tuple,
+            result_handler: Union[Callable[[Any], Any], None] = None) -> 'CallBatch.DeferredResult':
+        """Queues a call to one of a helper's JavaScript functions.
+
+        Args:
+            helper (HasReferencedJavaScript): The helper whose JavaScript function is to be called.
+            function_name (str): The name of the function to call.
+            args (tuple): The arguments for the function.
+            result_handler (Callable[[Any], Any], optional): A function to convert the result of the call into the value
+                                                             of the deferred result. It may raise an exception. Defaults to None.
+
+        Returns:
+            CallBatch.DeferredResult: The result that will be resolved when the batch is flushed.
+        """
+        call = CallBatch._DeferredCall(helper, function_name, args, result_handler)
+        self._calls.append(call)
+
+        return call.deferred_result
+
+    def add_check(self, check: Hashable) -> bool:
+        """Records a check that only needs to be made once within this batch, such as waiting for a grid
+        to be visible before reading from it, so that reads after the first can be deferred.
+
+        Args:
+            check (Hashable): Identifies the check, e.g. ('GridHelper.visible', grid_cq).
+
+        Returns:
+            bool: True if the check has not already been made within this batch, so should be made now, False otherwise.
+        """
+        if check in self._checks:
+            return False
+
+        self._checks.add(check)
+        return True
+
+    def flush(self):
+        """Makes all of the queued calls in a single roundtrip, resolving their deferred results."""
+        if not self._calls:
+            return
+
+        calls, self._calls = self._calls, []
+
+        self._logger.debug("Flushing batch of %d calls", len(calls))
+        results = calls[0].helper._call_functions([(call.helper, call.function_name, call.args) for call in calls]) # pylint: disable=protected-access
+
+        for call, result in zip(calls, results):
+            if 'error' in result:
+                call.deferred_result.set_exception(JavascriptException(result['error']))
+                continue
+
+            value = result.get('value')
+
+            try:
+                if call.result_handler:
+                    value = call.result_handler(value)
+            except Exception as exc: # pylint: disable=broad-exception-caught
+                call.deferred_result.set_exception(exc)
+            else:
+                call.deferred_result.set_result(value)
+
+    class _DeferredCall:
+        """A call that has been queued on a batch."""
+
+        def __init__(self,
+                     helper: 'HasReferencedJavaScript',
+                     function_name: str,
+                     args: tuple,
+                     result_handler: Union[Callable[[Any], Any], None]):
+            """Initialises an instance of this class
+
+            Args:
+                helper (HasReferencedJavaScript): The helper whose JavaScript function is to be called.
+                function_name (str): The name of the function to call.
+                args (tuple): The arguments for the function.
+                result_handler (Callable[[Any], Any], optional): A function to convert the result of the call.
+            """
+            self.helper = helper
+            """The helper whose JavaScript function is to be called"""
+
+            self.function_name = function_name
+            """The name of the function to call"""
+
+            self.args = args
+            """The arguments for the function"""
+
+            self.result_handler = result_handler
+            """The function to convert the result of the call, if any"""
+
+            self.deferred_result = CallBatch.DeferredResult()
+            """The result that is resolved when the call has been made"""
+
+    class DeferredResult:
+        """The result of a call that has been queued on a batch, which is resolved when the batch is flushed."""
+
+        def __init__(self):
+            """Initialises an instance of this class"""
+            self._is_resolved: bool = False
+            self._value: Any = None
+            self._exception: Union[Exception, None] = None
+
+        def is_resolved(self) -> bool:
+            """Indicates whether the call has been made.
+
+            Returns:
+                bool: True if the call has been made, False otherwise.
+            """
+            return self._is_resolved
+
+        def result(self) -> Any:
+            """Gets the result of the call.
+
+            If the call raised an exception then that exception is raised here.
+
+            Returns:
+                Any: The result of the call.
+            """
+            if not self._is_resolved:
+                raise CallBatch.NotFlushedException()
+
+            if self._exception is not None:
+                raise self._exception
+
+            return self._value
+
+        def set_result(self, value: Any):
+            """Resolves this result with a value.
+
+            Args:
+                value (Any): The result of the call.
+            """
+            self._value = value
+            self._is_resolved = True
+
+        def set_exception(self, exception: Exception):
+            """Resolves this result with an exception.
+
+            Args:
+                exception (Exception): The exception raised by the call.
+            """
+            self._exception = exception
+            self._is_resolved = True
+
+    class NotFlushedException(Exception):
+        """Exception class thrown when the result of a deferred call is requested before its batch has been flushed."""
+
+        def __init__(self, message: str = "The result is not available until its batch has been flushed."):
+            """Initialises an instance of this exception
+
+            Args:
+                message (str, optional): The exception message. Defaults to "The result is not available until its batch has been flushed.".
+            """
+            self.message = message
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message
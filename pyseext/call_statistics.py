@@ -0,0 +1,178 @@
+"""
+Module that contains our CallStatistics class.
+"""
+import json
+import threading
+from typing import Any
+
+from pyseext.instrumentation import Instrumentation
+
+class CallStatistics(Instrumentation.Listener):
+    """An instrumentation listener that aggregates statistics per public helper method,
+    such as the number of browser roundtrips and the time spent executing versus waiting.
+
+    Statistics for a method include those of any helper methods it calls, so they answer
+    questions such as "how many roundtrips does `FieldHelper.set_field_value` make?".
+
+    Can be used as a context manager, which adds it as a listener on entry and removes it on exit.
+
+    e.g.
+        with CallStatistics() as statistics:
+            field_helper.set_field_value(form_cq, 'name', 'Bob')
+
+        print(statistics.get_statistics()['FieldHelper.set_field_value']['roundtrips'])
+        statistics.dump('pyseext_statistics.json')
+    """
+
+    def __init__(self):
+        """Initialises an instance of this class"""
+        self._lock = threading.Lock()
+        """The lock that protects our statistics, since spans can end on multiple threads"""
+
+        self._statistics: dict[str, CallStatistics.MethodStatistics] = {}
+        """The statistics for each method, keyed on name, e.g. 'GridHelper.click_row'"""
+
+    def __enter__(self) -> 'CallStatistics':
+        """Adds this instance as an instrumentation listener.
+
+        Returns:
+            CallStatistics: This instance.
+        """
+        Instrumentation.add_listener(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Removes this instance as an instrumentation listener."""
+        Instrumentation.remove_listener(self)
+
+    def on_span_end(self, span: Instrumentation.Span):
+        """Adds an ended method span to the statistics for its method.
+
+        Args:
+            span (Instrumentation.Span): The span.
+        """
+        if span.kind != Instrumentation.SPAN_KIND_METHOD:
+            return
+
+        with self._lock:
+            method_statistics = self._statistics.get(span.name)
+
+            if method_statistics is None:
+                method_statistics = CallStatistics.MethodStatistics()
+                self._statistics[span.name] = method_statistics
+
+            method_statistics.add_span(span)
+
+    def get_statistics(self) -> dict[str, dict[str, Any]]:
+        """Gets the statistics recorded so far.
+
+        Returns:
+            dict[str, dict[str, Any]]: The statistics for each method that has been called, keyed on name
+                                       and ordered by total time, longest first.
+        """
+        with self._lock:
+            items = [(name, method_statistics.to_dict()) for name, method_statistics in self._statistics.items()]
+
+        items.sort(key=lambda item: item[1]['total_time'], reverse=True)
+        return dict(items)
+
+    def reset(self):
+        """Discards the statistics recorded so far."""
+        with self._lock:
+            self._statistics = {}
+
+    def to_json(self, indent: int = 2) -> str:
+        """Gets the statistics recorded so far as JSON.
+
+        Args:
+            indent (int, optional): The indent to use. Defaults to 2.
+
+        Returns:
+            str: The JSON.
+        """
+        return json.dumps(self.get_statistics(), indent=indent)
+
+    def dump(self, file_path: str):
+        """Writes the statistics recorded so far to a file as JSON.
+
+        Args:
+            file_path (str): The path of the file to write.
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(self.to_json())
+
+    class MethodStatistics:
+        """The statistics aggregated for a single method."""
+
+        def __init__(self):
+            """Initialises an instance of this class"""
+            self.calls: int = 0
+            """The number of calls"""
+
+            self.errors: int = 0
+            """The number of calls that raised an exception"""
+
+            self.roundtrips: int = 0
+            """The total number of roundtrips made"""
+
+            self.max_roundtrips: int = 0
+            """The largest number of roundtrips made by a single call"""
+
+            self.total_time: float = 0.0
+            """The total number of seconds spent in calls"""
+
+            self.max_time: float = 0.0
+            """The longest time taken by a single call, in seconds"""
+
+            self.roundtrip_time: float = 0.0
+            """The total number of seconds spent executing roundtrips"""
+
+            self.wait_time: float = 0.0
+            """The total number of seconds spent not executing roundtrips, i.e. waiting"""
+
+            self.bytes_sent: int = 0
+            """The total approximate size of the payloads sent"""
+
+            self.bytes_received: int = 0
+            """The total approximate size of the payloads received"""
+
+        def add_span(self, span: Instrumentation.Span):
+            """Adds an ended span for a call to our statistics.
+
+            Args:
+                span (Instrumentation.Span): The span.
+            """
+            duration = span.duration
+
+            self.calls += 1
+            self.errors += 1 if span.exception is not None else 0
+            self.roundtrips += span.roundtrip_count
+            self.max_roundtrips = max(self.max_roundtrips, span.roundtrip_count)
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+            self.roundtrip_time += span.roundtrip_time
+            self.wait_time += span.wait_time
+            self.bytes_sent += span.bytes_sent
+            self.bytes_received += span.bytes_received
+
+        def to_dict(self) -> dict[str, Any]:
+            """Gets these statistics as a dictionary, including averages per call.
+
+            Returns:
+                dict[str, Any]: The statistics.
+            """
+            return {
+                'calls': self.calls,
+                'errors': self.errors,
+                'roundtrips': self.roundtrips,
+                'mean_roundtrips': self.roundtrips / self.calls,
+                'max_roundtrips': self.max_roundtrips,
+                'total_time': self.total_time,
+                'mean_time': self.total_time / self.calls,
+                'max_time': self.max_time,
+                'roundtrip_time': self.roundtrip_time,
+                'mean_roundtrip_time': self.roundtrip_time / self.roundtrips if self.roundtrips else 0.0,
+                'wait_time': self.wait_time,
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received
+            }
@@ -0,0 +1,224 @@
+"""
+Module that contains our ChromeTracer class.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Union
+
+from pyseext.instrumentation import Instrumentation
+
+class ChromeTracer(Instrumentation.Listener):
+    """An instrumentation listener that records a timeline of helper activity in the Chrome trace event format,
+    which can be loaded into chrome://tracing or https://ui.perfetto.dev.
+
+    Helper method calls, expectation polls and calls to our JavaScript are shown as nested spans, with the
+    WebDriver commands they make (e.g. 'executeScript', or 'actions' for an `ActionChains.perform`) inside them.
+    Time spent waiting shows as the gaps between them.
+
+    Can be used as a context manager, which adds it as a listener on entry and removes it on exit,
+    writing the trace if a file path was given.
+
+    e.g.
+        with ChromeTracer('test_edit_person.trace.json'):
+            grid_helper.filter_string_column('gridpanel', 'surname', 'Smith')
+    """
+
+    # Public class properties
+    ROUNDTRIP_CATEGORY: str = 'roundtrip'
+    """The category given to the events for WebDriver commands"""
+
+    HTTP_CATEGORY: str = 'http'
+    """The category given to the events for HTTP requests to a remote end, for instrumented connections"""
+
+    MAX_ARGUMENT_LENGTH: int = 200
+    """The maximum length of the representation of each call argument recorded with an event"""
+
+    def __init__(self, file_path: Union[str, None] = None):
+        """Initialises an instance of this class
+
+        Args:
+            file_path (str, optional): The path of the file to write the trace to when used as a context manager. Defaults to None.
+        """
+        self._file_path = file_path
+        """The path of the file to write the trace to when used as a context manager"""
+
+        self._lock = threading.Lock()
+        """The lock that protects our events, since spans can end on multiple threads"""
+
+        self._events: list[dict[str, Any]] = []
+        """The trace events recorded so far"""
+
+        self._thread_ids: set[int] = set()
+        """The identifiers of the threads that we have recorded the names of"""
+
+        self._process_id = os.getpid()
+        """The process identifier used for our events"""
+
+        self._origin = time.perf_counter()
+        """The `time.perf_counter` value that our event timestamps are relative to"""
+
+    def __enter__(self) -> 'ChromeTracer':
+        """Adds this instance as an instrumentation listener.
+
+        Returns:
+            ChromeTracer: This instance.
+        """
+        Instrumentation.add_listener(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Removes this instance as an instrumentation listener, and writes the trace if we have a file path."""
+        Instrumentation.remove_listener(self)
+
+        if self._file_path:
+            self.dump(self._file_path)
+
+    def on_span_end(self, span: Instrumentation.Span):
+        """Records an event for an ended span.
+
+        Args:
+            span (Instrumentation.Span): The span.
+        """
+        args: dict[str, Any] = {
+            'roundtrips': span.roundtrip_count,
+            'roundtrip_ms': round(span.roundtrip_time * 1000, 3),
+            'wait_ms': round(span.wait_time * 1000, 3)
+        }
+
+        if span.args:
+            args['args'] = [self._get_argument_repr(arg) for arg in span.args]
+
+        if span.kwargs:
+            args['kwargs'] = {key: self._get_argument_repr(value) for key, value in span.kwargs.items()}
+
+        if span.exception is not None:
+            args['exception'] = self._get_argument_repr(span.exception)
+
+        self._add_event(span.name, span.kind, span.thread_id, span.start_time, span.duration, args)
+
+    def on_roundtrip(self, roundtrip: Instrumentation.Roundtrip):
+        """Records an event for a completed roundtrip.
+
+        Args:
+            roundtrip (Instrumentation.Roundtrip): The roundtrip.
+        """
+        args: dict[str, Any] = {
+            'bytes_sent': roundtrip.bytes_sent,
+            'bytes_received': roundtrip.bytes_received
+        }
+
+        if roundtrip.exception is not None:
+            args['exception'] = self._get_argument_repr(roundtrip.exception)
+
+        self._add_event(roundtrip.command, self.ROUNDTRIP_CATEGORY, roundtrip.thread_id, roundtrip.start_time, roundtrip.duration, args)
+
+    def on_http_request(self, http_request: Instrumentation.HttpRequest):
+        """Records an event for a completed HTTP request to a remote end.
+
+        Args:
+            http_request (Instrumentation.HttpRequest): The request.
+        """
+        args: dict[str, Any] = {
+            'url': http_request.url,
+            'bytes_sent': http_request.bytes_sent
+        }
+
+        if http_request.exception is not None:
+            args['exception'] = self._get_argument_repr(http_request.exception)
+
+        self._add_event(http_request.method, self.HTTP_CATEGORY, http_request.thread_id, http_request.start_time, http_request.duration, args)
+
+    def get_trace(self) -> dict[str, Any]:
+        """Gets the trace recorded so far.
+
+        Returns:
+            dict[str, Any]: The trace, in the Chrome trace event JSON object format.
+        """
+        with self._lock:
+            events = list(self._events)
+
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms'
+        }
+
+    def reset(self):
+        """Discards the events recorded so far."""
+        with self._lock:
+            self._events = []
+            self._thread_ids = set()
+
+    def dump(self, file_path: str):
+        """Writes the trace recorded so far to a file.
+
+        Args:
+            file_path (str): The path of the file to write.
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.get_trace(), file)
+
+    def _add_event(self, name: str, category: str, thread_id: int, start_time: float, duration: float, args: dict[str, Any]):
+        """Adds a complete event to our events.
+
+        Args:
+            name (str): The name of the event.
+            category (str): The category of the event.
+            thread_id (int): The identifier of the thread the event happened on.
+            start_time (float): The time the event started, from `time.perf_counter`.
+            duration (float): The duration of the event, in seconds.
+            args (dict[str, Any]): The arguments to show for the event.
+        """
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start_time - self._origin) * 1000000, 3),
+            'dur': round(duration * 1000000, 3),
+            'pid': self._process_id,
+            'tid': thread_id,
+            'args': args
+        }
+
+        with self._lock:
+            if thread_id not in self._thread_ids:
+                self._thread_ids.add(thread_id)
+                self._events.append(self._get_thread_name_event(thread_id))
+
+            self._events.append(event)
+
+    def _get_thread_name_event(self, thread_id: int) -> dict[str, Any]:
+        """Gets the metadata event that names a thread.
+
+        Args:
+            thread_id (int): The identifier of the thread.
+
+        Returns:
+            dict[str, Any]: The event.
+        """
+        thread_name = next((thread.name for thread in threading.enumerate() if thread.ident == thread_id), str(thread_id))
+
+        return {
+            'name': 'thread_name',
+            'ph': 'M',
+            'pid': self._process_id,
+            'tid': thread_id,
+            'args': {'name': thread_name}
+        }
+
+    def _get_argument_repr(self, value: Any) -> str:
+        """Gets the representation of a value to record with an event, truncated to `MAX_ARGUMENT_LENGTH`.
+
+        Args:
+            value (Any): The value.
+
+        Returns:
+            str: The representation.
+        """
+        value_repr = repr(value)
+
+        if len(value_repr) > self.MAX_ARGUMENT_LENGTH:
+            value_repr = value_repr[:self.MAX_ARGUMENT_LENGTH] + '...'
+
+        return value_repr
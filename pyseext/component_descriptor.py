@@ -0,0 +1,134 @@
+"""
+Module that contains our ComponentDescriptor class.
+"""
+from typing import Any, TYPE_CHECKING, Union
+
+from pyseext.session import Session
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+class ComponentDescriptor:
+    """A compact description of an element matched by a component query, as returned by `ComponentQuery.describe`.
+
+    Everything a test usually asks of a matched element, such as whether it is visible or what its text is,
+    is computed in the browser in the same call as the query, so reading it costs no further roundtrips.
+    The `WebElement` itself is only resolved when an interaction needs it, see `get_element`.
+    """
+
+    def __init__(self,
+                 driver: 'WebDriver',
+                 description: dict[str, Any],
+                 cq: str,
+                 root_id: Union[str, None] = None,
+                 css_selector: Union[str, None] = None,
+                 index: int = 0):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver the query was executed with.
+            description (dict[str, Any]): The description returned from the browser.
+            cq (str): The query that matched the element.
+            root_id (str, optional): The id of the container within which the query was performed.
+            css_selector (str, optional): The CSS selector used to get child elements of the found components.
+            index (int, optional): The position of the element in the results of the query. Defaults to 0.
+        """
+        # Instance variables
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        self.cq = cq
+        """The query that matched the element"""
+
+        self.root_id = root_id
+        """The id of the container within which the query was performed, if any"""
+
+        self.css_selector = css_selector
+        """The CSS selector used to get child elements of the found components, if any"""
+
+        self.index = index
+        """The position of the element in the results of the query"""
+
+        self.component_id: str = description.get('componentId')
+        """The id of the component that matched the query"""
+
+        self.element_id: Union[str, None] = description.get('elementId')
+        """The id of the DOM element, if it has one"""
+
+        self.xtype: Union[str, None] = description.get('xtype')
+        """The xtype of the component"""
+
+        self.is_visible: bool = bool(description.get('visible'))
+        """Whether the component is visible, including its ancestors, when it was described"""
+
+        self.is_disabled: bool = bool(description.get('disabled'))
+        """Whether the component was disabled when it was described"""
+
+        self.text: str = description.get('text') or ''
+        """The rendered text of the DOM element, trimmed in the same way as `WebElement.text`"""
+
+        self.rect: Union[dict[str, float], None] = description.get('rect')
+        """The bounding rectangle of the DOM element, relative to the viewport, with the keys 'x', 'y', 'width' and 'height'"""
+
+        self._element: Union['WebElement', None] = None
+        """The DOM element, once it has been resolved"""
+
+    def get_element(self) -> 'WebElement':
+        """Resolves the DOM element that was described, which costs a roundtrip the first time it is called.
+
+        The element is found by its id if it has one, otherwise the query is executed again.
+
+        Returns:
+            WebElement: The DOM element.
+
+        Raises:
+            ElementNoLongerMatchedException: If the element can no longer be found.
+        """
+        if self._element is None:
+            if self.element_id:
+                from selenium.common.exceptions import NoSuchElementException
+                from selenium.webdriver.common.by import By
+
+                try:
+                    self._element = self._driver.find_element(By.ID, self.element_id)
+                except NoSuchElementException as exc:
+                    raise ComponentDescriptor.ElementNoLongerMatchedException(self) from exc
+            else:
+                results = Session(self._driver).component_query.query(self.cq, self.root_id, self.css_selector)
+
+                if len(results) <= self.index:
+                    raise ComponentDescriptor.ElementNoLongerMatchedException(self)
+
+                self._element = results[self.index]
+
+        return self._element
+
+    def __repr__(self) -> str:
+        """Returns a string representation of this descriptor"""
+        return (f"ComponentDescriptor(component_id={self.component_id!r}, element_id={self.element_id!r}, "
+                f"xtype={self.xtype!r}, is_visible={self.is_visible!r}, is_disabled={self.is_disabled!r}, text={self.text!r})")
+
+    class ElementNoLongerMatchedException(Exception):
+        """Exception class thrown when the element for a descriptor can no longer be found"""
+
+        def __init__(self,
+                     descriptor: 'ComponentDescriptor',
+                     message: str = "The element described for component '{component_id}' from component query '{cq}' can no longer be found."):
+            """Initialises an instance of this exception
+
+            Args:
+                descriptor (ComponentDescriptor): The descriptor whose element could not be found.
+                message (str, optional): The message for the exception. Must contain a 'component_id' and 'cq' format inserts.
+                                         Defaults to "The element described for component '{component_id}' from component query '{cq}' can no longer be found.".
+            """
+            self.message = message
+            self._component_id = descriptor.component_id
+            self._cq = descriptor.cq
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message.format(component_id=self._component_id, cq=self._cq)
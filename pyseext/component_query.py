@@ -1,53 +1,32 @@
 """
 Module that contains our ComponentQuery class.
 """
-import logging
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.wait import WebDriverWait
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.session import Session
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+    from pyseext.component_descriptor import ComponentDescriptor
+    from pyseext.polling_strategy import PollingStrategy
 
 
 class ComponentQuery(HasReferencedJavaScript):
     """A class to help with using Ext.ComponentQuery"""
 
-    # Class variables
-    _QUERY_TEMPLATE: str = "return globalThis.PySeExt.ComponentQuery.query('{cq}')"
-    """The script template to use to execute a component query.
-    Requires the inserts: {cq}"""
-
-    _QUERY_TEMPLATE_WITH_ROOT: str = "return globalThis.PySeExt.ComponentQuery.query('{cq}', '{root_id}')"
-    """The script template to use to execute a component query under a specified root.
-    Requires the inserts: {cq}, {root_id}"""
-
-    _QUERY_TEMPLATE_WITH_CSS_SELECTOR: str = "return globalThis.PySeExt.ComponentQuery.query('{cq}', undefined, '{css_selector}')"
-    """The script template to use to execute a component query, and then execute a CSS selector query against each matched element.
-    Requires the inserts: {cq}, {css_selector}"""
-
-    _QUERY_TEMPLATE_WITH_ROOT_AND_CSS_SELECTOR: str = "return globalThis.PySeExt.ComponentQuery.query('{cq}', '{root_id}', '{css_selector}')"
-    """The script template to use to execute a component query under a specified root, and then execute a CSS selector query against each matched element.
-    Requires the inserts: {cq}, {root_id}, {css_selector}"""
-
-    _IS_COMPONENT_INSTANCE_OF_CLASS_TEMPLATE: str = "return globalThis.PySeExt.ComponentQuery.isComponentInstanceOf('{class_name}', '{cq}')"
-    """The script template to use to determine whether a component query matches a component of the specified class.
-    Requires the inserts: {class_name}, {cq}"""
-
-    _IS_COMPONENT_INSTANCE_OF_CLASS_TEMPLATE_WITH_ROOT: str = "return globalThis.PySeExt.ComponentQuery.isComponentInstanceOf('{class_name}', '{cq}', '{root_id}')"
-    """The script template to use to determine whether a component query matches a component of the specified class.
-    Requires the inserts: {class_name}, {cq}, {root_id}"""
-
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
         # Instance variables
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The logger instance for this class instance"""
 
         self._driver = driver
@@ -56,7 +35,7 @@ class ComponentQuery(HasReferencedJavaScript):
         # Initialise our base class
         super().__init__(driver, self._logger)
 
-    def query(self, cq: str, root_id: Union[str, None] = None, css_selector: Union[str, None] = None) -> list[WebElement]:
+    def query(self, cq: str, root_id: Union[str, None] = None, css_selector: Union[str, None] = None) -> list['WebElement']:
         """Executes a ComponentQuery and returns the result
 
         Args:
@@ -70,49 +49,51 @@ class ComponentQuery(HasReferencedJavaScript):
         """
         if root_id is None and css_selector is None:
             self._logger.debug("Executing CQ '%s'", cq)
-            script = self._QUERY_TEMPLATE.format(cq=cq)
         elif css_selector is None:
             self._logger.debug("Executing CQ '%s' under root '%s'", cq, root_id)
-            script = self._QUERY_TEMPLATE_WITH_ROOT.format(cq=cq, root_id=root_id)
         elif root_id is None:
             self._logger.debug("Executing CQ '%s' with CSS selector '%s'", cq, css_selector)
-            script = self._QUERY_TEMPLATE_WITH_CSS_SELECTOR.format(cq=cq, css_selector=css_selector)
         else:
             self._logger.debug("Executing CQ '%s' under root '%s' with CSS selector '%s'", cq, root_id, css_selector)
-            script = self._QUERY_TEMPLATE_WITH_ROOT_AND_CSS_SELECTOR.format(cq=cq, root_id=root_id, css_selector=css_selector)
-
-        self.ensure_javascript_loaded()
-        query_result = self._driver.execute_script(script)
+        query_result = self._call_function('query', cq, root_id, css_selector, returns_elements=True)
 
-        self._logger.debug("CQ '%s' gave results: %s", cq, query_result)
+        self._logger.debug("CQ '%s' gave results: %s", cq, LoggingPolicy.render(query_result))
 
         return query_result
 
-    def wait_for_query(self, cq: str, root_id: Union[str, None] = None, timeout: float = 10, throw_if_not_found: bool = True, css_selector: Union[str, None] = None) -> list[WebElement]:
+    def wait_for_query(self, cq: str, root_id: Union[str, None] = None, timeout: Union[float, None] = None, throw_if_not_found: bool = True, css_selector: Union[str, None] = None, polling_strategy: Union['PollingStrategy', None] = None) -> list['WebElement']:
         """Method that waits for the specified CQ to match something
 
         Args:
             cq (str): The query to execute
             root_id (str, optional): The id of the container within which to perform the query.
                                      If omitted, all components within the document are included in the search.
-            timeout (float): Number of seconds before timing out (default 10)
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 10.
             throw_if_not_found (bool): Indicates whether to throw an exception if not found (default True).
             css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component,
                                           e.g. a clear trigger on a field would be '.x-form-clear-trigger'.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
 
         Returns:
             list[WebElement]: An array of DOM elements that match the query or an empty array if not found (and not configured to throw)
         """
+        timeout = self._get_wait_timeout('wait_for_query', cq, timeout, 10)
+
         try:
-            WebDriverWait(self._driver, timeout).until(ComponentQuery.ComponentQueryFoundExpectation(cq))
-            return self.query(cq, root_id, css_selector)
+            with self._recording_wait('wait_for_query', cq):
+                if self.USE_IN_BROWSER_WAITS:
+                    return self._wait_for_function('query', cq, root_id, css_selector, timeout=timeout)
+
+                return self._poll_until(ComponentQuery.ComponentQueryFoundExpectation(cq, root_id, css_selector, self), timeout, polling_strategy)
         except TimeoutException as exc:
             if throw_if_not_found:
                 raise ComponentQuery.QueryNotFoundException(cq, timeout, root_id) from exc
 
             return []
 
-    def wait_for_single_query(self, cq: str, root_id: Union[str, None] = None, timeout: float = 10, css_selector: Union[str, None] = None) -> WebElement:
+    def wait_for_single_query(self, cq: str, root_id: Union[str, None] = None, timeout: Union[float, None] = None, css_selector: Union[str, None] = None, polling_strategy: Union['PollingStrategy', None] = None) -> 'WebElement':
         """Method that waits for the specified CQ to match a single result.
         If there are multiple matches then an error is thrown.
 
@@ -120,20 +101,23 @@ class ComponentQuery(HasReferencedJavaScript):
             cq (str): The query to execute
             root_id (str, optional): The id of the container within which to perform the query.
                                      If omitted, all components within the document are included in the search.
-            timeout (float): Number of seconds before timing out (default 10)
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 10.
             css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component,
                                           e.g. a clear trigger on a field would be '.x-form-clear-trigger'.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
 
         Returns:
             WebElement: The DOM element that matches the query
         """
-        results = self.wait_for_query(cq, root_id, timeout, True, css_selector)
+        results = self.wait_for_query(cq, root_id, timeout, True, css_selector, polling_strategy)
         if len(results) > 1:
             raise ComponentQuery.QueryMatchedMultipleElementsException(cq, len(results))
 
         return results[0]
 
-    def wait_for_single_query_visible(self, cq: str, root_id: Union[str, None] = None, timeout: float = 10, css_selector: Union[str, None] = None) -> WebElement:
+    def wait_for_single_query_visible(self, cq: str, root_id: Union[str, None] = None, timeout: Union[float, None] = None, css_selector: Union[str, None] = None, polling_strategy: Union['PollingStrategy', None] = None) -> 'WebElement':
         """Method that waits for the specified CQ to match a single visible result.
         If there are multiple matches then an error is thrown.
 
@@ -141,9 +125,12 @@ class ComponentQuery(HasReferencedJavaScript):
             cq (str): The query to execute
             root_id (str, optional): The id of the container within which to perform the query.
                                      If omitted, all components within the document are included in the search.
-            timeout (float): Number of seconds before timing out (default 10)
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 10.
             css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component,
                                           e.g. a clear trigger on a field would be '.x-form-clear-trigger'.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
 
         Returns:
             WebElement: The DOM element that matches the query
@@ -151,7 +138,110 @@ class ComponentQuery(HasReferencedJavaScript):
         if not cq.endswith('{isVisible(true)}'):
             cq = cq + '{isVisible(true)}'
 
-        return self.wait_for_single_query(cq, root_id, timeout, css_selector)
+        return self.wait_for_single_query(cq, root_id, timeout, css_selector, polling_strategy)
+
+    def describe(self, cq: str, root_id: Union[str, None] = None, css_selector: Union[str, None] = None) -> list['ComponentDescriptor']:
+        """Executes a ComponentQuery and returns descriptors of the result.
+
+        This matches the same elements as `query`, but each descriptor also holds the component id, element id, xtype,
+        visibility, disabled state, text and bounding rectangle of its element, all computed in the same call.
+        The `WebElement` is only resolved if `ComponentDescriptor.get_element` is called.
+
+        Args:
+            cq (str): The query to execute
+            root_id (str, optional): The id of the container within which to perform the query.
+                                     If omitted, all components within the document are included in the search.
+            css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component,
+                                          e.g. a clear trigger on a field would be '.x-form-clear-trigger'.
+        Returns:
+            list[ComponentDescriptor]: An array of descriptors of the DOM elements that match the query or an empty array if not found
+        """
+        self._logger.debug("Describing CQ '%s' under root '%s' with CSS selector '%s'", cq, root_id, css_selector)
+        descriptions = self._call_function('describe', cq, root_id, css_selector)
+
+        self._logger.debug("CQ '%s' gave descriptions: %s", cq, LoggingPolicy.render(descriptions))
+
+        return self._to_descriptors(descriptions, cq, root_id, css_selector)
+
+    def _to_descriptors(self,
+                        descriptions: Union[list[dict], None],
+                        cq: str,
+                        root_id: Union[str, None] = None,
+                        css_selector: Union[str, None] = None) -> list['ComponentDescriptor']:
+        """Creates descriptors from the descriptions returned by our JavaScript's describe function.
+
+        Args:
+            descriptions (list[dict]): The descriptions, or None.
+            cq (str): The query that was executed.
+            root_id (str, optional): The id of the container within which the query was performed.
+            css_selector (str, optional): The CSS selector used to get child elements of the found components.
+
+        Returns:
+            list[ComponentDescriptor]: A descriptor for each description.
+        """
+        from pyseext.component_descriptor import ComponentDescriptor
+
+        return [ComponentDescriptor(self._driver, description, cq, root_id, css_selector, index)
+                for index, description in enumerate(descriptions or [])]
+
+    def wait_for_descriptors(self, cq: str, root_id: Union[str, None] = None, timeout: Union[float, None] = None, throw_if_not_found: bool = True, css_selector: Union[str, None] = None, polling_strategy: Union['PollingStrategy', None] = None) -> list['ComponentDescriptor']:
+        """Method that waits for the specified CQ to match something, returning descriptors of the result.
+
+        Args:
+            cq (str): The query to execute
+            root_id (str, optional): The id of the container within which to perform the query.
+                                     If omitted, all components within the document are included in the search.
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 10.
+            throw_if_not_found (bool): Indicates whether to throw an exception if not found (default True).
+            css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component,
+                                          e.g. a clear trigger on a field would be '.x-form-clear-trigger'.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
+
+        Returns:
+            list[ComponentDescriptor]: An array of descriptors of the DOM elements that match the query or an empty array if not found (and not configured to throw)
+        """
+        timeout = self._get_wait_timeout('wait_for_descriptors', cq, timeout, 10)
+
+        try:
+            with self._recording_wait('wait_for_descriptors', cq):
+                if self.USE_IN_BROWSER_WAITS:
+                    return self._to_descriptors(self._wait_for_function('describe', cq, root_id, css_selector, timeout=timeout), cq, root_id, css_selector)
+
+                return self._poll_until(ComponentQuery.ComponentQueryDescribedExpectation(cq, root_id, css_selector, self), timeout, polling_strategy)
+        except TimeoutException as exc:
+            if throw_if_not_found:
+                raise ComponentQuery.QueryNotFoundException(cq, timeout, root_id) from exc
+
+            return []
+
+    def wait_for_single_descriptor_visible(self, cq: str, root_id: Union[str, None] = None, timeout: Union[float, None] = None, css_selector: Union[str, None] = None, polling_strategy: Union['PollingStrategy', None] = None) -> 'ComponentDescriptor':
+        """Method that waits for the specified CQ to match a single visible result, returning a descriptor of it.
+        If there are multiple matches then an error is thrown.
+
+        Args:
+            cq (str): The query to execute
+            root_id (str, optional): The id of the container within which to perform the query.
+                                     If omitted, all components within the document are included in the search.
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 10.
+            css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component,
+                                          e.g. a clear trigger on a field would be '.x-form-clear-trigger'.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
+
+        Returns:
+            ComponentDescriptor: The descriptor of the DOM element that matches the query
+        """
+        if not cq.endswith('{isVisible(true)}'):
+            cq = cq + '{isVisible(true)}'
+
+        results = self.wait_for_descriptors(cq, root_id, timeout, True, css_selector, polling_strategy)
+        if len(results) > 1:
+            raise ComponentQuery.QueryMatchedMultipleElementsException(cq, len(results))
+
+        return results[0]
 
     def is_component_instance_of_class(self, class_name: str, cq: str, root_id: Union[str, None] = None, timeout: float = 1) -> bool:
         """Determines whether the component for the specified CQ is an instance of the specified class name.
@@ -170,13 +260,7 @@ class ComponentQuery(HasReferencedJavaScript):
         Returns:
             bool: True if the component is an instance of the specified class (including a subclass). False otherwise.
         """
-        if root_id is None:
-            script = self._IS_COMPONENT_INSTANCE_OF_CLASS_TEMPLATE.format(class_name=class_name, cq=cq)
-        else:
-            script = self._IS_COMPONENT_INSTANCE_OF_CLASS_TEMPLATE_WITH_ROOT.format(class_name=class_name, cq=cq, root_id=root_id)
-
-        self.ensure_javascript_loaded()
-        result = self._driver.execute_script(script)
+        result = self._call_function('isComponentInstanceOf', class_name, cq, root_id)
 
         if result is None:
             raise ComponentQuery.QueryNotFoundException(cq, timeout, root_id)
@@ -186,16 +270,70 @@ class ComponentQuery(HasReferencedJavaScript):
     class ComponentQueryFoundExpectation:
         """ An expectation for checking that an Ext.ComponentQuery is found"""
 
-        def __init__(self, cq: str):
+        def __init__(self,
+                     cq: str,
+                     root_id: Union[str, None] = None,
+                     css_selector: Union[str, None] = None,
+                     component_query: Union['ComponentQuery', None] = None):
+            """Initialises an instance of this class.
+
+            Args:
+                cq (str): The query to execute
+                root_id (str, optional): The id of the container within which to perform the query.
+                                         If omitted, all components within the document are included in the search.
+                css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component.
+                component_query (ComponentQuery, optional): The instance to use to execute the query.
+                                                            Defaults to the one from the driver's `Session`.
+            """
+            self._cq = cq
+            self._root_id = root_id
+            self._css_selector = css_selector
+            self._component_query = component_query
+
+        def __call__(self, driver):
+            """Method that determines whether a CQ is found
+
+            Returns:
+                list[WebElement]: The DOM elements that match the query, which is falsy if there are none.
+            """
+            if self._component_query is None:
+                self._component_query = Session(driver).component_query
+
+            return self._component_query.query(self._cq, self._root_id, self._css_selector)
+
+    class ComponentQueryDescribedExpectation:
+        """ An expectation for checking that an Ext.ComponentQuery is found, which returns descriptors of the result"""
+
+        def __init__(self,
+                     cq: str,
+                     root_id: Union[str, None] = None,
+                     css_selector: Union[str, None] = None,
+                     component_query: Union['ComponentQuery', None] = None):
             """Initialises an instance of this class.
+
+            Args:
+                cq (str): The query to execute
+                root_id (str, optional): The id of the container within which to perform the query.
+                                         If omitted, all components within the document are included in the search.
+                css_selector (str, optional): An optional CSS selector that can be used to get child elements of a found component.
+                component_query (ComponentQuery, optional): The instance to use to execute the query.
+                                                            Defaults to the one from the driver's `Session`.
             """
             self._cq = cq
+            self._root_id = root_id
+            self._css_selector = css_selector
+            self._component_query = component_query
 
         def __call__(self, driver):
             """Method that determines whether a CQ is found
+
+            Returns:
+                list[ComponentDescriptor]: Descriptors of the DOM elements that match the query, which is falsy if there are none.
             """
-            results = ComponentQuery(driver).query(self._cq)
-            return results is not None and len(results) > 0
+            if self._component_query is None:
+                self._component_query = Session(driver).component_query
+
+            return self._component_query.describe(self._cq, self._root_id, self._css_selector)
 
     class QueryMatchedMultipleElementsException(Exception):
         """Exception class thrown when expecting a single component query match and get multiple"""
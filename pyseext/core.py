@@ -1,14 +1,16 @@
 """
 Module that contains our Core class.
 """
-import logging
 import time
-from typing import Union, Any
-
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.wait import WebDriverWait
+from typing import Any, TYPE_CHECKING, Union
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.polling_strategy import PollingStrategy
+from pyseext.session import Session
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 class Core(HasReferencedJavaScript):
     """A class to help with core testing functionality."""
@@ -17,15 +19,12 @@ class Core(HasReferencedJavaScript):
     _IS_DOM_READY: str = "return !!(globalThis.Ext && globalThis.Ext.isDomReady)"
     """The script to use to access the JavaScript property 'Ext.IsDomReady'"""
 
-    _IS_AJAX_REQUEST_IN_PROGRESS: str = "return globalThis.PySeExt.Core.isAjaxRequestInProgress()"
-    """The script to use to call the JavaScript method PySeExt.Core.isAjaxRequestInProgress"""
-
     # FIXME: Could use a means of injecting event sniffing perhaps?
     # .....: Using Ext.mixin.Observable.capture
 
     # FIXME: Another thought is to inject a means to show field names on forms, xtype on components, etc?
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class.
 
         Args:
@@ -33,7 +32,7 @@ class Core(HasReferencedJavaScript):
         """
 
         # Instance variables
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -42,16 +41,21 @@ class Core(HasReferencedJavaScript):
         # Initialise our base class
         super().__init__(driver, self._logger)
 
-    def wait_for_dom_ready(self, timeout: float = 30):
+    def wait_for_dom_ready(self, timeout: Union[float, None] = None, polling_strategy: Union[PollingStrategy, None] = None):
         """Method that waits until Ext indicates that the DOM is ready.
         Calls Ext.isDomReady.
 
         Will throw a TimeOutException if the value is not true within the specified timeout period.
 
         Args:
-            timeout (float): Number of seconds before timing out (default 30)
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 30.
+            polling_strategy (PollingStrategy, optional): How often to poll. Defaults to `PollingStrategy.get_default()`.
         """
-        WebDriverWait(self._driver, timeout).until(Core.IsDomReadyExpectation())
+        timeout = self._get_wait_timeout('wait_for_dom_ready', None, timeout, 30)
+
+        with self._recording_wait('wait_for_dom_ready', None):
+            self._poll_until(Core.IsDomReadyExpectation(), timeout, polling_strategy)
 
     def try_get_object_member(self, obj: Union[dict, Any], member: str, default: Any = None) -> Any:
         """Attempts to get the member from an object, but if object itself is not a dictionary
@@ -79,24 +83,37 @@ class Core(HasReferencedJavaScript):
         Returns:
             bool: True if there is a request in progress, False otherwise.
         """
-        script = self._IS_AJAX_REQUEST_IN_PROGRESS
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('isAjaxRequestInProgress')
 
     def wait_for_no_ajax_requests_in_progress(self,
-                                              timeout: float = 30,
-                                              poll_frequecy: float = 0.2,
-                                              recheck_time_if_false: float = 0.2):
+                                              timeout: Union[float, None] = None,
+                                              poll_frequecy: Union[float, None] = None,
+                                              recheck_time_if_false: float = 0.2,
+                                              polling_strategy: Union[PollingStrategy, None] = None):
         """Method that waits until there are no Ajax requests in progress.
 
         Will throw a TimeOutException if the value is not true within the specified timeout period.
 
         Args:
-            timeout (float, optional): Number of seconds before timing out. Defaults to 30.
-            poll_frequency (float, optional): Number of seconds to poll. Defaults to 0.2.
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 30.
+            poll_frequency (float, optional): Number of seconds to poll, if polling at a fixed interval rather than using the polling strategy.
+                                              Ignored when waiting in the browser, see `USE_IN_BROWSER_WAITS`. Defaults to None.
             recheck_time_if_false (float, optional): If we get a result such that no Ajax calls are in progress, this is the amount of time to wait to check again. Defaults to 0.2.
+                                                     When waiting in the browser, no Ajax calls must be in progress for the whole of this time.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
         """
-        WebDriverWait(self._driver, timeout, poll_frequency = poll_frequecy).until(Core.IsNoAjaxCallInProgressExpectation(recheck_time_if_false))
+        timeout = self._get_wait_timeout('wait_for_no_ajax_requests_in_progress', None, timeout, 30)
+
+        with self._recording_wait('wait_for_no_ajax_requests_in_progress', None):
+            if self.USE_IN_BROWSER_WAITS:
+                self._wait_for_function('isAjaxRequestInProgress', timeout=timeout, negate=True, settle_time=recheck_time_if_false)
+            else:
+                if poll_frequecy is not None:
+                    polling_strategy = PollingStrategy.fixed(poll_frequecy)
+
+                self._poll_until(Core.IsNoAjaxCallInProgressExpectation(recheck_time_if_false, self), timeout, polling_strategy)
 
     class IsDomReadyExpectation:
         """An expectation for checking Ext.isDomReady"""
@@ -111,23 +128,27 @@ class Core(HasReferencedJavaScript):
     class IsNoAjaxCallInProgressExpectation:
         """An expectation for checking whether there is an Ajax call in progress."""
 
-        def __init__(self, recheck_time_if_false: Union[float, None] = None):
+        def __init__(self, recheck_time_if_false: Union[float, None] = None, core: Union['Core', None] = None):
             """Initialises an instance of this class.
 
             Args:
                 recheck_time_if_false (float, optional): If we get a value of false (so there is not a call in progress),
                                                          this is the amount of time to wait to check again. Defaults to None.
+                core (Core, optional): The instance to use to make the check. Defaults to the one from the driver's `Session`.
             """
             self._recheck_time_if_false = recheck_time_if_false
+            self._core = core
 
         def __call__(self, driver):
-            """Method that determines whether Ext.isDomReady"""
-            core = Core(driver)
-            is_call_in_progress = core.is_ajax_request_in_progress()
+            """Method that determines whether there is an Ajax call in progress"""
+            if self._core is None:
+                self._core = Session(driver).core
+
+            is_call_in_progress = self._core.is_ajax_request_in_progress()
 
             if not is_call_in_progress and self._recheck_time_if_false:
                 time.sleep(self._recheck_time_if_false)
-                is_call_in_progress = core.is_ajax_request_in_progress()
+                is_call_in_progress = self._core.is_ajax_request_in_progress()
 
             return not is_call_in_progress
 
@@ -0,0 +1,203 @@
+"""
+Module that contains our DevToolsTransport class.
+"""
+import json
+from typing import Any, TYPE_CHECKING, Union
+
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+class DevToolsTransport:
+    """A class that executes scripts using the Chrome DevTools Protocol command Runtime.callFunctionOn, rather than
+    the WebDriver's execute_script, for Chromium based browsers.
+
+    This avoids the WebDriver's script wrapping and element marshalling, with arguments passed as JSON and the
+    result returned by value. It should therefore only be used for scripts whose arguments and results are JSON safe,
+    i.e. not for those that take or return elements.
+
+    Each script is called as a function on the page's global object, with its arguments passed separately, so the text
+    of the function is the same for every call and the browser can reuse its compiled code.
+
+    DevTools can only call functions in the top level frame of the page, so while the WebDriver has switched to
+    another frame scripts are executed using the WebDriver. The frame that the WebDriver is in is read from the
+    browser the first time a script is executed, and then tracked as the WebDriver switches frame.
+
+    There is one transport for each WebDriver, see `get_for_driver`.
+
+    If the browser is not Chromium based, or the DevTools command fails the first time it is used, then scripts are
+    executed using the WebDriver as normal.
+    """
+
+    # Public class properties
+    CHROMIUM_BROWSER_NAMES: tuple[str, ...] = ('chrome', 'chromium', 'chrome-headless-shell', 'msedge', 'microsoftedge')
+    """The (lower case) browser names reported by the WebDriver's capabilities that we consider to be Chromium based"""
+
+    # Class variables
+    _FUNCTION_DECLARATION_TEMPLATE: str = "function() {{\n{script}\n}}"
+    """The template to use to build a function declaration that executes a script with arguments, in the way execute_script does.
+    Requires the inserts: {script}"""
+
+    _GLOBAL_OBJECT_EXPRESSION: str = 'globalThis'
+    """The expression to evaluate to get a reference to the page's global object, which our functions are called on"""
+
+    _FRAME_DEPTH_SCRIPT: str = """var depth = 0, frame = window;
+while (frame !== frame.parent) { frame = frame.parent; depth += 1; }
+return depth;"""
+    """The script to use, with the WebDriver, to find how many frames deep the WebDriver has switched to"""
+
+    _DRIVER_ATTRIBUTE_NAME: str = '_pyseext_dev_tools_transport'
+    """The name of the attribute of a WebDriver that holds its transport. It is held by the driver itself,
+    rather than in a mapping keyed on it, since the transport refers to the driver, so would keep it alive."""
+
+    def __init__(self, driver: 'WebDriver'):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver to use
+        """
+        self._logger = LoggingPolicy.get_logger(__name__)
+        """The Logger instance for this class instance"""
+
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        browser_name = str(getattr(driver, 'caps', {}).get('browserName', '')).lower()
+
+        self._is_supported: Union[bool, None] = None if browser_name in self.CHROMIUM_BROWSER_NAMES else False
+        """Indicates whether the DevTools command is supported, or None if we have not tried it yet"""
+
+        self._global_object_id: Union[str, None] = None
+        """The DevTools id of the page's global object, or None if it has not been fetched since the last navigation"""
+
+        self._frame_depth: Union[int, None] = None
+        """How many frames deep the WebDriver has switched to, 0 being the top level frame, or None if it has not been read yet"""
+
+        if self._is_supported is not False:
+            self._track_frames()
+
+    @staticmethod
+    def get_for_driver(driver: 'WebDriver') -> 'DevToolsTransport':
+        """Gets the transport for a driver, creating it if need be.
+
+        Args:
+            driver (WebDriver): The webdriver.
+
+        Returns:
+            DevToolsTransport: The transport for the driver.
+        """
+        transport = getattr(driver, DevToolsTransport._DRIVER_ATTRIBUTE_NAME, None)
+
+        if transport is None:
+            transport = DevToolsTransport(driver)
+            setattr(driver, DevToolsTransport._DRIVER_ATTRIBUTE_NAME, transport)
+
+        return transport
+
+    def is_supported(self) -> bool:
+        """Indicates whether scripts are (or will be attempted to be) executed using DevTools.
+
+        Returns:
+            bool: True if DevTools is in use, False if we are falling back to the WebDriver.
+        """
+        return self._is_supported is not False
+
+    def execute_script(self, script: str, *args) -> Any:
+        """Executes a script, in the same way as the WebDriver's execute_script, so the script should return its result.
+
+        Args:
+            script (str): The script to execute.
+            *args: Any JSON safe arguments for the script.
+
+        Returns:
+            Any: The result of the script, by value.
+        """
+        if self._is_supported is not False and self._frame_depth is None:
+            self._frame_depth = self._driver.execute_script(self._FRAME_DEPTH_SCRIPT)
+
+        if self._is_supported is False or self._frame_depth:
+            return self._driver.execute_script(script, *args)
+
+        try:
+            json.dumps(args)
+        except TypeError:
+            # Not JSON safe, e.g. an element, so leave it to the WebDriver
+            return self._driver.execute_script(script, *args)
+
+        try:
+            response = self._call_function_on(self._FUNCTION_DECLARATION_TEMPLATE.format(script=script), args)
+        except (AttributeError, RuntimeError, WebDriverException) as exc:
+            if self._is_supported:
+                raise
+
+            self._logger.debug("DevTools is not available, so will execute scripts using the WebDriver: %s", exc)
+            self._is_supported = False
+
+            return self._driver.execute_script(script, *args)
+
+        self._is_supported = True
+
+        exception_details = response.get('exceptionDetails')
+        if exception_details:
+            exception = exception_details.get('exception') or {}
+            raise JavascriptException(exception.get('description') or exception_details.get('text'))
+
+        return response.get('result', {}).get('value')
+
+    def _call_function_on(self, function_declaration: str, args: tuple) -> dict:
+        """Calls a function on the page's global object using DevTools, fetching the id of the global object first if needed.
+
+        If the id is no longer valid, since the page has changed, then it is fetched again and the call retried once.
+
+        Args:
+            function_declaration (str): The function declaration.
+            args (tuple): The JSON safe arguments for the function.
+
+        Returns:
+            dict: The DevTools response.
+        """
+        parameters = {
+            'functionDeclaration': function_declaration,
+            'arguments': [{'value': arg} for arg in args],
+            'returnByValue': True
+        }
+
+        if self._global_object_id is not None:
+            try:
+                return self._driver.execute_cdp_cmd('Runtime.callFunctionOn', {'objectId': self._global_object_id, **parameters})
+            except WebDriverException as exc:
+                self._logger.debug("DevTools call on the global object failed, the page must have changed: %s", exc)
+
+        self._global_object_id = self._driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': self._GLOBAL_OBJECT_EXPRESSION
+        })['result']['objectId']
+
+        return self._driver.execute_cdp_cmd('Runtime.callFunctionOn', {'objectId': self._global_object_id, **parameters})
+
+    def _track_frames(self):
+        """Wraps the `execute` method of our WebDriver, so that we know when it switches frame, or navigates."""
+        from selenium.webdriver.remote.command import Command # pylint: disable=import-outside-toplevel
+
+        original_execute = self._driver.execute
+
+        def execute(driver_command: str, params: Union[dict, None] = None) -> Any:
+            response = original_execute(driver_command, params)
+
+            if driver_command == Command.SWITCH_TO_FRAME:
+                if (params or {}).get('id') is None:
+                    self._frame_depth = 0
+                elif self._frame_depth is not None:
+                    self._frame_depth += 1
+            elif driver_command == Command.SWITCH_TO_PARENT_FRAME:
+                if self._frame_depth is not None:
+                    self._frame_depth = max(self._frame_depth - 1, 0)
+            elif driver_command in (Command.SWITCH_TO_WINDOW, Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH):
+                self._frame_depth = 0
+                self._global_object_id = None
+
+            return response
+
+        self._driver.execute = execute
@@ -1,71 +1,35 @@
 """
 Module that contains our FieldHelper class.
 """
-import logging
 
-from typing import Union, Any
+from typing import Any, TYPE_CHECKING, Union
 from datetime import datetime
 
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.wait import WebDriverWait
-from pyseext.component_query import ComponentQuery
-
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
 from pyseext.core import Core
-from pyseext.input_helper import InputHelper
-from pyseext.store_helper import StoreHelper
+from pyseext.session import Session
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+    from pyseext.component_query import ComponentQuery
+    from pyseext.input_helper import InputHelper
+    from pyseext.polling_strategy import PollingStrategy
+    from pyseext.store_helper import StoreHelper
 
 class FieldHelper(HasReferencedJavaScript):
     """A class to help with interacting with Ext fields"""
 
-    # Class variables
-    _FIND_FIELD_INPUT_ELEMENT_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.findFieldInputElement('{form_cq}', '{name}')"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.findFieldInputElement
-    Requires the inserts: {form_cq}, {name}"""
-
-    _GET_FIELD_XTYPE_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.getFieldXType('{form_cq}', '{name}')"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.getFieldXType
-    Requires the inserts: {form_cq}, {name}"""
-
-    _GET_FIELD_VALUE_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.getFieldValue('{form_cq}', '{name}')"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.getFieldValue
-    Requires the inserts: {form_cq}, {name}"""
-
-    _GET_FIELD_DISPLAY_VALUE_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.getFieldDisplayValue('{form_cq}', '{name}')"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.getFieldDisplayValue
-    Requires the inserts: {form_cq}, {name}"""
-
-    _SET_FIELD_VALUE_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.setFieldValue('{form_cq}', '{name}', {value})"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.setFieldValue
-    Requires the inserts: {form_cq}, {name}, {value}"""
-
-    _IS_REMOTELY_FILTERED_COMBOBOX_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.isRemotelyFilteredComboBox('{form_cq}', '{name}')"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.isRemotelyFilteredComboBox
-    Requires the inserts: {form_cq}, {name}"""
-
-    _FOCUS_FIELD_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.focusField('{form_cq}', {index_or_name})"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.focusField
-    Requires the inserts: {form_cq}, {index_or_name}"""
-
-    _DOES_FIELD_HAVE_FOCUS_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.doesFieldHaveFocus('{form_cq}', {index_or_name})"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.doesFieldHaveFocus
-    Requires the inserts: {form_cq}, {index_or_name}"""
-
-    _SELECT_COMBOBOX_VALUE_TEMPLATE: str = "return globalThis.PySeExt.FieldHelper.selectComboBoxValue('{form_cq}', '{name}', {data})"
-    """The script template to use to call the JavaScript method PySeExt.FieldHelper.selectComboBoxValue
-    Requires the inserts: {form_cq}, {name}, {data}"""
-
-    _GET_FIELD_RAW_VALUE: str = "return globalThis.PySeExt.FieldHelper.getFieldRawValue('{form_cq}', '{name}')"
-
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
-        self._logger = logging.getLogger(__name__)
+        from selenium.webdriver.common.action_chains import ActionChains
+
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -74,22 +38,30 @@ class FieldHelper(HasReferencedJavaScript):
         self._action_chains = ActionChains(driver)
         """The ActionChains instance for this class instance"""
 
-        self._core = Core(driver)
-        """The `Core` instance for this class instance"""
+        # Initialise our base class
+        super().__init__(driver, self._logger)
 
-        self._input_helper = InputHelper(driver)
-        """The `InputHelper` instance for this class instance"""
+    @property
+    def _core(self) -> Core:
+        """The `Core` instance for our driver, from its `Session`"""
+        return Session(self._driver).core
 
-        self._store_helper = StoreHelper(driver)
-        """The `StoreHelper` instance for this class instance"""
+    @property
+    def _input_helper(self) -> 'InputHelper':
+        """The `InputHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).input_helper
 
-        self._cq = ComponentQuery(driver)
-        """The `ComponentQuery` instance for this class instance"""
+    @property
+    def _store_helper(self) -> 'StoreHelper':
+        """The `StoreHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).store_helper
 
-        # Initialise our base class
-        super().__init__(driver, self._logger)
+    @property
+    def _cq(self) -> 'ComponentQuery':
+        """The `ComponentQuery` instance for our driver, from its `Session`"""
+        return Session(self._driver).component_query
 
-    def find_field_input_element(self, form_cq: str, name: str) -> WebElement:
+    def find_field_input_element(self, form_cq: str, name: str) -> 'WebElement':
         """Attempts to get a field by name from the specified form panel
 
         Args:
@@ -109,13 +81,13 @@ class FieldHelper(HasReferencedJavaScript):
         self._cq.wait_for_single_query(field_cq)
 
         # Now get its input element
-        script = self._FIND_FIELD_INPUT_ELEMENT_TEMPLATE.format(form_cq=form_cq, name=name)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('findFieldInputElement', form_cq, name, returns_elements=True)
 
     def get_field_xtype(self, form_cq: str, name: str) -> str:
         """Attempts to get the xtype of a field by name from the specified form panel
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             form_cq (str): The component query that identifies the form panel in which to look for the field
             name (str): The name of the field
@@ -123,9 +95,7 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             str: The xtype of the field, or None if not found.
         """
-        script = self._GET_FIELD_XTYPE_TEMPLATE.format(form_cq=form_cq, name=name)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('getFieldXType', form_cq, name, deferrable=True)
 
     def is_field_a_combobox(self, form_cq: str, name: str) -> bool:
         """Determine whether the field (by name) on the specified form panel is a combobox (or a subclass of it).
@@ -203,6 +173,8 @@ class FieldHelper(HasReferencedJavaScript):
     def get_field_value(self, form_cq: str, name: str) -> Any:
         """Attempts to get the value of a field by name from the specified form panel
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             form_cq (str): The component query that identifies the form panel in which to look for the field
             name (str): The name of the field
@@ -210,22 +182,15 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             Any: The value of the field, or None if not found.
         """
-        script = self._GET_FIELD_VALUE_TEMPLATE.format(form_cq=form_cq, name=name)
-        self.ensure_javascript_loaded()
-
-        value = self._driver.execute_script(script)
-
-        if self.is_field_a_date_field(form_cq, name):
-            if value:
-                value = datetime.strptime(value, '%d/%m/%Y')
-
-        return value
+        return self._call_function('getFieldValue', form_cq, name, deferrable=True, result_handler=self._get_field_value_from_result)
 
     def get_field_display_value(self, form_cq: str, name: str) -> Any:
         """Attempts to get the display value of a field by name from the specified form panel.
 
         Supported by comboboxes and display fields.
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             form_cq (str): The component query that identifies the form panel in which to look for the field
             name (str): The name of the field
@@ -233,15 +198,15 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             Any: The display value of the field, or None if not found or if the field does not have a display value.
         """
-        script = self._GET_FIELD_DISPLAY_VALUE_TEMPLATE.format(form_cq=form_cq, name=name)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('getFieldDisplayValue', form_cq, name, deferrable=True)
 
     def get_field_raw_value(self, form_cq: str, name: str) -> Any:
         """Attempts to get the raw value of a field by name from the specified form panel.
 
         Can be used to get the value for a date field.
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             form_cq (str): The component query that identifies the form panel in which to look for the field
             name (str): The name of the field
@@ -249,9 +214,7 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             Any: The raw value of the field, or None if not found or if the field does not have a raw value.
         """
-        script = self._GET_FIELD_RAW_VALUE.format(form_cq=form_cq, name=name)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('getFieldRawValue', form_cq, name, deferrable=True)
 
     def set_field_value(self, form_cq: str, name: str, value: Union[dict, float, str], delay: float = 0.1):
         """Sets the value for a field.
@@ -278,7 +241,7 @@ class FieldHelper(HasReferencedJavaScript):
             delay (float): The delay in seconds to use between keystrokes when typing into a field. Defaults to 0.1 second.
         """
         # Only used for radiogroup controls now, but xtype still useful to throw a better error if field not found.
-        field_xtype = self.get_field_xtype(form_cq, name)
+        field_xtype = self._call_function('getFieldXType', form_cq, name)
 
         if field_xtype:
             # Field found!
@@ -381,17 +344,7 @@ class FieldHelper(HasReferencedJavaScript):
             name (str): The name of the field
             value (Union[int, str]): The value for the field.
         """
-        # If value is a string then we want to quote it in our script
-        if isinstance(value, str):
-            value = f"'{value}'"
-
-        # If value is a boolean we want to force it to lowercase
-        if isinstance(value, bool):
-            value = str(value).lower()
-
-        script = self._SET_FIELD_VALUE_TEMPLATE.format(form_cq=form_cq, name=name, value=value)
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('setFieldValue', form_cq, name, value)
 
     def focus_field(self, form_cq: str, index_or_name: Union[int, str], check_has_focus_after: bool = True):
         """Method to focus on a field on a form by (zero-based) index or name.
@@ -401,15 +354,8 @@ class FieldHelper(HasReferencedJavaScript):
             index_or_name (Union[int, str]): The zero-based index or name of the field to focus.
             check_has_focus_after (bool): Indicates whether to check that the field is focused afterwards. Defaults to True.
         """
-        # If value is a string then we want to quote it in our script
-        if isinstance(index_or_name, str):
-            index_or_name = f"'{index_or_name}'"
-
-        script = self._FOCUS_FIELD_TEMPLATE.format(form_cq=form_cq, index_or_name=index_or_name)
-        self.ensure_javascript_loaded()
-
         self._logger.info("Focusing field %s on form '%s'", index_or_name, form_cq)
-        self._driver.execute_script(script)
+        self._call_function('focusField', form_cq, index_or_name)
 
         if check_has_focus_after:
             has_focus = self.does_field_have_focus(form_cq, index_or_name)
@@ -417,7 +363,7 @@ class FieldHelper(HasReferencedJavaScript):
             if not has_focus:
                 self._logger.debug("Field %s on form '%s' does not have focus!", index_or_name, form_cq)
                 # Try again (can't hurt)
-                self._driver.execute_script(script)
+                self._call_function('focusField', form_cq, index_or_name)
 
             else:
                 self._logger.debug("Field %s on form '%s' has focus!", index_or_name, form_cq)
@@ -432,23 +378,30 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             bool: True if the field has focus, False otherwise.
         """
-        # If value is a string then we want to quote it in our script
-        if isinstance(index_or_name, str):
-            index_or_name = f"'{index_or_name}'"
-
-        script = self._DOES_FIELD_HAVE_FOCUS_TEMPLATE.format(form_cq=form_cq, index_or_name=index_or_name)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('doesFieldHaveFocus', form_cq, index_or_name)
 
-    def wait_until_field_has_focus(self, form_cq: str, index_or_name: Union[int, str], timeout: float = 10):
+    def wait_until_field_has_focus(self,
+                                   form_cq: str,
+                                   index_or_name: Union[int, str],
+                                   timeout: Union[float, None] = None,
+                                   polling_strategy: Union['PollingStrategy', None] = None):
         """Waits until the focus is on a field on a form by (zero-based) index or name.
 
         Args:
             form_cq (str): The component query that identifies the form panel in which to look for the field
             index_or_name (Union[int, str]): The zero-based index or name of the field.
-            timeout (float): Number of seconds before timing out (default 10)
+            timeout (float, optional): Number of seconds before timing out.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 10.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
         """
-        WebDriverWait(self._driver, timeout).until(FieldHelper.FieldHasFocusExpectation(form_cq, index_or_name))
+        timeout = self._get_wait_timeout('wait_until_field_has_focus', form_cq, timeout, 10)
+
+        with self._recording_wait('wait_until_field_has_focus', form_cq):
+            if self.USE_IN_BROWSER_WAITS:
+                self._wait_for_function('doesFieldHaveFocus', form_cq, index_or_name, timeout=timeout)
+            else:
+                self._poll_until(FieldHelper.FieldHasFocusExpectation(form_cq, index_or_name, self), timeout, polling_strategy)
 
     def get_field_component_query(self, form_cq: str, name: str):
         """Builds the component query for a field on a form.
@@ -474,7 +427,7 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             bool: True if the value of the field matches the expected, False otherwise.
         """
-        field_value = self.get_field_value(form_cq, name)
+        field_value = self._call_function('getFieldValue', form_cq, name, result_handler=self._get_field_value_from_result)
 
         return field_value == value
 
@@ -495,9 +448,28 @@ class FieldHelper(HasReferencedJavaScript):
         """
         self._store_helper.wait_for_store_loaded(self.get_field_component_query(form_cq, name))
 
-        script = self._SELECT_COMBOBOX_VALUE_TEMPLATE.format(form_cq=form_cq, name=name, data=data)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('selectComboBoxValue', form_cq, name, data)
+
+    @staticmethod
+    def _get_field_value_from_result(result: Union[dict, None]) -> Any:
+        """Gets the value of a field from the result of the JavaScript method PySeExt.FieldHelper.getFieldValue,
+        converting dates into datetimes.
+
+        Args:
+            result (Union[dict, None]): The result of the call, containing the 'value' and whether it 'isDate'.
+
+        Returns:
+            Any: The value of the field.
+        """
+        if not result:
+            return None
+
+        value = result.get('value')
+
+        if result.get('isDate') and value:
+            value = datetime.strptime(value, '%d/%m/%Y')
+
+        return value
 
     def _is_field_remotely_filtered_combobox(self, form_cq: str, name: str) -> bool:
         """Attempts to find a field by name from the specified form panel, and determine whether
@@ -510,9 +482,7 @@ class FieldHelper(HasReferencedJavaScript):
         Returns:
             bool: True if the field was found, and is a remotely filtered combobox. False otherwise.
         """
-        script = self._IS_REMOTELY_FILTERED_COMBOBOX_TEMPLATE.format(form_cq=form_cq, name=name)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('isRemotelyFilteredComboBox', form_cq, name)
 
     class FieldNotFoundException(Exception):
         """Exception class thrown when we failed to find the specified field"""
@@ -591,17 +561,22 @@ class FieldHelper(HasReferencedJavaScript):
     class FieldHasFocusExpectation:
         """ An expectation for checking that the specified field has focus"""
 
-        def __init__(self, form_cq: str, index_or_name: Union[int, str]):
+        def __init__(self, form_cq: str, index_or_name: Union[int, str], field_helper: Union['FieldHelper', None] = None):
             """Initialises an instance of this class.
 
             Args:
                 form_cq (str): The component query that identifies the form panel in which to look for the field
                 index_or_name (Union[int, str]): The zero-based index or name of the field.
+                field_helper (FieldHelper, optional): The instance to use to make the check. Defaults to the one from the driver's `Session`.
             """
             self._form_cq = form_cq
             self._index_or_name = index_or_name
+            self._field_helper = field_helper
 
         def __call__(self, driver):
-            """Method that determines whether a CQ is found
+            """Method that determines whether the field has focus
             """
-            return FieldHelper(driver).does_field_have_focus(self._form_cq, self._index_or_name)
+            if self._field_helper is None:
+                self._field_helper = Session(driver).field_helper
+
+            return self._field_helper.does_field_have_focus(self._form_cq, self._index_or_name)
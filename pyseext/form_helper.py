@@ -1,42 +1,53 @@
 """
 Module that contains our FormHelper class.
 """
-import logging
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from selenium.webdriver.remote.webdriver import WebDriver
+from pyseext.session import Session
+from pyseext.instrumented_helper import InstrumentedHelper
+from pyseext.logging_policy import LoggingPolicy
 
-from pyseext.component_query import ComponentQuery
-from pyseext.field_helper import FieldHelper
-from pyseext.button_helper import ButtonHelper
-from pyseext.input_helper import InputHelper
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from pyseext.component_query import ComponentQuery
+    from pyseext.field_helper import FieldHelper
+    from pyseext.button_helper import ButtonHelper
+    from pyseext.input_helper import InputHelper
 
-class FormHelper:
+class FormHelper(InstrumentedHelper):
     """A class to help with interacting with Ext form panels and forms"""
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
         """The WebDriver instance for this class instance"""
 
-        self._button_helper = ButtonHelper(driver)
-        """The `ButtonHelper` instance for this class instance"""
+    @property
+    def _button_helper(self) -> 'ButtonHelper':
+        """The `ButtonHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).button_helper
 
-        self._field_helper = FieldHelper(driver)
-        """The `FieldHelper` instance for this class instance"""
+    @property
+    def _field_helper(self) -> 'FieldHelper':
+        """The `FieldHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).field_helper
 
-        self._input_helper = InputHelper(driver)
-        """The `InputHelper` instance for this class instance"""
+    @property
+    def _input_helper(self) -> 'InputHelper':
+        """The `InputHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).input_helper
 
-        self._cq = ComponentQuery(driver)
-        """The `ComponentQuery` instance for this class instance"""
+    @property
+    def _cq(self) -> 'ComponentQuery':
+        """The `ComponentQuery` instance for our driver, from its `Session`"""
+        return Session(self._driver).component_query
 
     def set_form_values(self, form_cq: str, field_values: Union[dict, list[Union[str, float, int, None]]], starting_field_index_or_name: Union[int, str, None] = 0):
         """Sets the values on the specified form panel.
@@ -61,13 +72,13 @@ class FormHelper:
 
         """
         if isinstance(field_values, dict):
-            self._logger.info("Populating form '%s' with values: %s", form_cq, field_values)
+            self._logger.info("Populating form '%s' with values: %s", form_cq, LoggingPolicy.render(field_values))
 
             for field_name in field_values.keys():
                 self._field_helper.set_field_value(form_cq, field_name, field_values[field_name])
 
         elif isinstance(field_values, list):
-            self._logger.info("Populating form '%s' with values: %s", form_cq, field_values)
+            self._logger.info("Populating form '%s' with values: %s", form_cq, LoggingPolicy.render(field_values))
 
             if not starting_field_index_or_name is None:
                 # Ensure we are starting at our desired field in the form
@@ -93,5 +104,5 @@ class FormHelper:
             form_cq (str): The component query that identifies the form panel to submit.
             text (str, optional): The text on the submit button. Defaults to 'Ok'.
         """
-        form = self._cq.wait_for_single_query_visible(form_cq)
-        self._button_helper.click_button_by_text(text, form.get_attribute('id'))
+        form = self._cq.wait_for_single_descriptor_visible(form_cq)
+        self._button_helper.click_button_by_text(text, form.component_id)
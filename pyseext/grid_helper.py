@@ -2,101 +2,88 @@
 Module that contains our GridHelper class.
 """
 
-import logging
 import random
-from typing import List, Union
+from typing import List, TYPE_CHECKING, Union
 
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import StaleElementReferenceException
-from selenium.webdriver.common.by import By
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
-from pyseext.component_query import ComponentQuery
-from pyseext.input_helper import InputHelper
-from pyseext.menu_helper import MenuHelper
-from pyseext.store_helper import StoreHelper
-from pyseext.core import Core
+from pyseext.call_batch import CallBatch
+from pyseext.record_type import RecordType
+from pyseext.session import Session
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+    from pyseext.component_query import ComponentQuery
+    from pyseext.input_helper import InputHelper
+    from pyseext.menu_helper import MenuHelper
+    from pyseext.store_helper import StoreHelper
+    from pyseext.core import Core
+    from pyseext.polling_strategy import PollingStrategy
 
 
 class GridHelper(HasReferencedJavaScript):
     """A class to help with interacting with Ext grid panels"""
 
+    # Class variables
+    _REQUIRED_JAVASCRIPT_CLASS_NAMES: tuple[str, ...] = ('Core',)
+    """The names of the other classes whose JavaScript our JavaScript uses"""
+
     # Public class properties
     GRID_CQ: str = "gridpanel"
     """The component query to use to find a grid panel"""
 
-    # Private class variables
-    _GET_COLUMN_HEADER_TEMPLATE: str = (
-        "return globalThis.PySeExt.GridHelper.getColumnHeader('{grid_cq}', '{column_text_or_data_index}')"
-    )
-    """The script template to use to call the JavaScript method PySeExt.GridHelper.getColumnHeader
-    Requires the inserts: {grid_cq}, {column_text_or_data_index}"""
-
-    _GET_COLUMN_HEADER_TRIGGER_TEMPLATE: str = (
-        "return globalThis.PySeExt.GridHelper.getColumnHeaderTrigger('{grid_cq}', '{column_text_or_data_index}')"
-    )
-    """The script template to use to call the JavaScript method PySeExt.GridHelper.getColumnHeaderTrigger
-    Requires the inserts: {grid_cq}, {column_text_or_data_index}"""
-
-    _CLEAR_SELECTION_TEMPLATE: str = (
-        "return globalThis.PySeExt.GridHelper.clearSelection('{grid_cq}')"
-    )
-    """The script template to use to call the JavaScript method PySeExt.GridHelper.clearSelection
-    Requires the inserts: {grid_cq}"""
-
-    _GET_ROW_TEMPLATE: str = (
-        "return globalThis.PySeExt.GridHelper.getRow('{grid_cq}', {row_data})"
-    )
-    """The script template to use to call the JavaScript method PySeExt.GridHelper.getRow
-    Requires the inserts: {grid_cq}, {row_data}"""
-
-    _GET_ROW_DATA_TEMPLATE: str = (
-        "return globalThis.PySeExt.GridHelper.getRowData('{grid_cq}', {row_data})"
-    )
-    """The script template to use to call the JavaScript method PySeExt.GridHelper.getRow
-    Requires the inserts: {grid_cq}, {row_data}"""
-
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
+        from selenium.webdriver.common.action_chains import ActionChains
 
         # Instance variables
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
         """The WebDriver instance for this class instance"""
 
-        self._cq = ComponentQuery(driver)
-        """The `ComponentQuery` instance for this class instance"""
+        self._action_chains = ActionChains(driver)
+        """The ActionChains instance for this class instance"""
 
-        self._input_helper = InputHelper(driver)
-        """The `InputHelper` instance for this class instance"""
+        # Initialise our base class
+        super().__init__(driver, self._logger)
 
-        self._menu_helper = MenuHelper(driver)
-        """The `MenuHelper` instance for this class instance"""
+    @property
+    def _cq(self) -> 'ComponentQuery':
+        """The `ComponentQuery` instance for our driver, from its `Session`"""
+        return Session(self._driver).component_query
 
-        self._store_helper = StoreHelper(driver)
-        """The `StoreHelper` instance for this class instance"""
+    @property
+    def _input_helper(self) -> 'InputHelper':
+        """The `InputHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).input_helper
 
-        self._action_chains = ActionChains(driver)
-        """The ActionChains instance for this class instance"""
+    @property
+    def _menu_helper(self) -> 'MenuHelper':
+        """The `MenuHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).menu_helper
 
-        self._core = Core(driver)
+    @property
+    def _store_helper(self) -> 'StoreHelper':
+        """The `StoreHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).store_helper
 
-        # Initialise our base class
-        super().__init__(driver, self._logger)
+    @property
+    def _core(self) -> 'Core':
+        """The `Core` instance for our driver, from its `Session`"""
+        return Session(self._driver).core
 
     def get_column_header(
         self, grid_cq: str, column_text_or_data_index: str
-    ) -> WebElement:
+    ) -> 'WebElement':
         """Gets the element for the specified column header
 
         Args:
@@ -110,11 +97,7 @@ class GridHelper(HasReferencedJavaScript):
         # Check grid can be found and is visible
         self._cq.wait_for_single_query_visible(grid_cq)
 
-        script = self._GET_COLUMN_HEADER_TEMPLATE.format(
-            grid_cq=grid_cq, column_text_or_data_index=column_text_or_data_index
-        )
-        self.ensure_javascript_loaded()
-        column_header = self._driver.execute_script(script)
+        column_header = self._call_function('getColumnHeader', grid_cq, column_text_or_data_index, returns_elements=True)
 
         if column_header:
             return column_header
@@ -125,6 +108,8 @@ class GridHelper(HasReferencedJavaScript):
         """Determines whether the specified column is visible,
         Throws a ColumnNotFoundException if the column does not exist.
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             grid_cq (str): The component query for the owning grid
             column_text_or_data_index (str): The header text or dataIndex of the grid column
@@ -132,12 +117,17 @@ class GridHelper(HasReferencedJavaScript):
         Returns:
             True if the column is visible, False otherwise.
         """
-        return self.get_column_header(grid_cq, column_text_or_data_index).is_displayed()
+        # Check grid can be found and is visible
+        self._wait_for_grid_visible(grid_cq)
+
+        return self._call_is_column_visible(grid_cq, column_text_or_data_index)
 
     def is_column_hidden(self, grid_cq: str, column_text_or_data_index: str) -> bool:
         """Determines whether the specified column is hidden.
         Throws a ColumnNotFoundException if the column does not exist.
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             grid_cq (str): The component query for the owning grid
             column_text_or_data_index (str): The header text or dataIndex of the grid column
@@ -145,13 +135,14 @@ class GridHelper(HasReferencedJavaScript):
         Returns:
             True if the column is hidden, False otherwise.
         """
-        return not self.get_column_header(
-            grid_cq, column_text_or_data_index
-        ).is_displayed()
+        # Check grid can be found and is visible
+        self._wait_for_grid_visible(grid_cq)
+
+        return self._call_is_column_visible(grid_cq, column_text_or_data_index, is_hidden_wanted=True)
 
     def check_columns_are_visible(
         self, grid_cq: str, column_text_or_data_indexes: list[str]
-    ) -> list[WebElement]:
+    ) -> list['WebElement']:
         """Checks that the specified columns are all visible on the specified grid.
         Throws a ColumnNotFoundException if the column does not exist.
 
@@ -162,18 +153,19 @@ class GridHelper(HasReferencedJavaScript):
         Returns:
             An array of columns that are not visible, if any.
         """
-        columns_not_visible = []
+        # Check grid can be found and is visible
+        self._cq.wait_for_single_query_visible(grid_cq)
 
-        for column_text_or_data_index in column_text_or_data_indexes:
-            is_visible = self.is_column_visible(grid_cq, column_text_or_data_index)
-            if not is_visible:
-                columns_not_visible.append(column_text_or_data_index)
+        # Then check all the columns in one go
+        with CallBatch(self._driver):
+            results = [(column_text_or_data_index, self._call_is_column_visible(grid_cq, column_text_or_data_index))
+                       for column_text_or_data_index in column_text_or_data_indexes]
 
-        return columns_not_visible
+        return [column_text_or_data_index for column_text_or_data_index, is_visible in results if not is_visible.result()]
 
     def check_columns_are_hidden(
         self, grid_cq: str, column_texts_or_data_indexes: list[str]
-    ) -> list[WebElement]:
+    ) -> list['WebElement']:
         """Checks that the specified columns are all hidden on the specified grid.
         Throws a ColumnNotFoundException if the column does not exist.
 
@@ -184,14 +176,50 @@ class GridHelper(HasReferencedJavaScript):
         Returns:
             An array of columns that are not hidden, if any.
         """
-        column_not_hidden = []
+        # Check grid can be found and is visible
+        self._cq.wait_for_single_query_visible(grid_cq)
+
+        # Then check all the columns in one go
+        with CallBatch(self._driver):
+            results = [(column_text_or_data_index, self._call_is_column_visible(grid_cq, column_text_or_data_index, is_hidden_wanted=True))
+                       for column_text_or_data_index in column_texts_or_data_indexes]
+
+        return [column_text_or_data_index for column_text_or_data_index, is_hidden in results if not is_hidden.result()]
+
+    def _wait_for_grid_visible(self, grid_cq: str):
+        """Waits for a grid to be visible before reading from it.
+
+        Within a `CallBatch` the wait is only made for the first read of each grid, since it cannot be deferred,
+        so would otherwise flush the batch before every read.
+
+        Args:
+            grid_cq (str): The component query for the grid
+        """
+        call_batch = CallBatch.get_active(self._driver)
+
+        if call_batch is None or call_batch.add_check(('GridHelper.visible', grid_cq)):
+            self._cq.wait_for_single_query_visible(grid_cq)
+
+    def _call_is_column_visible(self, grid_cq: str, column_text_or_data_index: str, is_hidden_wanted: bool = False) -> bool:
+        """Calls the JavaScript method PySeExt.GridHelper.isColumnVisible, without waiting for the grid.
+        The call can be deferred by a `CallBatch`.
+
+        Args:
+            grid_cq (str): The component query for the owning grid
+            column_text_or_data_index (str): The header text or dataIndex of the grid column
+            is_hidden_wanted (bool, optional): Indicates whether to return whether the column is hidden instead. Defaults to False.
+
+        Returns:
+            bool: True if the column is visible (or hidden if wanted), False otherwise.
+        """
+        def handle_result(is_visible: Union[bool, None]) -> bool:
+            """Throws if the column was not found, otherwise returns the visibility wanted."""
+            if is_visible is None:
+                raise GridHelper.ColumnNotFoundException(grid_cq, column_text_or_data_index)
 
-        for column_text_or_data_index in column_texts_or_data_indexes:
-            is_hidden = self.is_column_hidden(grid_cq, column_text_or_data_index)
-            if not is_hidden:
-                column_not_hidden.append(column_text_or_data_index)
+            return is_visible != is_hidden_wanted
 
-        return column_not_hidden
+        return self._call_function('isColumnVisible', grid_cq, column_text_or_data_index, deferrable=True, result_handler=handle_result)
 
     def click_column_header(self, grid_cq: str, column_text_or_data_index: str):
         """Clicks on the specified column header.
@@ -215,7 +243,7 @@ class GridHelper(HasReferencedJavaScript):
 
     def get_column_header_trigger(
         self, grid_cq: str, column_text_or_data_index: str
-    ) -> WebElement:
+    ) -> 'WebElement':
         """Gets the element for the specified column header's trigger
 
         Args:
@@ -229,11 +257,7 @@ class GridHelper(HasReferencedJavaScript):
         # Check grid can be found and is visible
         self._cq.wait_for_single_query_visible(grid_cq)
 
-        script = self._GET_COLUMN_HEADER_TRIGGER_TEMPLATE.format(
-            grid_cq=grid_cq, column_text_or_data_index=column_text_or_data_index
-        )
-        self.ensure_javascript_loaded()
-        column_header_trigger = self._driver.execute_script(script)
+        column_header_trigger = self._call_function('getColumnHeaderTrigger', grid_cq, column_text_or_data_index, returns_elements=True)
 
         if column_header_trigger:
             return column_header_trigger
@@ -448,16 +472,14 @@ class GridHelper(HasReferencedJavaScript):
 
         self._logger.info("Clearing selection on grid with CQ '%s'", grid_cq)
 
-        script = self._CLEAR_SELECTION_TEMPLATE.format(grid_cq=grid_cq)
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('clearSelection', grid_cq)
 
     def get_row(
         self,
         grid_cq: str,
         row_data: Union[int, dict],
         should_throw_exception: bool = True,
-    ) -> WebElement:
+    ) -> 'WebElement':
         """Gets the element for the row with the specified data or index in the grid.
 
         The grid must be visible.
@@ -474,15 +496,26 @@ class GridHelper(HasReferencedJavaScript):
         # Check grid can be found and is visible
         self._cq.wait_for_single_query_visible(grid_cq)
 
-        script = self._GET_ROW_TEMPLATE.format(grid_cq=grid_cq, row_data=row_data)
-        self.ensure_javascript_loaded()
-        row = self._driver.execute_script(script)
+        row = self._find_row(grid_cq, row_data)
 
         if row or not should_throw_exception:
             return row
 
         raise GridHelper.RowNotFoundException(grid_cq, row_data)
 
+    def _find_row(self, grid_cq: str, row_data: Union[int, dict]) -> Union['WebElement', None]:
+        """Finds the element for the row with the specified data or index in the grid,
+        without first checking that the grid is visible.
+
+        Args:
+            grid_cq (str): The component query for the grid
+            row_data (Union[int, dict]): The row data or index for the record to be found.
+
+        Returns:
+            WebElement: The DOM element for the row or None if not found
+        """
+        return self._call_function('getRow', grid_cq, row_data, returns_elements=True)
+
     def get_row_data(
         self,
         grid_cq: str,
@@ -493,6 +526,8 @@ class GridHelper(HasReferencedJavaScript):
 
         The grid must be visible.
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             grid_cq (str): The component query for the grid
             row_data (Union[int, dict]): The row data or index for the record to be found.
@@ -503,16 +538,38 @@ class GridHelper(HasReferencedJavaScript):
             Dict: Dict containing the store for the row or None if not found (and not thrown)
         """
         # Check grid can be found and is visible
-        self._cq.wait_for_single_query_visible(grid_cq)
+        self._wait_for_grid_visible(grid_cq)
 
-        script = self._GET_ROW_DATA_TEMPLATE.format(grid_cq=grid_cq, row_data=row_data)
-        self.ensure_javascript_loaded()
-        row = self._driver.execute_script(script)
+        def handle_result(row: Union[dict, None]) -> Union[dict, None]:
+            """Throws if the row was not found, and we've been asked to."""
+            if row or not should_throw_exception:
+                return row
 
-        if row or not should_throw_exception:
-            return row
+            raise GridHelper.RowNotFoundException(grid_cq, row_data)
 
-        raise GridHelper.RowNotFoundException(grid_cq, row_data)
+        return self._call_function('getRowData', grid_cq, row_data, deferrable=True, result_handler=handle_result)
+
+    def get_rows_data(self, grid_cq: str, fields: Union[list[str], None] = None) -> list[RecordType.Record]:
+        """Gets the data for every row in the grid's store.
+
+        The grid must be visible.
+
+        The data is returned as compact records rather than dicts, see `RecordType`, which matters when
+        a grid holds many thousands of rows. Use `RecordType.Record.to_dict` to get a dict for a row.
+
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
+        Args:
+            grid_cq (str): The component query for the grid
+            fields (list[str], optional): The fields to include. If omitted, every field found in the data is included.
+
+        Returns:
+            list[RecordType.Record]: A record for each row.
+        """
+        # Check grid can be found and is visible
+        self._wait_for_grid_visible(grid_cq)
+
+        return self._call_function('getRowsData', grid_cq, fields, deferrable=True, result_handler=RecordType.from_table)
 
     def click_row(self, grid_cq: str, row_data: Union[int, dict]):
         """Clicks the row with the specified data or index in the grid.
@@ -528,7 +585,7 @@ class GridHelper(HasReferencedJavaScript):
             row = self.get_row(grid_cq, row_data)
 
             self._logger.info(
-                "Clicking clicking row '%s' on grid with CQ '%s'", row_data, grid_cq
+                "Clicking clicking row '%s' on grid with CQ '%s'", LoggingPolicy.render(row_data), grid_cq
             )
 
             self._action_chains.move_to_element(row)
@@ -546,26 +603,32 @@ class GridHelper(HasReferencedJavaScript):
             self.check_row_selected(grid_cq, row_data)
 
     def wait_for_row(
-        self, grid_cq: str, row_data: Union[int, dict], timeout: float = 60
-    ) -> WebElement:
+        self, grid_cq: str, row_data: Union[int, dict], timeout: Union[float, None] = None, polling_strategy: Union['PollingStrategy', None] = None
+    ) -> 'WebElement':
         """Waits for the specified row to appear in the grid, reloading the store until
         it is found, or until the timeout is hit.
 
         Args:
             grid_cq (str): The component query for the grid.
             row_data (Union[int, dict]): The row data or index of the record we are waiting for.
-            timeout (int, optional): The number of seconds to wait for the row before erroring. Defaults to 60.
+            timeout (float, optional): The number of seconds to wait for the row before erroring.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 60.
+            polling_strategy (PollingStrategy, optional): How often to poll, which is also how often the store is reloaded.
+                                                          Defaults to `PollingStrategy.get_default()`.
 
         Returns:
             WebElement: The DOM element for the row
         """
-        WebDriverWait(self._driver, timeout).until(
-            GridHelper.RowFoundExpectation(grid_cq, row_data)
-        )
-        return self.get_row(grid_cq, row_data)
+        timeout = self._get_wait_timeout('wait_for_row', grid_cq, timeout, 60)
+
+        # Check grid can be found and is visible, so that each poll need only look for the row
+        self._cq.wait_for_single_query_visible(grid_cq, polling_strategy=polling_strategy)
+
+        with self._recording_wait('wait_for_row', grid_cq):
+            return self._poll_until(GridHelper.RowFoundExpectation(grid_cq, row_data, self), timeout, polling_strategy)
 
     def wait_to_click_row(
-        self, grid_cq: str, row_data: Union[int, dict], timeout: float = 120
+        self, grid_cq: str, row_data: Union[int, dict], timeout: Union[float, None] = None
     ):
         """Waits for the specified row to appear in the grid, reloading the store until
         it is found, or until the timeout is hit.
@@ -574,11 +637,10 @@ class GridHelper(HasReferencedJavaScript):
         Args:
             grid_cq (str): The component query for the grid.
             row_data (Union[int, dict]): The row data or index of the record we are waiting for.
-            timeout (int, optional): The number of seconds to wait for the row before erroring. Defaults to 60.
+            timeout (float, optional): The number of seconds to wait for the row before erroring.
+                                       Defaults to the adaptive timeout of `wait_for_row`, see `WaitAnalytics`, if there is one, otherwise 120.
         """
-        WebDriverWait(self._driver, timeout).until(
-            GridHelper.RowFoundExpectation(grid_cq, row_data)
-        )
+        self.wait_for_row(grid_cq, row_data, self._get_wait_timeout('wait_for_row', grid_cq, timeout, 120))
         self._core.wait_for_no_ajax_requests_in_progress()
         self.click_row(grid_cq, row_data)
         self.check_row_selected(grid_cq, row_data)
@@ -595,6 +657,8 @@ class GridHelper(HasReferencedJavaScript):
             grid_cq (str): The component query for the grid.
             row_data (List[Union[int, dict]]): The row data or index of the record we are waiting for to be clicked after holding CONTROL.
         """
+        from selenium.webdriver.common.keys import Keys
+
         if not row_data:
             raise ValueError("row_data must contain at least one row")
         self.wait_to_click_row(grid_cq, row_data[0])
@@ -654,6 +718,8 @@ class GridHelper(HasReferencedJavaScript):
             grid_cq (str): CQ of grid
             row_data (Union[int, dict]): Data of row to check.
         """
+        from selenium.webdriver.common.by import By
+
         check_row = self.get_row(
             grid_cq,
             row_data,
@@ -726,29 +792,35 @@ class GridHelper(HasReferencedJavaScript):
     class RowFoundExpectation:
         """An expectation for checking that a row has been found"""
 
-        def __init__(self, grid_cq: str, row_data: Union[int, dict]):
+        def __init__(self, grid_cq: str, row_data: Union[int, dict], grid_helper: Union['GridHelper', None] = None):
             """Initialises an instance of this class.
 
             Args:
                 grid_cq (str): The component query for the grid.
                 row_data (Union[int, dict]): The row data or index of the record we are waiting for.
+                grid_helper (GridHelper, optional): The instance to use to find the row. Defaults to the one from the driver's `Session`.
             """
             self._grid_cq = grid_cq
             self._row_data = row_data
+            self._grid_helper = grid_helper
 
         def __call__(self, driver):
             """Method that determines whether a row was found.
 
             If the row is not found the grid is refreshed and the load waited for.
+
+            Returns:
+                WebElement: The DOM element for the row, or False if it was not found.
             """
-            grid_helper = GridHelper(driver)
+            if self._grid_helper is None:
+                self._grid_helper = Session(driver).grid_helper
 
-            row = grid_helper.get_row(self._grid_cq, self._row_data, False)
+            row = self._grid_helper._find_row(self._grid_cq, self._row_data) # pylint: disable=protected-access
             if row:
-                return True
+                return row
 
             # Trigger a reload, and wait for it to complete
-            store_helper = StoreHelper(driver)
+            store_helper = self._grid_helper._store_helper # pylint: disable=protected-access
             store_helper.reset_store_load_count(self._grid_cq)
             store_helper.trigger_reload(self._grid_cq)
             store_helper.wait_for_store_loaded(self._grid_cq)
@@ -1,29 +1,305 @@
 """
 Module that contains our HasReferencedJavaScript class.
 """
+import time
+import uuid
+import warnings
+from contextlib import contextmanager
+from importlib import resources
 from logging import Logger
-from os import path
-import pkg_resources
+from typing import Any, Callable, Iterator, TYPE_CHECKING, Union
+from weakref import WeakKeyDictionary
 
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.remote.command import Command
 
-class HasReferencedJavaScript:
-    """Base class to be used by our test classes that have JavaScript that they need to load"""
+from pyseext import __version__
+from pyseext.call_batch import CallBatch
+from pyseext.dev_tools_transport import DevToolsTransport
+from pyseext.instrumentation import Instrumentation
+from pyseext.instrumented_helper import InstrumentedHelper
+from pyseext.logging_policy import LoggingPolicy
+from pyseext.payload_codec import PayloadCodec
+from pyseext.polling_strategy import PollingStrategy
+from pyseext.wait_analytics import WaitAnalytics
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+_SCRIPT_SOURCE_CACHE: dict[str, str] = {}
+"""Process-wide cache of our decoded JavaScript sources, keyed on file name, so that each file is only read once."""
+
+class HasReferencedJavaScript(InstrumentedHelper):
+    """Base class to be used by our test classes that have JavaScript that they need to load.
+
+    Rather than asking the browser whether our JavaScript is loaded before every call, we plant a
+    token in the page when we load it, and remember per driver which classes have been loaded for that token.
+    Our JavaScript functions are called by name through a constant script that checks for the token first,
+    so only after a navigation does a call report that our JavaScript is missing, at which point it is loaded
+    and the call retried once.
+
+    Nothing is sent to the browser when an instance is constructed, so helpers are cheap to create; our
+    JavaScript is loaded on the first call that needs it.
+    """
+
+    # Public class properties
+    USE_BUNDLED_JAVASCRIPT: bool = False
+    """Indicates whether all of our JavaScript should be injected as a single, versioned bundle the first
+    time any class needs it on a page, rather than each class injecting its own script. Defaults to False."""
+
+    USE_PRELOAD_SCRIPTS: bool = False
+    """Indicates whether our bundled JavaScript should be registered as a WebDriver BiDi preload script, the first
+    time any class needs it for a driver, so that the browser installs it before any page script runs on every navigation.
+    Our calls then never need to load anything after a navigation.
+    If the driver does not support BiDi then we fall back to loading our JavaScript when it is found to be missing.
+    Implies `USE_BUNDLED_JAVASCRIPT`. Defaults to False."""
+
+    USE_DEV_TOOLS_TRANSPORT: bool = False
+    """Indicates whether calls to our JavaScript that neither take nor return elements should be made using the Chrome
+    DevTools Protocol, rather than the WebDriver's execute_script, when the browser is Chromium based.
+    See `DevToolsTransport` for details. Defaults to False."""
+
+    USE_COMPRESSED_PAYLOADS: bool = False
+    """Indicates whether calls to our JavaScript that neither take nor return elements should compress arguments and results
+    whose JSON is at least `COMPRESSED_PAYLOAD_THRESHOLD` characters, which saves time when the browser is remote.
+    Results are compressed using the browser's `CompressionStream`, and arguments decompressed using its `DecompressionStream`,
+    so compressing large arguments requires a browser that supports them. See `PayloadCodec` for details.
+    Takes precedence over `USE_DEV_TOOLS_TRANSPORT` for those calls. Defaults to False."""
+
+    COMPRESSED_PAYLOAD_THRESHOLD: int = PayloadCodec.DEFAULT_THRESHOLD
+    """The size of JSON, in characters, from which arguments and results are compressed when `USE_COMPRESSED_PAYLOADS` is set"""
+
+    USE_IN_BROWSER_WAITS: bool = True
+    """Indicates whether waits on our JavaScript functions, such as `ComponentQuery.wait_for_query`, are made in the browser,
+    which evaluates the function on a timer and calls back as soon as it holds, so a wait costs a single roundtrip and reacts
+    within milliseconds. Otherwise waits poll from Python, see `PollingStrategy`. Defaults to True."""
+
+    IN_BROWSER_WAIT_INTERVAL: Union[float, None] = 0.01
+    """The number of seconds between evaluations of the function being waited for in the browser.
+    If None then it is evaluated on every animation frame, using `requestAnimationFrame`. Defaults to 0.01."""
+
+    IN_BROWSER_WAIT_MAX_CALL_TIME: float = 20
+    """The longest, in seconds, that a single call waits in the browser. Longer waits are made using several calls.
+    Each call is also kept `IN_BROWSER_WAIT_SCRIPT_TIMEOUT_MARGIN` seconds below the WebDriver's script timeout. Defaults to 20."""
+
+    IN_BROWSER_WAIT_SCRIPT_TIMEOUT_MARGIN: float = 2
+    """The number of seconds by which each call that waits in the browser is kept below the WebDriver's script timeout,
+    to allow for the time taken by the roundtrip. If the script timeout is shorter than twice this margin then calls
+    wait for half of it instead. Defaults to 2."""
 
     # Class variables
-    _SCRIPT_LOADED_TEST_TEMPLATE: str = \
-        "return globalThis.Ext && globalThis.Ext.isDefined && globalThis.Ext.isDefined(globalThis.PySeExt && globalThis.PySeExt.{class_name})"
-    """The script template to use to determine whether the JavaScript for a class has been loaded"""
+    _NOT_LOADED_RESULT: str = '__PySeExtNotLoaded__'
+    """The value returned by a guarded script when our JavaScript is not loaded for the current page token"""
+
+    _IS_PAGE_TOKEN_PRESENT_SCRIPT: str = "return !!(globalThis.PySeExt && globalThis.PySeExt.__pageToken === arguments[0]);"
+    """The script to use to determine whether our page token is present. Takes the page token as its only argument."""
+
+    _CALL_FUNCTION_SCRIPT: str = """var pySeExt = globalThis.PySeExt, owner;
+if (!(pySeExt && pySeExt.__pageToken === arguments[0])) { return '__PySeExtNotLoaded__'; }
+owner = pySeExt[arguments[1]];
+return owner[arguments[2]].apply(owner, Array.prototype.slice.call(arguments, 3));"""
+    """The script to use to call one of our JavaScript functions, so long as our page token is present.
+    Takes the page token, class name and function name as its first three arguments, followed by the arguments
+    for the function. Since the text never changes the browser only has to parse it once.
+    Returns `_NOT_LOADED_RESULT` if the page token is not present."""
+
+    _CALL_ASYNC_FUNCTION_SCRIPT: str = """var pySeExt = globalThis.PySeExt, owner;
+if (!(pySeExt && pySeExt.__pageToken === arguments[0])) { arguments[arguments.length - 1]('__PySeExtNotLoaded__'); return; }
+owner = pySeExt[arguments[1]];
+owner[arguments[2]].apply(owner, Array.prototype.slice.call(arguments, 3));"""
+    """The script to use to call one of our asynchronous JavaScript functions, so long as our page token is present.
+    Takes the same arguments as `_CALL_FUNCTION_SCRIPT`, with the function being passed the WebDriver's callback as its last argument.
+    Passes `_NOT_LOADED_RESULT` to the callback if the page token is not present."""
+
+    _COMPRESSED_SCRIPT_TEMPLATE: str = """var pySeExt = globalThis.PySeExt, threshold = arguments[3], envelope = arguments[4], callback = arguments[5];
+if (!(pySeExt && pySeExt.__pageToken === arguments[0])) {{ callback('__PySeExtNotLoaded__'); return; }}
+var className = arguments[1], functionName = arguments[2];
+function pipe(data, stream) {{ return new Response(new Blob([data]).stream().pipeThrough(stream)); }}
+function fail(error) {{ callback({{ error: String((error && error.message) || error) }}); }}
+function invoke(args) {{
+{invoke}
+}}
+function call(args) {{
+    var result, json;
+    try {{
+        result = invoke(args);
+        json = JSON.stringify(result);
+    }} catch (error) {{
+        fail(error);
+        return;
+    }}
+    if (json === undefined || json.length < threshold || typeof CompressionStream === 'undefined') {{
+        callback({{ value: result }});
+        return;
+    }}
+    pipe(json, new CompressionStream('gzip')).arrayBuffer().then(function(buffer) {{
+        var bytes = new Uint8Array(buffer), binary = '', i;
+        for (i = 0; i < bytes.length; i += 32768) {{
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 32768));
+        }}
+        callback({{ gzip: btoa(binary) }});
+    }}, fail);
+}}
+if (envelope.gzip) {{
+    pipe(Uint8Array.from(atob(envelope.gzip), function(c) {{ return c.charCodeAt(0); }}), new DecompressionStream('gzip')).text().then(function(json) {{
+        call(JSON.parse(json));
+    }}, fail);
+}} else {{
+    call(envelope.value);
+}}"""
+    """The script template to use to build an asynchronous script that calls our JavaScript with compressed payloads,
+    so long as our page token is present. The script takes the page token, class name, function name, compression threshold
+    and an envelope holding the arguments, as encoded by `PayloadCodec.encode`, and passes the callback an envelope holding the result.
+    It passes `_NOT_LOADED_RESULT` to the callback if the page token is not present.
+    Requires the inserts: {invoke}, the body of a function that is passed the arguments and returns the result"""
+
+    _CALL_FUNCTION_COMPRESSED_SCRIPT: str = _COMPRESSED_SCRIPT_TEMPLATE.format(invoke="""    var owner = pySeExt[className];
+    return owner[functionName].apply(owner, args);""")
+    """The asynchronous script to use to call one of our JavaScript functions with compressed payloads, so long as our page token is present.
+    Takes the page token, class name, function name, compression threshold and an envelope holding the arguments for the function,
+    as encoded by `PayloadCodec.encode`, and passes the callback an envelope holding the result.
+    Passes `_NOT_LOADED_RESULT` to the callback if the page token is not present."""
+
+    _CALL_FUNCTIONS_COMPRESSED_SCRIPT: str = _COMPRESSED_SCRIPT_TEMPLATE.format(invoke="""    var results = [], i, owner;
+    for (i = 0; i < args.length; i += 1) {
+        try {
+            owner = pySeExt[args[i][0]];
+            results.push({ value: owner[args[i][1]].apply(owner, args[i][2]) });
+        } catch (error) {
+            results.push({ error: String((error && error.message) || error) });
+        }
+    }
+    return results;""")
+    """The asynchronous script to use to call a number of our JavaScript functions in one go with compressed payloads,
+    so long as our page token is present. Takes the same arguments as `_CALL_FUNCTION_COMPRESSED_SCRIPT`, except that the class
+    and function names are unused, and the envelope holds a list of [class name, function name, arguments] for the calls.
+    The result is a list containing either the value or the error for each call, as for `_CALL_FUNCTIONS_SCRIPT`."""
+
+    _WAIT_FOR_FUNCTION_SCRIPT: str = """var pySeExt = globalThis.PySeExt, args = arguments[3], negate = arguments[4], settleTime = arguments[5],
+    timeout = arguments[6], interval = arguments[7], callback = arguments[8], functionName = arguments[2], owner, start = Date.now(), metSince = null;
+if (!(pySeExt && pySeExt.__pageToken === arguments[0])) { callback('__PySeExtNotLoaded__'); return; }
+owner = pySeExt[arguments[1]];
+function isMet(value) {
+    var met = Array.isArray(value) ? value.length > 0 : !!value;
+    return negate ? !met : met;
+}
+function schedule() {
+    if (interval === null && globalThis.requestAnimationFrame) {
+        globalThis.requestAnimationFrame(check);
+    } else {
+        setTimeout(check, interval || 0);
+    }
+}
+function check() {
+    var value, now;
+    try {
+        value = owner[functionName].apply(owner, args);
+    } catch (error) {
+        callback({ error: String((error && error.message) || error) });
+        return;
+    }
+    now = Date.now();
+    if (isMet(value)) {
+        if (metSince === null) { metSince = now; }
+        if (now - metSince >= settleTime) { callback({ value: negate ? true : value }); return; }
+    } else {
+        metSince = null;
+    }
+    if (now - start >= timeout) { callback({ timedOut: true }); return; }
+    schedule();
+}
+check();"""
+    """The asynchronous script to use to wait, in the browser, for one of our JavaScript functions to return a value that
+    Python would consider true, so long as our page token is present. An empty array is not considered true.
+    Takes the page token, class name, function name, a list of arguments for the function, whether to wait for the value
+    to be false instead, how many milliseconds the value must hold for, the timeout in milliseconds, and the milliseconds
+    between evaluations, or null to use requestAnimationFrame.
+    Passes the callback an envelope holding the 'value' or 'error', as for `PayloadCodec.decode`, or `timedOut`.
+    Passes `_NOT_LOADED_RESULT` to the callback if the page token is not present."""
+
+    _UNLOADED_WHILE_WAITING_MESSAGE: str = 'unload'
+    """Part of the message of the error a WebDriver raises if the page is navigated away from during an asynchronous script"""
+
+    _CALL_FUNCTIONS_SCRIPT: str = """var pySeExt = globalThis.PySeExt, calls = arguments[1], results = [], i, call, owner;
+if (!(pySeExt && pySeExt.__pageToken === arguments[0])) { return '__PySeExtNotLoaded__'; }
+for (i = 0; i < calls.length; i += 1) {
+    call = calls[i];
+    try {
+        owner = pySeExt[call[0]];
+        results.push({ value: owner[call[1]].apply(owner, call[2]) });
+    } catch (error) {
+        results.push({ error: String((error && error.message) || error) });
+    }
+}
+return results;"""
+    """The script to use to call a number of our JavaScript functions in one go, so long as our page token is present.
+    Takes the page token, and a list of [class name, function name, arguments] for the calls.
+    Returns a list containing either the value or the error for each call, or `_NOT_LOADED_RESULT` if the page token is not present."""
+
+    _CLASS_SCRIPT_TEMPLATE: str = """var isSamePage = !!(globalThis.PySeExt && globalThis.PySeExt.__pageToken === arguments[0]);
+if (!isSamePage) {{
+{page_change_script}
+}}
+{script}
+if (!isSamePage) {{
+    globalThis.PySeExt.__pageToken = arguments[1];
+}}
+return isSamePage;"""
+    """The script template to use to load the JavaScript for a single class, and plant our page token.
+    Takes the current and new page tokens as arguments, and returns whether the current token was already present.
+    Requires the inserts: {page_change_script}, the JavaScript for the classes thought to be loaded already, which is only run
+    if the current token is not present, and {script}, the JavaScript that is always run"""
+
+    _BUNDLED_SCRIPT_TEMPLATE: str = """var loadedVersion = globalThis.PySeExt && globalThis.PySeExt.__version,
+    isSamePage = !!(globalThis.PySeExt && globalThis.PySeExt.__pageToken === arguments[0]);
+if (loadedVersion && loadedVersion !== '{version}') {{
+    return {{ version: loadedVersion, isSamePage: isSamePage }};
+}}
+{scripts}
+globalThis.PySeExt.__version = '{version}';
+if (!isSamePage) {{
+    globalThis.PySeExt.__pageToken = arguments[1];
+}}
+return {{ version: globalThis.PySeExt.__version, isSamePage: isSamePage }};"""
+    """The script template to use to inject all of our JavaScript in a single call, and plant our page token.
+    Takes the current and new page tokens as arguments, and returns the loaded version and whether the current token was already present.
+    If a different version is already loaded then nothing is injected.
+    Requires the inserts: {version}, {scripts}"""
+
+    _PRELOAD_SCRIPT_TEMPLATE: str = """() => {{
+{scripts}
+globalThis.PySeExt.__version = '{version}';
+globalThis.PySeExt.__pageToken = '{page_token}';
+}}"""
+    """The function declaration to use to register all of our JavaScript as a preload script, which plants a fixed page token.
+    Requires the inserts: {version}, {scripts}, {page_token}"""
+
+    _BUNDLED_SCRIPT_FIRST_CLASS_NAME: str = 'Core'
+    """The name of the class whose JavaScript is placed first in the bundle"""
+
+    _bundled_script: Union[str, None] = None
+    """The bundled script, built the first time it is needed"""
+
+    _bundled_script_sources: Union[str, None] = None
+    """The sources of all of our JavaScript joined together, built the first time they are needed"""
+
+    _preload_page_tokens: 'WeakKeyDictionary[WebDriver, Union[str, None]]' = WeakKeyDictionary()
+    """The page token planted by the preload script registered for each WebDriver, or None if a driver does not support them"""
+
+    _script_timeouts: 'WeakKeyDictionary[WebDriver, Union[float, None]]' = WeakKeyDictionary()
+    """The script timeout of each WebDriver, in seconds, read the first time a wait is made in the browser, or None if it has none"""
 
-    _SCRIPT_LOAD_TIMEOUT: float = 10
-    """The script loading timeout to use. Defaults to 10 seconds."""
+    _page_states: 'WeakKeyDictionary[WebDriver, HasReferencedJavaScript._PageState]' = WeakKeyDictionary()
+    """The state of the current page for each WebDriver, as far as our JavaScript is concerned"""
+
+    _REQUIRED_JAVASCRIPT_CLASS_NAMES: tuple[str, ...] = ()
+    """The names of the other classes whose JavaScript our JavaScript uses, which is loaded along with ours"""
 
     _ASYNC_SCRIPT_TEMPLATE: str = "var {callback_parameter_name} = arguments[arguments.length - 1]; {script}"
     """The script template to use to call some Asynchronous JavaScript, that has a callback for its last parameter.
     Requires the inserts: {callback_parameter_name}, {script}"""
 
-    def __init__(self, driver: WebDriver, logger: Logger):
+    def __init__(self, driver: 'WebDriver', logger: Logger):
         """Initialises an instance of this class
 
         Args:
@@ -36,27 +312,551 @@ class HasReferencedJavaScript:
         self._logger = logger
         """The Logger instance for this class instance"""
 
-        self.ensure_javascript_loaded()
-
     def ensure_javascript_loaded(self):
         """Ensures that our JavaScript has been loaded into the DOM.
 
         If it hasn't then it is loaded.
+
+        When `USE_BUNDLED_JAVASCRIPT` is set then the JavaScript for all classes is loaded in one go.
+        When `USE_PRELOAD_SCRIPTS` is set, and supported, this is only ever needed for the page that is current
+        when our preload script is registered.
+        """
+        page_state = self._get_page_state()
+
+        if page_state.is_loaded(type(self).__name__):
+            if self._driver.execute_script(self._IS_PAGE_TOKEN_PRESENT_SCRIPT, page_state.page_token):
+                return
+
+            self._logger.debug("JavaScript for '%s' is no longer loaded, the page must have changed", type(self).__name__)
+            page_state.reset(None)
+
+        self._load_javascript(page_state)
+
+    def _call_function(self,
+                       function_name: str,
+                       *args,
+                       deferrable: bool = False,
+                       result_handler: Union[Callable[[Any], Any], None] = None,
+                       returns_elements: bool = False) -> Any:
+        """Calls one of the JavaScript functions for this class, e.g. `PySeExt.GridHelper.getRow`.
+
+        The arguments are passed through the WebDriver's argument marshalling rather than being formatted
+        into the script, so they can be any JSON safe value or a WebElement.
+
+        If our JavaScript is not known to be loaded into the current page then it is loaded first.
+        If the call reports that it is not loaded (so there has been a navigation) then it is loaded
+        and the call retried once.
+
+        If a `CallBatch` is active for our driver then a deferrable call is queued on it, and a
+        `CallBatch.DeferredResult` returned. Any other call flushes the batch first.
+
+        If `USE_COMPRESSED_PAYLOADS` is set then large arguments and results of calls that do not return elements are compressed.
+        Otherwise, if `USE_DEV_TOOLS_TRANSPORT` is set, calls that do not return elements are made using DevTools where possible.
+
+        Args:
+            function_name (str): The name of the function to call.
+            *args: Any arguments for the function.
+            deferrable (bool, optional): Indicates whether the call can be queued on an active batch.
+                                         Should only be set for calls that do not change the page. Defaults to False.
+            result_handler (Callable[[Any], Any], optional): A function to convert the result of the call into
+                                                             the value returned. Defaults to None.
+            returns_elements (bool, optional): Indicates whether the function returns elements, so must be called
+                                               using the WebDriver. Defaults to False.
+
+        Returns:
+            Any: The result of the function, or a `CallBatch.DeferredResult` if the call was queued.
+        """
+        call_batch = CallBatch.get_active(self._driver)
+
+        if call_batch:
+            if deferrable:
+                return call_batch.add(self, function_name, args, result_handler)
+
+            call_batch.flush()
+
+        if returns_elements:
+            result = self._call_guarded(self._driver.execute_script, self._CALL_FUNCTION_SCRIPT, function_name, args)
+        elif self.USE_COMPRESSED_PAYLOADS:
+            result = self._call_guarded(self._execute_compressed, self._CALL_FUNCTION_COMPRESSED_SCRIPT, function_name, args)
+        else:
+            result = self._call_guarded(self._get_execute_script_by_value(), self._CALL_FUNCTION_SCRIPT, function_name, args)
+
+        if result_handler:
+            result = result_handler(result)
+
+        return result
+
+    def _call_async_function(self, function_name: str, *args) -> Any:
+        """Calls one of the asynchronous JavaScript functions for this class, that takes a callback as its last parameter.
+
+        See `_call_function` for how arguments and loading are handled.
+
+        Args:
+            function_name (str): The name of the function to call.
+            *args: Any arguments for the function, not including the callback.
+
+        Returns:
+            Any: The value passed to the callback by the function.
+        """
+        call_batch = CallBatch.get_active(self._driver)
+
+        if call_batch:
+            call_batch.flush()
+
+        return self._call_guarded(self._driver.execute_async_script, self._CALL_ASYNC_FUNCTION_SCRIPT, function_name, args)
+
+    def _wait_for_function(self,
+                           function_name: str,
+                           *args,
+                           timeout: float,
+                           negate: bool = False,
+                           settle_time: Union[float, None] = None) -> Any:
+        """Waits, in the browser, for one of the JavaScript functions for this class to return a value that Python
+        would consider true, e.g. a non-empty array.
+
+        The function is evaluated every `IN_BROWSER_WAIT_INTERVAL` seconds, and the call returns as soon as it holds,
+        so the wait costs a single roundtrip, or one for every `IN_BROWSER_WAIT_MAX_CALL_TIME` seconds of a longer wait.
+        Each call is kept within the WebDriver's script timeout, which is read the first time a driver waits, and again
+        if a call still exceeds it.
+        If the page is navigated away from during the wait, then the wait carries on in the new page.
+
+        The settle time is limited to half of the timeout, and half of the time a single call can wait,
+        so that the value has the chance to hold for long enough within a call.
+
+        See `_call_function` for how arguments and loading are handled.
+
+        Args:
+            function_name (str): The name of the function to wait for.
+            *args: Any arguments for the function.
+            timeout (float): Number of seconds before timing out.
+            negate (bool, optional): Indicates whether to wait for the function to return a false value instead. Defaults to False.
+            settle_time (float, optional): The number of seconds that the value must continuously hold for. Defaults to None.
+
+        Returns:
+            Any: The value returned by the function, or True if negated.
+
+        Raises:
+            TimeoutException: If the function does not hold within the timeout.
+        """
+        call_batch = CallBatch.get_active(self._driver)
+
+        if call_batch:
+            call_batch.flush()
+
+        interval = None if self.IN_BROWSER_WAIT_INTERVAL is None else int(self.IN_BROWSER_WAIT_INTERVAL * 1000)
+        deadline = time.monotonic() + timeout
+        max_call_time = self._get_max_wait_call_time()
+
+        self._logger.debug("Waiting in the browser for '%s' with arguments %s", function_name, LoggingPolicy.render(args))
+
+        while True:
+            call_time = min(max(deadline - time.monotonic(), 0), max_call_time)
+            settle_time_ms = int(min(settle_time or 0, timeout / 2, max_call_time / 2) * 1000)
+
+            try:
+                envelope = self._call_guarded(self._driver.execute_async_script,
+                                              self._WAIT_FOR_FUNCTION_SCRIPT,
+                                              function_name,
+                                              (list(args), negate, settle_time_ms, int(call_time * 1000), interval))
+            except TimeoutException:
+                # The script timeout must have been lowered since we read it
+                self._script_timeouts.pop(self._driver, None)
+                previous_max_call_time, max_call_time = max_call_time, self._get_max_wait_call_time()
+
+                if max_call_time >= previous_max_call_time:
+                    raise
+
+                self._logger.debug("Waiting in the browser for '%s' exceeded the script timeout, waiting for at most %s seconds per call",
+                                   function_name, max_call_time)
+                envelope = {'timedOut': True}
+            except JavascriptException as exc:
+                if self._UNLOADED_WHILE_WAITING_MESSAGE not in str(exc.msg):
+                    raise
+
+                # The next call finds our page token missing, so loads our JavaScript into the new page
+                self._logger.debug("Page unloaded while waiting for '%s'", function_name)
+                envelope = {'timedOut': True}
+
+            if not envelope.get('timedOut'):
+                return PayloadCodec.decode(envelope)
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Waiting for 'PySeExt.{type(self).__name__}.{function_name}' timed out after {timeout} seconds")
+
+    def _get_max_wait_call_time(self) -> float:
+        """Gets the longest, in seconds, that a single call can wait in the browser, which is `IN_BROWSER_WAIT_MAX_CALL_TIME`
+        kept within the WebDriver's script timeout.
+
+        Returns:
+            float: The number of seconds.
+        """
+        if self._driver not in self._script_timeouts:
+            self._script_timeouts[self._driver] = self._read_script_timeout()
+
+        script_timeout = self._script_timeouts[self._driver]
+        if script_timeout is None:
+            return self.IN_BROWSER_WAIT_MAX_CALL_TIME
+
+        return min(self.IN_BROWSER_WAIT_MAX_CALL_TIME, max(script_timeout - self.IN_BROWSER_WAIT_SCRIPT_TIMEOUT_MARGIN, script_timeout / 2))
+
+    def _read_script_timeout(self) -> Union[float, None]:
+        """Reads the WebDriver's script timeout.
+
+        Returns:
+            Union[float, None]: The number of seconds, or None if scripts never time out, or the timeout could not be read.
+        """
+        try:
+            script_timeout = (self._driver.execute(Command.GET_TIMEOUTS)['value'] or {}).get('script')
+        except WebDriverException as exc:
+            self._logger.debug("Could not read the script timeout: %s", exc)
+            return None
+
+        return None if script_timeout is None else script_timeout / 1000
+
+    def _poll_until(self,
+                    method: Callable[['WebDriver'], Any],
+                    timeout: float,
+                    polling_strategy: Union[PollingStrategy, None] = None) -> Any:
+        """Polls a method, such as one of our Expectation classes, from Python until it returns a value that is not false.
+
+        Args:
+            method (Callable[[WebDriver], Any]): The method to poll, which is passed our driver.
+            timeout (float): Number of seconds before timing out.
+            polling_strategy (PollingStrategy, optional): How often to poll. Defaults to `PollingStrategy.get_default()`.
+
+        Returns:
+            Any: The value returned by the method.
+
+        Raises:
+            TimeoutException: If the method does not return a value that is not false within the timeout.
+        """
+        return (polling_strategy or PollingStrategy.get_default()).until(self._driver, method, timeout)
+
+    def _get_wait_timeout(self, wait_name: str, subject: Union[str, None], timeout: Union[float, None], default: float) -> float:
+        """Gets the timeout for one of our waits, which is the one given, if any, otherwise an adaptive timeout
+        from the current `WaitAnalytics`, if any, otherwise the default.
+
+        Args:
+            wait_name (str): The name of the wait method, e.g. 'wait_for_query'.
+            subject (str, optional): What is being waited for, generally a component query.
+            timeout (float, optional): The timeout given to the wait, if any.
+            default (float): The usual default timeout of the wait.
+
+        Returns:
+            float: The number of seconds before timing out.
+        """
+        if timeout is not None:
+            return timeout
+
+        analytics = WaitAnalytics.get_current()
+        if analytics is None:
+            return default
+
+        return analytics.get_timeout(f'{type(self).__name__}.{wait_name}', subject, default)
+
+    @contextmanager
+    def _recording_wait(self, wait_name: str, subject: Union[str, None]) -> Iterator[None]:
+        """A context manager that records the time taken by one of our waits with the current `WaitAnalytics`, if any,
+        provided the wait is satisfied, i.e. does not raise.
+
+        Args:
+            wait_name (str): The name of the wait method, e.g. 'wait_for_query'.
+            subject (str, optional): What is being waited for, generally a component query.
+        """
+        analytics = WaitAnalytics.get_current()
+        if analytics is None:
+            yield
+            return
+
+        start_time = time.monotonic()
+        yield
+        analytics.record(f'{type(self).__name__}.{wait_name}', subject, time.monotonic() - start_time)
+
+    def _call_guarded(self, execute, script: str, function_name: str, args: tuple) -> Any:
+        """Calls a JavaScript function using the supplied execute method and script, guarded by our page token.
+
+        Args:
+            execute (Callable): The WebDriver method to use to execute the script.
+            script (str): The script to use to call the function.
+            function_name (str): The name of the function to call.
+            args (tuple): The arguments for the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        page_state = self._get_page_state()
+        class_name = type(self).__name__
+
+        with Instrumentation.span(Instrumentation.SPAN_KIND_SCRIPT, f'PySeExt.{class_name}.{function_name}', self._driver, args):
+            if page_state.is_loaded(class_name):
+                result = execute(script, page_state.page_token, class_name, function_name, *args)
+                if result != self._NOT_LOADED_RESULT:
+                    return result
+
+                self._logger.debug("JavaScript for '%s' is no longer loaded, the page must have changed", class_name)
+                page_state.reset(None)
+
+            self._load_javascript(page_state)
+
+            result = execute(script, page_state.page_token, class_name, function_name, *args)
+            if result == self._NOT_LOADED_RESULT:
+                raise HasReferencedJavaScript.JavaScriptNotLoadedException(class_name)
+
+            return result
+
+    def _call_functions(self, calls: list[tuple['HasReferencedJavaScript', str, tuple]]) -> list[dict]:
+        """Calls a number of JavaScript functions, possibly belonging to other classes, in a single roundtrip.
+
+        The JavaScript for each class is loaded first if need be, and the calls are made using the same transport and
+        payload compression as `_call_function`, so none of the functions may return elements.
+
+        Args:
+            calls (list[tuple[HasReferencedJavaScript, str, tuple]]): The helper, function name and arguments for each call.
+
+        Returns:
+            list[dict]: A dictionary for each call containing either its 'value' or its 'error'.
+        """
+        with Instrumentation.span(Instrumentation.SPAN_KIND_SCRIPT, 'PySeExt.callFunctions', self._driver, (len(calls),)):
+            return self._call_functions_guarded(calls)
+
+    def _call_functions_guarded(self, calls: list[tuple['HasReferencedJavaScript', str, tuple]]) -> list[dict]:
+        """Calls a number of JavaScript functions in a single roundtrip, guarded by our page token.
+
+        Args:
+            calls (list[tuple[HasReferencedJavaScript, str, tuple]]): The helper, function name and arguments for each call.
+
+        Returns:
+            list[dict]: A dictionary for each call containing either its 'value' or its 'error'.
         """
+        page_state = self._get_page_state()
+        helpers = {type(helper).__name__: helper for helper, _, _ in calls}
+        script_calls = [[type(helper).__name__, function_name, list(args)] for helper, function_name, args in calls]
+
+        if self.USE_COMPRESSED_PAYLOADS:
+            execute, script = self._execute_functions_compressed, self._CALL_FUNCTIONS_COMPRESSED_SCRIPT
+        else:
+            execute, script = self._get_execute_script_by_value(), self._CALL_FUNCTIONS_SCRIPT
+
+        if all(page_state.is_loaded(class_name) for class_name in helpers):
+            results = execute(script, page_state.page_token, script_calls)
+            if results != self._NOT_LOADED_RESULT:
+                return results
+
+            self._logger.debug("JavaScript for '%s' is no longer loaded, the page must have changed", "', '".join(helpers))
+            page_state.reset(None)
+
+        # If loading the JavaScript for one helper finds that the page has changed then the JavaScript for
+        # the helpers before it has gone too, so go round again until every helper is loaded into the same page
+        loaded_page_token = None
+        while loaded_page_token != page_state.page_token:
+            loaded_page_token = page_state.page_token
+
+            for class_name, helper in helpers.items():
+                if not page_state.is_loaded(class_name):
+                    helper._load_javascript(page_state) # pylint: disable=protected-access
+
+        results = execute(script, page_state.page_token, script_calls)
+        if results == self._NOT_LOADED_RESULT:
+            raise HasReferencedJavaScript.JavaScriptNotLoadedException("', '".join(helpers))
+
+        return results
+
+    def _execute_compressed(self, script: str, page_token: str, class_name: Union[str, None], function_name: Union[str, None], *args) -> Any:
+        """Executes a script built from `_COMPRESSED_SCRIPT_TEMPLATE`, encoding the arguments for, and decoding the result of, the function.
+
+        Args:
+            script (str): The script, generally `_CALL_FUNCTION_COMPRESSED_SCRIPT`.
+            page_token (str): Our page token.
+            class_name (str): The name of the class whose function is being called, if the script uses it.
+            function_name (str): The name of the function to call, if the script uses it.
+            *args: Any arguments for the function.
+
+        Returns:
+            Any: The result of the function, or `_NOT_LOADED_RESULT` if our page token is not present.
+        """
+        threshold = self.COMPRESSED_PAYLOAD_THRESHOLD
+        envelope = self._driver.execute_async_script(script, page_token, class_name, function_name, threshold, PayloadCodec.encode(list(args), threshold))
+
+        if envelope == self._NOT_LOADED_RESULT:
+            return envelope
+
+        return PayloadCodec.decode(envelope)
+
+    def _execute_functions_compressed(self, script: str, page_token: str, calls: list[list]) -> Any:
+        """Executes `_CALL_FUNCTIONS_COMPRESSED_SCRIPT`, encoding the calls, and decoding their results.
+
+        Args:
+            script (str): The script, which is `_CALL_FUNCTIONS_COMPRESSED_SCRIPT`.
+            page_token (str): Our page token.
+            calls (list[list]): The [class name, function name, arguments] for each call.
+
+        Returns:
+            Any: The results of the calls, or `_NOT_LOADED_RESULT` if our page token is not present.
+        """
+        return self._execute_compressed(script, page_token, None, None, *calls)
+
+    def _get_execute_script_by_value(self) -> Callable[..., Any]:
+        """Gets the method to use to execute a script whose arguments and result are JSON safe.
+
+        Returns:
+            Callable[..., Any]: The execute_script method of our `DevToolsTransport` if `USE_DEV_TOOLS_TRANSPORT` is set,
+                                otherwise that of our WebDriver.
+        """
+        if not self.USE_DEV_TOOLS_TRANSPORT:
+            return self._driver.execute_script
+
+        return DevToolsTransport.get_for_driver(self._driver).execute_script
+
+    def _get_page_state(self) -> 'HasReferencedJavaScript._PageState':
+        """Gets the state of the current page for our WebDriver, creating it if need be.
+
+        Returns:
+            HasReferencedJavaScript._PageState: The page state for our WebDriver.
+        """
+        page_state = HasReferencedJavaScript._page_states.get(self._driver)
+
+        if page_state is None:
+            page_state = HasReferencedJavaScript._PageState()
+            HasReferencedJavaScript._page_states[self._driver] = page_state
+
+        return page_state
+
+    def _load_javascript(self, page_state: 'HasReferencedJavaScript._PageState'):
+        """Loads our JavaScript into the current page, planting a page token if the page does not have ours.
+
+        Raises a `JavaScriptVersionMismatchException` if bundling and a different version of our JavaScript
+        has already been loaded into the page.
+
+        When `USE_PRELOAD_SCRIPTS` is set then our preload script is registered first, if it has not been already,
+        and the page token it plants is used, so that pages it loads into need nothing further.
+
+        Args:
+            page_state (HasReferencedJavaScript._PageState): The page state for our WebDriver, which is updated.
+        """
+        preload_page_token = self._register_preload_script() if self.USE_PRELOAD_SCRIPTS else None
+        new_page_token = preload_page_token or uuid.uuid4().hex
         class_name = type(self).__name__
+        use_bundle = self.USE_BUNDLED_JAVASCRIPT or self.USE_PRELOAD_SCRIPTS
+
+        if use_bundle:
+            self._logger.debug("Loading bundled JavaScript for version '%s'", __version__)
+            result = self._driver.execute_script(self._get_bundled_script(), page_state.page_token, new_page_token)
+
+            if result['version'] != __version__:
+                raise HasReferencedJavaScript.JavaScriptVersionMismatchException(result['version'], __version__)
+
+            is_same_page = result['isSamePage']
+        else:
+            # Any classes our JavaScript uses are loaded first, in the same script. Those we think are loaded already
+            # are only loaded if the page turns out to have changed, since then they are gone too.
+            class_names = [*self._REQUIRED_JAVASCRIPT_CLASS_NAMES, class_name]
+            loaded_class_names = [name for name in self._REQUIRED_JAVASCRIPT_CLASS_NAMES if page_state.is_loaded(name)]
+            unloaded_class_names = [name for name in class_names if name not in loaded_class_names]
+
+            self._logger.debug("Loading JavaScript for '%s'", "', '".join(unloaded_class_names))
+            script = self._CLASS_SCRIPT_TEMPLATE.format(page_change_script=self._get_class_scripts(loaded_class_names),
+                                                        script=self._get_class_scripts(unloaded_class_names))
+            is_same_page = self._driver.execute_script(script, page_state.page_token, new_page_token)
+
+        if not is_same_page:
+            page_state.reset(new_page_token)
+
+        if use_bundle:
+            page_state.is_bundle_loaded = True
+        else:
+            page_state.loaded_class_names.update(class_names)
+
+    @staticmethod
+    def _get_class_scripts(class_names: list[str]) -> str:
+        """Gets the JavaScript for a number of classes, joined together.
+
+        Args:
+            class_names (list[str]): The names of the classes.
+
+        Returns:
+            str: The joined JavaScript.
+        """
+        return ';\n'.join(HasReferencedJavaScript._get_script_source(f'PySeExt.{class_name}.js') for class_name in class_names)
+
+    def _register_preload_script(self) -> Union[str, None]:
+        """Registers our bundled JavaScript as a WebDriver BiDi preload script for our driver, if it has not been already.
+
+        Returns:
+            Union[str, None]: The page token that the preload script plants, or None if the driver does not support preload scripts.
+        """
+        if self._driver in HasReferencedJavaScript._preload_page_tokens:
+            return HasReferencedJavaScript._preload_page_tokens[self._driver]
 
-        # If our JavaScript has not been loaded then load it now
-        if not self._driver.execute_script(self._SCRIPT_LOADED_TEST_TEMPLATE.format(class_name=class_name)):
-            # Read JavaScript from package resources
-            stream = pkg_resources.resource_stream(__package__, path.join('js', f'PySeExt.{class_name}.js'))
+        page_token = uuid.uuid4().hex
 
-            self._logger.debug("Loading JavaScript from '%s'", stream.name)
-            self._driver.execute_script(str(stream.read(), encoding = "utf-8"))
+        try:
+            self._driver.script.add_preload_script(function_declaration=self._PRELOAD_SCRIPT_TEMPLATE.format(scripts=self._get_bundled_script_sources(),
+                                                                                                              version=__version__,
+                                                                                                              page_token=page_token))
+            self._logger.debug("Registered preload script for version '%s'", __version__)
+        except (AttributeError, WebDriverException) as exc:
+            self._logger.debug("Preload scripts are not supported, so will load JavaScript when needed: %s", exc)
+            page_token = None
 
-            # Wait for it to the loaded
-            WebDriverWait(self._driver,
-                          self._SCRIPT_LOAD_TIMEOUT).until(HasReferencedJavaScript.JavaScriptLoadedExpectation(class_name,
-                                                                                                               self._SCRIPT_LOADED_TEST_TEMPLATE))
+        HasReferencedJavaScript._preload_page_tokens[self._driver] = page_token
+        return page_token
+
+    @classmethod
+    def _get_bundled_script(cls) -> str:
+        """Gets the script that contains all of our JavaScript, building it the first time it is needed.
+
+        Returns:
+            str: The bundled script.
+        """
+        if HasReferencedJavaScript._bundled_script is None:
+            HasReferencedJavaScript._bundled_script = cls._BUNDLED_SCRIPT_TEMPLATE.format(version=__version__,
+                                                                                          scripts=cls._get_bundled_script_sources())
+
+        return HasReferencedJavaScript._bundled_script
+
+    @classmethod
+    def _get_bundled_script_sources(cls) -> str:
+        """Gets the sources of all of our JavaScript joined together, building them the first time they are needed.
+
+        Returns:
+            str: The joined sources.
+        """
+        if HasReferencedJavaScript._bundled_script_sources is None:
+            file_names = sorted(resource.name for resource in resources.files(__package__).joinpath('js').iterdir()
+                                if resource.name.startswith('PySeExt.') and resource.name.endswith('.js'))
+
+            # Ensure that core comes first, since others use it
+            first_file_name = f'PySeExt.{cls._BUNDLED_SCRIPT_FIRST_CLASS_NAME}.js'
+            if first_file_name in file_names:
+                file_names.remove(first_file_name)
+                file_names.insert(0, first_file_name)
+
+            scripts = [cls._get_script_source(file_name) for file_name in file_names]
+
+            HasReferencedJavaScript._bundled_script_sources = ';\n'.join(scripts)
+
+        return HasReferencedJavaScript._bundled_script_sources
+
+    @staticmethod
+    def _get_script_source(file_name: str) -> str:
+        """Gets the source of one of our JavaScript files from the package resources.
+
+        The source is only read from disk the first time it is requested, after which it is
+        served from a process-wide cache.
+
+        Args:
+            file_name (str): The name of the file in our 'js' folder, e.g. 'PySeExt.Core.js'.
+
+        Returns:
+            str: The decoded JavaScript source.
+        """
+        source = _SCRIPT_SOURCE_CACHE.get(file_name)
+
+        if source is None:
+            source = resources.files(__package__).joinpath('js').joinpath(file_name).read_text(encoding = "utf-8")
+            _SCRIPT_SOURCE_CACHE[file_name] = source
+
+        return source
 
     def get_async_script_content(self, script: str, callback_parameter_name: str = 'callback') -> str:
         """Builds some async script content, to call some JavaScript that takes a callback function.
@@ -73,8 +873,47 @@ class HasReferencedJavaScript:
         """
         return self._ASYNC_SCRIPT_TEMPLATE.format(callback_parameter_name=callback_parameter_name, script=script)
 
+    class _PageState:
+        """Tracks which of our JavaScript has been loaded into the current page of a WebDriver."""
+
+        def __init__(self):
+            """Initialises an instance of this class"""
+            self.page_token: Union[str, None] = None
+            """The token we planted in the page when we last loaded JavaScript into it, or None if we have not"""
+
+            self.loaded_class_names: set[str] = set()
+            """The names of the classes whose JavaScript has been loaded for the page token"""
+
+            self.is_bundle_loaded: bool = False
+            """Indicates whether our bundled JavaScript has been loaded for the page token"""
+
+        def is_loaded(self, class_name: str) -> bool:
+            """Determines whether the JavaScript for a class is known to be loaded for the page token.
+
+            Args:
+                class_name (str): The name of the class.
+
+            Returns:
+                bool: True if the JavaScript is loaded, False otherwise.
+            """
+            return self.page_token is not None and (self.is_bundle_loaded or class_name in self.loaded_class_names)
+
+        def reset(self, page_token: Union[str, None]):
+            """Resets the state for a new page, with the specified page token.
+
+            Args:
+                page_token (Union[str, None]): The token that has been planted in the new page, or None if we have not planted one yet.
+            """
+            self.page_token = page_token
+            self.loaded_class_names = set()
+            self.is_bundle_loaded = False
+
     class JavaScriptLoadedExpectation:
-        """ An expectation for checking that our JavaScript has loaded"""
+        """ An expectation for checking that our JavaScript has loaded
+
+        Deprecated, since our JavaScript is no longer waited for after loading it. Whether it is loaded is
+        determined by the page token planted in the page, see `ensure_javascript_loaded`.
+        """
 
         def __init__(self, class_name: str, test_template: str):
             """Initialises an instance of this class
@@ -83,9 +922,54 @@ class HasReferencedJavaScript:
                 class_name (str): The name of the class that we're loading the script for
                 test_template (str): The template to use to test for the script being loaded
             """
+            warnings.warn('JavaScriptLoadedExpectation is deprecated, and will be removed in a future version', DeprecationWarning, stacklevel=2)
+
             self._class_name = class_name
             self._test_template = test_template
 
         def __call__(self, driver):
             """Method that determines whether our JavaScript is present"""
             return driver.execute_script(self._test_template.format(class_name=self._class_name))
+
+    class JavaScriptNotLoadedException(Exception):
+        """Exception class thrown when our JavaScript is still not loaded after loading it."""
+
+        def __init__(self, class_name: str, message: str = "The JavaScript for '{class_name}' was not present after loading it. Is the page still navigating?"):
+            """Initialises an instance of this exception
+
+            Args:
+                class_name (str): The name of the class whose JavaScript was being loaded.
+                message (str, optional): The exception message. Defaults to "The JavaScript for '{class_name}' was not present after loading it. Is the page still navigating?".
+            """
+            self.message = message
+            self._class_name = class_name
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message.format(class_name=self._class_name)
+
+    class JavaScriptVersionMismatchException(Exception):
+        """Exception class thrown when a page already has a different version of our JavaScript loaded."""
+
+        def __init__(self,
+                     loaded_version: Union[str, None],
+                     expected_version: str,
+                     message: str = "The page has version '{loaded_version}' of the PySeExt JavaScript loaded, but version '{expected_version}' was expected."):
+            """Initialises an instance of this exception
+
+            Args:
+                loaded_version (str): The version of our JavaScript that is loaded in the page.
+                expected_version (str): The version of our JavaScript that we were expecting.
+                message (str, optional): The exception message. Defaults to "The page has version '{loaded_version}' of the PySeExt JavaScript loaded, but version '{expected_version}' was expected.".
+            """
+            self.message = message
+            self._loaded_version = loaded_version
+            self._expected_version = expected_version
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message.format(loaded_version=self._loaded_version, expected_version=self._expected_version)
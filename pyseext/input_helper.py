@@ -1,16 +1,17 @@
 """
 Module that contains our InputHelper class.
 """
-import logging
 import random
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
+from pyseext.instrumented_helper import InstrumentedHelper
+from pyseext.logging_policy import LoggingPolicy
 
-class InputHelper:
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+class InputHelper(InstrumentedHelper):
     """A class to help with user input."""
 
     INPUT_SLEEP_MINIMUM: float = 0.0001
@@ -19,13 +20,15 @@ class InputHelper:
     INPUT_SLEEP_MAXIMUM: float = 0.002
     """The maximum amount of time in seconds to wait between key presses when typing or other inputs. Defaults to 0.002 seconds."""
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
-        self._logger = logging.getLogger(__name__)
+        from selenium.webdriver.common.action_chains import ActionChains
+
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -34,7 +37,7 @@ class InputHelper:
         self._action_chains = ActionChains(driver)
         """The ActionChains instance for this class instance"""
 
-    def type_into_element(self, element: WebElement, text: str, delay: float = 0.1, tab_off: Union[bool, None] = False, disable_realistic_typing: bool = True, clear_first: bool = True):
+    def type_into_element(self, element: 'WebElement', text: str, delay: float = 0.1, tab_off: Union[bool, None] = False, disable_realistic_typing: bool = True, clear_first: bool = True):
         """Types into an input element in a realistic manner, unless web driver is remote.
 
         Args:
@@ -100,6 +103,8 @@ class InputHelper:
             pause_time (float, optional): The amount of time to pause after hitting tab (when web driver is not remote).
                                           Defaults to None, in which case a random wait time is used between INPUT_SLEEP_MINIMUM and INPUT_SLEEP_MAXIMUM.
         """
+        from selenium.webdriver.common.keys import Keys
+
         self._action_chains.send_keys(Keys.TAB)
 
         if not self._driver._is_remote: # pylint: disable=protected-access
@@ -118,6 +123,8 @@ class InputHelper:
             pause_time (float, optional): The amount of time to pause after hitting return (when web driver is not remote).
                                           Defaults to None, in which case a random wait time is used between INPUT_SLEEP_MINIMUM and INPUT_SLEEP_MAXIMUM.
         """
+        from selenium.webdriver.common.keys import Keys
+
         self._action_chains.send_keys(Keys.RETURN)
 
         if not self._driver._is_remote: # pylint: disable=protected-access
@@ -135,6 +142,8 @@ class InputHelper:
             pause_time (float, optional): The amount of time to pause after hitting escape (when web driver is not remote).
                                           Defaults to None, in which case a random wait time is used between INPUT_SLEEP_MINIMUM and INPUT_SLEEP_MAXIMUM.
         """
+        from selenium.webdriver.common.keys import Keys
+
         self._action_chains.send_keys(Keys.ESCAPE)
 
         if not self._driver._is_remote: # pylint: disable=protected-access
@@ -152,6 +161,8 @@ class InputHelper:
             pause_time (float, optional): The amount of time to pause after hitting delete (when web driver is not remote).
                                           Defaults to None, in which case a random wait time is used between INPUT_SLEEP_MINIMUM and INPUT_SLEEP_MAXIMUM.
         """
+        from selenium.webdriver.common.keys import Keys
+
         self._action_chains.send_keys(Keys.DELETE)
 
         if not self._driver._is_remote: # pylint: disable=protected-access
@@ -0,0 +1,512 @@
+"""
+Module that contains our Instrumentation class.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TYPE_CHECKING, Union
+from weakref import WeakSet
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.remote_connection import RemoteConnection
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+class Instrumentation:
+    """A class that reports what our helpers do to any registered listeners.
+
+    Every public helper method call, expectation poll and call to our JavaScript is reported as a span,
+    and every command sent to the WebDriver (so every browser roundtrip, e.g. an `execute_script` or an
+    `ActionChains.perform`) is reported as a roundtrip, which is attributed to each span that is open on
+    the thread at the time.
+
+    Nothing is recorded, and the overhead is a single check per call, unless a listener has been added.
+
+    e.g.
+        statistics = CallStatistics()
+        Instrumentation.add_listener(statistics)
+        ...
+        statistics.dump('pyseext_statistics.json')
+    """
+
+    # Public class properties
+    SPAN_KIND_METHOD: str = 'method'
+    """The kind of span used for a call to a public helper method"""
+
+    SPAN_KIND_POLL: str = 'poll'
+    """The kind of span used for a single poll of one of our expectations"""
+
+    SPAN_KIND_SCRIPT: str = 'script'
+    """The kind of span used for a call to one of our JavaScript functions, including any loading of our JavaScript it needs"""
+
+    # Class variables
+    _listeners: tuple['Instrumentation.Listener', ...] = ()
+    """The registered listeners. Replaced, rather than modified, so it can be iterated without locking"""
+
+    _listeners_lock: threading.Lock = threading.Lock()
+    """The lock used when changing the registered listeners"""
+
+    _thread_state: threading.local = threading.local()
+    """The per thread state, which holds the stack of open spans"""
+
+    _instrumented_drivers: 'WeakSet[WebDriver]' = WeakSet()
+    """The WebDrivers whose commands we are reporting"""
+
+    _instrumented_connections: 'WeakSet[RemoteConnection]' = WeakSet()
+    """The remote connections whose HTTP requests we are reporting"""
+
+    @staticmethod
+    def add_listener(listener: 'Instrumentation.Listener'):
+        """Adds a listener, which is then told about all spans and roundtrips.
+
+        Args:
+            listener (Instrumentation.Listener): The listener to add.
+        """
+        with Instrumentation._listeners_lock:
+            if listener not in Instrumentation._listeners:
+                Instrumentation._listeners = Instrumentation._listeners + (listener,)
+
+    @staticmethod
+    def remove_listener(listener: 'Instrumentation.Listener'):
+        """Removes a listener that was previously added.
+
+        Args:
+            listener (Instrumentation.Listener): The listener to remove.
+        """
+        with Instrumentation._listeners_lock:
+            Instrumentation._listeners = tuple(existing for existing in Instrumentation._listeners if existing is not listener)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Indicates whether any listeners have been added, so that anything is being recorded.
+
+        Returns:
+            bool: True if there are listeners, False otherwise.
+        """
+        return bool(Instrumentation._listeners)
+
+    @staticmethod
+    def get_current_span() -> Union['Instrumentation.Span', None]:
+        """Gets the innermost open span on the current thread.
+
+        Returns:
+            Union[Instrumentation.Span, None]: The span, or None if there is not one.
+        """
+        stack = Instrumentation._get_span_stack()
+        return stack[-1] if stack else None
+
+    @staticmethod
+    @contextmanager
+    def span(kind: str, name: str, driver: Union['WebDriver', None] = None, args: tuple = (), kwargs: Union[dict, None] = None) -> Iterator[Union['Instrumentation.Span', None]]:
+        """A context manager that reports the code it wraps as a span, if any listeners have been added.
+
+        Args:
+            kind (str): The kind of span, e.g. `SPAN_KIND_METHOD`.
+            name (str): The name of the span, e.g. 'GridHelper.click_row'.
+            driver (WebDriver, optional): The WebDriver whose commands should be reported. Defaults to None.
+            args (tuple, optional): The positional arguments of the call, for listeners that want them. Defaults to ().
+            kwargs (dict, optional): The keyword arguments of the call, for listeners that want them. Defaults to None.
+
+        Yields:
+            Union[Instrumentation.Span, None]: The span, or None if nothing is being recorded.
+        """
+        listeners = Instrumentation._listeners
+        if not listeners:
+            yield None
+            return
+
+        if driver is not None:
+            Instrumentation.instrument_driver(driver)
+
+        stack = Instrumentation._get_span_stack()
+        span = Instrumentation.Span(kind, name, stack[-1] if stack else None, args, kwargs or {})
+
+        stack.append(span)
+        Instrumentation._notify(listeners, 'on_span_start', span)
+
+        try:
+            yield span
+        except BaseException as exc:
+            span.exception = exc
+            raise
+        finally:
+            span.end()
+            stack.pop()
+            Instrumentation._notify(Instrumentation._listeners, 'on_span_end', span)
+
+    @staticmethod
+    def instrument_class(cls: type):
+        """Wraps the public methods defined by a class, so that each call is reported as a span.
+
+        The `__call__` method of any expectation classes nested in the class is wrapped too,
+        so that each poll is reported as a span.
+
+        Args:
+            cls (type): The class whose methods are to be wrapped.
+        """
+        for member_name, member in list(vars(cls).items()):
+            if isinstance(member, type):
+                expectation_call = vars(member).get('__call__')
+
+                if member_name.endswith('Expectation') and expectation_call and not getattr(expectation_call, '__pyseext_instrumented__', False):
+                    member.__call__ = Instrumentation._wrap_method(expectation_call, f'{cls.__name__}.{member_name}', Instrumentation.SPAN_KIND_POLL)
+
+                continue
+
+            if member_name.startswith('_') or not callable(member) or getattr(member, '__pyseext_instrumented__', False):
+                continue
+
+            setattr(cls, member_name, Instrumentation._wrap_method(member, f'{cls.__name__}.{member_name}'))
+
+    @staticmethod
+    def instrument_driver(driver: 'WebDriver'):
+        """Wraps the `execute` method of a WebDriver instance, so that each command it sends is reported as a roundtrip.
+
+        This is done automatically for the driver of any helper that is called while listeners are added.
+
+        Args:
+            driver (WebDriver): The webdriver.
+        """
+        if driver in Instrumentation._instrumented_drivers:
+            return
+
+        original_execute = driver.execute
+
+        def execute(driver_command: str, params: Union[dict, None] = None) -> Any:
+            listeners = Instrumentation._listeners
+            if not listeners:
+                return original_execute(driver_command, params)
+
+            roundtrip = Instrumentation.Roundtrip(driver_command, Instrumentation._get_payload_size(params))
+
+            try:
+                response = original_execute(driver_command, params)
+            except BaseException as exc:
+                roundtrip.exception = exc
+                raise
+            else:
+                roundtrip.bytes_received = Instrumentation._get_payload_size(response.get('value') if isinstance(response, dict) else response)
+            finally:
+                roundtrip.end()
+
+                for open_span in Instrumentation._get_span_stack():
+                    open_span.add_roundtrip(roundtrip)
+
+                Instrumentation._notify(listeners, 'on_roundtrip', roundtrip)
+
+            return response
+
+        driver.execute = execute
+        Instrumentation._instrumented_drivers.add(driver)
+
+    @staticmethod
+    def instrument_connection(connection: 'RemoteConnection'):
+        """Wraps the method of a remote connection that sends HTTP requests to the remote end, so that the latency
+        of each request is reported, separately from the time taken to encode the command and decode the response.
+
+        This is done by `SessionFactory` for the drivers it creates.
+
+        Args:
+            connection (RemoteConnection): The remote connection, e.g. `driver.command_executor`.
+        """
+        if connection in Instrumentation._instrumented_connections:
+            return
+
+        original_request = connection._request # pylint: disable=protected-access
+
+        def request(method: str, url: str, body: Union[str, None] = None) -> Any:
+            listeners = Instrumentation._listeners
+            if not listeners:
+                return original_request(method, url, body)
+
+            http_request = Instrumentation.HttpRequest(method, url, len(body) if body else 0)
+
+            try:
+                return original_request(method, url, body)
+            except BaseException as exc:
+                http_request.exception = exc
+                raise
+            finally:
+                http_request.end()
+                Instrumentation._notify(listeners, 'on_http_request', http_request)
+
+        connection._request = request # pylint: disable=protected-access
+        Instrumentation._instrumented_connections.add(connection)
+
+    @staticmethod
+    def _wrap_method(method: Callable, name: str, kind: str = SPAN_KIND_METHOD) -> Callable:
+        """Wraps a helper method, or expectation's `__call__` method, so that each call is reported as a span.
+
+        Args:
+            method (Callable): The method to wrap.
+            name (str): The name of the span, e.g. 'GridHelper.click_row'.
+            kind (str, optional): The kind of span. Defaults to `SPAN_KIND_METHOD`.
+
+        Returns:
+            Callable: The wrapped method.
+        """
+        def wrapper(self, *args, **kwargs):
+            if not Instrumentation._listeners:
+                return method(self, *args, **kwargs)
+
+            # Expectations are passed the driver, helpers hold it
+            driver = args[0] if kind == Instrumentation.SPAN_KIND_POLL and args else getattr(self, '_driver', None)
+
+            with Instrumentation.span(kind, name, driver, args, kwargs):
+                return method(self, *args, **kwargs)
+
+        wrapper.__name__ = method.__name__
+        wrapper.__qualname__ = method.__qualname__
+        wrapper.__doc__ = method.__doc__
+        wrapper.__module__ = method.__module__
+        wrapper.__wrapped__ = method
+        wrapper.__pyseext_instrumented__ = True
+
+        return wrapper
+
+    @staticmethod
+    def _get_span_stack() -> list['Instrumentation.Span']:
+        """Gets the stack of open spans for the current thread.
+
+        Returns:
+            list[Instrumentation.Span]: The stack, innermost last.
+        """
+        stack = getattr(Instrumentation._thread_state, 'stack', None)
+
+        if stack is None:
+            stack = []
+            Instrumentation._thread_state.stack = stack
+
+        return stack
+
+    @staticmethod
+    def _get_payload_size(payload: Any) -> int:
+        """Gets the approximate size of a command's payload, as JSON.
+
+        Args:
+            payload (Any): The payload.
+
+        Returns:
+            int: The size in characters.
+        """
+        if payload is None:
+            return 0
+
+        try:
+            return len(json.dumps(payload, default=str))
+        except (TypeError, ValueError):
+            return len(str(payload))
+
+    @staticmethod
+    def _notify(listeners: tuple['Instrumentation.Listener', ...], method_name: str, event: Any):
+        """Tells each listener about an event.
+
+        Args:
+            listeners (tuple[Instrumentation.Listener, ...]): The listeners to tell.
+            method_name (str): The name of the listener method to call.
+            event (Any): The span or roundtrip.
+        """
+        for listener in listeners:
+            getattr(listener, method_name)(event)
+
+    class Listener:
+        """Base class for listeners to our instrumentation, whose methods do nothing by default.
+
+        Note that listeners may be called from multiple threads.
+        """
+
+        def on_span_start(self, span: 'Instrumentation.Span'):
+            """Called when a span starts.
+
+            Args:
+                span (Instrumentation.Span): The span.
+            """
+
+        def on_span_end(self, span: 'Instrumentation.Span'):
+            """Called when a span ends.
+
+            Args:
+                span (Instrumentation.Span): The span.
+            """
+
+        def on_roundtrip(self, roundtrip: 'Instrumentation.Roundtrip'):
+            """Called when a command sent to the WebDriver completes.
+
+            Args:
+                roundtrip (Instrumentation.Roundtrip): The roundtrip.
+            """
+
+        def on_http_request(self, http_request: 'Instrumentation.HttpRequest'):
+            """Called when an HTTP request to a remote end completes, for connections that are instrumented,
+            see `Instrumentation.instrument_connection`.
+
+            Args:
+                http_request (Instrumentation.HttpRequest): The request.
+            """
+
+    class Span:
+        """A timed piece of work, such as a public helper method call."""
+
+        def __init__(self, kind: str, name: str, parent: Union['Instrumentation.Span', None], args: tuple, kwargs: dict):
+            """Initialises an instance of this class
+
+            Args:
+                kind (str): The kind of span, e.g. `Instrumentation.SPAN_KIND_METHOD`.
+                name (str): The name of the span, e.g. 'GridHelper.click_row'.
+                parent (Instrumentation.Span, optional): The span that was open when this one started.
+                args (tuple): The positional arguments of the call.
+                kwargs (dict): The keyword arguments of the call.
+            """
+            self.kind = kind
+            """The kind of span"""
+
+            self.name = name
+            """The name of the span"""
+
+            self.parent = parent
+            """The span that was open when this one started, if any"""
+
+            self.args = args
+            """The positional arguments of the call"""
+
+            self.kwargs = kwargs
+            """The keyword arguments of the call"""
+
+            self.thread_id = threading.get_ident()
+            """The identifier of the thread the span ran on"""
+
+            self.start_time = time.perf_counter()
+            """The time the span started, from `time.perf_counter`"""
+
+            self.end_time: Union[float, None] = None
+            """The time the span ended, from `time.perf_counter`, or None if still open"""
+
+            self.roundtrip_count: int = 0
+            """The number of roundtrips made while the span was open, including by nested spans"""
+
+            self.roundtrip_time: float = 0.0
+            """The number of seconds spent in roundtrips while the span was open"""
+
+            self.bytes_sent: int = 0
+            """The approximate size of the payloads sent in roundtrips while the span was open"""
+
+            self.bytes_received: int = 0
+            """The approximate size of the payloads received in roundtrips while the span was open"""
+
+            self.exception: Union[BaseException, None] = None
+            """The exception that the span ended with, if any"""
+
+        @property
+        def duration(self) -> float:
+            """The number of seconds the span was open for, so far if still open"""
+            return (self.end_time if self.end_time is not None else time.perf_counter()) - self.start_time
+
+        @property
+        def is_wait(self) -> bool:
+            """Whether the span is for a call to one of our `wait_*` methods"""
+            return self.kind == Instrumentation.SPAN_KIND_METHOD and self.name.rpartition('.')[2].startswith('wait_')
+
+        @property
+        def wait_time(self) -> float:
+            """The number of seconds the span was open for, but not in a roundtrip.
+            This is mostly time spent between polls or sleeping, although it includes our own overhead too."""
+            return max(self.duration - self.roundtrip_time, 0.0)
+
+        def add_roundtrip(self, roundtrip: 'Instrumentation.Roundtrip'):
+            """Attributes a roundtrip to this span.
+
+            Args:
+                roundtrip (Instrumentation.Roundtrip): The roundtrip.
+            """
+            self.roundtrip_count += 1
+            self.roundtrip_time += roundtrip.duration
+            self.bytes_sent += roundtrip.bytes_sent
+            self.bytes_received += roundtrip.bytes_received
+
+        def end(self):
+            """Marks the span as ended."""
+            self.end_time = time.perf_counter()
+
+    class Roundtrip:
+        """A command sent to the WebDriver, and its response."""
+
+        def __init__(self, command: str, bytes_sent: int):
+            """Initialises an instance of this class
+
+            Args:
+                command (str): The WebDriver command, e.g. 'executeScript'.
+                bytes_sent (int): The approximate size of the payload sent.
+            """
+            self.command = command
+            """The WebDriver command"""
+
+            self.span = Instrumentation.get_current_span()
+            """The innermost span that was open when the command was sent, if any"""
+
+            self.thread_id = threading.get_ident()
+            """The identifier of the thread the command was sent on"""
+
+            self.start_time = time.perf_counter()
+            """The time the command was sent, from `time.perf_counter`"""
+
+            self.end_time: Union[float, None] = None
+            """The time the response was received, from `time.perf_counter`, or None if still waiting"""
+
+            self.bytes_sent = bytes_sent
+            """The approximate size of the payload sent"""
+
+            self.bytes_received: int = 0
+            """The approximate size of the payload received"""
+
+            self.exception: Union[BaseException, None] = None
+            """The exception that the command raised, if any"""
+
+        @property
+        def duration(self) -> float:
+            """The number of seconds the roundtrip took, so far if still waiting"""
+            return (self.end_time if self.end_time is not None else time.perf_counter()) - self.start_time
+
+        def end(self):
+            """Marks the roundtrip as complete."""
+            self.end_time = time.perf_counter()
+
+    class HttpRequest:
+        """An HTTP request sent to a remote end by an instrumented remote connection, and its response."""
+
+        def __init__(self, method: str, url: str, bytes_sent: int):
+            """Initialises an instance of this class
+
+            Args:
+                method (str): The HTTP method, e.g. 'POST'.
+                url (str): The URL of the request.
+                bytes_sent (int): The size of the request body.
+            """
+            self.method = method
+            """The HTTP method"""
+
+            self.url = url
+            """The URL of the request"""
+
+            self.bytes_sent = bytes_sent
+            """The size of the request body"""
+
+            self.thread_id = threading.get_ident()
+            """The identifier of the thread the request was sent on"""
+
+            self.start_time = time.perf_counter()
+            """The time the request was sent, from `time.perf_counter`"""
+
+            self.end_time: Union[float, None] = None
+            """The time the response was received, from `time.perf_counter`, or None if still waiting"""
+
+            self.exception: Union[BaseException, None] = None
+            """The exception that the request raised, if any"""
+
+        @property
+        def duration(self) -> float:
+            """The number of seconds the request took, so far if still waiting"""
+            return (self.end_time if self.end_time is not None else time.perf_counter()) - self.start_time
+
+        def end(self):
+            """Marks the request as complete."""
+            self.end_time = time.perf_counter()
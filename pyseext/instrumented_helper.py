@@ -0,0 +1,17 @@
+"""
+Module that contains our InstrumentedHelper class.
+"""
+from pyseext.instrumentation import Instrumentation
+
+class InstrumentedHelper:
+    """Base class for our helpers, that reports every call to their public methods to our `Instrumentation`.
+
+    The public methods of each subclass are wrapped when the subclass is defined, and each call is reported as a span,
+    along with the browser roundtrips made by the helper's WebDriver during it.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Wraps the public methods of a subclass as it is defined."""
+        super().__init_subclass__(**kwargs)
+
+        Instrumentation.instrument_class(cls)
@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.ComponentQuery = {
     /**
@@ -19,8 +17,66 @@ globalThis.PySeExt.ComponentQuery = {
      * @return {Object[]}            The matched dom objects or an empty array if none found.
      */
     query: function(selector, rootId, cssSelector) {
+        var results = [];
+
+        this.forEachElement(selector, rootId, cssSelector, function(component, dom) {
+            results.push(dom);
+        });
+
+        return results;
+    },
+
+    /**
+     * Returns an array of descriptors of the matched element dom objects from within the dom.
+     *
+     * This matches exactly the same elements as query, but rather than returning the dom objects,
+     * returns what a test usually goes on to ask of them, so that it can be asked in the same call.
+     *
+     * @param {String} selector      The selector string to filter returned elements.
+     * @param {String} [rootId]      The id of the dom element indicating the container within which to perform the query.
+     *                               If omitted, all components within the document are included in the search.
+     * @param {String} [cssSelector] An optional CSS selector that can be used to get child elements of a found component, e.g. a trigger on a field.
+     * @return {Object[]}            The descriptors, or an empty array if none found. Each has the members
+     *                               componentId, elementId, xtype, visible, disabled, text and rect, where rect has
+     *                               the members x, y, width and height.
+     */
+    describe: function(selector, rootId, cssSelector) {
+        var results = [];
+
+        this.forEachElement(selector, rootId, cssSelector, function(component, dom) {
+            var rect = dom.getBoundingClientRect ? dom.getBoundingClientRect() : null,
+                text = dom.innerText;
+
+            if (typeof text !== 'string') {
+                text = dom.textContent || '';
+            }
+
+            results.push({
+                componentId: component.getId ? component.getId() : component.id,
+                elementId: dom.id || null,
+                xtype: component.getXType ? component.getXType() : component.xtype,
+                visible: component.isVisible ? component.isVisible(true) : true,
+                disabled: component.isDisabled ? component.isDisabled() : !!component.disabled,
+                // Trim as WebElement.text does, keeping non-breaking spaces, e.g. the text of a menu spacer
+                text: text.replace(/^[ \t\r\n]+|[ \t\r\n]+$/g, '').replace(/\u00a0/g, ' '),
+                rect: rect ? { x: rect.x, y: rect.y, width: rect.width, height: rect.height } : null
+            });
+        });
+
+        return results;
+    },
+
+    /**
+     * Calls a function for each element dom object matched by a component query, in the order that query returns them.
+     *
+     * @param {String} selector      The selector string to filter returned elements.
+     * @param {String} [rootId]      The id of the dom element indicating the container within which to perform the query.
+     *                               If omitted, all components within the document are included in the search.
+     * @param {String} [cssSelector] An optional CSS selector that can be used to get child elements of a found component, e.g. a trigger on a field.
+     * @param {Function} fn          The function to call, which is passed the component and the dom object.
+     */
+    forEachElement: function(selector, rootId, cssSelector, fn) {
         var components,
-            results = [],
             root,
             len,
             i,
@@ -56,19 +112,17 @@ globalThis.PySeExt.ComponentQuery = {
                                     if (el[j]) {
                                         // This will already be a DOM element,
                                         // since Element.query defaults to that.
-                                        results.push(el[j]);
+                                        fn(component, el[j]);
                                     }
                                 }
                             }
                         } else {
-                            results.push(el.dom);
+                            fn(component, el.dom);
                         }
                     }
                 }
             }
         }
-
-        return results;
     },
 
     /**
@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.Core = {
     /**
@@ -30,5 +28,72 @@ globalThis.PySeExt.Core = {
      */
     isAjaxRequestInProgress: function() {
         return globalThis.Ext.Ajax.isLoading();
+    },
+
+    /**
+     * Converts the data of many records into a table, which is far more compact to return than an array of objects,
+     * since each field name is only sent once.
+     *
+     * Dates are converted to strings, in the same way as GridHelper.getRowData.
+     *
+     * @param  {String}   name     The name of the model the records are for, if known.
+     * @param  {Object[]} data     The data of each record.
+     * @param  {String[]} [fields] The fields to include. If omitted, every field found in the data is included,
+     *                             in the order in which they are first found.
+     * @return {Object} The table, with the members name, fields and rows, where each row is an array of values
+     *                  in the same order as fields, with null for a field a record does not have.
+     */
+    getTable: function(name, data, fields) {
+        var fieldIndexes = {},
+            rows = [],
+            len = data && data.length || 0,
+            i,
+            j,
+            item,
+            key,
+            value,
+            row;
+
+        if (fields) {
+            for (j = 0; j < fields.length; j += 1) {
+                fieldIndexes[fields[j]] = j;
+            }
+        } else {
+            fields = [];
+
+            for (i = 0; i < len; i += 1) {
+                for (key in data[i]) {
+                    if (Object.prototype.hasOwnProperty.call(data[i], key) && !Object.prototype.hasOwnProperty.call(fieldIndexes, key)) {
+                        fieldIndexes[key] = fields.length;
+                        fields.push(key);
+                    }
+                }
+            }
+        }
+
+        for (i = 0; i < len; i += 1) {
+            item = data[i];
+            row = [];
+
+            for (j = 0; j < fields.length; j += 1) {
+                value = item[fields[j]];
+
+                if (value instanceof Date) {
+                    value = value.toLocaleString("en-GB", { timeZone: "Europe/London" });
+                } else if (value === undefined) {
+                    value = null;
+                }
+
+                row.push(value);
+            }
+
+            rows.push(row);
+        }
+
+        return {
+            name: name || null,
+            fields: fields,
+            rows: rows
+        };
     }
 };
\ No newline at end of file
@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.FieldHelper = {
     /**
@@ -28,23 +26,28 @@ globalThis.PySeExt.FieldHelper = {
 
     /**
      * Finds the specified field on the specified form and returns it's value.
+     *
+     * Dates are returned as strings in the format dd/mm/yyyy, along with a flag to say so,
+     * so the Python can convert them back without asking what type of field it is.
      * @param {String} formCQ The CQ to get to the form panel.
      * @param {String} name The name of the field.
-     * @returns {Mixed} The value of the field, if found.
+     * @returns {Object} An object containing the value of the field, if found, and whether it is a date.
      */
     getFieldValue: function(formCQ, name) {
         var field = this.__getField(formCQ, name),
-            value;
+            value,
+            isDate = false;
 
         if (field) {
             value = field.getValue();
             // Python cannot convert a JS datetime to a Python one, so convert before sending.
             if (Ext.isDate(value)) {
-                value = value.toLocaleDateString('en-gb')
+                value = value.toLocaleDateString('en-gb');
+                isDate = true;
             }
         }
 
-        return value;
+        return { value: value, isDate: isDate };
     },
 
     /**
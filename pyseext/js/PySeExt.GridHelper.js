@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.GridHelper = {
     /**
@@ -15,6 +13,19 @@ globalThis.PySeExt.GridHelper = {
         return columnHeader && columnHeader.getEl().dom;
     },
 
+    /**
+     * Determines whether a column on the specified grid is visible, by header text or dataIndex.
+     * @param {String} gridSelector The CQ for the grid
+     * @param {String} columnTextOrDataIndex The text or dataIndex of the column
+     * @returns {Boolean} True if the column is visible, false if it is hidden, or null if the column was not found.
+     */
+    isColumnVisible: function(gridSelector, columnTextOrDataIndex) {
+        var me = this,
+            columnHeader = me.__findColumnHeader(gridSelector, columnTextOrDataIndex);
+
+        return columnHeader ? columnHeader.isVisible(true) : null;
+    },
+
     /**
      * Gets the element for a column header's trigger on the specified grid, by header text or dataIndex.
      * @param {String} gridSelector The CQ for the grid
@@ -124,6 +135,33 @@ globalThis.PySeExt.GridHelper = {
         return null;
     },
 
+    /**
+     * Gets the data of every row in the grid, as a table.
+     *
+     * @param  {String}   gridSelector The selector for the grid.
+     * @param  {String[]} [fields]     The fields to include. If omitted, every field found in the data is included.
+     * @return {Object} The table, see PySeExt.Core.getTable, or null if the grid is not found.
+     */
+    getRowsData: function(gridSelector, fields) {
+        var grids = globalThis.Ext.ComponentQuery.query(gridSelector),
+            store,
+            model,
+            data = [];
+
+        if (grids && grids.length) {
+            store = grids[0].getStore();
+            model = store.getModel && store.getModel();
+
+            store.each(function(record) {
+                data.push(record.getData());
+            });
+
+            return globalThis.PySeExt.Core.getTable(model && model.$className, data, fields);
+        }
+
+        return null;
+    },
+
     /**
      * Trims the specified row data to contain just the required fields.
      *
@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.LocalStorageHelper = {
     /**
@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.StoreHelper = {
     /**
@@ -132,6 +130,25 @@ globalThis.PySeExt.StoreHelper = {
         }
     },
 
+    /**
+     * Gets the data of every record in the store, as a table.
+     *
+     * @param  {String}   storeHolderCQ The component query to use to find the store holder.
+     * @param  {String[]} [fields]      The fields to include. If omitted, every field found in the data is included.
+     * @return {Object} The table, see PySeExt.Core.getTable.
+     */
+    getRecords: function(storeHolderCQ, fields) {
+        var store = globalThis.PySeExt.StoreHelper.__getStoreFromStoreHolder(storeHolderCQ),
+            model = store.getModel && store.getModel(),
+            data = [];
+
+        store.each(function(record) {
+            data.push(record.getData());
+        });
+
+        return globalThis.PySeExt.Core.getTable(model && model.$className, data, fields);
+    },
+
     /**
      * Attempts to retrieve the store from a store holder described by a component query.
      *
@@ -1,5 +1,3 @@
-globalThis.None = null;
-
 globalThis.PySeExt = globalThis.PySeExt || {};
 globalThis.PySeExt.TreeHelper = {
     /**
@@ -95,6 +93,57 @@ globalThis.PySeExt.TreeHelper = {
         }
     },
 
+    /**
+     * Gets the data of every loaded node in the tree, or under a node, as a table.
+     *
+     * Nodes are listed depth first, in the order in which they appear in the tree. The root node is only
+     * included when the whole tree is requested and the root is visible.
+     *
+     * @param {String}   treeSelector          The selector to use to find the tree.
+     * @param {String[]} [fields]              The fields to include. If omitted, every field found in the data is included.
+     * @param {Object}   [parentNodeTextOrData] The optional text or data identifying the node whose descendants are wanted.
+     *                                         If omitted the whole tree is included.
+     * @return {Object} The table, see PySeExt.Core.getTable.
+     */
+    getNodesData: function (treeSelector, fields, parentNodeTextOrData) {
+        var me = this,
+            treePanel = me.__getTree(treeSelector),
+            parentNodeData = parentNodeTextOrData,
+            parentNode,
+            store,
+            model,
+            data = [];
+
+        if (Ext.isString(parentNodeData)) {
+            parentNodeData = me.__getDataForText(parentNodeData);
+        }
+
+        if (parentNodeData) {
+            parentNode = me.__getNodeByData(treeSelector, parentNodeData);
+
+            if (!parentNode) {
+                globalThis.Ext.raise("Could not find requested parent node!");
+            }
+        } else {
+            parentNode = treePanel.getRootNode();
+
+            if (treePanel.rootVisible) {
+                data.push(parentNode.getData());
+            }
+        }
+
+        parentNode.cascadeBy(function (node) {
+            if (node !== parentNode) {
+                data.push(node.getData());
+            }
+        });
+
+        store = treePanel.getStore();
+        model = store.getModel && store.getModel();
+
+        return globalThis.PySeExt.Core.getTable(model && model.$className, data, fields);
+    },
+
     /**
      * Determines if the specified node or any of its children are currently loading.
      * @private
@@ -1,37 +1,25 @@
 """
 Module that contains our LocalStorageHelper class.
 """
-import logging
-from typing import Any
-
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import Any, TYPE_CHECKING
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 class LocalStorageHelper(HasReferencedJavaScript):
     """A class to help with using local storage, through Ext's interfaces.
     """
 
-    # Class variables
-    _STORE_VALUE_TEMPLATE: str = "return globalThis.PySeExt.LocalStorageHelper.storeValue('{key}', {value})"
-    """The script template to use to call the JavaScript method PySeExt.LocalStorageHelper.storeValue
-    Requires the inserts: {key}, {value}"""
-
-    _CLEAR_VALUE_TEMPLATE: str = "return globalThis.PySeExt.LocalStorageHelper.clearValue('{key}')"
-    """The script template to use to call the JavaScript method PySeExt.LocalStorageHelper.clearValue
-    Requires the inserts: {key}"""
-
-    _GET_STORED_VALUE_TEMPLATE: str = "return globalThis.PySeExt.LocalStorageHelper.getStoredValue('{key}')"
-    """The script template to use to call the JavaScript method PySeExt.LocalStorageHelper.getStoredValue
-    Requires the inserts: {key}"""
-
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -52,11 +40,9 @@ class LocalStorageHelper(HasReferencedJavaScript):
             key (str): The key to use when storing the value.
             value (Any): The value to store.
         """
-        self._logger.debug("Storing value '%s' under key '%s'", value, key)
+        self._logger.debug("Storing value '%s' under key '%s'", LoggingPolicy.render(value), key)
 
-        script = self._STORE_VALUE_TEMPLATE.format(key=key, value=value)
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('storeValue', key, value)
 
     def clear_value(self, key: str):
         """Clears a value in our persistent storage (implemented as local storage).
@@ -66,19 +52,17 @@ class LocalStorageHelper(HasReferencedJavaScript):
         """
         self._logger.debug("Clearing value with key '%s'", key)
 
-        script = self._CLEAR_VALUE_TEMPLATE.format(key=key)
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('clearValue', key)
 
     def get_stored_value(self, key: str) -> Any:
         """Retrieves a value that has been saved in #storedData using #storeValue.
 
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
         Args:
             key (str): The key to use to retrieve the data.
 
         Returns:
             Any: The retrieved value or None if key does not exist.
         """
-        script = self._CLEAR_VALUE_TEMPLATE.format(key=key)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('getStoredValue', key, deferrable=True)
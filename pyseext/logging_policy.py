@@ -0,0 +1,202 @@
+"""
+Module that contains our LoggingPolicy class.
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Union
+
+
+class LoggingPolicy:
+    """A class that controls how our helpers log, so that debug logging can be turned on without slowing tests down.
+
+    It provides:
+        - per-helper levels, see `set_level`.
+        - renderers that truncate large values, such as query results or form values, and only build the text
+          if the message is actually logged, see `render`.
+        - sampling of the messages logged by each poll of a wait made from Python, see `POLL_LOG_SAMPLE_INTERVAL`.
+
+    Our helpers get their loggers using `get_logger`, so that the sampling applies to them.
+
+    e.g.
+        LoggingPolicy.set_level(ComponentQuery, logging.DEBUG)
+        LoggingPolicy.MAX_RENDER_LENGTH = 500
+        LoggingPolicy.POLL_LOG_SAMPLE_INTERVAL = 10
+    """
+
+    # Public class properties
+    MAX_RENDER_LENGTH: int = 200
+    """The maximum number of characters that a value passed through `render` is logged as, before it is truncated"""
+
+    POLL_LOG_SAMPLE_INTERVAL: int = 1
+    """Messages logged during the polls of a wait made from Python are only logged for the first poll and every
+    this many polls after it, e.g. 10 logs polls 0, 10, 20 and so on, so the poll that ends a wait may not be logged.
+    1 logs every poll. Defaults to 1."""
+
+    # Class variables
+    _poll_number: ContextVar[Union[int, None]] = ContextVar('pyseext_poll_number', default=None)
+    """The zero-based number of the poll currently being made by a wait, or None if not polling"""
+
+    _filtered_loggers: set[str] = set()
+    """The names of the loggers that our sampling filter has been added to"""
+
+    @staticmethod
+    def get_logger(name: str) -> logging.Logger:
+        """Gets a logger, adding our poll sampling filter to it the first time.
+
+        Args:
+            name (str): The name of the logger, generally the module's `__name__`.
+
+        Returns:
+            logging.Logger: The logger.
+        """
+        logger = logging.getLogger(name)
+
+        if name not in LoggingPolicy._filtered_loggers:
+            logger.addFilter(LoggingPolicy._POLL_SAMPLING_FILTER)
+            LoggingPolicy._filtered_loggers.add(name)
+
+        return logger
+
+    @staticmethod
+    def set_level(helper: Union[type, str], level: Union[int, str]):
+        """Sets the level that a helper logs at.
+
+        Args:
+            helper (Union[type, str]): The helper class, e.g. `ComponentQuery`, or the name of its logger,
+                                       e.g. 'pyseext.component_query'.
+            level (Union[int, str]): The level, e.g. `logging.DEBUG` or 'DEBUG'.
+        """
+        name = helper if isinstance(helper, str) else helper.__module__
+
+        LoggingPolicy.get_logger(name).setLevel(level)
+
+    @staticmethod
+    def set_levels(levels: dict[Union[type, str], Union[int, str]]):
+        """Sets the levels that a number of helpers log at.
+
+        Args:
+            levels (dict[Union[type, str], Union[int, str]]): The level for each helper, see `set_level`.
+        """
+        for helper, level in levels.items():
+            LoggingPolicy.set_level(helper, level)
+
+    @staticmethod
+    def render(value: Any, max_length: Union[int, None] = None) -> 'LoggingPolicy.Rendered':
+        """Wraps a value to be logged, so that it is only converted to text if the message is logged,
+        and then truncated.
+
+        e.g.
+            self._logger.debug("CQ '%s' gave results: %s", cq, LoggingPolicy.render(results))
+
+        Args:
+            value (Any): The value.
+            max_length (int, optional): The maximum number of characters to log. Defaults to `MAX_RENDER_LENGTH`.
+
+        Returns:
+            LoggingPolicy.Rendered: The wrapped value, for use as an argument to a logging call.
+        """
+        return LoggingPolicy.Rendered(value, max_length)
+
+    @staticmethod
+    @contextmanager
+    def polling(poll_number: int) -> Iterator[None]:
+        """Marks the messages logged within the context as being logged by a poll of a wait,
+        so that they are sampled.
+
+        Args:
+            poll_number (int): The zero-based number of the poll.
+        """
+        token = LoggingPolicy._poll_number.set(poll_number)
+
+        try:
+            yield
+        finally:
+            LoggingPolicy._poll_number.reset(token)
+
+    class Rendered:
+        """A value to be logged, which is converted to truncated text only when the message is logged."""
+
+        __slots__ = ('_value', '_max_length')
+
+        def __init__(self, value: Any, max_length: Union[int, None] = None):
+            """Initialises an instance of this class
+
+            Args:
+                value (Any): The value.
+                max_length (int, optional): The maximum number of characters to log. Defaults to `LoggingPolicy.MAX_RENDER_LENGTH`.
+            """
+            self._value = value
+            self._max_length = max_length
+
+        def __str__(self) -> str:
+            """Returns the value as text, truncated to the maximum length"""
+            max_length = LoggingPolicy.MAX_RENDER_LENGTH if self._max_length is None else self._max_length
+            text = self._render(self._value, max_length)
+
+            if len(text) > max_length:
+                return f'{text[:max_length]}...'
+
+            return text
+
+        @staticmethod
+        def _render(value: Any, max_length: int, is_item: bool = False) -> str:
+            """Renders a value as text, stopping once it is longer than the maximum length,
+            so that the rest of a large collection is never rendered.
+
+            Args:
+                value (Any): The value.
+                max_length (int): The length at which to stop.
+                is_item (bool, optional): Whether the value is an item in a collection, so strings are quoted. Defaults to False.
+
+            Returns:
+                str: The text, which may be longer than the maximum length.
+            """
+            value_type = type(value)
+
+            if value_type is str:
+                return repr(value) if is_item else value
+
+            if value_type.__name__ == 'WebElement':
+                return f'<WebElement {value.id}>'
+
+            if value_type in (list, tuple, dict):
+                if value_type is dict:
+                    items = (f'{key!r}: {LoggingPolicy.Rendered._render(item, max_length, True)}' for key, item in value.items())
+                    start, end = '{', '}'
+                else:
+                    items = (LoggingPolicy.Rendered._render(item, max_length, True) for item in value)
+                    start, end = ('[', ']') if value_type is list else ('(', ')')
+
+                text = start
+                for count, item_text in enumerate(items):
+                    if len(text) > max_length:
+                        return f'{text}... ({len(value) - count} more)'
+
+                    text += item_text if count == 0 else ', ' + item_text
+
+                return text + end
+
+            return repr(value)
+
+    class _PollSamplingFilter(logging.Filter):
+        """A logging filter that drops messages logged by polls that are not sampled, see `LoggingPolicy.POLL_LOG_SAMPLE_INTERVAL`."""
+
+        def filter(self, record: logging.LogRecord) -> bool:
+            """Determines whether a message should be logged.
+
+            Args:
+                record (logging.LogRecord): The message.
+
+            Returns:
+                bool: True if the message should be logged.
+            """
+            poll_number = LoggingPolicy._poll_number.get()
+
+            if poll_number is None or LoggingPolicy.POLL_LOG_SAMPLE_INTERVAL <= 1:
+                return True
+
+            return poll_number % LoggingPolicy.POLL_LOG_SAMPLE_INTERVAL == 0
+
+    _POLL_SAMPLING_FILTER: logging.Filter = _PollSamplingFilter()
+    """The filter that is added to our loggers"""
@@ -1,16 +1,19 @@
 """
 Module that contains our MenuHelper class.
 """
-import logging
-from typing import Union
-
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
+from typing import TYPE_CHECKING, Union
 
 from pyseext.component_query import ComponentQuery
+from pyseext.session import Session
+from pyseext.instrumented_helper import InstrumentedHelper
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+    from pyseext.component_descriptor import ComponentDescriptor
 
-class MenuHelper:
+class MenuHelper(InstrumentedHelper):
     """A class to help with interacting with Ext menus and menu items"""
 
     # Class variables
@@ -28,23 +31,29 @@ class MenuHelper:
     SPACER_TEXT_CONTEXT: str = ' '
     """The text content of a spacer element in a menu."""
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
+        from selenium.webdriver.common.action_chains import ActionChains
 
         # Instance variables
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
-        self._cq = ComponentQuery(driver)
-        """The `ComponentQuery` instance for this class instance"""
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
 
         self._action_chains = ActionChains(driver)
         """The ActionChains instance for this class instance"""
 
+    @property
+    def _cq(self) -> ComponentQuery:
+        """The `ComponentQuery` instance for our driver, from its `Session`"""
+        return Session(self._driver).component_query
+
     def move_to_menu_item(self, cq: str, root_id: Union[str, None] = None):
         """Finds a menu item using the supplied component query and moves to it.
 
@@ -118,7 +127,7 @@ class MenuHelper:
         else:
             return None
 
-    def get_enabled_menu_items(self, root_id: Union[str, None] = None, timeout: float = 1) -> list[WebElement]:
+    def get_enabled_menu_items(self, root_id: Union[str, None] = None, timeout: float = 1) -> list['WebElement']:
         """Finds visible, enabled menu items.
 
         Args:
@@ -134,6 +143,24 @@ class MenuHelper:
                                        timeout=timeout,
                                        throw_if_not_found=False)
 
+    def describe_enabled_menu_items(self, root_id: Union[str, None] = None, timeout: float = 1) -> list['ComponentDescriptor']:
+        """Finds visible, enabled menu items, returning descriptors of them.
+
+        Unlike `get_enabled_menu_items`, the text of every item is available without a further roundtrip per item.
+
+        Args:
+            root_id (str, optional): The id of the container within which to perform the query.
+                If omitted, all components within the document are included in the search.
+            timeout (float): Number of seconds before timing out (default 1)
+
+        Returns:
+            list[ComponentDescriptor]: An array of descriptors of the menu items that match the query or an empty array if none found
+        """
+        return self._cq.wait_for_descriptors(cq=self._ENABLED_MENU_ITEMS_CQ,
+                                             root_id=root_id,
+                                             timeout=timeout,
+                                             throw_if_not_found=False)
+
     def check_menu_item_enabled(self, text: str, root_id: Union[str, None] = None):
         """Checks that we can find an enabled menu item with the specified text.
 
@@ -1,23 +1,18 @@
 """
 Module that contains our ObservableHelper class.
 """
-import logging
-from typing import Union
-
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import TYPE_CHECKING, Union
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 class ObservableHelper(HasReferencedJavaScript):
     """A class to help with observable objects in Ext."""
 
-    _WAIT_FOR_EVENT_TEMPLATE: str = "return globalThis.PySeExt.ObservableHelper.waitForEvent('{component_cq}', '{event_name}', {timeout}, {member_accessor}, callback)"
-    """The script template to use to call the asynchronous JavaScript method PySeExt.ObservableHelper.waitForEvent
-    Requires the inserts: {component_cq}, {event_name}, {timeout}, {member_accessor}
-
-    Use our base classes `get_async_script_content` method call it.."""
-
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class.
 
         Args:
@@ -25,7 +20,7 @@ class ObservableHelper(HasReferencedJavaScript):
         """
 
         # Instance variables
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -48,19 +43,10 @@ class ObservableHelper(HasReferencedJavaScript):
         """
         if member_accessor:
             self._logger.debug("Waiting for event '%s' on '%s[%s]'", event_name, component_cq, member_accessor)
-            # Wrap in quotes
-            member_accessor = f"'{member_accessor}'"
         else:
             self._logger.debug("Waiting for event '%s' on '%s'", event_name, component_cq)
-            member_accessor = 'undefined'
-
-        async_script = self.get_async_script_content(self._WAIT_FOR_EVENT_TEMPLATE).format(component_cq = component_cq,
-                                                                                           event_name =  event_name,
-                                                                                           timeout = timeout,
-                                                                                           member_accessor = member_accessor)
-        self.ensure_javascript_loaded()
 
-        result = self._driver.execute_async_script(async_script)
+        result = self._call_async_function('waitForEvent', component_cq, event_name, timeout, member_accessor)
 
         if isinstance(result, str):
             # An error has been returned!
@@ -0,0 +1,80 @@
+"""
+Module that contains our PayloadCodec class.
+"""
+import base64
+import gzip
+import json
+from typing import Any
+
+from selenium.common.exceptions import JavascriptException
+
+class PayloadCodec:
+    """A class that encodes and decodes the payloads of calls to our JavaScript, compressing those that are large.
+
+    A payload is sent as an envelope, which is either `{'value': payload}` for a payload whose JSON is smaller than
+    the threshold, or `{'gzip': '<base64>'}` for the gzipped JSON of a larger one. Failures in the browser are
+    returned as `{'error': message}`.
+
+    In the browser the encoding and decoding is done using `CompressionStream` and `DecompressionStream`.
+    If the browser does not support `CompressionStream` then results are always returned uncompressed.
+
+    See `HasReferencedJavaScript.USE_COMPRESSED_PAYLOADS`.
+    """
+
+    # Public class properties
+    DEFAULT_THRESHOLD: int = 64 * 1024
+    """The default size of JSON, in characters, from which a payload is compressed"""
+
+    VALUE_KEY: str = 'value'
+    """The key of an envelope holding an uncompressed payload"""
+
+    GZIP_KEY: str = 'gzip'
+    """The key of an envelope holding a compressed payload"""
+
+    ERROR_KEY: str = 'error'
+    """The key of an envelope holding an error raised in the browser"""
+
+    @staticmethod
+    def encode(payload: Any, threshold: int = DEFAULT_THRESHOLD) -> dict[str, Any]:
+        """Encodes a payload, compressing it if its JSON is at least the threshold in size.
+
+        Payloads that cannot be represented in JSON, such as those containing a `WebElement`, are never compressed.
+
+        Args:
+            payload (Any): The payload.
+            threshold (int, optional): The size of JSON, in characters, from which the payload is compressed.
+                                       Defaults to `DEFAULT_THRESHOLD`.
+
+        Returns:
+            dict[str, Any]: The envelope.
+        """
+        try:
+            payload_json = json.dumps(payload, separators=(',', ':'))
+        except TypeError:
+            return {PayloadCodec.VALUE_KEY: payload}
+
+        if len(payload_json) < threshold:
+            return {PayloadCodec.VALUE_KEY: payload}
+
+        return {PayloadCodec.GZIP_KEY: base64.b64encode(gzip.compress(payload_json.encode('utf-8'))).decode('ascii')}
+
+    @staticmethod
+    def decode(envelope: dict[str, Any]) -> Any:
+        """Decodes an envelope, decompressing its payload if need be.
+
+        Args:
+            envelope (dict[str, Any]): The envelope.
+
+        Returns:
+            Any: The payload.
+
+        Raises:
+            JavascriptException: If the envelope holds an error raised in the browser.
+        """
+        if PayloadCodec.ERROR_KEY in envelope:
+            raise JavascriptException(envelope[PayloadCodec.ERROR_KEY])
+
+        if PayloadCodec.GZIP_KEY in envelope:
+            return json.loads(gzip.decompress(base64.b64decode(envelope[PayloadCodec.GZIP_KEY])).decode('utf-8'))
+
+        return envelope.get(PayloadCodec.VALUE_KEY)
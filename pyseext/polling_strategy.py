@@ -0,0 +1,186 @@
+"""
+Module that contains our PollingStrategy class.
+"""
+import time
+from typing import Any, Callable, Iterator, TYPE_CHECKING, Union
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class PollingStrategy:
+    """A class that describes how often a wait polls from Python, and that performs such waits.
+
+    Polling starts fast and backs off exponentially, up to a maximum interval, so short waits resolve quickly
+    and long waits do not keep hammering the browser.
+
+    Every `wait_*` method that polls from Python takes an optional strategy, and uses the process-wide default,
+    see `set_default`, when one is not supplied.
+
+    e.g.
+        PollingStrategy.set_default(PollingStrategy(initial_interval=0.1, multiplier=2, max_interval=2))
+        component_query.wait_for_query(cq, polling_strategy=PollingStrategy.fixed(0.5))
+
+    Waits made in the browser, see `HasReferencedJavaScript.USE_IN_BROWSER_WAITS`, do not poll from Python
+    so do not use a strategy.
+    """
+
+    # Public class properties
+    DEFAULT_INITIAL_INTERVAL: float = 0.05
+    """The default number of seconds to wait before polling for the second time"""
+
+    DEFAULT_MULTIPLIER: float = 1.5
+    """The default factor that the interval grows by after each poll"""
+
+    DEFAULT_MAX_INTERVAL: float = 1
+    """The default maximum number of seconds between polls"""
+
+    # Class variables
+    _default: Union['PollingStrategy', None] = None
+    """The process-wide default strategy, created the first time it is needed"""
+
+    def __init__(self,
+                 initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+                 multiplier: float = DEFAULT_MULTIPLIER,
+                 max_interval: float = DEFAULT_MAX_INTERVAL):
+        """Initialises an instance of this class
+
+        Args:
+            initial_interval (float, optional): The number of seconds to wait before polling for the second time.
+                                                Defaults to `DEFAULT_INITIAL_INTERVAL`.
+            multiplier (float, optional): The factor that the interval grows by after each poll. Use 1 for a fixed interval.
+                                          Defaults to `DEFAULT_MULTIPLIER`.
+            max_interval (float, optional): The maximum number of seconds between polls. Defaults to `DEFAULT_MAX_INTERVAL`.
+        """
+        if initial_interval <= 0 or multiplier < 1 or max_interval < initial_interval:
+            raise PollingStrategy.InvalidStrategyException(initial_interval, multiplier, max_interval)
+
+        # Instance variables
+        self.initial_interval = initial_interval
+        """The number of seconds to wait before polling for the second time"""
+
+        self.multiplier = multiplier
+        """The factor that the interval grows by after each poll"""
+
+        self.max_interval = max_interval
+        """The maximum number of seconds between polls"""
+
+    @staticmethod
+    def fixed(interval: float) -> 'PollingStrategy':
+        """Creates a strategy that polls at a fixed interval, as `WebDriverWait` does.
+
+        Args:
+            interval (float): The number of seconds between polls.
+
+        Returns:
+            PollingStrategy: The strategy.
+        """
+        return PollingStrategy(interval, 1, interval)
+
+    @staticmethod
+    def get_default() -> 'PollingStrategy':
+        """Gets the process-wide default strategy.
+
+        Returns:
+            PollingStrategy: The default strategy.
+        """
+        if PollingStrategy._default is None:
+            PollingStrategy._default = PollingStrategy()
+
+        return PollingStrategy._default
+
+    @staticmethod
+    def set_default(strategy: Union['PollingStrategy', None]):
+        """Sets the process-wide default strategy, used by waits that are not given one.
+
+        Args:
+            strategy (PollingStrategy): The strategy, or None to restore the original default.
+        """
+        PollingStrategy._default = strategy
+
+    def get_intervals(self) -> Iterator[float]:
+        """Generates the number of seconds to wait before each poll after the first.
+
+        Returns:
+            Iterator[float]: The intervals, which never end.
+        """
+        interval = self.initial_interval
+
+        while True:
+            yield interval
+            interval = min(interval * self.multiplier, self.max_interval)
+
+    def until(self, driver: 'WebDriver', method: Callable[['WebDriver'], Any], timeout: float, message: str = '') -> Any:
+        """Polls a method, such as one of our Expectation classes, until it returns a value that is not false,
+        in the same way as `WebDriverWait.until`.
+
+        Args:
+            driver (WebDriver): The webdriver to pass to the method.
+            method (Callable[[WebDriver], Any]): The method to poll.
+            timeout (float): Number of seconds before timing out.
+            message (str, optional): The message for the exception raised on timing out. Defaults to ''.
+
+        Returns:
+            Any: The value returned by the method.
+
+        Raises:
+            TimeoutException: If the method does not return a value that is not false within the timeout.
+        """
+        intervals = self.get_intervals()
+        end_time = time.monotonic() + timeout
+        poll_number = 0
+
+        while True:
+            try:
+                # Messages logged by the method are sampled, see LoggingPolicy.POLL_LOG_SAMPLE_INTERVAL
+                with LoggingPolicy.polling(poll_number):
+                    value = method(driver)
+
+                if value:
+                    return value
+            except NoSuchElementException:
+                pass
+
+            poll_number += 1
+
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message)
+
+            time.sleep(min(next(intervals), remaining))
+
+    def __repr__(self) -> str:
+        """Returns a string representation of this strategy"""
+        return f"PollingStrategy(initial_interval={self.initial_interval!r}, multiplier={self.multiplier!r}, max_interval={self.max_interval!r})"
+
+    class InvalidStrategyException(Exception):
+        """Exception class thrown when a polling strategy is configured with invalid values"""
+
+        def __init__(self,
+                     initial_interval: float,
+                     multiplier: float,
+                     max_interval: float,
+                     message: str = "Invalid polling strategy with initial interval {initial_interval}, multiplier {multiplier} and maximum interval {max_interval}. "
+                                    "The initial interval must be positive, the multiplier at least 1, and the maximum interval at least the initial interval."):
+            """Initialises an instance of this exception
+
+            Args:
+                initial_interval (float): The initial interval.
+                multiplier (float): The multiplier.
+                max_interval (float): The maximum interval.
+                message (str, optional): The message for the exception. Must contain 'initial_interval', 'multiplier' and 'max_interval' format inserts.
+            """
+            self.message = message
+            self._initial_interval = initial_interval
+            self._multiplier = multiplier
+            self._max_interval = max_interval
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message.format(initial_interval=self._initial_interval, multiplier=self._multiplier, max_interval=self._max_interval)
@@ -0,0 +1,293 @@
+"""
+A pytest plugin that provides a session scoped `Session` fixture, and records the browser roundtrips and wait time of each test,
+failing tests that exceed their budget.
+
+Enable it with `pytest -p pyseext.pytest_plugin`, or `pytest_plugins = ['pyseext.pytest_plugin']` in a conftest.py.
+
+e.g.
+    @pytest.mark.pyseext_budget(roundtrips=40, wait_seconds=5)
+    def test_add_user(pyseext_session):
+        pyseext_session.form_helper.set_form_values('#userForm', {'name': 'Bob'})
+        ...
+
+The driver is created by the `pyseext_driver` fixture, from the `--pyseext-browser` and `--pyseext-remote-url` options,
+and can be replaced by defining a `pyseext_driver` fixture in a conftest.py.
+"""
+# pylint: disable=import-outside-toplevel
+import threading
+from typing import Iterator, TYPE_CHECKING, Union
+
+import pytest
+
+from pyseext.instrumentation import Instrumentation
+from pyseext.session import Session
+from pyseext.session_factory import SessionFactory
+from pyseext.slow_call_detector import SlowCallDetector
+from pyseext.wait_analytics import WaitAnalytics
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class PytestPlugin(Instrumentation.Listener):
+    """The plugin, which listens to our instrumentation to count the roundtrips and wait time of each test.
+
+    Only the test itself is measured, not the setup of its fixtures, and the counts are recorded as user properties
+    of each test, so appear in JUnit XML reports, with the names `USER_PROPERTY_ROUNDTRIPS` and `USER_PROPERTY_WAIT_SECONDS`.
+
+    The wait time is the time spent in our `wait_*` methods, whether they wait in the browser or poll from Python.
+    Waits that are made by other waits are only counted once.
+    """
+
+    # Public class properties
+    MARKER_NAME: str = 'pyseext_budget'
+    """The name of the marker that sets the budget of a test"""
+
+    USER_PROPERTY_ROUNDTRIPS: str = 'pyseext_roundtrips'
+    """The name of the user property that holds the number of roundtrips made by a test"""
+
+    USER_PROPERTY_WAIT_SECONDS: str = 'pyseext_wait_seconds'
+    """The name of the user property that holds the number of seconds a test spent waiting"""
+
+    BROWSERS: tuple[str, ...] = ('chrome', 'firefox', 'edge', 'safari')
+    """The browsers that the `pyseext_driver` fixture can create a driver for"""
+
+    def __init__(self,
+                 enforce_budgets: bool = True,
+                 slow_call_detector: Union[SlowCallDetector, None] = None,
+                 wait_analytics: Union[WaitAnalytics, None] = None):
+        """Initialises an instance of this class
+
+        Args:
+            enforce_budgets (bool, optional): Indicates whether tests that exceed their budget should fail. Defaults to True.
+            slow_call_detector (SlowCallDetector, optional): The detector that reports slow calls made by tests, if any. Defaults to None.
+            wait_analytics (WaitAnalytics, optional): The analytics that record the waits made by tests, if any. Defaults to None.
+        """
+        # Instance variables
+        self._enforce_budgets = enforce_budgets
+        """Indicates whether tests that exceed their budget should fail"""
+
+        self.slow_call_detector = slow_call_detector
+        """The detector that reports slow calls made by tests, if any"""
+
+        self.wait_analytics = wait_analytics
+        """The analytics that record the waits made by tests, if any"""
+
+        self._lock = threading.Lock()
+        """The lock that protects our counts, since roundtrips can be made on multiple threads"""
+
+        self._roundtrips: int = 0
+        """The number of roundtrips made by the current test"""
+
+        self._wait_time: float = 0.0
+        """The number of seconds the current test has spent waiting"""
+
+    def on_roundtrip(self, roundtrip: Instrumentation.Roundtrip):
+        """Counts a roundtrip against the current test.
+
+        Args:
+            roundtrip (Instrumentation.Roundtrip): The roundtrip.
+        """
+        with self._lock:
+            self._roundtrips += 1
+
+    def on_span_end(self, span: Instrumentation.Span):
+        """Counts the time taken by an outermost wait against the current test.
+
+        Args:
+            span (Instrumentation.Span): The span.
+        """
+        if not span.is_wait:
+            return
+
+        parent = span.parent
+        while parent is not None:
+            if parent.is_wait:
+                return
+
+            parent = parent.parent
+
+        with self._lock:
+            self._wait_time += span.duration
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Iterator[None]:
+        """Measures a test, recording its roundtrips and wait time, and failing it if it passed but exceeded its budget.
+
+        Args:
+            item (pytest.Item): The test.
+        """
+        with self._lock:
+            self._roundtrips = 0
+            self._wait_time = 0.0
+
+        try:
+            result = yield
+        finally:
+            with self._lock:
+                roundtrips = self._roundtrips
+                wait_time = self._wait_time
+
+            item.user_properties.append((self.USER_PROPERTY_ROUNDTRIPS, roundtrips))
+            item.user_properties.append((self.USER_PROPERTY_WAIT_SECONDS, round(wait_time, 3)))
+
+        marker = item.get_closest_marker(self.MARKER_NAME)
+        if marker is not None and self._enforce_budgets:
+            failures = self._get_budget_failures(marker, roundtrips, wait_time)
+
+            if failures:
+                pytest.fail(f"Test exceeded its {self.MARKER_NAME}: {'; '.join(failures)}.", pytrace=False)
+
+        return result
+
+    @pytest.fixture(scope='session')
+    def pyseext_driver(self, request: pytest.FixtureRequest) -> Iterator['WebDriver']:
+        """Creates the driver for the test session from the `--pyseext-browser` and `--pyseext-remote-url` options,
+        quitting it at the end of the session. Remote drivers are created by a `SessionFactory`.
+
+        Define a `pyseext_driver` fixture in a conftest.py to create the driver another way.
+
+        Args:
+            request (pytest.FixtureRequest): The request for the fixture.
+
+        Yields:
+            WebDriver: The driver.
+        """
+        from selenium import webdriver
+
+        browser = request.config.getoption('pyseext_browser')
+        remote_url = request.config.getoption('pyseext_remote_url')
+
+        options_class = {
+            'chrome': webdriver.ChromeOptions,
+            'firefox': webdriver.FirefoxOptions,
+            'edge': webdriver.EdgeOptions,
+            'safari': webdriver.SafariOptions
+        }[browser]
+
+        if remote_url:
+            driver = SessionFactory(remote_url).create_driver(options_class())
+        else:
+            driver_class = {
+                'chrome': webdriver.Chrome,
+                'firefox': webdriver.Firefox,
+                'edge': webdriver.Edge,
+                'safari': webdriver.Safari
+            }[browser]
+            driver = driver_class(options=options_class())
+
+        try:
+            yield driver
+        finally:
+            driver.quit()
+
+    @pytest.fixture(scope='session')
+    def pyseext_session(self, pyseext_driver: 'WebDriver') -> Session:
+        """Gets the `Session` for the driver of the test session, whose helpers are shared by every test.
+
+        Every command sent by the driver is counted as a roundtrip, not just those sent by our helpers.
+
+        Args:
+            pyseext_driver (WebDriver): The driver.
+
+        Returns:
+            Session: The session.
+        """
+        Instrumentation.instrument_driver(pyseext_driver)
+        return Session(pyseext_driver)
+
+    @staticmethod
+    def _get_budget_failures(marker: pytest.Mark, roundtrips: int, wait_time: float) -> list[str]:
+        """Compares the measurements of a test with its budget.
+
+        Args:
+            marker (pytest.Mark): The budget marker, with optional 'roundtrips' and 'wait_seconds' arguments.
+            roundtrips (int): The number of roundtrips the test made.
+            wait_time (float): The number of seconds the test spent waiting.
+
+        Returns:
+            list[str]: A description of each part of the budget that was exceeded, empty if none were.
+        """
+        failures = []
+        roundtrip_budget: Union[int, None] = marker.kwargs.get('roundtrips')
+        wait_budget: Union[float, None] = marker.kwargs.get('wait_seconds')
+
+        if roundtrip_budget is not None and roundtrips > roundtrip_budget:
+            failures.append(f'made {roundtrips} browser roundtrips, more than the {roundtrip_budget} allowed')
+
+        if wait_budget is not None and wait_time > wait_budget:
+            failures.append(f'waited for {wait_time:.2f} seconds, more than the {wait_budget} allowed')
+
+        return failures
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """Adds our command line options.
+
+    Args:
+        parser (pytest.Parser): The parser.
+    """
+    group = parser.getgroup('pyseext')
+    group.addoption('--pyseext-browser', dest='pyseext_browser', choices=PytestPlugin.BROWSERS, default='chrome',
+                    help='The browser that the pyseext_driver fixture creates a driver for. Defaults to chrome.')
+    group.addoption('--pyseext-remote-url', dest='pyseext_remote_url', default=None,
+                    help='The URL of a remote WebDriver server, e.g. a Selenium Grid, for the pyseext_driver fixture to connect to.')
+    group.addoption('--pyseext-no-budgets', dest='pyseext_no_budgets', action='store_true', default=False,
+                    help=f'Record roundtrips and wait time, but do not fail tests that exceed their {PytestPlugin.MARKER_NAME}.')
+    group.addoption('--pyseext-slow-calls', dest='pyseext_slow_calls', default=None, metavar='PATH',
+                    help='The path of a JSON lines file to append a report of each slow helper call to.')
+    group.addoption('--pyseext-slow-call-threshold', dest='pyseext_slow_call_threshold', type=float, default=SlowCallDetector.DEFAULT_THRESHOLD,
+                    help=f'The number of seconds above which a helper call is reported as slow. Defaults to {SlowCallDetector.DEFAULT_THRESHOLD}.')
+    group.addoption('--pyseext-wait-stats', dest='pyseext_wait_stats', default=None, metavar='PATH',
+                    help='The path of a stats file to record how long each wait takes in, saved at the end of the test session.')
+    group.addoption('--pyseext-adaptive-timeouts', dest='pyseext_adaptive_timeouts', action='store_true', default=False,
+                    help='Set the timeouts of waits that are not given one from their history in the --pyseext-wait-stats file.')
+
+
+def pytest_configure(config: pytest.Config):
+    """Registers our marker and plugin, adds the plugin, and any slow call detector, as instrumentation listeners,
+    and makes any wait analytics current.
+
+    Args:
+        config (pytest.Config): The pytest config.
+    """
+    config.addinivalue_line('markers', f'{PytestPlugin.MARKER_NAME}(roundtrips=None, wait_seconds=None): '
+                                       'fail the test if it makes more browser roundtrips, or spends more seconds in pyseext waits, than allowed.')
+
+    slow_call_detector = None
+    if config.getoption('pyseext_slow_calls'):
+        slow_call_detector = SlowCallDetector(config.getoption('pyseext_slow_call_threshold'), config.getoption('pyseext_slow_calls'))
+        Instrumentation.add_listener(slow_call_detector)
+
+    wait_analytics = None
+    if config.getoption('pyseext_wait_stats'):
+        wait_analytics = WaitAnalytics(config.getoption('pyseext_wait_stats'), adaptive=config.getoption('pyseext_adaptive_timeouts'))
+        WaitAnalytics.set_current(wait_analytics)
+    elif config.getoption('pyseext_adaptive_timeouts'):
+        raise pytest.UsageError('--pyseext-adaptive-timeouts requires --pyseext-wait-stats')
+
+    plugin = PytestPlugin(enforce_budgets=not config.getoption('pyseext_no_budgets'),
+                          slow_call_detector=slow_call_detector,
+                          wait_analytics=wait_analytics)
+    config.pluginmanager.register(plugin, 'pyseext_plugin')
+    Instrumentation.add_listener(plugin)
+
+
+def pytest_unconfigure(config: pytest.Config):
+    """Removes our plugin, and any slow call detector, as instrumentation listeners, and saves any wait analytics.
+
+    Args:
+        config (pytest.Config): The pytest config.
+    """
+    plugin = config.pluginmanager.get_plugin('pyseext_plugin')
+
+    if plugin is not None:
+        Instrumentation.remove_listener(plugin)
+        config.pluginmanager.unregister(plugin)
+
+        if plugin.slow_call_detector is not None:
+            Instrumentation.remove_listener(plugin.slow_call_detector)
+
+        if plugin.wait_analytics is not None:
+            WaitAnalytics.set_current(None)
+            plugin.wait_analytics.save()
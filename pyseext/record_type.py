@@ -0,0 +1,132 @@
+"""
+Module that contains our RecordType class.
+"""
+import functools
+import keyword
+import re
+from collections import namedtuple
+from typing import Any, Union
+
+
+class RecordType:
+    """A class that creates compact record classes for bulk data, such as every row of a grid.
+
+    A record class is created for each model and set of fields, and is a tuple subclass with `__slots__ = ()`,
+    so a record costs a single tuple rather than a dict, and the field names are held only once, by the class.
+
+    Fields can be read as attributes, e.g. `record.name`, provided the field name is a valid identifier,
+    or by name using `get`. Use `to_dict` to get a plain dict where one is needed, e.g. to compare with
+    expected data.
+    """
+
+    # Class variables
+    _MAX_RECORD_CLASSES: int = 256
+    """The number of most recently used record classes that are kept, so that reading data with ever changing fields
+    does not hold on to a class for every set of fields"""
+
+    _INVALID_CHARACTERS = re.compile(r'\W')
+    """Matches characters that cannot be used in a class name"""
+
+    _RESERVED_NAMES: frozenset[str] = frozenset(('get', 'to_dict', 'FIELDS', 'MODEL_NAME'))
+    """Names of members of `RecordType.Record` that a field cannot be read as an attribute by, since it would hide them"""
+
+    @staticmethod
+    def get_record_class(fields: Union[list[str], tuple[str, ...]], model_name: Union[str, None] = None) -> type:
+        """Gets the record class for a set of fields, creating it the first time it is needed.
+
+        The most recently used `_MAX_RECORD_CLASSES` classes are kept, and the same class is returned for them each time.
+
+        Args:
+            fields (Union[list[str], tuple[str, ...]]): The names of the fields, in order.
+            model_name (str, optional): The name of the model the records are for, e.g. 'MyApp.model.User',
+                                        which is used to name the class.
+
+        Returns:
+            type: The record class, which is a subclass of `RecordType.Record`.
+        """
+        return RecordType._create_record_class(tuple(fields), model_name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_MAX_RECORD_CLASSES)
+    def _create_record_class(fields: tuple[str, ...], model_name: Union[str, None]) -> type:
+        """Creates the record class for a set of fields.
+
+        Args:
+            fields (tuple[str, ...]): The names of the fields, in order.
+            model_name (str, optional): The name of the model the records are for, which is used to name the class.
+
+        Returns:
+            type: The record class, which is a subclass of `RecordType.Record`.
+        """
+        class_name = RecordType._INVALID_CHARACTERS.sub('_', model_name.split('.')[-1]) if model_name else 'Record'
+        if not class_name.isidentifier() or keyword.iskeyword(class_name):
+            class_name = 'Record'
+
+        # Field names that are not valid identifiers are renamed positionally by namedtuple, as are
+        # reserved ones, but are still available by their real name from get and to_dict.
+        attribute_names = ['_' if field in RecordType._RESERVED_NAMES else field for field in fields]
+        base_class = namedtuple(class_name, attribute_names, rename=True)
+
+        return type(class_name, (base_class, RecordType.Record), {
+            '__slots__': (),
+            'FIELDS': fields,
+            'MODEL_NAME': model_name,
+            '_FIELD_INDEXES': {field: index for index, field in enumerate(fields)}
+        })
+
+    @staticmethod
+    def from_table(table: Union[dict[str, Any], None]) -> list['RecordType.Record']:
+        """Creates records from a table returned by our JavaScript, see `PySeExt.Core.getTable`.
+
+        Args:
+            table (dict[str, Any]): The table, with the keys 'name', 'fields' and 'rows', or None.
+
+        Returns:
+            list[RecordType.Record]: A record for each row in the table, or an empty list if there is no table.
+        """
+        if not table:
+            return []
+
+        record_class = RecordType.get_record_class(table['fields'], table.get('name'))
+        make = record_class._make
+
+        return [make(row) for row in table['rows']]
+
+    class Record:
+        """The base class for our record classes, which adds access to fields by their real names."""
+
+        __slots__ = ()
+
+        FIELDS: tuple[str, ...] = ()
+        """The names of the fields of the record, in order"""
+
+        MODEL_NAME: Union[str, None] = None
+        """The name of the model the records are for, if known"""
+
+        _FIELD_INDEXES: dict[str, int] = {}
+        """The position of each field, keyed on its name"""
+
+        def get(self, field: str, default: Any = None) -> Any:
+            """Gets the value of a field by its name.
+
+            Args:
+                field (str): The name of the field.
+                default (Any, optional): The value to return if the record has no such field. Defaults to None.
+
+            Returns:
+                Any: The value of the field.
+            """
+            index = self._FIELD_INDEXES.get(field)
+
+            if index is None:
+                return default
+
+            return self[index]
+
+        def to_dict(self) -> dict[str, Any]:
+            """Converts the record to a dict, keyed on the real field names.
+
+            Returns:
+                dict[str, Any]: The data of the record.
+            """
+            return dict(zip(self.FIELDS, self))
@@ -0,0 +1,147 @@
+"""
+Module that contains our Session class.
+"""
+# pylint: disable=import-outside-toplevel
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+if TYPE_CHECKING:
+    from pyseext.button_helper import ButtonHelper
+    from pyseext.component_query import ComponentQuery
+    from pyseext.core import Core
+    from pyseext.field_helper import FieldHelper
+    from pyseext.form_helper import FormHelper
+    from pyseext.grid_helper import GridHelper
+    from pyseext.input_helper import InputHelper
+    from pyseext.local_storage_helper import LocalStorageHelper
+    from pyseext.menu_helper import MenuHelper
+    from pyseext.observable_helper import ObservableHelper
+    from pyseext.store_helper import StoreHelper
+    from pyseext.tree_helper import TreeHelper
+
+class Session:
+    """A class that hands out a single, lazily created instance of each of our helpers for a WebDriver.
+
+    Every session for the same driver shares the same helper instances, and the helpers use it to get
+    the other helpers they depend on, so constructing a helper costs nothing until it is used.
+
+    e.g.
+        session = Session(driver)
+        session.grid_helper.click_row('gridpanel', 0)
+    """
+
+    # Class variables
+    _HELPERS_ATTRIBUTE_NAME: str = '_pyseext_session_helpers'
+    """The name of the attribute of a WebDriver that holds its helper instances. They are held by the driver itself,
+    rather than in a mapping keyed on it, since the helpers refer to the driver, so would keep it alive."""
+
+    def __init__(self, driver: 'WebDriver'):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver to use
+        """
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        if not hasattr(driver, self._HELPERS_ATTRIBUTE_NAME):
+            setattr(driver, self._HELPERS_ATTRIBUTE_NAME, {})
+
+        self._helpers: dict[type, Any] = getattr(driver, self._HELPERS_ATTRIBUTE_NAME)
+        """The helper instances for our driver, keyed on their class"""
+
+    @property
+    def driver(self) -> 'WebDriver':
+        """The WebDriver for this session"""
+        return self._driver
+
+    @property
+    def button_helper(self) -> 'ButtonHelper':
+        """The `ButtonHelper` for this session"""
+        from pyseext.button_helper import ButtonHelper
+        return self._get_helper(ButtonHelper)
+
+    @property
+    def component_query(self) -> 'ComponentQuery':
+        """The `ComponentQuery` for this session"""
+        from pyseext.component_query import ComponentQuery
+        return self._get_helper(ComponentQuery)
+
+    @property
+    def core(self) -> 'Core':
+        """The `Core` for this session"""
+        from pyseext.core import Core
+        return self._get_helper(Core)
+
+    @property
+    def field_helper(self) -> 'FieldHelper':
+        """The `FieldHelper` for this session"""
+        from pyseext.field_helper import FieldHelper
+        return self._get_helper(FieldHelper)
+
+    @property
+    def form_helper(self) -> 'FormHelper':
+        """The `FormHelper` for this session"""
+        from pyseext.form_helper import FormHelper
+        return self._get_helper(FormHelper)
+
+    @property
+    def grid_helper(self) -> 'GridHelper':
+        """The `GridHelper` for this session"""
+        from pyseext.grid_helper import GridHelper
+        return self._get_helper(GridHelper)
+
+    @property
+    def input_helper(self) -> 'InputHelper':
+        """The `InputHelper` for this session"""
+        from pyseext.input_helper import InputHelper
+        return self._get_helper(InputHelper)
+
+    @property
+    def local_storage_helper(self) -> 'LocalStorageHelper':
+        """The `LocalStorageHelper` for this session"""
+        from pyseext.local_storage_helper import LocalStorageHelper
+        return self._get_helper(LocalStorageHelper)
+
+    @property
+    def menu_helper(self) -> 'MenuHelper':
+        """The `MenuHelper` for this session"""
+        from pyseext.menu_helper import MenuHelper
+        return self._get_helper(MenuHelper)
+
+    @property
+    def observable_helper(self) -> 'ObservableHelper':
+        """The `ObservableHelper` for this session"""
+        from pyseext.observable_helper import ObservableHelper
+        return self._get_helper(ObservableHelper)
+
+    @property
+    def store_helper(self) -> 'StoreHelper':
+        """The `StoreHelper` for this session"""
+        from pyseext.store_helper import StoreHelper
+        return self._get_helper(StoreHelper)
+
+    @property
+    def tree_helper(self) -> 'TreeHelper':
+        """The `TreeHelper` for this session"""
+        from pyseext.tree_helper import TreeHelper
+        return self._get_helper(TreeHelper)
+
+    def _get_helper(self, helper_class: type) -> Any:
+        """Gets the instance of a helper class for our driver, creating it if need be.
+
+        Args:
+            helper_class (type): The helper class.
+
+        Returns:
+            Any: The helper instance.
+        """
+        helper = self._helpers.get(helper_class)
+
+        if helper is None:
+            helper = helper_class(self._driver)
+            self._helpers[helper_class] = helper
+
+        return helper
@@ -0,0 +1,136 @@
+"""
+Module that contains our SessionFactory class.
+"""
+# pylint: disable=import-outside-toplevel
+from typing import TYPE_CHECKING, Union
+
+from pyseext.instrumentation import Instrumentation
+from pyseext.session import Session
+
+if TYPE_CHECKING:
+    from selenium.webdriver.common.options import BaseOptions
+    from selenium.webdriver.remote.client_config import ClientConfig
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+class SessionFactory:
+    """A class that creates remote WebDrivers, e.g. for a Selenium Grid, that are tuned for the cost of each roundtrip,
+    along with a `Session` for them.
+
+    Each driver sends its commands over a persistent pool of keep-alive HTTP connections, sized for parallel use,
+    e.g. by `pyseext.aio`, with TCP keep-alive enabled so that idle connections are not dropped by load balancers,
+    and with separate connect and read timeouts.
+
+    The latency of each HTTP request is reported to our instrumentation, see `Instrumentation.Listener.on_http_request`,
+    so the cost of the connection to the remote end can be told apart from the rest of each roundtrip.
+
+    e.g.
+        factory = SessionFactory('http://grid:4444', pool_size=4, read_timeout=60)
+        session = factory.create_session(webdriver.ChromeOptions())
+        session.grid_helper.click_row('gridpanel', 0)
+    """
+
+    # Public class properties
+    DEFAULT_POOL_SIZE: int = 10
+    """The default number of connections kept open to the remote end"""
+
+    DEFAULT_CONNECT_TIMEOUT: float = 10
+    """The default number of seconds to wait for a connection to the remote end to be made"""
+
+    DEFAULT_READ_TIMEOUT: float = 120
+    """The default number of seconds to wait for the remote end to respond to a command"""
+
+    def __init__(self,
+                 remote_url: str,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 tcp_keep_alive: bool = True,
+                 ignore_certificates: bool = False,
+                 extra_headers: Union[dict[str, str], None] = None):
+        """Initialises an instance of this class
+
+        Args:
+            remote_url (str): The URL of the remote end, e.g. 'http://grid:4444'.
+            pool_size (int, optional): The number of connections kept open to the remote end. Defaults to `DEFAULT_POOL_SIZE`.
+            connect_timeout (float, optional): The number of seconds to wait for a connection to be made. Defaults to `DEFAULT_CONNECT_TIMEOUT`.
+            read_timeout (float, optional): The number of seconds to wait for the remote end to respond to a command.
+                                            Defaults to `DEFAULT_READ_TIMEOUT`.
+            tcp_keep_alive (bool, optional): Indicates whether to enable TCP keep-alive on the connections. Defaults to True.
+            ignore_certificates (bool, optional): Indicates whether to skip checking the certificate of the remote end. Defaults to False.
+            extra_headers (dict[str, str], optional): Headers to add to every request, e.g. for authentication. Defaults to None.
+        """
+        # Instance variables
+        self.remote_url = remote_url
+        """The URL of the remote end"""
+
+        self.pool_size = pool_size
+        """The number of connections kept open to the remote end"""
+
+        self.connect_timeout = connect_timeout
+        """The number of seconds to wait for a connection to be made"""
+
+        self.read_timeout = read_timeout
+        """The number of seconds to wait for the remote end to respond to a command"""
+
+        self.tcp_keep_alive = tcp_keep_alive
+        """Indicates whether to enable TCP keep-alive on the connections"""
+
+        self.ignore_certificates = ignore_certificates
+        """Indicates whether to skip checking the certificate of the remote end"""
+
+        self.extra_headers = extra_headers
+        """Headers to add to every request"""
+
+    def create_client_config(self) -> 'ClientConfig':
+        """Creates the client configuration used for the drivers we create.
+
+        Returns:
+            ClientConfig: The configuration.
+        """
+        import socket
+
+        import urllib3
+        from selenium.webdriver.remote.client_config import ClientConfig
+
+        pool_manager_args = {
+            'maxsize': self.pool_size,
+            'block': False
+        }
+
+        if self.tcp_keep_alive:
+            pool_manager_args['socket_options'] = urllib3.connection.HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+        # Selenium reads the arguments for its pool manager from a nested key of this dictionary
+        return ClientConfig(remote_server_addr=self.remote_url,
+                            keep_alive=True,
+                            ignore_certificates=self.ignore_certificates,
+                            init_args_for_pool_manager={'init_args_for_pool_manager': pool_manager_args},
+                            timeout=urllib3.Timeout(connect=self.connect_timeout, read=self.read_timeout),
+                            extra_headers=self.extra_headers)
+
+    def create_driver(self, options: 'BaseOptions') -> 'WebDriver':
+        """Creates a remote driver, which starts a new browser session on the remote end.
+
+        Args:
+            options (BaseOptions): The options for the browser, e.g. `webdriver.ChromeOptions()`.
+
+        Returns:
+            WebDriver: The driver.
+        """
+        from selenium import webdriver
+
+        driver = webdriver.Remote(command_executor=self.remote_url, options=options, client_config=self.create_client_config())
+        Instrumentation.instrument_connection(driver.command_executor)
+
+        return driver
+
+    def create_session(self, options: 'BaseOptions') -> Session:
+        """Creates a remote driver, and the `Session` for it.
+
+        Args:
+            options (BaseOptions): The options for the browser, e.g. `webdriver.ChromeOptions()`.
+
+        Returns:
+            Session: The session, whose `driver` should be quit when finished with.
+        """
+        return Session(self.create_driver(options))
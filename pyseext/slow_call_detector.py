@@ -0,0 +1,259 @@
+"""
+Module that contains our SlowCallDetector class.
+"""
+import json
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Union
+
+from pyseext.instrumentation import Instrumentation
+from pyseext.logging_policy import LoggingPolicy
+
+class SlowCallDetector(Instrumentation.Listener):
+    """An instrumentation listener that reports every helper call that takes longer than a threshold.
+
+    Each report is a JSON object holding the call's arguments, the Python call stack of the code that made it,
+    the time spent in the browser (i.e. in WebDriver commands) and the wait that took the longest, which is the call
+    itself if it is a wait that made no other waits. It also holds the critical path, the chain of nested calls that
+    took the most time, so that a wait hidden behind several others can be found, e.g. the `recheck_time_if_false=1`
+    of the ajax wait made by `FieldHelper.set_field_value` for remote comboboxes.
+
+    Reports are appended to a JSON lines file if a file path is given, otherwise they are logged as warnings, with
+    the report available to handlers as the `pyseext_slow_call` attribute of the log record.
+
+    Only calls made from outside our helpers are reported, the calls they make being covered by their report.
+    The call stack is only captured for calls that are reported, so fast calls cost no more than a dictionary update.
+
+    Can be used as a context manager, which adds it as a listener on entry and removes it on exit.
+
+    e.g.
+        with SlowCallDetector(threshold=2, file_path='slow_calls.jsonl'):
+            field_helper.set_field_value(form_cq, 'country', 'France')
+    """
+
+    # Public class properties
+    DEFAULT_THRESHOLD: float = 2.0
+    """The default number of seconds above which a call is reported"""
+
+    MAX_STACK_DEPTH: int = 20
+    """The maximum number of frames of the calling code's stack recorded in a report, innermost last"""
+
+    LOG_RECORD_ATTRIBUTE: str = 'pyseext_slow_call'
+    """The name of the attribute of the log record that holds the report, when reports are logged"""
+
+    # Private class properties
+    _PACKAGE_PATH: str = str(Path(__file__).parent)
+    """The path of our package, whose frames are left out of the call stacks we record"""
+
+    _IGNORED_PACKAGES: tuple[str, ...] = ('_pytest', 'pytest', 'pluggy')
+    """The packages, other than ours, whose frames are left out of the call stacks we record"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, file_path: Union[str, None] = None):
+        """Initialises an instance of this class
+
+        Args:
+            threshold (float, optional): The number of seconds above which a call is reported. Defaults to `DEFAULT_THRESHOLD`.
+            file_path (str, optional): The path of the JSON lines file that reports are appended to.
+                                       Defaults to None, which logs reports instead.
+        """
+        # Instance variables
+        self.threshold = threshold
+        """The number of seconds above which a call is reported"""
+
+        self._file_path = file_path
+        """The path of the JSON lines file that reports are appended to, if any"""
+
+        self._lock = threading.Lock()
+        """The lock that protects our summaries and file, since spans can end on multiple threads"""
+
+        self._child_summaries: dict[int, dict[str, dict[str, Any]]] = {}
+        """The summaries of the nested spans of each open span, keyed on the id of the open span, then the name of the nested span"""
+
+        self._report_count: int = 0
+        """The number of calls that have been reported"""
+
+        self._logger = LoggingPolicy.get_logger(__name__)
+        """The Logger instance for this class instance"""
+
+    @property
+    def report_count(self) -> int:
+        """The number of calls that have been reported"""
+        return self._report_count
+
+    def __enter__(self) -> 'SlowCallDetector':
+        """Adds this instance as an instrumentation listener.
+
+        Returns:
+            SlowCallDetector: This instance.
+        """
+        Instrumentation.add_listener(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_):
+        """Removes this instance as an instrumentation listener."""
+        Instrumentation.remove_listener(self)
+
+    def on_span_end(self, span: Instrumentation.Span):
+        """Adds an ended span to the summary of its parent, or reports it if it is an outermost call that was slow.
+
+        Args:
+            span (Instrumentation.Span): The span.
+        """
+        with self._lock:
+            children = self._child_summaries.pop(id(span), None)
+
+            if span.parent is not None:
+                self._add_child_summary(span, children)
+                return
+
+        if span.kind == Instrumentation.SPAN_KIND_METHOD and span.duration > self.threshold:
+            self._report(self._create_report(span, children or {}))
+
+    def _add_child_summary(self, span: Instrumentation.Span, children: Union[dict[str, dict[str, Any]], None]):
+        """Adds an ended span to the summary of its parent's nested spans, in which spans with the same name are combined,
+        keeping the nested spans of the longest. Must be called holding our lock.
+
+        Args:
+            span (Instrumentation.Span): The span.
+            children (dict[str, dict[str, Any]], optional): The summary of the span's own nested spans.
+        """
+        siblings = self._child_summaries.setdefault(id(span.parent), {})
+        summary = siblings.get(span.name)
+        duration = span.duration
+
+        if summary is None:
+            siblings[span.name] = {
+                'name': span.name,
+                'kind': span.kind,
+                'is_wait': span.is_wait,
+                'calls': 1,
+                'duration': duration,
+                'max_duration': duration,
+                'children': children or {}
+            }
+        else:
+            summary['calls'] += 1
+            summary['duration'] += duration
+
+            if duration > summary['max_duration']:
+                summary['max_duration'] = duration
+                summary['children'] = children or {}
+
+    def _create_report(self, span: Instrumentation.Span, children: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """Creates the report for a slow call.
+
+        Args:
+            span (Instrumentation.Span): The span of the call.
+            children (dict[str, dict[str, Any]]): The summary of the call's nested spans.
+
+        Returns:
+            dict[str, Any]: The report.
+        """
+        report: dict[str, Any] = {
+            'time': time.time(),
+            'name': span.name,
+            'duration': round(span.duration, 3),
+            'threshold': self.threshold,
+            'args': [str(LoggingPolicy.render(arg)) for arg in span.args],
+            'kwargs': {key: str(LoggingPolicy.render(value)) for key, value in span.kwargs.items()},
+            'roundtrips': span.roundtrip_count,
+            'browser_duration': round(span.roundtrip_time, 3),
+            'wait_duration': round(span.wait_time, 3),
+            'slowest_wait': self._get_slowest_wait(children) or ({'name': span.name, 'calls': 1, 'duration': round(span.duration, 3)} if span.is_wait else None),
+            'critical_path': self._get_critical_path(children),
+            'stack': self._get_calling_stack(),
+            'test': os.environ.get('PYTEST_CURRENT_TEST'),
+            'process_id': os.getpid(),
+            'thread_id': span.thread_id
+        }
+
+        if span.exception is not None:
+            report['exception'] = str(LoggingPolicy.render(span.exception))
+
+        return report
+
+    def _report(self, report: dict[str, Any]):
+        """Appends a report to our file, or logs it if we do not have one.
+
+        Args:
+            report (dict[str, Any]): The report.
+        """
+        line = json.dumps(report, default=str)
+
+        with self._lock:
+            self._report_count += 1
+
+            if self._file_path:
+                with open(self._file_path, 'a', encoding='utf-8') as file:
+                    file.write(line + '\n')
+                return
+
+        self._logger.warning("Slow call to '%s' took %.3f seconds: %s", report['name'], report['duration'], line,
+                             extra={self.LOG_RECORD_ATTRIBUTE: report})
+
+    @staticmethod
+    def _get_slowest_wait(children: dict[str, dict[str, Any]]) -> Union[dict[str, Any], None]:
+        """Finds the wait that took the longest in total among the nested spans of a call, at any depth.
+
+        Args:
+            children (dict[str, dict[str, Any]]): The summary of the call's nested spans.
+
+        Returns:
+            Union[dict[str, Any], None]: The name, number of calls and total duration of the wait, or None if no waits were made.
+        """
+        slowest = None
+        pending = list(children.values())
+
+        while pending:
+            summary = pending.pop()
+
+            if summary['is_wait'] and (slowest is None or summary['duration'] > slowest['duration']):
+                slowest = summary
+
+            pending.extend(summary['children'].values())
+
+        if slowest is None:
+            return None
+
+        return {'name': slowest['name'], 'calls': slowest['calls'], 'duration': round(slowest['duration'], 3)}
+
+    @staticmethod
+    def _get_critical_path(children: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Follows the nested spans of a call that took the most time, down to the innermost.
+
+        Args:
+            children (dict[str, dict[str, Any]]): The summary of the call's nested spans.
+
+        Returns:
+            list[dict[str, Any]]: The name, kind, number of calls and total duration of each span on the path, outermost first.
+        """
+        path = []
+
+        while children:
+            summary = max(children.values(), key=lambda child: child['duration'])
+            path.append({
+                'name': summary['name'],
+                'kind': summary['kind'],
+                'calls': summary['calls'],
+                'duration': round(summary['duration'], 3)
+            })
+            children = summary['children']
+
+        return path
+
+    @staticmethod
+    def _get_calling_stack() -> list[str]:
+        """Gets the Python call stack of the code that called our helpers, leaving out our own frames and those of the test runner.
+
+        Returns:
+            list[str]: A description of each frame, e.g. 'tests/test_people.py:42 in test_edit_person', innermost last.
+        """
+        frames = [frame for frame in traceback.extract_stack()
+                  if not frame.filename.startswith((SlowCallDetector._PACKAGE_PATH, '<frozen '))
+                  and not any(f'{os.sep}{package}{os.sep}' in frame.filename for package in SlowCallDetector._IGNORED_PACKAGES)
+                  and not frame.filename.endswith(f'{os.sep}contextlib.py')]
+
+        return [f'{frame.filename}:{frame.lineno} in {frame.name}' for frame in frames[-SlowCallDetector.MAX_STACK_DEPTH:]]
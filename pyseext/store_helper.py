@@ -1,41 +1,29 @@
 """
 Module that contains our StoreHelper class.
 """
-import logging
-
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import TYPE_CHECKING, Union
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.record_type import RecordType
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 class StoreHelper(HasReferencedJavaScript):
     """A class to help with using stores, through Ext's interfaces."""
 
     # Class variables
-    _RESET_STORE_LOAD_COUNT_TEMPLATE: str = "return globalThis.PySeExt.StoreHelper.resetStoreLoadCount('{store_holder_cq}')"
-    """The script template to use to call the JavaScript method PySeExt.StoreHelper.resetStoreLoadCount
-    Requires the inserts: {store_holder_cq}"""
-
-    _WAIT_FOR_STORE_LOADED_TEMPLATE: str = "return globalThis.PySeExt.StoreHelper.waitForStoreLoaded('{store_holder_cq}', callback)"
-    """The script template to use to call the asynchronous JavaScript method PySeExt.StoreHelper.waitForStoreLoaded
-    Requires the inserts: {store_holder_cq}
-
-    Use our base classes `get_async_script_content` method call it."""
+    _REQUIRED_JAVASCRIPT_CLASS_NAMES: tuple[str, ...] = ('Core',)
+    """The names of the other classes whose JavaScript our JavaScript uses"""
 
-    _RELOAD_STORE_TEMPLATE: str = "return globalThis.PySeExt.StoreHelper.reload('{store_holder_cq}')"
-    """The script template to use to call the JavaScript method PySeExt.StoreHelper.reload
-    Requires the inserts: {store_holder_cq}"""
-
-    _CHECK_STORE_CONTAINS_TEMPLATE: str = "return globalThis.PySeExt.StoreHelper.checkStoreContains('{store_holder_cq}', {data}, {should_only_contain_specified_data})"
-    """The script template to use to call the JavaScript method PySeExt.StoreHelper.checkStoreContains
-    Requires the inserts: {store_holder_cq}, {data}, {should_only_contain_specified_data}"""
-
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
-        self._logger = logging.getLogger(__name__)
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -62,9 +50,7 @@ class StoreHelper(HasReferencedJavaScript):
         """
         self._logger.debug("Resetting loadCount on store owned by '%s'", store_holder_cq)
 
-        script = self._RESET_STORE_LOAD_COUNT_TEMPLATE.format(store_holder_cq=store_holder_cq)
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('resetStoreLoadCount', store_holder_cq)
 
     def wait_for_store_loaded(self, store_holder_cq: str):
         """ Waits for the specified store to return true from its isLoaded method.
@@ -77,9 +63,7 @@ class StoreHelper(HasReferencedJavaScript):
         """
         self._logger.debug("Waiting for store owned by '%s' to load", store_holder_cq)
 
-        async_script = self.get_async_script_content(self._WAIT_FOR_STORE_LOADED_TEMPLATE).format(store_holder_cq=store_holder_cq)
-        self.ensure_javascript_loaded()
-        self._driver.execute_async_script(async_script)
+        self._call_async_function('waitForStoreLoaded', store_holder_cq)
 
         self._logger.debug("Store owned by '%s' loaded", store_holder_cq)
 
@@ -89,9 +73,7 @@ class StoreHelper(HasReferencedJavaScript):
         Args:
             store_holder_cq (str): The component query to use to find the store holder.
         """
-        script = self._RELOAD_STORE_TEMPLATE.format(store_holder_cq=store_holder_cq)
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('reload', store_holder_cq)
 
     def trigger_reload_and_wait(self, store_holder_cq: str):
         """Triggers a load on the specified store and waits for it to complete.
@@ -140,6 +122,21 @@ class StoreHelper(HasReferencedJavaScript):
                                                                  Defaults to False, so the store is allowed to contain other data.
         """
         self.wait_for_store_loaded(store_holder_cq)
-        script = self._CHECK_STORE_CONTAINS_TEMPLATE.format(store_holder_cq=store_holder_cq, data=data, should_only_contain_specified_data=str(should_only_contain_specified_data).lower())
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+        self._call_function('checkStoreContains', store_holder_cq, data, should_only_contain_specified_data)
+
+    def get_records(self, store_holder_cq: str, fields: Union[list[str], None] = None) -> list[RecordType.Record]:
+        """Gets the data of every record in the specified store.
+
+        The data is returned as compact records rather than dicts, see `RecordType`, which matters when
+        a store holds many thousands of records. Use `RecordType.Record.to_dict` to get a dict for a record.
+
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
+        Args:
+            store_holder_cq (str): The component query to use to find the store holder.
+            fields (list[str], optional): The fields to include. If omitted, every field found in the data is included.
+
+        Returns:
+            list[RecordType.Record]: A record for each record in the store.
+        """
+        return self._call_function('getRecords', store_holder_cq, fields, deferrable=True, result_handler=RecordType.from_table)
@@ -0,0 +1,11 @@
+"""
+Support for exercising our helpers without a browser, e.g. to benchmark or regression test their roundtrips.
+
+e.g.
+    driver = pyseext.testing.FakeWebDriver()
+    driver.command_executor.set_function_result('Core', 'isAjaxRequestInProgress', True)
+"""
+from pyseext.testing.fake_command_executor import FakeCommandExecutor
+from pyseext.testing.fake_web_driver import FakeWebDriver
+from pyseext.testing.command_recorder import CommandRecorder
+from pyseext.testing.replay_command_executor import ReplayCommandExecutor
@@ -0,0 +1,95 @@
+"""
+Module that contains our CommandRecorder class.
+"""
+import json
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyseext import __version__
+
+class CommandRecorder:
+    """A context manager that records the commands a WebDriver sends, and the raw responses it receives,
+    so that the session can be replayed without a browser by a `ReplayCommandExecutor`.
+
+    Recording should start with a new driver, before any of our helpers have been used with it, so that
+    the replayed session loads our JavaScript at the same points as the recorded one.
+
+    e.g.
+        with CommandRecorder(driver) as recorder:
+            grid_helper.click_row('gridpanel', 0)
+
+        recorder.save('click_row.recording.json')
+    """
+
+    # Public class properties
+    RECORDING_FORMAT_VERSION: int = 1
+    """The version of the recording file format"""
+
+    def __init__(self, driver: WebDriver):
+        """Initialises an instance of this class
+
+        Args:
+            driver (WebDriver): The webdriver whose commands are to be recorded.
+        """
+        self._driver = driver
+        """The WebDriver instance for this class instance"""
+
+        self._original_execute = None
+        """The command executor's execute method, while we are recording"""
+
+        self.commands: list[dict[str, Any]] = []
+        """The commands recorded so far, each with its 'command', 'params' and 'response'"""
+
+    def __enter__(self) -> 'CommandRecorder':
+        """Starts recording.
+
+        Returns:
+            CommandRecorder: This instance.
+        """
+        command_executor = self._driver.command_executor
+        original_execute = command_executor.execute
+
+        def execute(command: str, params: dict) -> dict:
+            response = original_execute(command, params)
+
+            self.commands.append({
+                'command': command,
+                'params': {key: value for key, value in (params or {}).items() if key != 'sessionId'},
+                'response': response
+            })
+
+            return response
+
+        self._original_execute = original_execute
+        command_executor.execute = execute
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops recording."""
+        self._driver.command_executor.execute = self._original_execute
+        self._original_execute = None
+
+    def get_recording(self) -> dict[str, Any]:
+        """Gets the recording made so far.
+
+        Returns:
+            dict[str, Any]: The recording, as saved by `save`.
+        """
+        return {
+            'formatVersion': self.RECORDING_FORMAT_VERSION,
+            'pyseextVersion': __version__,
+            'capabilities': self._driver.caps,
+            'commands': self.commands
+        }
+
+    def save(self, file_path: str):
+        """Saves the recording made so far to a JSON file.
+
+        Values that cannot be represented in JSON are saved as strings.
+
+        Args:
+            file_path (str): The path of the file to write.
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.get_recording(), file, default=str)
@@ -0,0 +1,482 @@
+"""
+Module that contains our FakeCommandExecutor class.
+"""
+import re
+import time
+from typing import Any, Callable, Union
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from pyseext import __version__
+from pyseext.core import Core
+from pyseext.dev_tools_transport import DevToolsTransport
+from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.payload_codec import PayloadCodec
+
+class FakeCommandExecutor:
+    """A stand in for a WebDriver's remote connection, that answers commands from canned state rather than a browser.
+
+    It understands how our JavaScript is loaded and called, so it answers calls to our `PySeExt.*` functions
+    using the handlers or results set for them, and reports our JavaScript as missing after a navigation, just like a browser.
+    A call fails if the JavaScript for its class, or for any class it uses (see `_REQUIRED_JAVASCRIPT_CLASS_NAMES`), is not loaded.
+    Any other script or command is answered using the handlers or results set for it, or None.
+
+    Every command is recorded in `commands`, so tests can assert on the roundtrips made.
+
+    Generally used through a `FakeWebDriver`.
+
+    e.g.
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_result('GridHelper', 'getRow', FakeCommandExecutor.element('row-1'))
+    """
+
+    # Public class properties
+    ELEMENT_KEY: str = 'element-6066-11e4-a52e-4f735466cecf'
+    """The key used by the WebDriver protocol to identify an element reference"""
+
+    SESSION_ID: str = 'pyseext-fake-session'
+    """The session identifier given to the fake session"""
+
+    DEFAULT_FUNCTION_RESULTS: dict[tuple[str, str], Any] = {
+        ('Core', 'isAjaxRequestInProgress'): False,
+        ('TreeHelper', 'isTreeLoading'): False,
+        ('StoreHelper', 'resetStoreLoadCount'): None,
+        ('StoreHelper', 'waitForStoreLoaded'): None,
+        ('StoreHelper', 'reload'): None
+    }
+    """The results of our JavaScript functions that are answered without needing to be set, keyed on class and function name"""
+
+    DEFAULT_SCRIPT_RESULTS: dict[str, Any] = {
+        Core._IS_DOM_READY: True # pylint: disable=protected-access
+    }
+    """The results of other scripts that are answered without needing to be set, keyed on the script"""
+
+    # Class variables
+    _LOADED_CLASS_NAME_PATTERN: re.Pattern = re.compile(r'globalThis\.PySeExt\.(\w+)\s*=\s*\{')
+    """The pattern used to find the names of the classes defined by a script that loads our JavaScript"""
+
+    def __init__(self, browser_name: str = 'fake'):
+        """Initialises an instance of this class
+
+        Args:
+            browser_name (str, optional): The browser name to report in the session's capabilities. Defaults to 'fake'.
+        """
+        self.browser_name = browser_name
+        """The browser name reported in the session's capabilities"""
+
+        self.commands: list[tuple[str, dict]] = []
+        """The commands received, with their parameters, in order"""
+
+        self.page_token: Union[str, None] = None
+        """The page token planted by our JavaScript in the current page, or None if it has not been loaded"""
+
+        self.loaded_class_names: set[str] = set()
+        """The names of the classes whose JavaScript has been loaded into the current page"""
+
+        self.url: Union[str, None] = None
+        """The URL of the current page, if one has been navigated to"""
+
+        self.frame_depth: int = 0
+        """How many frames deep the WebDriver has switched to, 0 being the top level frame"""
+
+        self.timeouts: dict[str, Union[int, None]] = {'implicit': 0, 'pageLoad': 300000, 'script': 30000}
+        """The session's timeouts, in milliseconds, as set by the WebDriver. Waits in the browser that exceed the script timeout fail."""
+
+        self._function_handlers: dict[tuple[str, str], Callable[..., Any]] = {}
+        """The handlers for our JavaScript functions, keyed on class and function name"""
+
+        self._script_handlers: dict[str, Callable[..., Any]] = {}
+        """The handlers for other scripts, keyed on the script"""
+
+        self._command_handlers: dict[str, Callable[[dict], Any]] = {}
+        """The handlers for other commands, keyed on the command"""
+
+        class_script = HasReferencedJavaScript._CLASS_SCRIPT_TEMPLATE.format(page_change_script='\0', script='\1') # pylint: disable=protected-access
+
+        self._class_script_prefix = class_script.split('\0', 1)[0]
+        """The start of every script that loads the JavaScript for individual classes"""
+
+        self._class_script_page_change_end = class_script.split('\0', 1)[1].split('\1', 1)[0]
+        """The text that ends the part of a script that loads the JavaScript for individual classes, which is only run after a navigation"""
+
+        self._bundled_script_prefix = self._get_template_prefix(HasReferencedJavaScript._BUNDLED_SCRIPT_TEMPLATE, # pylint: disable=protected-access
+                                                                version=__version__,
+                                                                scripts='\0')
+        """The start of the script that loads all of our JavaScript"""
+
+    @staticmethod
+    def element(element_id: str) -> dict[str, str]:
+        """Creates the reference to an element that a handler can return, which the WebDriver turns into a `WebElement`.
+
+        Args:
+            element_id (str): The identifier of the element.
+
+        Returns:
+            dict[str, str]: The element reference.
+        """
+        return {FakeCommandExecutor.ELEMENT_KEY: element_id}
+
+    def set_function_handler(self, class_name: str, function_name: str, handler: Callable[..., Any]):
+        """Sets the handler for one of our JavaScript functions, which is called with the function's arguments
+        and returns its result, or raises an exception to simulate a JavaScript error.
+
+        Args:
+            class_name (str): The name of the class, e.g. 'GridHelper'.
+            function_name (str): The name of the function, e.g. 'getRow'.
+            handler (Callable[..., Any]): The handler.
+        """
+        self._function_handlers[(class_name, function_name)] = handler
+
+    def set_function_result(self, class_name: str, function_name: str, result: Any):
+        """Sets the result to return for one of our JavaScript functions.
+
+        Args:
+            class_name (str): The name of the class, e.g. 'GridHelper'.
+            function_name (str): The name of the function, e.g. 'getRow'.
+            result (Any): The result.
+        """
+        self.set_function_handler(class_name, function_name, lambda *args: result)
+
+    def set_script_handler(self, script: str, handler: Callable[..., Any]):
+        """Sets the handler for a script, which is called with the script's arguments and returns its result.
+
+        Args:
+            script (str): The script.
+            handler (Callable[..., Any]): The handler.
+        """
+        self._script_handlers[script] = handler
+
+    def set_script_result(self, script: str, result: Any):
+        """Sets the result to return for a script.
+
+        Args:
+            script (str): The script.
+            result (Any): The result.
+        """
+        self.set_script_handler(script, lambda *args: result)
+
+    def set_command_handler(self, command: str, handler: Callable[[dict], Any]):
+        """Sets the handler for any other WebDriver command, which is called with the command's parameters and returns its value.
+
+        Args:
+            command (str): The command, e.g. 'getElementText'.
+            handler (Callable[[dict], Any]): The handler.
+        """
+        self._command_handlers[command] = handler
+
+    def navigate(self, url: Union[str, None] = None):
+        """Simulates navigating to a new page, so our JavaScript is no longer loaded.
+
+        Args:
+            url (str, optional): The URL of the new page. Defaults to None.
+        """
+        self.url = url
+        self.frame_depth = 0
+        self.page_token = None
+        self.loaded_class_names = set()
+
+    def get_command_count(self, command: Union[str, None] = None) -> int:
+        """Gets the number of commands received.
+
+        Args:
+            command (str, optional): The command to count, or None to count all commands. Defaults to None.
+
+        Returns:
+            int: The number of commands.
+        """
+        return sum(1 for received_command, _ in self.commands if command is None or received_command == command)
+
+    def execute(self, command: str, params: dict) -> dict:
+        """Answers a WebDriver command.
+
+        Args:
+            command (str): The command.
+            params (dict): The parameters for the command.
+
+        Returns:
+            dict: The response.
+        """
+        self.commands.append((command, params))
+
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': self.SESSION_ID, 'capabilities': {'browserName': self.browser_name}}}
+
+        if command == Command.GET:
+            self.navigate(params.get('url'))
+            return {'value': None}
+
+        if command == Command.GET_TIMEOUTS:
+            return {'value': dict(self.timeouts)}
+
+        if command == Command.SET_TIMEOUTS:
+            self.timeouts.update(params)
+            return {'value': None}
+
+        if command == Command.SWITCH_TO_FRAME:
+            self.frame_depth = 0 if params.get('id') is None else self.frame_depth + 1
+            return {'value': None}
+
+        if command == Command.SWITCH_TO_PARENT_FRAME:
+            self.frame_depth = max(self.frame_depth - 1, 0)
+            return {'value': None}
+
+        if command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC):
+            return {'value': self._to_wire(self._execute_script(params['script'], params.get('args', [])))}
+
+        handler = self._command_handlers.get(command)
+        return {'value': self._to_wire(handler(params) if handler else None)}
+
+    def close(self):
+        """Closes the connection, which does nothing."""
+
+    def _execute_script(self, script: str, args: list) -> Any:
+        """Answers a script, as the browser would.
+
+        Args:
+            script (str): The script.
+            args (list): The arguments for the script.
+
+        Returns:
+            Any: The result of the script.
+        """
+        # pylint: disable=protected-access
+        if script == HasReferencedJavaScript._IS_PAGE_TOKEN_PRESENT_SCRIPT:
+            return self.page_token is not None and args[0] == self.page_token
+
+        if script == DevToolsTransport._FRAME_DEPTH_SCRIPT:
+            return self.frame_depth
+
+        if script.startswith(self._class_script_prefix):
+            page_change_script, script = script[len(self._class_script_prefix):].split(self._class_script_page_change_end, 1)
+            return self._load_javascript(script, args, page_change_script)
+
+        if script.startswith(self._bundled_script_prefix):
+            return {'version': __version__, 'isSamePage': self._load_javascript(script, args)}
+
+        if script in (HasReferencedJavaScript._CALL_FUNCTION_SCRIPT, HasReferencedJavaScript._CALL_ASYNC_FUNCTION_SCRIPT):
+            if not self._is_page_token_present(args[0]):
+                return HasReferencedJavaScript._NOT_LOADED_RESULT
+
+            return self._call_function(args[1], args[2], args[3:])
+
+        if script == HasReferencedJavaScript._CALL_FUNCTION_COMPRESSED_SCRIPT:
+            if not self._is_page_token_present(args[0]):
+                return HasReferencedJavaScript._NOT_LOADED_RESULT
+
+            try:
+                return PayloadCodec.encode(self._call_function(args[1], args[2], PayloadCodec.decode(args[4])), args[3])
+            except JavascriptException as exc:
+                return {PayloadCodec.ERROR_KEY: exc.msg}
+
+        if script == HasReferencedJavaScript._WAIT_FOR_FUNCTION_SCRIPT:
+            if not self._is_page_token_present(args[0]):
+                return HasReferencedJavaScript._NOT_LOADED_RESULT
+
+            return self._wait_for_function(*args[1:])
+
+        if script == HasReferencedJavaScript._CALL_FUNCTIONS_SCRIPT:
+            if not self._is_page_token_present(args[0]):
+                return HasReferencedJavaScript._NOT_LOADED_RESULT
+
+            return self._call_functions(args[1])
+
+        if script == HasReferencedJavaScript._CALL_FUNCTIONS_COMPRESSED_SCRIPT:
+            if not self._is_page_token_present(args[0]):
+                return HasReferencedJavaScript._NOT_LOADED_RESULT
+
+            return PayloadCodec.encode(self._call_functions(PayloadCodec.decode(args[4])), args[3])
+
+        handler = self._script_handlers.get(script)
+        if handler:
+            return handler(*args)
+
+        return self.DEFAULT_SCRIPT_RESULTS.get(script)
+
+    def _load_javascript(self, script: str, args: list, page_change_script: str = '') -> bool:
+        """Answers a script that loads our JavaScript, planting the new page token if ours is not present.
+
+        Args:
+            script (str): The script, or the part of it that is always run.
+            args (list): The current and new page tokens.
+            page_change_script (str, optional): The part of the script that is only run if our page token is not present. Defaults to ''.
+
+        Returns:
+            bool: Whether the current page token was already present.
+        """
+        is_same_page = self._is_page_token_present(args[0])
+
+        if not is_same_page:
+            self.page_token = args[1]
+            self.loaded_class_names.update(self._LOADED_CLASS_NAME_PATTERN.findall(page_change_script))
+
+        self.loaded_class_names.update(self._LOADED_CLASS_NAME_PATTERN.findall(script))
+
+        return is_same_page
+
+    def _call_function(self, class_name: str, function_name: str, args: list) -> Any:
+        """Answers a call to one of our JavaScript functions.
+
+        Args:
+            class_name (str): The name of the class.
+            function_name (str): The name of the function.
+            args (list): The arguments for the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        if class_name not in self.loaded_class_names:
+            raise JavascriptException(f"TypeError: The JavaScript for '{class_name}' has not been loaded")
+
+        for required_class_name in self._get_required_class_names(class_name):
+            if required_class_name not in self.loaded_class_names:
+                raise JavascriptException(f"TypeError: The JavaScript for '{required_class_name}', used by '{class_name}', has not been loaded")
+
+        key = (class_name, function_name)
+        handler = self._function_handlers.get(key)
+
+        if handler:
+            return handler(*args)
+
+        if key in self.DEFAULT_FUNCTION_RESULTS:
+            return self.DEFAULT_FUNCTION_RESULTS[key]
+
+        raise JavascriptException(f"No fake handler has been set for 'PySeExt.{class_name}.{function_name}'")
+
+    def _call_functions(self, calls: list[list]) -> list[dict[str, Any]]:
+        """Answers a number of calls to our JavaScript functions made in one go.
+
+        Args:
+            calls (list[list]): The [class name, function name, arguments] for each call.
+
+        Returns:
+            list[dict[str, Any]]: A dictionary for each call containing either its 'value' or its 'error'.
+        """
+        results = []
+        for class_name, function_name, function_args in calls:
+            try:
+                results.append({PayloadCodec.VALUE_KEY: self._call_function(class_name, function_name, function_args)})
+            except JavascriptException as exc:
+                results.append({PayloadCodec.ERROR_KEY: exc.msg})
+
+        return results
+
+    def _wait_for_function(self,
+                           class_name: str,
+                           function_name: str,
+                           args: list,
+                           negate: bool,
+                           settle_time: int,
+                           timeout: int,
+                           interval: Union[int, None]) -> dict[str, Any]:
+        """Answers a wait for one of our JavaScript functions, evaluating it repeatedly, as the browser would.
+
+        Args:
+            class_name (str): The name of the class.
+            function_name (str): The name of the function.
+            args (list): The arguments for the function.
+            negate (bool): Whether to wait for the function to return a false value instead.
+            settle_time (int): The number of milliseconds that the value must continuously hold for.
+            timeout (int): The timeout in milliseconds.
+            interval (int): The milliseconds between evaluations, or None for every animation frame.
+
+        Returns:
+            dict[str, Any]: An envelope holding the 'value' or 'error', or `timedOut`.
+
+        Raises:
+            TimeoutException: If the wait exceeds the script timeout.
+        """
+        start = time.monotonic()
+        met_since = None
+        script_timeout = self.timeouts.get('script')
+
+        while True:
+            try:
+                value = self._call_function(class_name, function_name, args)
+            except JavascriptException as exc:
+                return {PayloadCodec.ERROR_KEY: exc.msg}
+
+            now = time.monotonic()
+            if bool(value) != negate:
+                if met_since is None:
+                    met_since = now
+
+                if (now - met_since) * 1000 >= settle_time:
+                    return {PayloadCodec.VALUE_KEY: True if negate else value}
+            else:
+                met_since = None
+
+            if (now - start) * 1000 >= timeout:
+                return {'timedOut': True}
+
+            if script_timeout is not None and (now - start) * 1000 >= script_timeout:
+                raise TimeoutException(f'script timeout of {script_timeout} ms exceeded')
+
+            time.sleep((16 if interval is None else interval) / 1000)
+
+    @staticmethod
+    def _get_required_class_names(class_name: str) -> tuple[str, ...]:
+        """Gets the names of the other classes whose JavaScript is used by the JavaScript for a class,
+        as declared by the `_REQUIRED_JAVASCRIPT_CLASS_NAMES` of the helper with that name.
+
+        Args:
+            class_name (str): The name of the class.
+
+        Returns:
+            tuple[str, ...]: The names of the classes, or an empty tuple if there is no helper with that name.
+        """
+        helper_classes = HasReferencedJavaScript.__subclasses__()
+
+        while helper_classes:
+            helper_class = helper_classes.pop()
+            if helper_class.__name__ == class_name:
+                return helper_class._REQUIRED_JAVASCRIPT_CLASS_NAMES # pylint: disable=protected-access
+
+            helper_classes.extend(helper_class.__subclasses__())
+
+        return ()
+
+    def _is_page_token_present(self, page_token: Union[str, None]) -> bool:
+        """Determines whether a page token is the one planted in the current page.
+
+        Args:
+            page_token (str, optional): The page token.
+
+        Returns:
+            bool: True if it is present, False otherwise.
+        """
+        return self.page_token is not None and page_token == self.page_token
+
+    def _to_wire(self, value: Any) -> Any:
+        """Converts a result into the form the WebDriver protocol uses, turning any `WebElement` into an element reference.
+
+        Args:
+            value (Any): The result.
+
+        Returns:
+            Any: The converted result.
+        """
+        if isinstance(value, WebElement):
+            return self.element(value.id)
+
+        if isinstance(value, (list, tuple)):
+            return [self._to_wire(item) for item in value]
+
+        if isinstance(value, dict):
+            return {key: self._to_wire(item) for key, item in value.items()}
+
+        return value
+
+    @staticmethod
+    def _get_template_prefix(template: str, **inserts) -> str:
+        """Gets the fixed text at the start of a script template, before its first variable insert.
+
+        Args:
+            template (str): The script template.
+            **inserts: The inserts for the template, one of which must be '\\0' to mark where the variable text starts.
+
+        Returns:
+            str: The fixed text.
+        """
+        return template.format(**inserts).split('\0', 1)[0]
@@ -0,0 +1,39 @@
+"""
+Module that contains our FakeWebDriver class.
+"""
+from typing import Union
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyseext.testing.fake_command_executor import FakeCommandExecutor
+from pyseext.testing.replay_command_executor import ReplayCommandExecutor
+
+class FakeWebDriver(WebDriver):
+    """A real Selenium `WebDriver` whose commands are answered without a browser, so that our helpers can be
+    exercised, benchmarked and regression tested for their roundtrips on a machine without one.
+
+    By default commands are answered by a `FakeCommandExecutor`, available as `command_executor`, which is scripted
+    with the results of our JavaScript functions. Alternatively a `ReplayCommandExecutor` can be given, to replay a
+    session recorded from a real browser by a `CommandRecorder`.
+
+    e.g.
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_result('FieldHelper', 'getFieldValue', {'value': 'Bob', 'isDate': False})
+
+        assert FieldHelper(driver).get_field_value('form', 'name') == 'Bob'
+        assert driver.command_executor.get_command_count('w3cExecuteScript') == 2
+    """
+
+    def __init__(self, command_executor: Union[FakeCommandExecutor, ReplayCommandExecutor, None] = None, is_remote: bool = True):
+        """Initialises an instance of this class
+
+        Args:
+            command_executor (Union[FakeCommandExecutor, ReplayCommandExecutor], optional): The command executor that answers our commands.
+                                                                                            Defaults to a new `FakeCommandExecutor`.
+            is_remote (bool, optional): Indicates whether the driver should report that it is remote, which, for example,
+                                        stops the `InputHelper` typing character by character. Defaults to True.
+        """
+        super().__init__(command_executor=command_executor or FakeCommandExecutor(), options=ArgOptions())
+
+        self._is_remote = is_remote
@@ -0,0 +1,131 @@
+"""
+Module that contains our ReplayCommandExecutor class.
+"""
+import json
+from typing import Any, Union
+
+from selenium.webdriver.remote.command import Command
+
+class ReplayCommandExecutor:
+    """A stand in for a WebDriver's remote connection, that answers commands with the responses recorded by a `CommandRecorder`.
+
+    Commands must arrive in the recorded order, with the same command and script, otherwise a `ReplayMismatchException`
+    is raised. Other parameters are not compared, since they include values that differ between sessions, such as our page token.
+
+    e.g.
+        driver = FakeWebDriver(ReplayCommandExecutor('click_row.recording.json'))
+        GridHelper(driver).click_row('gridpanel', 0)
+    """
+
+    # Public class properties
+    SESSION_ID: str = 'pyseext-replay-session'
+    """The session identifier given to the replayed session"""
+
+    def __init__(self, recording: Union[str, dict[str, Any]]):
+        """Initialises an instance of this class
+
+        Args:
+            recording (Union[str, dict[str, Any]]): The path of a recording file saved by a `CommandRecorder`, or the recording itself.
+        """
+        if isinstance(recording, str):
+            with open(recording, 'r', encoding='utf-8') as file:
+                recording = json.load(file)
+
+        self._capabilities: dict[str, Any] = recording.get('capabilities') or {}
+        """The capabilities of the recorded session"""
+
+        self._commands: list[dict[str, Any]] = recording['commands']
+        """The recorded commands"""
+
+        self.position: int = 0
+        """The index of the next recorded command to replay"""
+
+    def is_complete(self) -> bool:
+        """Indicates whether all of the recorded commands have been replayed.
+
+        Returns:
+            bool: True if they have, False otherwise.
+        """
+        return self.position >= len(self._commands)
+
+    def execute(self, command: str, params: dict) -> dict:
+        """Answers a WebDriver command with the next recorded response.
+
+        Args:
+            command (str): The command.
+            params (dict): The parameters for the command.
+
+        Returns:
+            dict: The recorded response.
+        """
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': self.SESSION_ID, 'capabilities': self._capabilities}}
+
+        if command == Command.QUIT:
+            return {'value': None}
+
+        if self.is_complete():
+            raise ReplayCommandExecutor.ReplayExhaustedException(command, len(self._commands))
+
+        recorded = self._commands[self.position]
+        script = (params or {}).get('script')
+
+        if recorded['command'] != command or recorded['params'].get('script') != script:
+            raise ReplayCommandExecutor.ReplayMismatchException(self.position, recorded['command'], command)
+
+        self.position += 1
+        return recorded['response']
+
+    def close(self):
+        """Closes the connection, which does nothing."""
+
+    class ReplayMismatchException(Exception):
+        """Exception class thrown when a command does not match the recorded command it is replacing."""
+
+        def __init__(self,
+                     position: int,
+                     recorded_command: str,
+                     command: str,
+                     message: str = "Command {position} was recorded as '{recorded_command}' but replayed as '{command}', or with a different script."):
+            """Initialises an instance of this exception
+
+            Args:
+                position (int): The index of the recorded command.
+                recorded_command (str): The recorded command.
+                command (str): The command being replayed.
+                message (str, optional): The exception message. Defaults to "Command {position} was recorded as '{recorded_command}' but replayed as '{command}', or with a different script.".
+            """
+            self.message = message
+            self._position = position
+            self._recorded_command = recorded_command
+            self._command = command
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message.format(position=self._position, recorded_command=self._recorded_command, command=self._command)
+
+    class ReplayExhaustedException(Exception):
+        """Exception class thrown when more commands are replayed than were recorded."""
+
+        def __init__(self,
+                     command: str,
+                     count: int,
+                     message: str = "Cannot replay '{command}' since all {count} recorded commands have been replayed."):
+            """Initialises an instance of this exception
+
+            Args:
+                command (str): The command being replayed.
+                count (int): The number of recorded commands.
+                message (str, optional): The exception message. Defaults to "Cannot replay '{command}' since all {count} recorded commands have been replayed.".
+            """
+            self.message = message
+            self._command = command
+            self._count = count
+
+            super().__init__(self.message)
+
+        def __str__(self):
+            """Returns a string representation of this exception"""
+            return self.message.format(command=self._command, count=self._count)
@@ -1,41 +1,26 @@
 """
 Module that contains our TreeHelper class.
 """
-import logging
 import time
-from typing import Union
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
+from typing import TYPE_CHECKING, Union
 
 from pyseext.has_referenced_javascript import HasReferencedJavaScript
-from pyseext.core import Core
 from pyseext.menu_helper import MenuHelper
+from pyseext.polling_strategy import PollingStrategy
+from pyseext.record_type import RecordType
+from pyseext.session import Session
+from pyseext.logging_policy import LoggingPolicy
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
 
 class TreeHelper(HasReferencedJavaScript):
     """A class to help with using trees, through Ext's interfaces."""
 
     # Class variables
-    _IS_TREE_LOADING_TEMPLATE: str = "return globalThis.PySeExt.TreeHelper.isTreeLoading('{tree_cq}')"
-    """The script template to use to call the JavaScript method PySeExt.TreeHelper.isTreeLoading
-    Requires the inserts: {tree_cq}"""
-
-    _GET_NODE_ELEMENT_TEMPLATE: str = "return globalThis.PySeExt.TreeHelper.getNodeElement('{tree_cq}', {node_text_or_data}, '{css_query}')"
-    """The script template to use to call the JavaScript method PySeExt.TreeHelper.getNodeElement
-    Requires the inserts: {tree_cq}, {node_text_or_data}, {css_query}"""
-
-    _GET_NODE_ELEMENT_WITH_ROOT_TEMPLATE: str = "return globalThis.PySeExt.TreeHelper.getNodeElement('{tree_cq}', {node_text_or_data}, '{css_query}', {root_node_text_or_data})"
-    """The script template to use to call the JavaScript method PySeExt.TreeHelper.getNodeElement including a root node to search from
-    Requires the inserts: {tree_cq}, {node_text_or_data}, {css_query}, {root_node_text_or_data}"""
-
-    _RELOAD_NODE_TEMPLATE: str = "return globalThis.PySeExt.TreeHelper.reloadNode('{tree_cq}', {node_text_or_data})"
-    """The script template to use to call the JavaScript method PySeExt.TreeHelper.reloadNode
-    Requires the inserts: {tree_cq}, {node_text_or_data}"""
-
-    _RELOAD_NODE_WITH_ROOT_TEMPLATE: str = "return globalThis.PySeExt.TreeHelper.reloadNode('{tree_cq}', {node_text_or_data}, {root_node_text_or_data})"
-    """The script template to use to call the JavaScript method PySeExt.TreeHelper.reloadNode including a root node to search from
-    Requires the inserts: {tree_cq}, {node_text_or_data}, {root_node_text_or_data}"""
+    _REQUIRED_JAVASCRIPT_CLASS_NAMES: tuple[str, ...] = ('Core',)
+    """The names of the other classes whose JavaScript our JavaScript uses"""
 
     _ICON_CSS_SELECTOR: str = ".x-tree-icon"
     """The CSS selector to use with get_node_element to find the node icon element.
@@ -49,13 +34,15 @@ class TreeHelper(HasReferencedJavaScript):
     """The CSS selector to use with get_node_element to find the node text element.
     """
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: 'WebDriver'):
         """Initialises an instance of this class
 
         Args:
             driver (WebDriver): The webdriver to use
         """
-        self._logger = logging.getLogger(__name__)
+        from selenium.webdriver.common.action_chains import ActionChains
+
+        self._logger = LoggingPolicy.get_logger(__name__)
         """The Logger instance for this class instance"""
 
         self._driver = driver
@@ -64,15 +51,14 @@ class TreeHelper(HasReferencedJavaScript):
         self._action_chains = ActionChains(driver)
         """The ActionChains instance for this class instance"""
 
-        self._core = Core(driver)
-        """The `Core` instance for this class instance"""
-
-        self._menu_helper = MenuHelper(driver)
-        """The `MenuHelper` instance for this class instance"""
-
         # Initialise our base class
         super().__init__(driver, self._logger)
 
+    @property
+    def _menu_helper(self) -> MenuHelper:
+        """The `MenuHelper` instance for our driver, from its `Session`"""
+        return Session(self._driver).menu_helper
+
     def is_tree_loading(self, tree_cq: str):
         """Determine whether the tree (any part of it) is currently loading.
 
@@ -85,30 +71,65 @@ class TreeHelper(HasReferencedJavaScript):
         Returns:
             bool: True if the tree is loaded, False otherwise.
         """
-        script = self._IS_TREE_LOADING_TEMPLATE.format(tree_cq=tree_cq)
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        return self._call_function('isTreeLoading', tree_cq)
 
     def wait_until_tree_not_loading(self,
                                     tree_cq: str,
-                                    timeout: float = 30,
-                                    poll_frequecy: float = 0.2,
-                                    recheck_time_if_false: float = 0.2):
+                                    timeout: Union[float, None] = None,
+                                    poll_frequecy: Union[float, None] = None,
+                                    recheck_time_if_false: float = 0.2,
+                                    polling_strategy: Union[PollingStrategy, None] = None):
         """Waits until the tree identified by the component query is not loading,
         or the timeout is hit
 
         Args:
             tree_cq (str): The component query for the tree.
-            timeout (float, optional): The number of seconds to wait before erroring. Defaults to 30.
-            poll_frequency (float, optional): Number of seconds to poll. Defaults to 0.2.
+            timeout (float, optional): The number of seconds to wait before erroring.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 30.
+            poll_frequency (float, optional): Number of seconds to poll, if polling at a fixed interval rather than using the polling strategy.
+                                              Ignored when waiting in the browser, see `USE_IN_BROWSER_WAITS`. Defaults to None.
             recheck_time_if_false (float, optional): If we get a result such that no Ajax calls are in progress, this is the amount of time to wait to check again. Defaults to 0.2.
+                                                     When waiting in the browser, the tree must not be loading for the whole of this time.
+            polling_strategy (PollingStrategy, optional): How often to poll, when not waiting in the browser.
+                                                          Defaults to `PollingStrategy.get_default()`.
+        """
+        timeout = self._get_wait_timeout('wait_until_tree_not_loading', tree_cq, timeout, 30)
+
+        with self._recording_wait('wait_until_tree_not_loading', tree_cq):
+            if self.USE_IN_BROWSER_WAITS:
+                self._wait_for_function('isTreeLoading', tree_cq, timeout=timeout, negate=True, settle_time=recheck_time_if_false)
+            else:
+                if poll_frequecy is not None:
+                    polling_strategy = PollingStrategy.fixed(poll_frequecy)
+
+                self._poll_until(TreeHelper.TreeNotLoadingExpectation(tree_cq, recheck_time_if_false, self), timeout, polling_strategy)
+
+    def get_nodes_data(self,
+                       tree_cq: str,
+                       fields: Union[list[str], None] = None,
+                       root_node_text_or_data: Union[str, dict, None] = None) -> list[RecordType.Record]:
+        """Gets the data of every loaded node in the tree, depth first, in the order in which they appear in the tree.
+
+        The data is returned as compact records rather than dicts, see `RecordType`, which matters when
+        a tree holds many thousands of nodes. Use `RecordType.Record.to_dict` to get a dict for a node.
+
+        If called within a `CallBatch` then a `CallBatch.DeferredResult` is returned instead.
+
+        Args:
+            tree_cq (str): The component query to use to find the tree.
+            fields (list[str], optional): The fields to include. If omitted, every field found in the data is included.
+            root_node_text_or_data (Union[str, dict], optional): The text or data indicating the node whose descendants are wanted.
+                                                                 If omitted, the whole tree is included, with the root node if it is visible.
+
+        Returns:
+            list[RecordType.Record]: A record for each node.
         """
-        WebDriverWait(self._driver, timeout, poll_frequency = poll_frequecy).until(TreeHelper.TreeNotLoadingExpectation(tree_cq, recheck_time_if_false))
+        return self._call_function('getNodesData', tree_cq, fields, root_node_text_or_data, deferrable=True, result_handler=RecordType.from_table)
 
     def get_node_icon_element(self,
                               tree_cq: str,
                               node_text_or_data: Union[str, dict],
-                              root_node_text_or_data: Union[str, dict, None] = None) -> WebElement:
+                              root_node_text_or_data: Union[str, dict, None] = None) -> 'WebElement':
         """Finds a node by text or data, then the child HTML element that holds it's icon.
 
         Args:
@@ -125,7 +146,7 @@ class TreeHelper(HasReferencedJavaScript):
     def get_node_text_element(self,
                               tree_cq: str,
                               node_text_or_data: Union[str, dict],
-                              root_node_text_or_data: Union[str, dict, None] = None) -> WebElement:
+                              root_node_text_or_data: Union[str, dict, None] = None) -> 'WebElement':
         """Finds a node by text or data, then the child HTML element that holds it's text.
 
         Args:
@@ -142,7 +163,7 @@ class TreeHelper(HasReferencedJavaScript):
     def get_node_expander_element(self,
                                   tree_cq: str,
                                   node_text_or_data: Union[str, dict],
-                                  root_node_text_or_data: Union[str, dict, None] = None) -> WebElement:
+                                  root_node_text_or_data: Union[str, dict, None] = None) -> 'WebElement':
         """Finds a node by text or data, then the child HTML element that holds it's expander UI element.
 
         Args:
@@ -160,7 +181,7 @@ class TreeHelper(HasReferencedJavaScript):
                          tree_cq: str,
                          node_text_or_data: Union[str, dict],
                          css_query: str,
-                         root_node_text_or_data: Union[str, dict, None] = None) -> WebElement:
+                         root_node_text_or_data: Union[str, dict, None] = None) -> 'WebElement':
         """Finds a node by text or data, then a child element by CSS query.
 
         Args:
@@ -181,19 +202,25 @@ class TreeHelper(HasReferencedJavaScript):
         """
         self.wait_until_tree_not_loading(tree_cq)
 
-        if isinstance(node_text_or_data, str):
-            node_text_or_data = f"'{node_text_or_data}'"
+        return self._find_node_element(tree_cq, node_text_or_data, css_query, root_node_text_or_data)
 
-        if isinstance(root_node_text_or_data, str):
-            root_node_text_or_data = f"'{root_node_text_or_data}'"
+    def _find_node_element(self,
+                           tree_cq: str,
+                           node_text_or_data: Union[str, dict],
+                           css_query: str,
+                           root_node_text_or_data: Union[str, dict, None] = None) -> Union['WebElement', None]:
+        """Finds a node by text or data, then a child element by CSS query, without first waiting for the tree to load.
 
-        if root_node_text_or_data:
-            script = self._GET_NODE_ELEMENT_WITH_ROOT_TEMPLATE.format(tree_cq=tree_cq, node_text_or_data=node_text_or_data, css_query=css_query, root_node_text_or_data=root_node_text_or_data)
-        else:
-            script = self._GET_NODE_ELEMENT_TEMPLATE.format(tree_cq=tree_cq, node_text_or_data=node_text_or_data, css_query=css_query)
+        Args:
+            tree_cq (str): The component query to use to find the tree.
+            node_text_or_data (Union[str, dict]): The node text or data to find.
+            css_query (str): The CSS to query for in the found node row element.
+            root_node_text_or_data (Union[str, dict], optional): The text or data indicating the root node under which to search for the node.
 
-        self.ensure_javascript_loaded()
-        return self._driver.execute_script(script)
+        Returns:
+            WebElement: The DOM element, or None if not found.
+        """
+        return self._call_function('getNodeElement', tree_cq, node_text_or_data, css_query, root_node_text_or_data, returns_elements=True)
 
     def open_node_context_menu(self,
                                tree_cq: str,
@@ -235,9 +262,9 @@ class TreeHelper(HasReferencedJavaScript):
         unexpected_items: list[str] = []
 
         # Get all menu items
-        menu_items = self._menu_helper.get_enabled_menu_items()
+        menu_items = self._menu_helper.describe_enabled_menu_items()
 
-        # Each element has a text member we can compare.
+        # Each descriptor has a text member we can compare, without a roundtrip per item.
         for item in menu_items:
             if ignore_spacers is True and item.text == MenuHelper.SPACER_TEXT_CONTEXT:
                 continue
@@ -283,9 +310,9 @@ class TreeHelper(HasReferencedJavaScript):
 
         if node:
             if root_node_text_or_data:
-                self._logger.info("Clicking expander on node '%s' (under root '%s') on tree with CQ '%s'", node_text_or_data, root_node_text_or_data, tree_cq)
+                self._logger.info("Clicking expander on node '%s' (under root '%s') on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), LoggingPolicy.render(root_node_text_or_data), tree_cq)
             else:
-                self._logger.info("Clicking expander on node '%s' on tree with CQ '%s'", node_text_or_data, tree_cq)
+                self._logger.info("Clicking expander on node '%s' on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), tree_cq)
 
             self._action_chains.move_to_element(node)
             self._action_chains.click(node)
@@ -317,9 +344,9 @@ class TreeHelper(HasReferencedJavaScript):
 
         if node:
             if root_node_text_or_data:
-                self._logger.info("Clicking on node '%s' (under root '%s'), with CSS query '%s' on tree with CQ '%s'", node_text_or_data, root_node_text_or_data, css_query, tree_cq)
+                self._logger.info("Clicking on node '%s' (under root '%s'), with CSS query '%s' on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), LoggingPolicy.render(root_node_text_or_data), css_query, tree_cq)
             else:
-                self._logger.info("Clicking on node '%s' with CSS query '%s' on tree with CQ '%s'", node_text_or_data, css_query, tree_cq)
+                self._logger.info("Clicking on node '%s' with CSS query '%s' on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), css_query, tree_cq)
 
             self._action_chains.move_to_element(node)
             self._action_chains.click(node)
@@ -351,9 +378,9 @@ class TreeHelper(HasReferencedJavaScript):
 
         if node:
             if root_node_text_or_data:
-                self._logger.info("Right clicking on node '%s' (under root '%s'), with CSS query '%s' on tree with CQ '%s'", node_text_or_data, root_node_text_or_data, css_query, tree_cq)
+                self._logger.info("Right clicking on node '%s' (under root '%s'), with CSS query '%s' on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), LoggingPolicy.render(root_node_text_or_data), css_query, tree_cq)
             else:
-                self._logger.info("Right clicking on node '%s' with CSS query '%s' on tree with CQ '%s'", node_text_or_data, css_query, tree_cq)
+                self._logger.info("Right clicking on node '%s' with CSS query '%s' on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), css_query, tree_cq)
 
             self._action_chains.move_to_element(node)
             self._action_chains.context_click(node)
@@ -365,7 +392,8 @@ class TreeHelper(HasReferencedJavaScript):
                            tree_cq: str,
                            node_text_or_data: Union[str, dict],
                            parent_node_text_or_data: Union[str, dict],
-                           timeout: float = 60) -> WebElement:
+                           timeout: Union[float, None] = None,
+                           polling_strategy: Union[PollingStrategy, None] = None) -> 'WebElement':
         """Method that waits until a tree node is available, refreshing the parent until it's
         found or the timeout is hit.
 
@@ -374,13 +402,21 @@ class TreeHelper(HasReferencedJavaScript):
             node_text_or_data (Union[str, dict]): The node text or data to find.
             parent_node_text_or_data (Union[str, dict]): The node text or data to use to find the nodes parent,
                                                          for refreshing purposes.
-            timeout (int, optional): The number of seconds to wait for the row before erroring. Defaults to 60.
+            timeout (float, optional): The number of seconds to wait for the node before erroring.
+                                       Defaults to an adaptive timeout, see `WaitAnalytics`, if there is one, otherwise 60.
+            polling_strategy (PollingStrategy, optional): How often to poll, which is also how often the parent is refreshed.
+                                                          Defaults to `PollingStrategy.get_default()`.
 
         Returns:
             WebElement: The DOM element for the node icon.
         """
-        WebDriverWait(self._driver, timeout).until(TreeHelper.NodeFoundExpectation(tree_cq, node_text_or_data, parent_node_text_or_data))
-        return self.get_node_icon_element(tree_cq, node_text_or_data)
+        timeout = self._get_wait_timeout('wait_for_tree_node', tree_cq, timeout, 60)
+
+        # Wait for any load once, so that each poll need only look for the node
+        self.wait_until_tree_not_loading(tree_cq, polling_strategy=polling_strategy)
+
+        with self._recording_wait('wait_for_tree_node', tree_cq):
+            return self._poll_until(TreeHelper.NodeFoundExpectation(tree_cq, node_text_or_data, parent_node_text_or_data, self), timeout, polling_strategy)
 
     def reload_node(self,
                     tree_cq: str,
@@ -396,24 +432,11 @@ class TreeHelper(HasReferencedJavaScript):
         """
         self.wait_until_tree_not_loading(tree_cq)
 
-        if isinstance(node_text_or_data, str):
-            node_text_or_data = f"'{node_text_or_data}'"
-
-        if isinstance(root_node_text_or_data, str):
-            root_node_text_or_data = f"'{root_node_text_or_data}'"
-
         if root_node_text_or_data:
-            script = self._RELOAD_NODE_WITH_ROOT_TEMPLATE.format(tree_cq=tree_cq, node_text_or_data=node_text_or_data, root_node_text_or_data=root_node_text_or_data)
+            self._logger.info("Reloading node '%s' (under root '%s') on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), LoggingPolicy.render(root_node_text_or_data), tree_cq)
         else:
-            script = self._RELOAD_NODE_TEMPLATE.format(tree_cq=tree_cq, node_text_or_data=node_text_or_data)
-
-        if root_node_text_or_data:
-            self._logger.info("Reloading node '%s' (under root '%s') on tree with CQ '%s'", node_text_or_data, root_node_text_or_data, tree_cq)
-        else:
-            self._logger.info("Reloading node '%s' on tree with CQ '%s'", node_text_or_data, tree_cq)
-
-        self.ensure_javascript_loaded()
-        self._driver.execute_script(script)
+            self._logger.info("Reloading node '%s' on tree with CQ '%s'", LoggingPolicy.render(node_text_or_data), tree_cq)
+        self._call_function('reloadNode', tree_cq, node_text_or_data, root_node_text_or_data)
 
     class NodeNotFoundException(Exception):
         """Exception class thrown when we failed to find the specified node"""
@@ -461,26 +484,29 @@ class TreeHelper(HasReferencedJavaScript):
     class TreeNotLoadingExpectation:
         """ An expectation for checking that a tree is not loading."""
 
-        def __init__(self, tree_cq: str, recheck_time_if_false: Union[float, None] = None):
+        def __init__(self, tree_cq: str, recheck_time_if_false: Union[float, None] = None, tree_helper: Union['TreeHelper', None] = None):
             """Initialises an instance of this class.
 
             Args:
                 tree_cq (str): The CQ used to find the tree
                 recheck_time_if_false (float, optional): If we get a value of false (so there is not a call in progress),
                                                          this is the amount of time to wait to check again. Defaults to None.
+                tree_helper (TreeHelper, optional): The instance to use to make the check. Defaults to the one from the driver's `Session`.
             """
             self._tree_cq = tree_cq
             self._recheck_time_if_false = recheck_time_if_false
+            self._tree_helper = tree_helper
 
         def __call__(self, driver):
             """Method that determines whether the tree is loading."""
-            tree_helper = TreeHelper(driver)
+            if self._tree_helper is None:
+                self._tree_helper = Session(driver).tree_helper
 
-            is_tree_loading = tree_helper.is_tree_loading(self._tree_cq)
+            is_tree_loading = self._tree_helper.is_tree_loading(self._tree_cq)
 
             if not is_tree_loading and self._recheck_time_if_false:
                 time.sleep(self._recheck_time_if_false)
-                is_tree_loading = tree_helper.is_tree_loading(self._tree_cq)
+                is_tree_loading = self._tree_helper.is_tree_loading(self._tree_cq)
 
             return not is_tree_loading
 
@@ -490,7 +516,8 @@ class TreeHelper(HasReferencedJavaScript):
         def __init__(self,
                      tree_cq: str,
                      node_text_or_data: Union[str, dict],
-                     parent_node_text_or_data: Union[str, dict]):
+                     parent_node_text_or_data: Union[str, dict],
+                     tree_helper: Union['TreeHelper', None] = None):
             """Initialises an instance of this class.
 
             Args:
@@ -498,24 +525,34 @@ class TreeHelper(HasReferencedJavaScript):
                 node_text_or_data (Union[str, dict]): The node text or data to find.
                 parent_node_text_or_data (Union[str, dict]): The node text or data to use to find the nodes parent,
                                                             for refreshing purposes.
+                tree_helper (TreeHelper, optional): The instance to use to find the node. Defaults to the one from the driver's `Session`.
             """
             self._tree_cq = tree_cq
             self._node_text_or_data = node_text_or_data
             self._parent_node_text_or_data = parent_node_text_or_data
+            self._tree_helper = tree_helper
 
         def __call__(self, driver):
             """Method that determines whether a node was found.
 
             If the node is not found the parent tree node is refreshed and the load waited for.
+
+            Returns:
+                WebElement: The DOM element for the node icon, or False if it was not found.
             """
-            tree_helper = TreeHelper(driver)
+            if self._tree_helper is None:
+                self._tree_helper = Session(driver).tree_helper
 
-            node = tree_helper.get_node_icon_element(self._tree_cq, self._node_text_or_data, self._parent_node_text_or_data)
+            node = self._tree_helper._find_node_element(self._tree_cq, # pylint: disable=protected-access
+                                                        self._node_text_or_data,
+                                                        TreeHelper._ICON_CSS_SELECTOR,
+                                                        self._parent_node_text_or_data)
             if node:
-                return True
+                return node
 
-            # Trigger a reload of the parent
-            tree_helper.reload_node(self._tree_cq, self._parent_node_text_or_data)
+            # Trigger a reload of the parent, and wait for it to complete
+            self._tree_helper.reload_node(self._tree_cq, self._parent_node_text_or_data)
+            self._tree_helper.wait_until_tree_not_loading(self._tree_cq)
             return False
 
     class UnexpectedMenuItemsFoundException(Exception):
@@ -0,0 +1,250 @@
+"""
+Module that contains our WaitAnalytics class.
+"""
+import json
+import math
+import os
+import threading
+from typing import Any, Union
+
+from pyseext.logging_policy import LoggingPolicy
+
+class WaitAnalytics:
+    """A class that records how long our waits take to be satisfied, per wait and component query, in a local stats file,
+    and that can set the timeouts of waits from that history.
+
+    Only waits that are satisfied are recorded, and only the most recent `MAX_SAMPLES` for each wait and query are kept.
+
+    In adaptive mode, a wait that is not given a timeout uses a high percentile of its history multiplied by a safety factor,
+    so that failing tests fail fast, while slow screens still get the time they need. Until a wait has enough history it uses
+    its usual default timeout, as it also does when not in adaptive mode. A timeout passed to a wait is always used as given.
+
+    Analytics are used by our helpers once made current, see `set_current`, or while used as a context manager,
+    which saves the stats file on exit.
+
+    e.g.
+        with WaitAnalytics('.pyseext_wait_stats.json', adaptive=True):
+            component_query.wait_for_query('#saveButton')
+    """
+
+    # Public class properties
+    DEFAULT_FILE_PATH: str = '.pyseext_wait_stats.json'
+    """The default path of the stats file"""
+
+    DEFAULT_PERCENTILE: float = 0.95
+    """The default percentile of the history of a wait that its adaptive timeout is based on"""
+
+    DEFAULT_SAFETY_FACTOR: float = 3.0
+    """The default factor that the percentile is multiplied by to give an adaptive timeout"""
+
+    DEFAULT_MIN_SAMPLES: int = 10
+    """The default number of times a wait must have been recorded before it is given an adaptive timeout"""
+
+    DEFAULT_MIN_TIMEOUT: float = 2.0
+    """The default shortest adaptive timeout, in seconds, which allows for the odd slow machine"""
+
+    MAX_SAMPLES: int = 200
+    """The number of most recent durations kept for each wait and query"""
+
+    # Class variables
+    _current: Union['WaitAnalytics', None] = None
+    """The analytics used by our helpers, if any"""
+
+    _FILE_VERSION: int = 1
+    """The version of the format of the stats file"""
+
+    def __init__(self,
+                 file_path: str = DEFAULT_FILE_PATH,
+                 adaptive: bool = False,
+                 percentile: float = DEFAULT_PERCENTILE,
+                 safety_factor: float = DEFAULT_SAFETY_FACTOR,
+                 min_samples: int = DEFAULT_MIN_SAMPLES,
+                 min_timeout: float = DEFAULT_MIN_TIMEOUT,
+                 max_timeout: Union[float, None] = None):
+        """Initialises an instance of this class, loading the stats file if it exists.
+
+        Args:
+            file_path (str, optional): The path of the stats file. Defaults to `DEFAULT_FILE_PATH`.
+            adaptive (bool, optional): Indicates whether waits that are not given a timeout should have one set from their history.
+                                       Defaults to False, which only records.
+            percentile (float, optional): The percentile of the history of a wait that its adaptive timeout is based on, between 0 and 1.
+                                          Defaults to `DEFAULT_PERCENTILE`.
+            safety_factor (float, optional): The factor that the percentile is multiplied by to give an adaptive timeout.
+                                             Defaults to `DEFAULT_SAFETY_FACTOR`.
+            min_samples (int, optional): The number of times a wait must have been recorded before it is given an adaptive timeout.
+                                         Defaults to `DEFAULT_MIN_SAMPLES`.
+            min_timeout (float, optional): The shortest adaptive timeout, in seconds. Defaults to `DEFAULT_MIN_TIMEOUT`.
+            max_timeout (float, optional): The longest adaptive timeout, in seconds. Defaults to None, for no limit.
+        """
+        # Instance variables
+        self.file_path = file_path
+        """The path of the stats file"""
+
+        self.adaptive = adaptive
+        """Indicates whether waits that are not given a timeout should have one set from their history"""
+
+        self.percentile = percentile
+        """The percentile of the history of a wait that its adaptive timeout is based on"""
+
+        self.safety_factor = safety_factor
+        """The factor that the percentile is multiplied by to give an adaptive timeout"""
+
+        self.min_samples = min_samples
+        """The number of times a wait must have been recorded before it is given an adaptive timeout"""
+
+        self.min_timeout = min_timeout
+        """The shortest adaptive timeout, in seconds"""
+
+        self.max_timeout = max_timeout
+        """The longest adaptive timeout, in seconds, if limited"""
+
+        self._lock = threading.Lock()
+        """The lock that protects our samples, since waits can be made on multiple threads"""
+
+        self._logger = LoggingPolicy.get_logger(__name__)
+        """The Logger instance for this class instance"""
+
+        self._samples: dict[str, dict[str, list[float]]] = self._load()
+        """The recorded durations, keyed on the wait, e.g. 'ComponentQuery.wait_for_query', then the query"""
+
+        self._new_samples: dict[str, dict[str, list[float]]] = {}
+        """The durations recorded since the stats file was loaded or saved, keyed as `_samples`"""
+
+    @staticmethod
+    def get_current() -> Union['WaitAnalytics', None]:
+        """Gets the analytics used by our helpers.
+
+        Returns:
+            Union[WaitAnalytics, None]: The analytics, or None if waits are not being recorded.
+        """
+        return WaitAnalytics._current
+
+    @staticmethod
+    def set_current(analytics: Union['WaitAnalytics', None]):
+        """Sets the analytics used by our helpers.
+
+        Args:
+            analytics (WaitAnalytics): The analytics, or None to stop recording waits.
+        """
+        WaitAnalytics._current = analytics
+
+    def __enter__(self) -> 'WaitAnalytics':
+        """Makes this instance the analytics used by our helpers.
+
+        Returns:
+            WaitAnalytics: This instance.
+        """
+        WaitAnalytics.set_current(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops this instance being used by our helpers, and saves the stats file."""
+        if WaitAnalytics._current is self:
+            WaitAnalytics.set_current(None)
+
+        self.save()
+
+    def record(self, wait: str, subject: Union[str, None], duration: float):
+        """Records the time a wait took to be satisfied.
+
+        Args:
+            wait (str): The wait, e.g. 'ComponentQuery.wait_for_query'.
+            subject (str, optional): What was waited for, generally a component query.
+            duration (float): The number of seconds the wait took.
+        """
+        subject = subject or ''
+
+        with self._lock:
+            samples = self._samples.setdefault(wait, {}).setdefault(subject, [])
+            samples.append(duration)
+            del samples[:-self.MAX_SAMPLES]
+
+            self._new_samples.setdefault(wait, {}).setdefault(subject, []).append(duration)
+
+    def get_samples(self, wait: str, subject: Union[str, None]) -> list[float]:
+        """Gets the recorded durations of a wait.
+
+        Args:
+            wait (str): The wait, e.g. 'ComponentQuery.wait_for_query'.
+            subject (str, optional): What was waited for, generally a component query.
+
+        Returns:
+            list[float]: The number of seconds each recorded wait took, oldest first.
+        """
+        with self._lock:
+            return list(self._samples.get(wait, {}).get(subject or '', ()))
+
+    def get_timeout(self, wait: str, subject: Union[str, None], default: float) -> float:
+        """Gets the timeout to use for a wait that was not given one.
+
+        Args:
+            wait (str): The wait, e.g. 'ComponentQuery.wait_for_query'.
+            subject (str, optional): What is being waited for, generally a component query.
+            default (float): The usual default timeout of the wait.
+
+        Returns:
+            float: The adaptive timeout, if in adaptive mode and the wait has enough history, otherwise the default.
+        """
+        if not self.adaptive:
+            return default
+
+        samples = self.get_samples(wait, subject)
+        if len(samples) < self.min_samples:
+            return default
+
+        samples.sort()
+        percentile = samples[max(math.ceil(self.percentile * len(samples)) - 1, 0)]
+        timeout = max(percentile * self.safety_factor, self.min_timeout)
+
+        if self.max_timeout is not None:
+            timeout = min(timeout, self.max_timeout)
+
+        self._logger.debug("Using adaptive timeout of %.2f seconds for '%s' on '%s', from %d samples", timeout, wait, subject, len(samples))
+
+        return timeout
+
+    def save(self):
+        """Saves the durations recorded by this instance to the stats file, merging them with any recorded by other processes
+        since it was loaded.
+        """
+        with self._lock:
+            if not self._new_samples:
+                return
+
+            samples = self._load()
+
+            for wait, subjects in self._new_samples.items():
+                for subject, durations in subjects.items():
+                    merged = samples.setdefault(wait, {}).setdefault(subject, [])
+                    merged.extend(durations)
+                    del merged[:-self.MAX_SAMPLES]
+
+            temporary_path = f'{self.file_path}.{os.getpid()}.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                json.dump({'version': self._FILE_VERSION, 'waits': samples}, file)
+
+            os.replace(temporary_path, self.file_path)
+
+            self._samples = samples
+            self._new_samples = {}
+
+    def _load(self) -> dict[str, dict[str, list[float]]]:
+        """Loads the durations from the stats file.
+
+        Returns:
+            dict[str, dict[str, list[float]]]: The durations, keyed on the wait then the query, or empty if there is no valid file.
+        """
+        try:
+            with open(self.file_path, encoding='utf-8') as file:
+                stats: dict[str, Any] = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            self._logger.warning("Ignoring wait stats file '%s' that could not be read: %s", self.file_path, exc)
+            return {}
+
+        if not isinstance(stats, dict) or stats.get('version') != self._FILE_VERSION:
+            self._logger.warning("Ignoring wait stats file '%s' with an unknown format", self.file_path)
+            return {}
+
+        return stats.get('waits') or {}
@@ -2,6 +2,8 @@
 
 # Learn more: https://github.com/kennethreitz/setup.py
 
+import re
+
 from setuptools import setup, find_packages
 
 
@@ -11,9 +13,13 @@ with open('README.md', encoding = 'utf-8') as f:
 with open('LICENSE', encoding = 'utf-8') as f:
     license_text = f.read()
 
+# The version is defined once, in the package, which also stamps it on our bundled JavaScript
+with open('pyseext/__init__.py', encoding = 'utf-8') as f:
+    version = re.search(r"^__version__ = '([^']+)'", f.read(), re.MULTILINE).group(1)
+
 setup(
     name='pyseext',
-    version='1.4.1',
+    version=version,
     description='Python Selenium ExtJS - package for helping interact with an ExtJS application from Python using Selenium',
     long_description=readme,
     author='Martyn West',
@@ -21,5 +27,5 @@ setup(
     url='https://github.com/westy/pyseext',
     license=license_text,
     packages=find_packages(exclude=('tests', 'docs')),
-    package_data={'pyseext': ['js/*.js']}
+    package_data={'pyseext': ['js/*.js', 'benchmark/fixtures/*']}
 )
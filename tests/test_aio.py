@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest
+
+from selenium.common.exceptions import JavascriptException
+
+from .context import pyseext
+from pyseext.aio import DriverExecutor
+from pyseext.call_batch import CallBatch
+from pyseext.testing import FakeWebDriver
+
+
+class AsyncHelperTestSuite(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asyncio counterparts of our helpers, using fake drivers."""
+
+    def setUp(self):
+        self.drivers = []
+
+    def tearDown(self):
+        for driver in self.drivers:
+            DriverExecutor.shutdown_for_driver(driver)
+
+    def _create_driver(self, get_records) -> FakeWebDriver:
+        """Creates a fake driver whose store reads are answered by a handler, which is passed the store holder's component query."""
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_handler('StoreHelper', 'getRecords', lambda store_holder_cq, fields: get_records(store_holder_cq))
+        self.drivers.append(driver)
+
+        return driver
+
+    @staticmethod
+    def _to_table(*names) -> dict:
+        """Gets the table of records for some people, as returned by our JavaScript."""
+        return {'name': 'Person', 'fields': ['name'], 'rows': [[name] for name in names]}
+
+    async def test_calls_are_run_on_driver_thread(self):
+        threads = []
+
+        def get_records(store_holder_cq):
+            threads.append(threading.current_thread().name)
+            return self._to_table('Bob')
+
+        records = await pyseext.aio.StoreHelper(self._create_driver(get_records)).get_records('#people')
+
+        self.assertEqual(records[0].name, 'Bob')
+        self.assertTrue(threads[0].startswith(DriverExecutor._THREAD_NAME_PREFIX)) # pylint: disable=protected-access
+
+    async def test_calls_for_one_driver_are_serialised(self):
+        lock = threading.Lock()
+        active = []
+        max_active = []
+
+        def get_records(store_holder_cq):
+            with lock:
+                active.append(store_holder_cq)
+                max_active.append(len(active))
+
+            time.sleep(0.05)
+
+            with lock:
+                active.remove(store_holder_cq)
+
+            return self._to_table(store_holder_cq)
+
+        store_helper = pyseext.aio.StoreHelper(self._create_driver(get_records))
+        results = await asyncio.gather(*(store_helper.get_records(f'#store{index}') for index in range(3)))
+
+        self.assertEqual(max(max_active), 1)
+        self.assertEqual([records[0].name for records in results], ['#store0', '#store1', '#store2'])
+
+    async def test_calls_for_different_drivers_run_concurrently(self):
+        # Each call waits for the other, so they can only complete if they run at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_records(store_holder_cq):
+            barrier.wait()
+            return self._to_table(store_holder_cq)
+
+        first = pyseext.aio.StoreHelper(self._create_driver(get_records))
+        second = pyseext.aio.StoreHelper(self._create_driver(get_records))
+
+        results = await asyncio.gather(first.get_records('#first'), second.get_records('#second'))
+
+        self.assertEqual([records[0].name for records in results], ['#first', '#second'])
+
+    async def test_exceptions_are_raised_by_coroutine(self):
+        def get_records(store_holder_cq):
+            raise JavascriptException('Store not found')
+
+        with self.assertRaises(JavascriptException):
+            await pyseext.aio.StoreHelper(self._create_driver(get_records)).get_records('#missing')
+
+    async def test_batched_calls_return_deferred_results(self):
+        driver = self._create_driver(lambda store_holder_cq: self._to_table(store_holder_cq))
+        store_helper = pyseext.aio.StoreHelper(driver)
+        await store_helper.ensure_javascript_loaded()
+        count = driver.command_executor.get_command_count()
+
+        with pyseext.batch(driver):
+            first = await store_helper.get_records('#first')
+            second = await store_helper.get_records('#second')
+
+        self.assertIsInstance(first, CallBatch.DeferredResult)
+        self.assertEqual(first.result()[0].name, '#first')
+        self.assertEqual(second.result()[0].name, '#second')
+        self.assertEqual(driver.command_executor.get_command_count() - count, 1)
+
+    async def test_only_public_helper_methods_are_exposed(self):
+        store_helper = pyseext.aio.StoreHelper(self._create_driver(lambda store_holder_cq: None))
+
+        with self.assertRaises(AttributeError):
+            store_helper.missing_method()
+
+        with self.assertRaises(AttributeError):
+            store_helper._call_function('getRecords')
+
+        self.assertIs(pyseext.aio.GridHelper.RowNotFoundException, pyseext.GridHelper.RowNotFoundException)
+
+    async def test_shutdown_replaces_executor(self):
+        driver = self._create_driver(lambda store_holder_cq: None)
+        executor = DriverExecutor.get_for_driver(driver)
+
+        self.assertIs(DriverExecutor.get_for_driver(driver), executor)
+
+        DriverExecutor.shutdown_for_driver(driver)
+        self.assertIsNot(DriverExecutor.get_for_driver(driver), executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from .context import pyseext
+from pyseext.benchmark import BenchmarkReport, BenchmarkRunner
+from pyseext.testing import FakeCommandExecutor, FakeWebDriver
+
+
+class BenchmarkTestSuite(unittest.TestCase):
+    """Tests for running benchmarks against a fake driver, and comparing their reports."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_percentiles_use_nearest_rank(self):
+        result = BenchmarkReport.OperationResult('operation', [0.4, 0.1, 0.3, 0.2], [1, 2, 1, 2])
+
+        self.assertEqual(result.get_percentile(50), 0.2)
+        self.assertEqual(result.get_percentile(99), 0.4)
+        self.assertEqual(result.get_max(), 0.4)
+        self.assertEqual(result.get_mean_roundtrips(), 1.5)
+
+    def test_compare_finds_slower_operations_and_extra_roundtrips(self):
+        baseline = BenchmarkReport()
+        baseline.add_result(BenchmarkReport.OperationResult('slower', [1.0], [1]))
+        baseline.add_result(BenchmarkReport.OperationResult('chattier', [1.0], [1]))
+        baseline.add_result(BenchmarkReport.OperationResult('same', [1.0], [1]))
+
+        report = BenchmarkReport()
+        report.add_result(BenchmarkReport.OperationResult('slower', [1.5], [1]))
+        report.add_result(BenchmarkReport.OperationResult('chattier', [1.0], [2]))
+        report.add_result(BenchmarkReport.OperationResult('same', [1.05], [1]))
+        report.add_result(BenchmarkReport.OperationResult('new', [1.0], [1]))
+
+        regressions = {comparison.name: comparison.is_regression for comparison in report.compare(baseline)}
+
+        self.assertEqual(regressions, {'slower': True, 'chattier': True, 'same': False})
+        self.assertIn('not in baseline', report.format_table(baseline))
+
+    def test_report_can_be_saved_and_loaded(self):
+        file_path = os.path.join(self.directory, 'baseline.json')
+
+        report = BenchmarkReport({'browser_name': 'chrome'})
+        report.add_result(BenchmarkReport.OperationResult('operation', [0.1, 0.2], [1, 1], errors=1))
+        report.save(file_path)
+
+        loaded = BenchmarkReport.load(file_path)
+        self.assertEqual(loaded.metadata['browser_name'], 'chrome')
+        self.assertEqual(loaded.results['operation'].durations, [0.1, 0.2])
+        self.assertEqual(loaded.results['operation'].errors, 1)
+
+    def test_run_measures_roundtrips_of_matching_operations(self):
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_result('ComponentQuery', 'query', [FakeCommandExecutor.element('grid-1')])
+
+        runner = BenchmarkRunner(driver, iterations=3, warmup=1)
+        report = runner.run(['component_query.query'])
+
+        self.assertIn('grid_helper.get_row.100k', runner.get_operation_names())
+        self.assertEqual(list(report.results), ['component_query.query'])
+        self.assertEqual(report.results['component_query.query'].roundtrips, [1, 1, 1])
+        self.assertEqual(report.results['component_query.query'].errors, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
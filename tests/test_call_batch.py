@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import JavascriptException
+
+from .context import pyseext
+from pyseext.call_batch import CallBatch
+from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.testing import FakeWebDriver
+
+
+class CallBatchTestSuite(unittest.TestCase):
+    """Tests for batching calls to our JavaScript, using a fake driver."""
+
+    def setUp(self):
+        """Creates a fake driver whose local storage holds a value for every key other than 'bad'."""
+        self.driver = FakeWebDriver()
+        self.executor = self.driver.command_executor
+
+        def get_stored_value(key):
+            if key == 'bad':
+                raise JavascriptException('Cannot read key')
+
+            return f'value of {key}'
+
+        self.executor.set_function_handler('LocalStorageHelper', 'getStoredValue', get_stored_value)
+        self.local_storage_helper = pyseext.LocalStorageHelper(self.driver)
+
+        # Load our JavaScript first, so only the calls themselves are counted
+        self.local_storage_helper.ensure_javascript_loaded()
+
+    def test_calls_are_made_in_one_roundtrip(self):
+        count = self.executor.get_command_count()
+
+        with pyseext.batch(self.driver):
+            first = self.local_storage_helper.get_stored_value('first')
+            second = self.local_storage_helper.get_stored_value('second')
+
+            self.assertFalse(first.is_resolved())
+
+        self.assertEqual(self.executor.get_command_count() - count, 1)
+        self.assertEqual(first.result(), 'value of first')
+        self.assertEqual(second.result(), 'value of second')
+
+    def test_errors_are_raised_by_their_own_result(self):
+        with pyseext.batch(self.driver):
+            bad = self.local_storage_helper.get_stored_value('bad')
+            good = self.local_storage_helper.get_stored_value('good')
+
+        with self.assertRaises(JavascriptException):
+            bad.result()
+
+        self.assertEqual(good.result(), 'value of good')
+
+    def test_result_is_not_available_until_flushed(self):
+        with pyseext.batch(self.driver):
+            result = self.local_storage_helper.get_stored_value('first')
+
+            with self.assertRaises(CallBatch.NotFlushedException):
+                result.result()
+
+    def test_calls_load_every_helper_into_a_new_page(self):
+        self.executor.set_function_result('FieldHelper', 'getFieldXType', 'textfield')
+        self.driver.get('http://example.com/other')
+
+        with pyseext.batch(self.driver):
+            value = self.local_storage_helper.get_stored_value('first')
+            xtype = pyseext.FieldHelper(self.driver).get_field_xtype('form', 'name')
+
+        self.assertEqual(value.result(), 'value of first')
+        self.assertEqual(xtype.result(), 'textfield')
+
+    def test_grid_reads_wait_for_the_grid_once(self):
+        self.executor.set_function_result('ComponentQuery', 'query', [self.executor.element('grid-1')])
+        self.executor.set_function_handler('GridHelper', 'isColumnVisible', lambda grid_cq, column: column != 'hidden')
+        grid_helper = pyseext.GridHelper(self.driver)
+
+        # Make a first read, so only the roundtrips of the batch are counted
+        grid_helper.is_column_visible('#grid', 'name')
+        count = self.executor.get_command_count()
+
+        with pyseext.batch(self.driver):
+            results = [grid_helper.is_column_visible('#grid', column) for column in ('name', 'age', 'hidden')]
+
+        self.assertEqual(self.executor.get_command_count() - count, 2)
+        self.assertEqual([result.result() for result in results], [True, True, False])
+
+    def test_calls_use_compressed_payloads(self):
+        with mock.patch.object(HasReferencedJavaScript, 'USE_COMPRESSED_PAYLOADS', True), \
+             mock.patch.object(HasReferencedJavaScript, 'COMPRESSED_PAYLOAD_THRESHOLD', 10):
+            with pyseext.batch(self.driver):
+                first = self.local_storage_helper.get_stored_value('first')
+                bad = self.local_storage_helper.get_stored_value('bad')
+
+        scripts = [params.get('script') for _, params in self.executor.commands]
+        self.assertIn(HasReferencedJavaScript._CALL_FUNCTIONS_COMPRESSED_SCRIPT, scripts) # pylint: disable=protected-access
+        self.assertNotIn(HasReferencedJavaScript._CALL_FUNCTIONS_SCRIPT, scripts) # pylint: disable=protected-access
+        self.assertEqual(first.result(), 'value of first')
+
+        with self.assertRaises(JavascriptException):
+            bad.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from .context import pyseext
+from pyseext.polling_strategy import PollingStrategy
+from pyseext.testing import FakeCommandExecutor, FakeWebDriver
+
+
+class ComponentQueryTestSuite(unittest.TestCase):
+    """Tests for component queries, and waiting for them, using a fake driver."""
+
+    def setUp(self):
+        """Creates a fake driver whose queries match once the query has been made `self.calls_until_found` times."""
+        self.driver = FakeWebDriver()
+        self.executor = self.driver.command_executor
+        self.query_calls = 0
+        self.calls_until_found = 1
+
+        def query(cq, root_id, css_selector):
+            self.query_calls += 1
+            return [FakeCommandExecutor.element('button-1')] if self.query_calls >= self.calls_until_found else []
+
+        self.executor.set_function_handler('ComponentQuery', 'query', query)
+        self.component_query = pyseext.ComponentQuery(self.driver)
+
+    def test_query_returns_elements(self):
+        results = self.component_query.query('button')
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], WebElement)
+        self.assertEqual(results[0].id, 'button-1')
+
+    def test_query_costs_one_roundtrip_once_loaded(self):
+        self.component_query.query('button')
+        count = self.executor.get_command_count()
+
+        self.component_query.query('button')
+        self.assertEqual(self.executor.get_command_count() - count, 1)
+
+    def test_wait_for_query_in_browser(self):
+        self.calls_until_found = 3
+
+        results = self.component_query.wait_for_query('button', timeout=5)
+
+        self.assertEqual(results[0].id, 'button-1')
+        self.assertEqual(self.query_calls, 3)
+        self.assertEqual(self.executor.get_command_count('w3cExecuteScriptAsync'), 1)
+
+    def test_wait_for_query_polling(self):
+        self.calls_until_found = 3
+
+        with mock.patch.object(pyseext.ComponentQuery, 'USE_IN_BROWSER_WAITS', False):
+            results = self.component_query.wait_for_query('button', timeout=5, polling_strategy=PollingStrategy.fixed(0.01))
+
+        self.assertEqual(results[0].id, 'button-1')
+        self.assertEqual(self.query_calls, 3)
+
+    def test_wait_for_query_times_out(self):
+        self.calls_until_found = float('inf')
+
+        with self.assertRaises(pyseext.ComponentQuery.QueryNotFoundException):
+            self.component_query.wait_for_query('button', timeout=0.1)
+
+        self.assertEqual(self.component_query.wait_for_query('button', timeout=0.1, throw_if_not_found=False), [])
+
+    def test_wait_for_single_query_rejects_multiple_matches(self):
+        self.executor.set_function_result('ComponentQuery', 'query', [FakeCommandExecutor.element('a'), FakeCommandExecutor.element('b')])
+
+        with self.assertRaises(pyseext.ComponentQuery.QueryMatchedMultipleElementsException):
+            self.component_query.wait_for_single_query('button', timeout=1)
+
+    def test_describe_returns_descriptors_without_elements(self):
+        self.executor.set_function_result('ComponentQuery', 'describe', [
+            {'componentId': 'button-1', 'elementId': 'button-1-el', 'xtype': 'button', 'visible': True, 'disabled': False, 'text': 'Save'}
+        ])
+        self.executor.set_command_handler('findElement', lambda params: FakeCommandExecutor.element(params['value']))
+
+        descriptors = self.component_query.describe('button')
+        self.assertEqual(self.executor.get_command_count('findElement'), 0)
+        self.assertEqual((descriptors[0].xtype, descriptors[0].is_visible, descriptors[0].text), ('button', True, 'Save'))
+
+        element = descriptors[0].get_element()
+        self.assertIs(descriptors[0].get_element(), element)
+        self.assertEqual(self.executor.get_command_count('findElement'), 1)
+
+    def test_descriptor_without_element_id_queries_again(self):
+        self.executor.set_function_result('ComponentQuery', 'describe', [{'componentId': 'button-1', 'visible': True}])
+
+        descriptor = self.component_query.describe('button')[0]
+        self.assertEqual(descriptor.get_element().id, 'button-1')
+
+        self.calls_until_found = float('inf')
+        descriptor = self.component_query.describe('button')[0]
+
+        with self.assertRaises(pyseext.ComponentDescriptor.ElementNoLongerMatchedException):
+            descriptor.get_element()
+
+    def test_expectation_reuses_session_helper(self):
+        expectation = pyseext.ComponentQuery.ComponentQueryFoundExpectation('button')
+
+        expectation(self.driver)
+        expectation(self.driver)
+
+        self.assertIs(expectation._component_query, pyseext.Session(self.driver).component_query) # pylint: disable=protected-access
+
+
+if __name__ == '__main__':
+    unittest.main()
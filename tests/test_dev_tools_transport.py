@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import unittest
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from .context import pyseext
+from pyseext.dev_tools_transport import DevToolsTransport
+from pyseext.testing import FakeCommandExecutor, FakeWebDriver
+
+
+class FakeChromeDriver(FakeWebDriver):
+    """A fake driver for a Chromium based browser, that answers DevTools commands by calling a script on our fake executor."""
+
+    def __init__(self):
+        super().__init__(FakeCommandExecutor('chrome'))
+
+        self.cdp_commands = []
+        self.global_object_id = 'global-1'
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.cdp_commands.append((cmd, cmd_args))
+
+        if cmd == 'Runtime.evaluate':
+            return {'result': {'type': 'object', 'objectId': self.global_object_id}}
+
+        if cmd_args['objectId'] != self.global_object_id:
+            raise WebDriverException('Could not find object with given id')
+
+        args = [argument['value'] for argument in cmd_args['arguments']]
+        return {'result': {'value': self.command_executor._execute_script('return-args', args)}} # pylint: disable=protected-access
+
+
+class DevToolsTransportTestSuite(unittest.TestCase):
+    """Tests for executing scripts using DevTools, using a fake driver."""
+
+    def setUp(self):
+        self.driver = FakeChromeDriver()
+        self.driver.command_executor.set_script_handler('return-args', lambda *args: list(args))
+        self.transport = DevToolsTransport.get_for_driver(self.driver)
+
+    def test_calls_constant_function_with_arguments(self):
+        self.assertEqual(self.transport.execute_script('return-args', 1, 'a'), [1, 'a'])
+        self.assertEqual(self.transport.execute_script('return-args', 2), [2])
+
+        calls = [cmd_args for cmd, cmd_args in self.driver.cdp_commands if cmd == 'Runtime.callFunctionOn']
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0]['functionDeclaration'], calls[1]['functionDeclaration'])
+        self.assertEqual(calls[0]['arguments'], [{'value': 1}, {'value': 'a'}])
+        self.assertEqual([cmd for cmd, _ in self.driver.cdp_commands].count('Runtime.evaluate'), 1)
+
+        # Only the one off read of the frame the WebDriver is in
+        self.assertEqual(self.driver.command_executor.get_command_count('w3cExecuteScript'), 1)
+
+    def test_refetches_global_object_after_page_change(self):
+        self.transport.execute_script('return-args', 1)
+        self.driver.global_object_id = 'global-2'
+
+        self.assertEqual(self.transport.execute_script('return-args', 2), [2])
+        self.assertEqual([cmd for cmd, _ in self.driver.cdp_commands].count('Runtime.evaluate'), 2)
+
+    def test_uses_webdriver_while_in_frame(self):
+        self.transport.execute_script('return-args', 1)
+        self.driver.switch_to.frame(WebElement(self.driver, 'frame-1'))
+
+        self.assertEqual(self.transport.execute_script('return-args', 2), [2])
+        self.assertEqual(self.driver.command_executor.get_command_count('w3cExecuteScript'), 2)
+
+        self.driver.switch_to.default_content()
+        cdp_command_count = len(self.driver.cdp_commands)
+
+        self.transport.execute_script('return-args', 3)
+        self.assertEqual(len(self.driver.cdp_commands), cdp_command_count + 1)
+
+    def test_uses_webdriver_when_created_in_frame(self):
+        driver = FakeChromeDriver()
+        driver.command_executor.set_script_handler('return-args', lambda *args: list(args))
+        driver.switch_to.frame(WebElement(driver, 'frame-1'))
+        transport = DevToolsTransport.get_for_driver(driver)
+
+        self.assertEqual(transport.execute_script('return-args', 1), [1])
+        self.assertEqual(driver.cdp_commands, [])
+
+        driver.switch_to.parent_frame()
+        transport.execute_script('return-args', 2)
+        self.assertEqual(len(driver.cdp_commands), 2)
+
+    def test_transport_does_not_keep_driver_alive(self):
+        self.transport.execute_script('return-args', 1)
+        driver_reference = weakref.ref(self.driver)
+
+        del self.driver, self.transport
+        gc.collect()
+
+        self.assertIsNone(driver_reference())
+
+
+if __name__ == '__main__':
+    unittest.main()
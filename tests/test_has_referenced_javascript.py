@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+from importlib import resources
+from unittest import mock
+
+from .context import pyseext
+from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.testing import FakeWebDriver
+
+
+class HasReferencedJavaScriptTestSuite(unittest.TestCase):
+    """Tests for how our JavaScript is loaded, and reloaded after a navigation, using a fake driver."""
+
+    def setUp(self):
+        """Creates a fake driver whose store reads need the JavaScript for Core as well as StoreHelper."""
+        self.driver = FakeWebDriver()
+        self.executor = self.driver.command_executor
+
+        def get_records(*args):
+            self.assertIn('Core', self.executor.loaded_class_names)
+            return {'name': 'MyApp.model.Person', 'fields': ['name'], 'rows': [['Bob']]}
+
+        self.executor.set_function_handler('StoreHelper', 'getRecords', get_records)
+        self.store_helper = pyseext.StoreHelper(self.driver)
+
+    def test_call_reloads_required_classes_after_navigation(self):
+        self.store_helper.get_records('#people')
+        self.assertEqual(self.executor.loaded_class_names, {'StoreHelper', 'Core'})
+
+        self.driver.get('http://example.com/other')
+
+        records = self.store_helper.get_records('#people')
+        self.assertEqual(self.executor.loaded_class_names, {'StoreHelper', 'Core'})
+        self.assertEqual(records[0].name, 'Bob')
+
+    def test_ensure_loaded_reloads_required_classes_after_navigation(self):
+        self.store_helper.ensure_javascript_loaded()
+        self.driver.get('http://example.com/other')
+
+        self.store_helper.ensure_javascript_loaded()
+        self.assertEqual(self.executor.loaded_class_names, {'StoreHelper', 'Core'})
+
+    def test_call_loads_required_classes_loaded_before_navigation(self):
+        pyseext.Core(self.driver).is_ajax_request_in_progress()
+        self.driver.get('http://example.com/other')
+
+        records = self.store_helper.get_records('#people')
+        self.assertEqual(self.executor.loaded_class_names, {'StoreHelper', 'Core'})
+        self.assertEqual(records[0].name, 'Bob')
+
+    def test_call_costs_one_roundtrip_once_loaded(self):
+        self.store_helper.get_records('#people')
+        count = self.executor.get_command_count()
+
+        self.store_helper.get_records('#people')
+        self.assertEqual(self.executor.get_command_count() - count, 1)
+
+    def test_bundled_javascript_is_loaded_once_for_all_helpers(self):
+        self.executor.set_function_result('LocalStorageHelper', 'getStoredValue', 'value')
+
+        with mock.patch.object(HasReferencedJavaScript, 'USE_BUNDLED_JAVASCRIPT', True):
+            self.store_helper.get_records('#people')
+            count = self.executor.get_command_count()
+
+            pyseext.LocalStorageHelper(self.driver).get_stored_value('key')
+
+        self.assertEqual(self.executor.get_command_count() - count, 1)
+        self.assertTrue({'Core', 'StoreHelper', 'LocalStorageHelper', 'GridHelper'} <= self.executor.loaded_class_names)
+
+    def test_preload_script_is_registered_once(self):
+        script = mock.Mock()
+
+        with mock.patch.object(HasReferencedJavaScript, 'USE_PRELOAD_SCRIPTS', True), \
+             mock.patch.object(FakeWebDriver, 'script', new=mock.PropertyMock(return_value=script)):
+            self.store_helper.get_records('#people')
+            self.driver.get('http://example.com/other')
+            self.store_helper.get_records('#people')
+
+        script.add_preload_script.assert_called_once()
+        self.assertIn(self.executor.page_token, script.add_preload_script.call_args.kwargs['function_declaration'])
+
+    def test_preload_falls_back_when_unsupported(self):
+        with mock.patch.object(HasReferencedJavaScript, 'USE_PRELOAD_SCRIPTS', True):
+            records = self.store_helper.get_records('#people')
+
+        self.assertEqual(records[0].name, 'Bob')
+        self.assertIn('Core', self.executor.loaded_class_names)
+
+    def test_script_sources_are_read_once(self):
+        with mock.patch('importlib.resources.files', wraps=resources.files) as files:
+            HasReferencedJavaScript._get_script_source('PySeExt.Core.js') # pylint: disable=protected-access
+            source = HasReferencedJavaScript._get_script_source('PySeExt.Core.js') # pylint: disable=protected-access
+
+        self.assertLessEqual(files.call_count, 1)
+        self.assertIn('PySeExt.Core', source)
+
+    def test_loaded_expectation_is_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            HasReferencedJavaScript.JavaScriptLoadedExpectation('StoreHelper', 'return true')
+
+    def test_wait_keeps_calls_within_script_timeout(self):
+        self.driver.set_script_timeout(5)
+
+        pyseext.Core(self.driver).wait_for_no_ajax_requests_in_progress(timeout=60)
+
+        wait_args = self._get_wait_args()
+        self.assertEqual(wait_args[6], 3000)
+
+    def test_wait_recovers_when_script_timeout_is_lowered(self):
+        core = pyseext.Core(self.driver)
+        core.wait_for_no_ajax_requests_in_progress(timeout=1)
+
+        # Lowered behind our back, so the first call in the browser exceeds it
+        self.executor.timeouts['script'] = 100
+        finished_at = time.monotonic() + 0.3
+        self.executor.set_function_handler('Core', 'isAjaxRequestInProgress', lambda: time.monotonic() < finished_at)
+
+        core.wait_for_no_ajax_requests_in_progress(timeout=2, recheck_time_if_false=0)
+
+        self.assertEqual(self._get_wait_args()[6], 50)
+
+    def test_wait_limits_settle_time_to_timeout(self):
+        pyseext.Core(self.driver).wait_for_no_ajax_requests_in_progress(timeout=0.5, recheck_time_if_false=1)
+
+        wait_args = self._get_wait_args()
+        self.assertEqual(wait_args[5], 250)
+
+    def _get_wait_args(self) -> list:
+        """Gets the arguments of the last wait made in the browser."""
+        script_args = [params['args'] for _, params in self.executor.commands
+                       if params.get('script') == HasReferencedJavaScript._WAIT_FOR_FUNCTION_SCRIPT] # pylint: disable=protected-access
+        return script_args[-1]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from .context import pyseext
+
+
+class ImportTimeTestSuite(unittest.TestCase):
+    """Regression tests for the cost of importing the package."""
+
+    HEAVY_MODULES = (
+        'selenium.webdriver.remote.webdriver',
+        'selenium.webdriver.support.wait',
+        'selenium.webdriver.common.action_chains'
+    )
+    """Modules that are slow to import, so should only be imported when a helper is first used"""
+
+    IMPORT_TIME_BUDGET = 0.1
+    """The number of seconds that importing the package may take, which is generous to allow for slow machines"""
+
+    def _run(self, code):
+        """Runs code in a fresh interpreter, returning what it prints as JSON."""
+        environment = dict(os.environ, PYTHONPATH=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+        output = subprocess.run([sys.executable, '-c', code], env=environment, capture_output=True, text=True, check=True).stdout
+        return json.loads(output)
+
+    def test_import_does_not_import_helpers_or_selenium(self):
+        modules = self._run("import json, sys, pyseext; print(json.dumps(list(sys.modules)))")
+
+        self.assertEqual([module for module in modules if module.startswith('pyseext.')], [])
+        self.assertEqual([module for module in modules if module.startswith('selenium')], [])
+
+    def test_exception_types_do_not_import_heavy_modules(self):
+        modules = self._run("import json, sys, pyseext\n"
+                            "pyseext.GridHelper.RowNotFoundException, pyseext.FormHelper, pyseext.TreeHelper, pyseext.Core.ArgumentException\n"
+                            "print(json.dumps(list(sys.modules)))")
+
+        for module in self.HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_import_time(self):
+        elapsed = self._run("import json, time\n"
+                            "start = time.perf_counter()\n"
+                            "import pyseext\n"
+                            "print(json.dumps(time.perf_counter() - start))")
+
+        self.assertLess(elapsed, self.IMPORT_TIME_BUDGET)
+
+    def test_lazy_exports(self):
+        for name, module_name in pyseext._LAZY_EXPORTS.items():
+            exported = getattr(pyseext, name)
+
+            self.assertEqual(exported.__module__, module_name)
+            self.assertIn(name, dir(pyseext))
+
+        with self.assertRaises(AttributeError):
+            pyseext.NotAHelper
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from .context import pyseext
+from pyseext.call_statistics import CallStatistics
+from pyseext.chrome_tracer import ChromeTracer
+from pyseext.instrumentation import Instrumentation
+from pyseext.slow_call_detector import SlowCallDetector
+from pyseext.testing import FakeWebDriver
+
+
+class InstrumentationTestSuite(unittest.TestCase):
+    """Tests for the instrumentation of helper calls, and its listeners, using a fake driver."""
+
+    def setUp(self):
+        self.driver = FakeWebDriver()
+        self.driver.command_executor.set_function_handler('StoreHelper', 'getRecords',
+                                                          lambda *args: {'name': 'Person', 'fields': ['name'], 'rows': [['Bob']]})
+        self.store_helper = pyseext.StoreHelper(self.driver)
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_call_statistics_count_roundtrips_per_method(self):
+        with CallStatistics() as statistics:
+            self.store_helper.get_records('#people')
+            self.store_helper.get_records('#people')
+
+        method_statistics = statistics.get_statistics()['StoreHelper.get_records']
+        self.assertEqual(method_statistics['calls'], 2)
+        self.assertEqual(method_statistics['max_roundtrips'], 2)
+        self.assertEqual(method_statistics['roundtrips'], 3)
+        self.assertFalse(Instrumentation.is_enabled())
+
+    def test_chrome_tracer_records_nested_events(self):
+        file_path = os.path.join(self.directory, 'trace.json')
+
+        with ChromeTracer(file_path):
+            self.store_helper.get_records('#people')
+
+        with open(file_path, encoding='utf-8') as file:
+            events = json.load(file)['traceEvents']
+
+        names = {(event['name'], event['cat']) for event in events if event['ph'] == 'X'}
+        self.assertIn(('StoreHelper.get_records', Instrumentation.SPAN_KIND_METHOD), names)
+        self.assertIn(('PySeExt.StoreHelper.getRecords', Instrumentation.SPAN_KIND_SCRIPT), names)
+        self.assertIn(('w3cExecuteScript', ChromeTracer.ROUNDTRIP_CATEGORY), names)
+
+    def test_slow_call_detector_reports_slow_calls_with_stack(self):
+        file_path = os.path.join(self.directory, 'slow_calls.jsonl')
+
+        with SlowCallDetector(threshold=0, file_path=file_path) as detector:
+            self.store_helper.get_records('#people')
+
+        with open(file_path, encoding='utf-8') as file:
+            reports = [json.loads(line) for line in file]
+
+        self.assertEqual(detector.report_count, 1)
+        self.assertEqual(reports[0]['name'], 'StoreHelper.get_records')
+        self.assertEqual(reports[0]['args'], ['#people'])
+        self.assertEqual(reports[0]['roundtrips'], 2)
+        self.assertIn('test_instrumentation.py', reports[0]['stack'][-1])
+        self.assertFalse(any('pyseext' + os.sep in frame and 'tests' not in frame for frame in reports[0]['stack']))
+
+    def test_slow_call_detector_ignores_fast_calls(self):
+        with SlowCallDetector(threshold=60) as detector:
+            self.store_helper.get_records('#people')
+
+        self.assertEqual(detector.report_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import unittest
+from unittest import mock
+
+from .context import pyseext
+from pyseext.logging_policy import LoggingPolicy
+
+
+class LoggingPolicyTestSuite(unittest.TestCase):
+    """Tests for how our helpers log."""
+
+    def test_render_truncates_large_values(self):
+        text = str(LoggingPolicy.render(list(range(1000)), max_length=20))
+
+        self.assertTrue(text.endswith('...'))
+        self.assertEqual(len(text), 23)
+
+    def test_render_quotes_strings_in_collections_only(self):
+        self.assertEqual(str(LoggingPolicy.render('Bob')), 'Bob')
+        self.assertEqual(str(LoggingPolicy.render({'name': 'Bob', 'tags': ('a',)})), "{'name': 'Bob', 'tags': ('a')}")
+
+    def test_render_is_lazy(self):
+        rendered = []
+
+        class Value:
+            def __repr__(self):
+                rendered.append(self)
+                return 'Value'
+
+        logger = LoggingPolicy.get_logger('pyseext.tests.lazy')
+        logger.setLevel(logging.INFO)
+
+        logger.debug('Value %s', LoggingPolicy.render(Value()))
+        self.assertEqual(rendered, [])
+
+        with self.assertLogs(logger, logging.DEBUG) as logs:
+            logger.debug('Value %s', LoggingPolicy.render(Value()))
+
+        self.assertEqual(logs.records[0].getMessage(), 'Value Value')
+
+    def test_polls_are_sampled(self):
+        logger = LoggingPolicy.get_logger('pyseext.tests.sampling')
+
+        with mock.patch.object(LoggingPolicy, 'POLL_LOG_SAMPLE_INTERVAL', 3), self.assertLogs(logger, logging.DEBUG) as logs:
+            for poll_number in range(7):
+                with LoggingPolicy.polling(poll_number):
+                    logger.debug('Poll %d', poll_number)
+
+            logger.debug('Not polling')
+
+        self.assertEqual([record.getMessage() for record in logs.records], ['Poll 0', 'Poll 3', 'Poll 6', 'Not polling'])
+
+    def test_set_level_by_helper(self):
+        LoggingPolicy.set_level(pyseext.ComponentQuery, 'WARNING')
+
+        try:
+            self.assertEqual(logging.getLogger('pyseext.component_query').level, logging.WARNING)
+        finally:
+            LoggingPolicy.set_level(pyseext.ComponentQuery, logging.NOTSET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import JavascriptException
+
+from .context import pyseext
+from pyseext.has_referenced_javascript import HasReferencedJavaScript
+from pyseext.payload_codec import PayloadCodec
+from pyseext.testing import FakeWebDriver
+
+
+class PayloadCodecTestSuite(unittest.TestCase):
+    """Tests for the envelopes that compressed payloads are sent in."""
+
+    def test_small_payload_is_not_compressed(self):
+        self.assertEqual(PayloadCodec.encode(['a', 1], threshold=100), {'value': ['a', 1]})
+
+    def test_large_payload_round_trips_compressed(self):
+        payload = {'rows': [['Bob', 1]] * 100}
+        envelope = PayloadCodec.encode(payload, threshold=100)
+
+        self.assertEqual(list(envelope), ['gzip'])
+        self.assertEqual(PayloadCodec.decode(envelope), payload)
+
+    def test_payload_that_is_not_json_is_not_compressed(self):
+        element = object()
+        self.assertEqual(PayloadCodec.encode([element], threshold=0), {'value': [element]})
+
+    def test_error_envelope_raises(self):
+        with self.assertRaises(JavascriptException) as context:
+            PayloadCodec.decode({'error': 'TypeError: oops'})
+
+        self.assertIn('TypeError: oops', str(context.exception))
+
+    def test_helper_call_uses_compressed_payloads(self):
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_handler('StoreHelper', 'getRecords',
+                                                     lambda *args: {'name': 'Person', 'fields': ['name'], 'rows': [['Bob']] * 100})
+
+        with mock.patch.object(HasReferencedJavaScript, 'USE_COMPRESSED_PAYLOADS', True), \
+             mock.patch.object(HasReferencedJavaScript, 'COMPRESSED_PAYLOAD_THRESHOLD', 100):
+            records = pyseext.StoreHelper(driver).get_records('#people')
+
+        scripts = [params.get('script') for _, params in driver.command_executor.commands]
+        self.assertIn(HasReferencedJavaScript._CALL_FUNCTION_COMPRESSED_SCRIPT, scripts) # pylint: disable=protected-access
+        self.assertEqual(len(records), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+import unittest
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from .context import pyseext
+from pyseext.polling_strategy import PollingStrategy
+
+
+class PollingStrategyTestSuite(unittest.TestCase):
+    """Tests for how waits made from Python poll."""
+
+    def tearDown(self):
+        PollingStrategy.set_default(None)
+
+    def test_intervals_back_off_to_maximum(self):
+        strategy = PollingStrategy(initial_interval=0.1, multiplier=2, max_interval=0.5)
+
+        self.assertEqual(list(itertools.islice(strategy.get_intervals(), 5)), [0.1, 0.2, 0.4, 0.5, 0.5])
+
+    def test_fixed_intervals(self):
+        self.assertEqual(list(itertools.islice(PollingStrategy.fixed(0.25).get_intervals(), 3)), [0.25, 0.25, 0.25])
+
+    def test_invalid_strategy_is_rejected(self):
+        for initial_interval, multiplier, max_interval in ((0, 2, 1), (0.1, 0.5, 1), (1, 2, 0.5)):
+            with self.assertRaises(PollingStrategy.InvalidStrategyException):
+                PollingStrategy(initial_interval, multiplier, max_interval)
+
+    def test_default_can_be_replaced_and_restored(self):
+        strategy = PollingStrategy.fixed(0.5)
+
+        PollingStrategy.set_default(strategy)
+        self.assertIs(PollingStrategy.get_default(), strategy)
+
+        PollingStrategy.set_default(None)
+        self.assertEqual(PollingStrategy.get_default().initial_interval, PollingStrategy.DEFAULT_INITIAL_INTERVAL)
+
+    def test_until_returns_first_true_value_ignoring_missing_elements(self):
+        results = iter([NoSuchElementException(), None, [], 'found'])
+
+        def method(driver):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+
+            return result
+
+        self.assertEqual(PollingStrategy.fixed(0.001).until(None, method, timeout=5), 'found')
+
+    def test_until_times_out_with_message(self):
+        with self.assertRaises(TimeoutException) as context:
+            PollingStrategy.fixed(0.01).until(None, lambda driver: False, timeout=0.05, message='Never happened')
+
+        self.assertIn('Never happened', str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from .context import pyseext
+from pyseext.pytest_plugin import PytestPlugin
+
+
+class PytestPluginTestSuite(unittest.TestCase):
+    """Tests for the pytest plugin, which run pytest on a test file that uses a fake driver."""
+
+    TEST_FILE = textwrap.dedent("""
+        import time
+
+        import pytest
+
+        from pyseext.testing import FakeWebDriver
+
+
+        @pytest.fixture(scope='session')
+        def pyseext_driver():
+            driver = FakeWebDriver()
+            driver.command_executor.set_function_result('LocalStorageHelper', 'getStoredValue', 'value')
+            driver.command_executor.set_function_handler('ComponentQuery', 'query', lambda *args: time.sleep(0.01) or [driver.command_executor.element('button-1')])
+            return driver
+
+
+        @pytest.mark.pyseext_budget(roundtrips=1)
+        def test_over_roundtrip_budget(pyseext_session):
+            pyseext_session.local_storage_helper.get_stored_value('first')
+            pyseext_session.local_storage_helper.get_stored_value('second')
+
+
+        @pytest.mark.pyseext_budget(roundtrips=10, wait_seconds=5)
+        def test_within_budget(pyseext_session):
+            pyseext_session.local_storage_helper.get_stored_value('first')
+            pyseext_session.component_query.wait_for_query('button', timeout=1)
+        """)
+    """The test file that pytest is run on"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+        with open(os.path.join(self.directory, 'test_budgets.py'), 'w', encoding='utf-8') as file:
+            file.write(self.TEST_FILE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _run_pytest(self, *args):
+        """Runs pytest with our plugin on the test file, returning the exit code and the outcome and user properties of each test."""
+        junit_path = os.path.join(self.directory, 'junit.xml')
+        environment = dict(os.environ, PYTHONPATH=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+        environment.pop('PYTEST_ADDOPTS', None)
+
+        process = subprocess.run([sys.executable, '-m', 'pytest', '-p', 'pyseext.pytest_plugin', '-p', 'no:cacheprovider',
+                                  f'--junitxml={junit_path}', *args, 'test_budgets.py'],
+                                 cwd=self.directory, env=environment, capture_output=True, text=True, check=False)
+
+        tests = {}
+        for test_case in ElementTree.parse(junit_path).getroot().iter('testcase'):
+            properties = {prop.get('name'): prop.get('value') for prop in test_case.iter('property')}
+            tests[test_case.get('name')] = ('failed' if test_case.find('failure') is not None else 'passed', properties)
+
+        return process.returncode, tests
+
+    def test_budgets_are_enforced(self):
+        exit_code, tests = self._run_pytest()
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(tests['test_over_roundtrip_budget'][0], 'failed')
+        self.assertEqual(tests['test_within_budget'][0], 'passed')
+
+    def test_roundtrips_and_wait_time_are_recorded(self):
+        _, tests = self._run_pytest()
+
+        over_properties = tests['test_over_roundtrip_budget'][1]
+        within_properties = tests['test_within_budget'][1]
+
+        self.assertEqual(over_properties[PytestPlugin.USER_PROPERTY_ROUNDTRIPS], '3')
+        self.assertEqual(over_properties[PytestPlugin.USER_PROPERTY_WAIT_SECONDS], '0.0')
+        self.assertGreater(float(within_properties[PytestPlugin.USER_PROPERTY_WAIT_SECONDS]), 0)
+
+    def test_budgets_are_not_enforced_when_disabled(self):
+        exit_code, tests = self._run_pytest('--pyseext-no-budgets')
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(tests['test_over_roundtrip_budget'][0], 'passed')
+
+    def test_wait_stats_are_saved(self):
+        stats_path = os.path.join(self.directory, 'wait_stats.json')
+
+        self._run_pytest(f'--pyseext-wait-stats={stats_path}')
+
+        self.assertEqual(len(pyseext.WaitAnalytics(stats_path).get_samples('ComponentQuery.wait_for_query', 'button')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from .context import pyseext
+from pyseext.record_type import RecordType
+
+
+class RecordTypeTestSuite(unittest.TestCase):
+    """Tests for the compact records that bulk data is returned as."""
+
+    def test_records_are_read_by_attribute_and_name(self):
+        records = RecordType.from_table({'name': 'MyApp.model.Person', 'fields': ['name', 'first-name', 'get'], 'rows': [['Bob', 'Robert', 1]]})
+
+        self.assertEqual(type(records[0]).__name__, 'Person')
+        self.assertEqual(records[0].name, 'Bob')
+        self.assertEqual(records[0].get('first-name'), 'Robert')
+        self.assertEqual(records[0].get('get'), 1)
+        self.assertEqual(records[0].get('missing', 'default'), 'default')
+        self.assertEqual(records[0].to_dict(), {'name': 'Bob', 'first-name': 'Robert', 'get': 1})
+
+    def test_no_table_gives_no_records(self):
+        self.assertEqual(RecordType.from_table(None), [])
+
+    def test_record_class_is_reused(self):
+        record_class = RecordType.get_record_class(['name'], 'MyApp.model.Person')
+
+        self.assertIs(RecordType.get_record_class(('name',), 'MyApp.model.Person'), record_class)
+        self.assertIsNot(RecordType.get_record_class(['name'], 'MyApp.model.Pet'), record_class)
+
+    def test_record_classes_are_bounded(self):
+        for index in range(RecordType._MAX_RECORD_CLASSES + 10): # pylint: disable=protected-access
+            RecordType.get_record_class([f'field{index}'])
+
+        self.assertLessEqual(RecordType._create_record_class.cache_info().currsize, RecordType._MAX_RECORD_CLASSES) # pylint: disable=protected-access
+
+
+if __name__ == '__main__':
+    unittest.main()
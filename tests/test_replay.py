@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from .context import pyseext
+from pyseext.testing import CommandRecorder, FakeWebDriver, ReplayCommandExecutor
+
+
+class ReplayTestSuite(unittest.TestCase):
+    """Tests for recording a session, and replaying it without a browser."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'session.recording.json')
+
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_handler('LocalStorageHelper', 'getStoredValue', lambda key: f'value of {key}')
+
+        with CommandRecorder(driver) as recorder:
+            helper = pyseext.LocalStorageHelper(driver)
+            helper.get_stored_value('first')
+            helper.get_stored_value('second')
+
+        recorder.save(self.file_path)
+        self.recorded_command_count = len(recorder.commands)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_replay_answers_recorded_commands(self):
+        executor = ReplayCommandExecutor(self.file_path)
+        helper = pyseext.LocalStorageHelper(FakeWebDriver(executor))
+
+        self.assertEqual(helper.get_stored_value('first'), 'value of first')
+        self.assertEqual(helper.get_stored_value('second'), 'value of second')
+        self.assertTrue(executor.is_complete())
+        self.assertEqual(executor.position, self.recorded_command_count)
+
+    def test_replay_rejects_different_commands(self):
+        store_helper = pyseext.StoreHelper(FakeWebDriver(ReplayCommandExecutor(self.file_path)))
+
+        with self.assertRaises(ReplayCommandExecutor.ReplayMismatchException):
+            store_helper.get_records('#people')
+
+    def test_replay_rejects_extra_commands(self):
+        helper = pyseext.LocalStorageHelper(FakeWebDriver(ReplayCommandExecutor(self.file_path)))
+        helper.get_stored_value('first')
+        helper.get_stored_value('second')
+
+        with self.assertRaises(ReplayCommandExecutor.ReplayExhaustedException):
+            helper.get_stored_value('third')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import unittest
+import weakref
+
+from .context import pyseext
+from pyseext.testing import FakeWebDriver
+
+
+class SessionTestSuite(unittest.TestCase):
+    """Tests for sharing helpers between the sessions for a driver."""
+
+    def test_helpers_are_shared_per_driver(self):
+        driver = FakeWebDriver()
+
+        self.assertIs(pyseext.Session(driver).store_helper, pyseext.Session(driver).store_helper)
+        self.assertIsNot(pyseext.Session(driver).store_helper, pyseext.Session(FakeWebDriver()).store_helper)
+
+    def test_helpers_share_loaded_javascript(self):
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_result('LocalStorageHelper', 'getStoredValue', 'value')
+
+        pyseext.Session(driver).local_storage_helper.get_stored_value('first')
+        pyseext.Session(driver).local_storage_helper.get_stored_value('second')
+
+        self.assertEqual(driver.command_executor.get_command_count('w3cExecuteScript'), 3)
+
+    def test_helpers_do_not_keep_driver_alive(self):
+        driver = FakeWebDriver()
+        pyseext.Session(driver).grid_helper.ensure_javascript_loaded()
+        driver_reference = weakref.ref(driver)
+
+        del driver
+        gc.collect()
+
+        self.assertIsNone(driver_reference())
+
+
+if __name__ == '__main__':
+    unittest.main()
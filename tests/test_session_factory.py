@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import json
+import socket
+import unittest
+from unittest import mock
+
+import urllib3
+from selenium import webdriver
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from .context import pyseext
+from pyseext.instrumentation import Instrumentation
+from pyseext.session_factory import SessionFactory
+
+
+class SessionFactoryTestSuite(unittest.TestCase):
+    """Tests for creating remote drivers with a tuned connection pool, with their HTTP requests answered by a stub."""
+
+    REMOTE_URL: str = 'http://grid:4444'
+    """The URL of the remote end, which is never connected to"""
+
+    def setUp(self):
+        self.factory = SessionFactory(self.REMOTE_URL, pool_size=4, connect_timeout=5, read_timeout=60)
+        self.requests = []
+
+        def request(pool_manager, method, url, body=None, headers=None, **kwargs):
+            """Answers a request to the remote end, as the remote end would."""
+            self.requests.append((method, url))
+
+            value = {'sessionId': 'remote-session', 'capabilities': {'browserName': 'chrome'}} if url.endswith('/session') else 'Title'
+            return urllib3.HTTPResponse(body=json.dumps({'value': value}).encode('utf-8'),
+                                        status=200,
+                                        headers={'Content-Type': 'application/json'},
+                                        preload_content=True)
+
+        patcher = mock.patch.object(urllib3.PoolManager, 'request', request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.listener = mock.Mock(spec=Instrumentation.Listener)
+        self.addCleanup(Instrumentation.remove_listener, self.listener)
+
+    def test_pool_settings_reach_urllib3(self):
+        connection = RemoteConnection(client_config=self.factory.create_client_config())
+        pool_kwargs = connection._conn.connection_pool_kw # pylint: disable=protected-access
+
+        self.assertEqual(pool_kwargs['maxsize'], 4)
+        self.assertFalse(pool_kwargs['block'])
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool_kwargs['socket_options'])
+        self.assertIsInstance(pool_kwargs['timeout'], urllib3.Timeout)
+        self.assertEqual(pool_kwargs['timeout'].connect_timeout, 5)
+        self.assertEqual(pool_kwargs['timeout'].read_timeout, 60)
+
+    def test_tcp_keep_alive_can_be_disabled(self):
+        factory = SessionFactory(self.REMOTE_URL, tcp_keep_alive=False)
+        connection = RemoteConnection(client_config=factory.create_client_config())
+
+        self.assertNotIn('socket_options', connection._conn.connection_pool_kw) # pylint: disable=protected-access
+
+    def test_create_session_instruments_http_requests(self):
+        session = self.factory.create_session(webdriver.ChromeOptions())
+        Instrumentation.add_listener(self.listener)
+
+        self.assertEqual(session.driver.title, 'Title')
+
+        http_request = self.listener.on_http_request.call_args.args[0]
+        self.assertEqual(http_request.method, 'GET')
+        self.assertEqual(http_request.url, f'{self.REMOTE_URL}/session/remote-session/title')
+        self.assertGreaterEqual(http_request.end_time, http_request.start_time)
+        self.assertEqual(session.driver.command_executor._conn.connection_pool_kw['maxsize'], 4) # pylint: disable=protected-access
+
+    def test_connection_is_instrumented_once(self):
+        connection = RemoteConnection(client_config=self.factory.create_client_config())
+        Instrumentation.instrument_connection(connection)
+        Instrumentation.instrument_connection(connection)
+        Instrumentation.add_listener(self.listener)
+
+        connection.execute(Command.GET_TITLE, {'sessionId': 'remote-session'})
+
+        self.assertEqual(self.listener.on_http_request.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from .context import pyseext
+from pyseext.testing import FakeCommandExecutor, FakeWebDriver
+from pyseext.wait_analytics import WaitAnalytics
+
+
+class WaitAnalyticsTestSuite(unittest.TestCase):
+    """Tests for recording how long waits take, and the adaptive timeouts set from that history."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'wait_stats.json')
+
+    def tearDown(self):
+        WaitAnalytics.set_current(None)
+        shutil.rmtree(self.directory)
+
+    def test_timeout_is_percentile_times_safety_factor(self):
+        analytics = WaitAnalytics(self.file_path, adaptive=True, percentile=0.9, safety_factor=2, min_samples=10, min_timeout=0)
+
+        for duration in range(1, 11):
+            analytics.record('ComponentQuery.wait_for_query', 'button', duration / 10)
+
+        self.assertAlmostEqual(analytics.get_timeout('ComponentQuery.wait_for_query', 'button', 10), 1.8)
+
+    def test_timeout_is_limited(self):
+        analytics = WaitAnalytics(self.file_path, adaptive=True, min_samples=1, min_timeout=2, max_timeout=5)
+
+        analytics.record('wait', 'fast', 0.01)
+        analytics.record('wait', 'slow', 100)
+
+        self.assertEqual(analytics.get_timeout('wait', 'fast', 10), 2)
+        self.assertEqual(analytics.get_timeout('wait', 'slow', 10), 5)
+
+    def test_default_is_used_without_enough_history_or_when_not_adaptive(self):
+        analytics = WaitAnalytics(self.file_path, adaptive=True, min_samples=2)
+        analytics.record('wait', 'button', 1)
+
+        self.assertEqual(analytics.get_timeout('wait', 'button', 10), 10)
+
+        analytics.record('wait', 'button', 1)
+        analytics.adaptive = False
+        self.assertEqual(analytics.get_timeout('wait', 'button', 10), 10)
+
+    def test_only_most_recent_samples_are_kept(self):
+        analytics = WaitAnalytics(self.file_path)
+
+        for duration in range(WaitAnalytics.MAX_SAMPLES + 5):
+            analytics.record('wait', None, duration)
+
+        samples = analytics.get_samples('wait', None)
+        self.assertEqual(len(samples), WaitAnalytics.MAX_SAMPLES)
+        self.assertEqual(samples[0], 5)
+
+    def test_save_merges_samples_from_other_processes(self):
+        first = WaitAnalytics(self.file_path)
+        second = WaitAnalytics(self.file_path)
+
+        first.record('wait', 'button', 1)
+        second.record('wait', 'button', 2)
+        second.record('wait', 'grid', 3)
+        first.save()
+        second.save()
+
+        self.assertEqual(WaitAnalytics(self.file_path).get_samples('wait', 'button'), [1, 2])
+        self.assertEqual(WaitAnalytics(self.file_path).get_samples('wait', 'grid'), [3])
+
+    def test_unreadable_file_is_ignored(self):
+        with open(self.file_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': 0, 'waits': {'wait': {'': [1]}}}, file)
+
+        self.assertEqual(WaitAnalytics(self.file_path).get_samples('wait', None), [])
+
+    def test_helper_waits_are_recorded(self):
+        driver = FakeWebDriver()
+        driver.command_executor.set_function_result('ComponentQuery', 'query', [FakeCommandExecutor.element('button-1')])
+
+        with WaitAnalytics(self.file_path) as analytics:
+            pyseext.ComponentQuery(driver).wait_for_query('button', timeout=1)
+
+        self.assertEqual(len(analytics.get_samples('ComponentQuery.wait_for_query', 'button')), 1)
+        self.assertIsNone(WaitAnalytics.get_current())
+        self.assertTrue(os.path.exists(self.file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()